@@ -0,0 +1,64 @@
+"""
+Benchmark for sharing one CustomCalendar instance per day.
+
+Holds the results of many single conversions that repeat the same two years of dates, the way long-lived service
+caches do, and measures them with `tracemalloc`: once as returned by `NepaliDateConverter.convert_english_to_nepali`,
+which returns the shared instance of each day, and once as a new instance per conversion, as before sharing.
+Also times `==` between equal calendars, which is an identity check for shared instances.
+
+Run from the repository root:
+    PYTHONPATH=src python benchmarks/bench_calendar_interning.py
+"""
+
+import timeit
+import tracemalloc
+from datetime import date, timedelta
+from nepali_calendar_utils.calendar_model.date_converters import DateConverters
+from nepali_calendar_utils.calendar_model.nepali_date_converter import NepaliDateConverter
+
+CONVERSION_COUNT = 500_000
+FIRST_DAY = date(2023, 1, 1)
+DAY_SPAN = 730
+
+
+def english_dates():
+    return [FIRST_DAY + timedelta(days=index % DAY_SPAN) for index in range(CONVERSION_COUNT)]
+
+
+def shared_calendars(dates):
+    return [NepaliDateConverter.convert_english_to_nepali(day.year, day.month, day.day) for day in dates]
+
+
+def new_calendars(dates):
+    return [DateConverters.create_nepali_calendar_from_ordinal(day.toordinal()) for day in dates]
+
+
+def traced_megabytes(convert, dates) -> float:
+    tracemalloc.start()
+    calendars = convert(dates)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del calendars
+    return size / 1e6
+
+
+def main():
+    dates = english_dates()
+    print(f"{CONVERSION_COUNT:,} conversions of {DAY_SPAN} distinct days")
+
+    new_mb = traced_megabytes(new_calendars, dates)
+    shared_mb = traced_megabytes(shared_calendars, dates)
+    list_mb = CONVERSION_COUNT * 8 / 1e6
+    print(f"{'new instance per conversion':>30} {new_mb:>8.1f} MB")
+    print(f"{'shared instances':>30} {shared_mb:>8.1f} MB  ({list_mb:.1f} MB of it is the list itself)")
+
+    first, second = new_calendars(dates[:1] * 2)
+    shared = shared_calendars(dates[:1])[0]
+    copies_usec = min(timeit.repeat(lambda: first == second, number=200_000, repeat=5)) / 200_000 * 1e6
+    shared_usec = min(timeit.repeat(lambda: shared == shared, number=200_000, repeat=5)) / 200_000 * 1e6
+    print(f"{'== between equal copies':>30} {copies_usec:>8.3f} usec")
+    print(f"{'== between shared instances':>30} {shared_usec:>8.3f} usec")
+
+
+if __name__ == "__main__":
+    main()
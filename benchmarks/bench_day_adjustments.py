@@ -0,0 +1,31 @@
+"""
+Benchmark for adding/subtracting days to a Nepali date.
+
+Shows that `NepaliDateConverter.get_nepali_calendar_after_addition_or_subtraction` costs the same
+no matter how many days are added or subtracted.
+
+Run from the repository root:
+    PYTHONPATH=src python benchmarks/bench_day_adjustments.py
+"""
+
+import timeit
+from nepali_calendar_utils.calendar_model.nepali_date_converter import NepaliDateConverter
+
+REPEAT = 5
+NUMBER = 20_000
+
+
+def main():
+    print(f"{'days_to_adjust':>15} {'usec/call':>10}")
+
+    for days_to_adjust in (1, 10, 100, 1_000, 10_000, 20_000, -20_000):
+        seconds = min(timeit.repeat(
+            lambda: NepaliDateConverter.get_nepali_calendar_after_addition_or_subtraction(2035, 6, 15, days_to_adjust),
+            repeat=REPEAT,
+            number=NUMBER,
+        ))
+        print(f"{days_to_adjust:>15} {seconds / NUMBER * 1e6:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Benchmark for converting digits between English and Nepali.
+
+Compares the previous per-character conversion with `NepaliDateConverter.convert_to_nepali_number` /
+`convert_to_english_number`, which use `str.translate` tables and memoize short strings, and with
+`NepaliDateConverter.localize_digits` for a large report body.
+
+Run from the repository root:
+    PYTHONPATH=src python benchmarks/bench_digit_localization.py
+"""
+
+import timeit
+from nepali_calendar_utils.calendar_model.nepali_date_converter import NepaliDateConverter
+
+REPEAT = 5
+NUMBER = 100_000
+
+NEPALI_DIGITS = ['०', '१', '२', '३', '४', '५', '६', '७', '८', '९']
+NEPALI_TO_ENGLISH_DIGITS = {
+    '०': '0', '१': '1', '२': '2', '३': '3', '४': '4',
+    '५': '5', '६': '6', '७': '7', '८': '8', '९': '9'
+}
+
+
+def per_character_to_nepali(string: str) -> str:
+    return ''.join(NEPALI_DIGITS[int(char)] if '0' <= char <= '9' else char for char in string)
+
+
+def per_character_to_english(string: str) -> str:
+    return ''.join(NEPALI_TO_ENGLISH_DIGITS.get(char, char) for char in string)
+
+
+def usec_per_call(function, argument) -> float:
+    seconds = min(timeit.repeat(lambda: function(argument), repeat=REPEAT, number=NUMBER))
+    return seconds / NUMBER * 1e6
+
+
+def main():
+    print(f"{'input':>22} {'per-char usec':>14} {'table usec':>11} {'speedup':>8}")
+
+    for name, old, new, argument in (
+        ("to nepali '24'", per_character_to_nepali, NepaliDateConverter.convert_to_nepali_number, "24"),
+        ("to nepali '2081'", per_character_to_nepali, NepaliDateConverter.convert_to_nepali_number, "2081"),
+        ("to nepali '2081/01/24'", per_character_to_nepali, NepaliDateConverter.convert_to_nepali_number, "2081/01/24"),
+        ("to english '२०८१'", per_character_to_english, NepaliDateConverter.convert_to_english_number, "२०८१"),
+    ):
+        old_usec = usec_per_call(old, argument)
+        new_usec = usec_per_call(new, argument)
+        print(f"{name:>22} {old_usec:>14.3f} {new_usec:>11.3f} {old_usec / new_usec:>7.1f}x")
+
+    report = ["Invoice 10234, due 2081/01/24, amount 15,300.50\n"] * 20_000
+    old_seconds = min(timeit.repeat(lambda: [per_character_to_nepali(line) for line in report], repeat=REPEAT, number=1))
+    new_seconds = min(timeit.repeat(lambda: list(NepaliDateConverter.localize_digits(report)), repeat=REPEAT, number=1))
+    print(f"{'report, 20k lines':>22} {old_seconds * 1e3:>12.1f}ms {new_seconds * 1e3:>9.1f}ms {old_seconds / new_seconds:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
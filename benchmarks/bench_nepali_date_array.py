@@ -0,0 +1,52 @@
+"""
+Benchmark for NepaliDateArray against a list of NepaliDate objects.
+
+Measures, for the same English dates, the memory held with `tracemalloc`, the time to convert them from
+English dates, and the time to sort them and read their year, month and day.
+
+Run from the repository root:
+    PYTHONPATH=src python benchmarks/bench_nepali_date_array.py
+"""
+
+import time
+import tracemalloc
+from datetime import date, timedelta
+from nepali_calendar_utils.data.nepali_date import NepaliDate
+from nepali_calendar_utils.data.nepali_date_array import NepaliDateArray
+
+DATE_COUNT = 1_000_000
+
+
+def measure(build):
+    tracemalloc.start()
+    started = time.perf_counter()
+    value = build()
+    elapsed = time.perf_counter() - started
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return value, size, elapsed
+
+
+def main():
+    first_date = date(1990, 1, 1)
+    english_dates = [first_date + timedelta(days=offset * 7919 % 18_000) for offset in range(DATE_COUNT)]
+
+    nepali_dates, list_bytes, list_seconds = measure(lambda: list(map(NepaliDate.from_english_date, english_dates)))
+    nepali_date_array, array_bytes, array_seconds = measure(lambda: NepaliDateArray.from_english_dates(english_dates))
+
+    started = time.perf_counter()
+    [(nepali_date.year, nepali_date.month, nepali_date.day_of_month) for nepali_date in sorted(nepali_dates)]
+    list_columns_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    nepali_date_array.sorted().to_columns()
+    array_columns_seconds = time.perf_counter() - started
+
+    print(f"{DATE_COUNT:,} dates")
+    print(f"{'':>18} {'MB':>8} {'convert s':>10} {'sort + columns s':>17}")
+    print(f"{'list[NepaliDate]':>18} {list_bytes / 1e6:>8.1f} {list_seconds:>10.2f} {list_columns_seconds:>17.2f}")
+    print(f"{'NepaliDateArray':>18} {array_bytes / 1e6:>8.1f} {array_seconds:>10.2f} {array_columns_seconds:>17.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Benchmark for converting a large stream of English dates to Nepali dates on several processes.
+
+Compares `NepaliDateConverter.convert_english_to_nepali_many`, which runs on one core, with
+`NepaliDateConverter.convert_many` for 1, 2, 4 and all CPUs. The input is a generator, so `convert_many` never holds
+more than a few chunks in memory. Both convert each distinct date once; the workers convert the dates not seen
+before, while reading the input and handing out the results for repeated dates stays in the calling process, so
+the speedup is largest on inputs with many distinct dates and bounded by that remaining serial work.
+
+Run from the repository root:
+    PYTHONPATH=src python benchmarks/bench_parallel_conversion.py
+"""
+
+import os
+import time
+from datetime import date, timedelta
+from nepali_calendar_utils.calendar_model.nepali_date_converter import NepaliDateConverter
+
+ROW_COUNT = 1_000_000
+CHUNK_SIZE = 10_000
+FIRST_DAY = date(1950, 1, 1)
+DAY_SPAN = 33_000
+
+
+def english_dates():
+    # Deterministic and spread over the whole range, so most chunks hold mostly distinct dates
+    for row in range(ROW_COUNT):
+        yield FIRST_DAY + timedelta(days=row * 7919 % DAY_SPAN)
+
+
+def rows_per_second(convert) -> float:
+    start = time.perf_counter()
+    for _ in convert():
+        pass
+    return ROW_COUNT / (time.perf_counter() - start)
+
+
+def main():
+    print(f"{ROW_COUNT:,} dates, {os.cpu_count()} CPUs")
+    print(f"{'method':>28} {'rows/s':>10}")
+
+    sequential = rows_per_second(lambda: NepaliDateConverter.convert_english_to_nepali_many(english_dates()))
+    print(f"{'convert_english_to_nepali_many':>28} {sequential:>10,.0f}")
+
+    for workers in sorted({1, 2, 4, os.cpu_count() or 1}):
+        parallel = rows_per_second(
+            lambda: NepaliDateConverter.convert_many(english_dates(), workers=workers, chunk_size=CHUNK_SIZE)
+        )
+        print(f"{f'convert_many, {workers} workers':>28} {parallel:>10,.0f} {parallel / sequential:>6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
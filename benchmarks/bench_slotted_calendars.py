@@ -0,0 +1,120 @@
+"""
+Benchmark for the slotted CustomCalendar, SimpleDate, SimpleTime and NepaliMonthCalendar.
+
+Compares each class with the frozen dataclass it replaced (reproduced below): the memory of one instance, measured
+with `tracemalloc` over many instances, and the time to build one. CustomCalendar is built the way the converters
+build it, leaving `day_of_week_in_month`, `week_of_month` and `week_of_year` to be derived when read; the
+dataclass had to be given all of them.
+
+Run from the repository root:
+    PYTHONPATH=src python benchmarks/bench_slotted_calendars.py
+"""
+
+import timeit
+import tracemalloc
+from dataclasses import dataclass, field
+from nepali_calendar_utils.data.custom_calendar import CustomCalendar, NepaliMonthCalendar, SimpleDate, SimpleTime
+
+INSTANCE_COUNT = 100_000
+REPEAT = 5
+NUMBER = 100_000
+
+
+@dataclass(frozen=True)
+class DataclassSimpleDate:
+    year: int
+    month: int
+    day_of_month: int = 1
+
+
+@dataclass(frozen=True)
+class DataclassSimpleTime:
+    hour: int
+    minute: int
+    second: int
+    nanosecond: int
+
+
+@dataclass(frozen=True)
+class DataclassNepaliMonthCalendar:
+    year: int
+    month: int
+    total_days_in_month: int
+    first_day_of_month: int
+    last_day_of_month: int
+    days_from_start_of_week_to_first_of_month: int = field(init=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, 'days_from_start_of_week_to_first_of_month', self.first_day_of_month - 1)
+
+
+@dataclass(frozen=True)
+class DataclassCustomCalendar:
+    year: int
+    month: int
+    day_of_month: int
+    era: int
+    first_day_of_month: int
+    last_day_of_month: int
+    total_days_in_month: int
+    day_of_week_in_month: int = -1
+    day_of_week: int = -1
+    day_of_year: int = -1
+    week_of_month: int = -1
+    week_of_year: int = -1
+
+
+# Same field values, so that only the containers differ; the ints are small and cached by Python
+CASES = (
+    ("SimpleDate", DataclassSimpleDate, SimpleDate, lambda cls: cls(81, 1, 15), lambda cls: cls(81, 1, 15)),
+    ("SimpleTime", DataclassSimpleTime, SimpleTime, lambda cls: cls(9, 45, 30, 0), lambda cls: cls(9, 45, 30, 0)),
+    (
+        "NepaliMonthCalendar",
+        DataclassNepaliMonthCalendar,
+        NepaliMonthCalendar,
+        lambda cls: cls(81, 1, 31, 7, 2),
+        lambda cls: cls(81, 1, 31, 7, 2),
+    ),
+    (
+        "CustomCalendar",
+        DataclassCustomCalendar,
+        CustomCalendar,
+        lambda cls: cls(
+            year=81, month=1, day_of_month=15, day_of_week_in_month=3, day_of_week=7, week_of_year=3, week_of_month=3,
+            day_of_year=15, first_day_of_month=7, last_day_of_month=2, total_days_in_month=31, era=2
+        ),
+        lambda cls: cls(
+            year=81, month=1, day_of_month=15, day_of_week=7, day_of_year=15, first_day_of_month=7,
+            last_day_of_month=2, total_days_in_month=31, era=2
+        ),
+    ),
+)
+
+
+def bytes_per_instance(build) -> float:
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    instances = [build() for _ in range(INSTANCE_COUNT)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # Leave out the list holding the instances
+    return (after - before - instances.__sizeof__()) / INSTANCE_COUNT
+
+
+def usec_per_instance(build) -> float:
+    return min(timeit.repeat(build, repeat=REPEAT, number=NUMBER)) / NUMBER * 1e6
+
+
+def main():
+    print(f"{'class':>20} {'dataclass B':>12} {'slotted B':>10} {'dataclass usec':>15} {'slotted usec':>13}")
+
+    for name, dataclass_class, slotted_class, build_dataclass, build_slotted in CASES:
+        dataclass_bytes = bytes_per_instance(lambda: build_dataclass(dataclass_class))
+        slotted_bytes = bytes_per_instance(lambda: build_slotted(slotted_class))
+        dataclass_usec = usec_per_instance(lambda: build_dataclass(dataclass_class))
+        slotted_usec = usec_per_instance(lambda: build_slotted(slotted_class))
+        print(f"{name:>20} {dataclass_bytes:>12.0f} {slotted_bytes:>10.0f} {dataclass_usec:>15.3f} {slotted_usec:>13.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,19 @@
-from nepali_calendar_utils.calendar_model.nepali_date_converter import NepaliDateConverter
-from nepali_calendar_utils.calendar_model.nepali_calendar_defaults import *
-from nepali_calendar_utils.data.custom_calendar import *
-from nepali_calendar_utils.data.nepali_date_locale import *
+from importlib import import_module
+
+# Same as `typing.TYPE_CHECKING`, without importing typing at runtime
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from nepali_calendar_utils.calendar_model.nepali_date_converter import NepaliDateConverter
+    from nepali_calendar_utils.calendar_model.nepali_calendar_defaults import NepaliCalendarDefaults
+    from nepali_calendar_utils.calendar_model.nepali_clock import NepaliClock
+    from nepali_calendar_utils.calendar_model.conversion_cache import ConversionCacheInfo
+    from nepali_calendar_utils.calendar_model.nepali_date_formatter import NepaliDateFormatter
+    from nepali_calendar_utils.calendar_model.nepali_date_parser import NepaliDateParser
+    from nepali_calendar_utils.calendar_model.nepali_date_recognizer import NepaliDateRecognizer
+    from nepali_calendar_utils.data.custom_calendar import *
+    from nepali_calendar_utils.data.nepali_date import NepaliDate
+    from nepali_calendar_utils.data.nepali_date_array import NepaliDateArray
+    from nepali_calendar_utils.data.nepali_date_locale import *
 
 __all__ = [
     "NameFormat",
@@ -15,5 +27,64 @@ __all__ = [
     "SimpleDate",
     "SimpleTime",
     "NepaliMonthCalendar",
+    "RecognizedNepaliDate",
+    "NepaliDate",
+    "NepaliDateArray",
     "NepaliDateConverter",
-]
\ No newline at end of file
+    "NepaliClock",
+    "ConversionCacheInfo",
+    "NepaliDateFormatter",
+    "NepaliDateParser",
+    "NepaliDateRecognizer",
+]
+
+# Public names are imported from their modules on first access, so `import nepali_calendar_utils` stays cheap
+# and only the parts of the package a caller actually uses get loaded.
+_lazy_attribute_modules = {
+    "NameFormat": "nepali_calendar_utils.data.nepali_date_locale",
+    "NepaliDateFormatStyle": "nepali_calendar_utils.data.nepali_date_locale",
+    "NepaliWeekdayName": "nepali_calendar_utils.data.nepali_date_locale",
+    "NepaliMonthName": "nepali_calendar_utils.data.nepali_date_locale",
+    "NepaliCalendarUtilsLang": "nepali_calendar_utils.data.nepali_date_locale",
+    "NepaliDateLocale": "nepali_calendar_utils.data.nepali_date_locale",
+    "nepali_weekdays": "nepali_calendar_utils.data.nepali_date_locale",
+    "english_weekdays": "nepali_calendar_utils.data.nepali_date_locale",
+    "nepali_months": "nepali_calendar_utils.data.nepali_date_locale",
+    "nepali_months_in_english": "nepali_calendar_utils.data.nepali_date_locale",
+    "english_months_in_english": "nepali_calendar_utils.data.nepali_date_locale",
+    "english_months_in_nepali": "nepali_calendar_utils.data.nepali_date_locale",
+    "nepali_month_spelling_variants": "nepali_calendar_utils.data.nepali_date_locale",
+    "NepaliCalendarDefaults": "nepali_calendar_utils.calendar_model.nepali_calendar_defaults",
+    "CustomCalendar": "nepali_calendar_utils.data.custom_calendar",
+    "CustomDateTime": "nepali_calendar_utils.data.custom_calendar",
+    "SimpleDate": "nepali_calendar_utils.data.custom_calendar",
+    "SimpleTime": "nepali_calendar_utils.data.custom_calendar",
+    "NepaliMonthCalendar": "nepali_calendar_utils.data.custom_calendar",
+    "RecognizedNepaliDate": "nepali_calendar_utils.data.custom_calendar",
+    "NepaliDate": "nepali_calendar_utils.data.nepali_date",
+    "NepaliDateArray": "nepali_calendar_utils.data.nepali_date_array",
+    "NepaliDateConverter": "nepali_calendar_utils.calendar_model.nepali_date_converter",
+    "NepaliClock": "nepali_calendar_utils.calendar_model.nepali_clock",
+    "ConversionCacheInfo": "nepali_calendar_utils.calendar_model.conversion_cache",
+    "NepaliDateFormatter": "nepali_calendar_utils.calendar_model.nepali_date_formatter",
+    "NepaliDateParser": "nepali_calendar_utils.calendar_model.nepali_date_parser",
+    "NepaliDateRecognizer": "nepali_calendar_utils.calendar_model.nepali_date_recognizer",
+}
+
+_lazy_submodules = ("calendar_model", "data")
+
+
+def __getattr__(name: str):
+    if name in _lazy_attribute_modules:
+        value = getattr(import_module(_lazy_attribute_modules[name]), name)
+    elif name in _lazy_submodules:
+        value = import_module(f"{__name__}.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_attribute_modules) | set(_lazy_submodules))
@@ -0,0 +1,5 @@
+import sys
+from nepali_calendar_utils.cli import main
+
+if __name__ == "__main__":
+    sys.exit(main())
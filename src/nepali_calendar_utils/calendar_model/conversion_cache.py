@@ -0,0 +1,100 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+from typing import Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class ConversionCacheInfo:
+    """
+    Statistics of a ConversionCache, e.g. to export as metrics.
+
+    Attributes:
+        hits (int): Number of conversions answered from the cache.
+        misses (int): Number of conversions that had to be computed.
+        evictions (int): Number of entries dropped to stay within `maxsize`.
+        maxsize (int): Maximum number of entries. 0 when caching is disabled.
+        currsize (int): Current number of entries.
+    """
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Returns the share of lookups answered from the cache, between 0 and 1.
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ConversionCache:
+    """
+    Bounded least-recently-used cache of date conversions, safe to share between threads.
+
+    Entries are keyed by the conversion function and its arguments, so one cache serves several conversions.
+    A miss is computed outside the lock, so a slow conversion never blocks lookups from other threads; two threads
+    missing the same key at once both compute it, which is harmless as conversions have no side effects. Failed
+    conversions (e.g. out of range dates) raise as usual and are not cached.
+
+    Args:
+        maxsize (int): Maximum number of entries. The least recently used entry is evicted to make room.
+
+    Raises:
+        ValueError: If `maxsize` is less than 1.
+    """
+
+    def __init__(self, maxsize: int):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1.")
+
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_convert(self, convert: Callable[..., T], *args: Hashable) -> T:
+        """
+        Returns `convert(*args)`, from the cache when it was computed before.
+        """
+        key = (convert, *args)
+
+        with self.lock:
+            value = self.entries.get(key)
+            if value is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return value
+
+            self.misses += 1
+
+        value = convert(*args)
+
+        with self.lock:
+            self.entries[key] = value
+            if len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+        return value
+
+    def cache_info(self) -> ConversionCacheInfo:
+        with self.lock:
+            return ConversionCacheInfo(self.hits, self.misses, self.evictions, self.maxsize, len(self.entries))
+
+    def cache_clear(self):
+        """
+        Removes every entry and resets the statistics.
+        """
+        with self.lock:
+            self.entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
@@ -1,7 +1,7 @@
-from typing import Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from nepali_calendar_utils.calendar_model.nepali_calendar_defaults import *
-from nepali_calendar_utils.data.nepali_year_month_map import *
 from nepali_calendar_utils.data.custom_calendar import *
+from nepali_calendar_utils.calendar_model.nepali_ordinal_index import NepaliOrdinalIndex
 from datetime import date
 
 class DateConverters:
@@ -10,185 +10,226 @@ class DateConverters:
     min_english_year = NepaliCalendarDefaults.EnglishYearRange[0]
     max_english_year = NepaliCalendarDefaults.EnglishYearRange[-1]
 
+    english_days_in_month = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+    english_days_in_month_of_leap_year = (0, 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+    nepali_month_calendars = None
+
+    # Shared CustomCalendar of the days converted so far, by day ordinal, so that repeated conversions of a day
+    # return the same instance. Each pool keeps at most `calendar_pool_maxsize` days, so iterating over long
+    # ranges does not grow memory without bound; days converted once a pool is full are built as new instances.
+    # preload_calendars() lifts the limit and fills both pools with every supported day.
+    default_calendar_pool_maxsize = 4096
+    calendar_pool_maxsize = default_calendar_pool_maxsize
+    nepali_calendars_by_ordinal: Dict[int, CustomCalendar] = {}
+    english_calendars_by_ordinal: Dict[int, CustomCalendar] = {}
+
     @staticmethod
     def get_total_days_in_nepali_month(nepaliYYYY: int, nepaliMM: int) -> int:
-        return days_in_month_map[nepaliYYYY][nepaliMM]
+        return NepaliOrdinalIndex.get_days_in_month(nepaliYYYY, nepaliMM)
 
     @staticmethod
     def convert_to_nepali_calendar(englishYYYY: int, englishMM: int, englishDD: int) -> CustomCalendar:
+        english_ordinal = DateConverters.get_english_ordinal(englishYYYY, englishMM, englishDD)
+
+        return DateConverters.get_nepali_calendar_from_ordinal(english_ordinal)
+
+    @staticmethod
+    def convert_many_to_nepali_calendar(english_dates: Iterable[Tuple[int, int, int]]) -> List[CustomCalendar]:
+        english_ordinals = [
+            DateConverters.get_english_ordinal(englishYYYY, englishMM, englishDD)
+            for englishYYYY, englishMM, englishDD in english_dates
+        ]
+
+        if not english_ordinals:
+            return []
+
+        # Resolve each distinct date once, walking the sorted ordinals and the month table together.
+        distinct_ordinals = sorted(set(english_ordinals))
+        month_start_ordinals = NepaliOrdinalIndex.month_start_ordinals
+        month_index = NepaliOrdinalIndex.ordinal_to_month_index(distinct_ordinals[0])
+
+        nepali_calendars = {}
+        for ordinal in distinct_ordinals:
+            while ordinal >= month_start_ordinals[month_index + 1]:
+                month_index += 1
+            nepali_calendars[ordinal] = DateConverters.get_nepali_calendar_from_ordinal(ordinal, month_index)
+
+        return [nepali_calendars[ordinal] for ordinal in english_ordinals]
+
+    @staticmethod
+    def get_english_ordinal(englishYYYY: int, englishMM: int, englishDD: int) -> int:
         if not DateConverters.is_english_date_in_conversion_range(englishYYYY, englishMM, englishDD):
             raise ValueError(f"Out of Range: English year {englishYYYY} is out of range to convert.")
 
-        starting_english_date, starting_nepali_calendar = DateConverters.initialize_starting_dates(
-            englishYYYY, False
-        )
+        english_ordinal = date(englishYYYY, englishMM, englishDD).toordinal()
 
-        english_base_date = date(
-            year=starting_english_date.year,
-            month=starting_english_date.month,
-            day=starting_english_date.day_of_month
-        )
+        if not NepaliOrdinalIndex.is_ordinal_in_range(english_ordinal):
+            raise ValueError(f"Out of Range: English date {englishYYYY}-{englishMM}-{englishDD} is out of range to convert.")
 
-        target_english_date = date(
-            year=englishYYYY,
-            month=englishMM,
-            day=englishDD
-        )
+        return english_ordinal
 
-        total_days_difference = (target_english_date - english_base_date).days
+    @staticmethod
+    def get_year_month_day(date_like) -> Tuple[int, int, int]:
+        if isinstance(date_like, date):
+            return date_like.year, date_like.month, date_like.day
+        if isinstance(date_like, (SimpleDate, CustomCalendar)):
+            return date_like.year, date_like.month, date_like.day_of_month
 
-        nepaliYYYY, nepaliMM, nepaliDD = (
-            starting_nepali_calendar.year,
-            starting_nepali_calendar.month,
-            starting_nepali_calendar.day_of_month
-        )
-        day_of_week = starting_nepali_calendar.day_of_week
+        year, month, day_of_month = date_like
+        return year, month, day_of_month
 
-        day_of_year = starting_nepali_calendar.day_of_year
-        week_of_year = starting_nepali_calendar.week_of_year
-        week_of_month = starting_nepali_calendar.week_of_month
+    @staticmethod
+    def get_nepali_calendar_from_ordinal(ordinal: int, month_index: Optional[int] = None) -> CustomCalendar:
+        nepali_calendars = DateConverters.nepali_calendars_by_ordinal
+        nepali_calendar = nepali_calendars.get(ordinal)
+        if nepali_calendar is None:
+            nepali_calendar = DateConverters.create_nepali_calendar_from_ordinal(ordinal, month_index)
+            if len(nepali_calendars) < DateConverters.calendar_pool_maxsize:
+                # setdefault keeps the first instance stored if another thread built the same day meanwhile
+                nepali_calendar = nepali_calendars.setdefault(ordinal, nepali_calendar)
 
-        first_day_of_month = starting_nepali_calendar.first_day_of_month
-        last_day_of_month = starting_nepali_calendar.last_day_of_month
+        return nepali_calendar
 
-        total_days_in_month = days_in_month_map[nepaliYYYY][nepaliMM]
+    @staticmethod
+    def create_nepali_calendar_from_ordinal(ordinal: int, month_index: Optional[int] = None) -> CustomCalendar:
+        if month_index is None:
+            month_index = NepaliOrdinalIndex.ordinal_to_month_index(ordinal)
 
-        for _ in range(total_days_difference):
-            nepaliDD += 1
-            day_of_year += 1
-            day_of_week += 1
-            
-            if day_of_week > 7:
-                day_of_week = 1
-                week_of_year += 1
-                week_of_month += 1
+        year_offset, month_offset = divmod(month_index, 12)
 
-            if nepaliDD > total_days_in_month:
-                nepaliMM += 1
-                nepaliDD = 1
+        nepaliYYYY = NepaliOrdinalIndex.years.start + year_offset
+        nepaliMM = month_offset + 1
 
-                if nepaliMM > 12:
-                    nepaliYYYY += 1
-                    nepaliMM = 1
-                    day_of_year = 1
-                    week_of_year = 1
+        month_start_ordinal = NepaliOrdinalIndex.month_start_ordinals[month_index]
+        year_start_ordinal = NepaliOrdinalIndex.month_start_ordinals[month_index - month_offset]
 
-                week_of_month = 1
-                total_days_in_month = days_in_month_map[nepaliYYYY][nepaliMM]
-                first_day_of_month = day_of_week
+        nepaliDD = ordinal - month_start_ordinal + 1
+        day_of_year = ordinal - year_start_ordinal + 1
+        total_days_in_month = NepaliOrdinalIndex.month_start_ordinals[month_index + 1] - month_start_ordinal
 
-            remaining_days = total_days_in_month - nepaliDD
-            last_day_of_month = (day_of_week + remaining_days) % 7 or 7
+        first_day_of_month = NepaliOrdinalIndex.get_day_of_week(month_start_ordinal)
 
+        # day_of_week_in_month, week_of_month and week_of_year are derived by CustomCalendar when read
         return CustomCalendar(
             year=nepaliYYYY,
             month=nepaliMM,
             day_of_month=nepaliDD,
-            day_of_week_in_month=(nepaliDD - 1) // 7 + 1,
-            day_of_week=day_of_week,
-            week_of_year=week_of_year,
-            week_of_month=week_of_month,
+            day_of_week=NepaliOrdinalIndex.get_day_of_week(ordinal),
             day_of_year=day_of_year,
             first_day_of_month=first_day_of_month,
-            last_day_of_month=last_day_of_month,
+            last_day_of_month=NepaliOrdinalIndex.get_day_of_week(month_start_ordinal + total_days_in_month - 1),
             total_days_in_month=total_days_in_month,
             era=2
         )
         
+    @staticmethod
+    def iter_nepali_calendars(start_date, end_date, step: int = 1, with_english_date: bool = False) -> Iterator:
+        if step == 0:
+            raise ValueError("step must not be zero.")
+
+        # Checked here rather than in the generator, so that a bad range raises when called, not on first use
+        start_ordinal = DateConverters.get_checked_nepali_ordinal(*DateConverters.get_year_month_day(start_date))
+        end_ordinal = DateConverters.get_checked_nepali_ordinal(*DateConverters.get_year_month_day(end_date))
+
+        return DateConverters.generate_nepali_calendars_from_ordinals(start_ordinal, end_ordinal, step, with_english_date)
+
+    @staticmethod
+    def get_checked_nepali_ordinal(nepali_yyyy: int, nepali_mm: int, nepali_dd: int) -> int:
+        nepali_ordinal = DateConverters.get_nepali_ordinal(nepali_yyyy, nepali_mm, nepali_dd)
+
+        if nepali_dd > NepaliOrdinalIndex.get_days_in_month(nepali_yyyy, nepali_mm):
+            raise ValueError(f"Day {nepali_dd} is out of range for month {nepali_mm}.")
+
+        return nepali_ordinal
+
+    @staticmethod
+    def generate_nepali_calendars_from_ordinals(
+        start_ordinal: int, end_ordinal: int, step: int, with_english_date: bool
+    ) -> Iterator:
+        month_start_ordinals = NepaliOrdinalIndex.month_start_ordinals
+        month_index = NepaliOrdinalIndex.ordinal_to_month_index(start_ordinal)
+
+        for ordinal in range(start_ordinal, end_ordinal + (1 if step > 0 else -1), step):
+            while ordinal >= month_start_ordinals[month_index + 1]:
+                month_index += 1
+            while ordinal < month_start_ordinals[month_index]:
+                month_index -= 1
+
+            nepali_calendar = DateConverters.get_nepali_calendar_from_ordinal(ordinal, month_index)
+
+            if with_english_date:
+                yield nepali_calendar, date.fromordinal(ordinal)
+            else:
+                yield nepali_calendar
+
     @staticmethod
     def convert_to_english_calendar(nepali_yyyy: int, nepali_mm: int, nepali_dd: int) -> CustomCalendar:
-        if not DateConverters.is_nepali_calendar_in_conversion_range(nepali_yyyy, nepali_mm, nepali_dd):
-            raise ValueError(f"Out of Range: Nepali year {nepali_yyyy} is out of range to convert.")
+        nepali_ordinal = DateConverters.get_nepali_ordinal(nepali_yyyy, nepali_mm, nepali_dd)
 
-        starting_english_date, starting_nepali_calendar = DateConverters.initialize_starting_dates(nepali_yyyy, True)
+        return DateConverters.get_english_calendar_from_ordinal(nepali_ordinal)
 
-        total_nep_days_count = DateConverters.calculate_total_nepali_days_count(
-            starting_nepali_calendar, nepali_yyyy, nepali_mm, nepali_dd
-        )
+    @staticmethod
+    def convert_many_to_english_calendar(nepali_dates: Iterable[Tuple[int, int, int]], as_date: bool = False) -> list:
+        nepali_ordinals = [
+            DateConverters.get_nepali_ordinal(nepali_yyyy, nepali_mm, nepali_dd)
+            for nepali_yyyy, nepali_mm, nepali_dd in nepali_dates
+        ]
 
-        english_yyyy, english_mm, english_dd = (
-            starting_english_date.year,
-            starting_english_date.month,
-            starting_english_date.day_of_month,
-        )
+        to_english = date.fromordinal if as_date else DateConverters.get_english_calendar_from_ordinal
+        english_dates = {ordinal: to_english(ordinal) for ordinal in set(nepali_ordinals)}
 
-        day_of_week = starting_english_date.day_of_week
-        day_of_year = starting_english_date.day_of_year
-        week_of_year = starting_english_date.week_of_year
-        week_of_month = starting_english_date.week_of_month
+        return [english_dates[ordinal] for ordinal in nepali_ordinals]
 
-        first_day_of_month = starting_english_date.first_day_of_month
-        last_day_of_month = starting_english_date.last_day_of_month
+    @staticmethod
+    def get_nepali_ordinal(nepali_yyyy: int, nepali_mm: int, nepali_dd: int) -> int:
+        if not DateConverters.is_nepali_calendar_in_conversion_range(nepali_yyyy, nepali_mm, nepali_dd):
+            raise ValueError(f"Out of Range: Nepali year {nepali_yyyy} is out of range to convert.")
 
-        total_days_in_month = DateConverters.get_total_days_in_english_month(english_yyyy, english_mm)
+        nepali_ordinal = NepaliOrdinalIndex.nepali_to_ordinal(nepali_yyyy, nepali_mm, nepali_dd)
+        # Days past the end of the last supported month would roll over into dates the tables don't cover
+        if not NepaliOrdinalIndex.is_ordinal_in_range(nepali_ordinal):
+            raise ValueError(f"Out of Range: Nepali date {nepali_yyyy}-{nepali_mm}-{nepali_dd} is out of range to convert.")
 
-        for _ in range(total_nep_days_count):
-            english_dd += 1
-            day_of_week += 1
-            day_of_year += 1
+        return nepali_ordinal
 
-            if day_of_week > 7:
-                day_of_week = 1
-                week_of_year += 1
-                week_of_month += 1
+    @staticmethod
+    def get_english_calendar_from_ordinal(ordinal: int) -> CustomCalendar:
+        english_calendars = DateConverters.english_calendars_by_ordinal
+        english_calendar = english_calendars.get(ordinal)
+        if english_calendar is None:
+            english_calendar = DateConverters.create_english_calendar_from_ordinal(ordinal)
+            if len(english_calendars) < DateConverters.calendar_pool_maxsize:
+                english_calendar = english_calendars.setdefault(ordinal, english_calendar)
 
-            if english_dd > total_days_in_month:
-                english_mm += 1
-                english_dd = 1
-                week_of_month = 1
+        return english_calendar
 
-                if english_mm > 12:
-                    english_yyyy += 1
-                    english_mm = 1
-                    day_of_year = 1
-                    week_of_year = 1
+    @staticmethod
+    def create_english_calendar_from_ordinal(ordinal: int) -> CustomCalendar:
+        english_date = date.fromordinal(ordinal)
+        english_yyyy, english_mm, english_dd = english_date.year, english_date.month, english_date.day
 
-                total_days_in_month = DateConverters.get_total_days_in_english_month(english_yyyy, english_mm)
-                first_day_of_month = day_of_week
+        month_start_ordinal = ordinal - english_dd + 1
+        year_start_ordinal = date(english_yyyy, 1, 1).toordinal()
 
-            remaining_days_of_the_month = total_days_in_month - english_dd
-            last_day_of_month = (day_of_week + remaining_days_of_the_month) % 7
+        day_of_year = ordinal - year_start_ordinal + 1
+        total_days_in_month = DateConverters.get_total_days_in_english_month(english_yyyy, english_mm)
 
-            if last_day_of_month == 0:
-                last_day_of_month = 7
+        first_day_of_month = NepaliOrdinalIndex.get_day_of_week(month_start_ordinal)
 
         return CustomCalendar(
             year=english_yyyy,
             month=english_mm,
             day_of_month=english_dd,
             first_day_of_month=first_day_of_month,
-            last_day_of_month=last_day_of_month,
-            day_of_week=day_of_week,
-            day_of_week_in_month=(english_dd - 1) // 7 + 1,
+            last_day_of_month=NepaliOrdinalIndex.get_day_of_week(month_start_ordinal + total_days_in_month - 1),
+            day_of_week=NepaliOrdinalIndex.get_day_of_week(ordinal),
             day_of_year=day_of_year,
-            week_of_month=week_of_month,
-            week_of_year=week_of_year,
             total_days_in_month=total_days_in_month,
             era=1,  # For English Date, the era is always 1 (for this library)
         )
 
      
-    @staticmethod   
-    def initialize_starting_dates(target_year: int, is_nepali_date: bool) -> tuple:
-        reference_date = (
-            nepali_date_map.get(target_year - 1)
-            if is_nepali_date
-            else english_date_map.get(target_year - 1)
-        )
-
-        starting_english_date = (
-            reference_date.englishDate
-            if reference_date and reference_date.englishDate
-            else NepaliCalendarDefaults.startingEnglishCalendar
-        )
-        starting_nepali_calendar = (
-            reference_date.nepaliDate
-            if reference_date and reference_date.nepaliDate
-            else NepaliCalendarDefaults.startingNepaliCalendar
-        )
-
-        return starting_english_date, starting_nepali_calendar
-
     @staticmethod
     def calculate_english_days_difference(starting_date: date, target_date: date) -> int:
         return (target_date - starting_date).days
@@ -198,19 +239,12 @@ class DateConverters:
     def calculate_total_nepali_days_count(
         starting_nepali_calendar: CustomCalendar, nepali_yyyy: int, nepali_mm: int, nepali_dd: int
     ) -> int:
-        total_nep_days_count = 0
-
-        for year in range(starting_nepali_calendar.year, nepali_yyyy):
-            days_in_year = days_in_month_map[year]
-            for month in range(1, 13):
-                total_nep_days_count += days_in_year[month]
-
-        for month in range(starting_nepali_calendar.month, nepali_mm):
-            total_nep_days_count += days_in_month_map[nepali_yyyy][month]
-
-        total_nep_days_count += nepali_dd - starting_nepali_calendar.day_of_month
-
-        return total_nep_days_count
+        return (
+            NepaliOrdinalIndex.nepali_to_ordinal(nepali_yyyy, nepali_mm, nepali_dd)
+            - NepaliOrdinalIndex.nepali_to_ordinal(
+                starting_nepali_calendar.year, starting_nepali_calendar.month, starting_nepali_calendar.day_of_month
+            )
+        )
 
     @staticmethod
     def get_nepali_month(nepali_year: int, nepali_month: int, added_months_count: int) -> NepaliMonthCalendar:
@@ -263,25 +297,23 @@ class DateConverters:
 
     @staticmethod
     def nepali_days_in_between(start_date: SimpleDate, end_date: SimpleDate) -> int:
-        if start_date.year > end_date.year:
-            return -DateConverters.nepali_days_in_between(end_date, start_date)
+        start_year, start_month, start_day = DateConverters.get_year_month_day(start_date)
+        end_year, end_month, end_day = DateConverters.get_year_month_day(end_date)
 
         if not (
-            DateConverters.is_nepali_calendar_in_conversion_range(
-                start_date.year, start_date.month, start_date.day_of_month
-            )
-            and DateConverters.is_nepali_calendar_in_conversion_range(
-                end_date.year, end_date.month, end_date.day_of_month
-            )
+            DateConverters.is_nepali_calendar_in_conversion_range(start_year, start_month, start_day)
+            and DateConverters.is_nepali_calendar_in_conversion_range(end_year, end_month, end_day)
         ):
-            raise ValueError(
-                f"Out of range: Start year {start_date.year} or end year {end_date.year}."
-            )
+            raise ValueError(f"Out of range: Start year {start_year} or end year {end_year}.")
 
-        start_offset = DateConverters.calculate_day_offset(start_date.year, start_date.year, start_date.month) + start_date.day_of_month
-        end_offset = DateConverters.calculate_day_offset(start_date.year, end_date.year, end_date.month) + end_date.day_of_month
+        return (
+            NepaliOrdinalIndex.nepali_to_ordinal(end_year, end_month, end_day)
+            - NepaliOrdinalIndex.nepali_to_ordinal(start_year, start_month, start_day)
+        )
 
-        return end_offset - start_offset
+    @staticmethod
+    def nepali_days_in_between_many(date_pairs: Iterable[Tuple[SimpleDate, SimpleDate]]) -> List[int]:
+        return [DateConverters.nepali_days_in_between(start_date, end_date) for start_date, end_date in date_pairs]
 
     @staticmethod
     def get_custom_calendar_using_day_month_year(year: int, month: int, day_of_month: int, adjust_month: bool) -> CustomCalendar:
@@ -294,65 +326,27 @@ class DateConverters:
                 raise ValueError(f"Day {day_of_month} is out of range for month {month}.")
             new_day_of_month = day_of_month
 
-        normalized_day_of_week = 7 if (month_details.first_day_of_month + new_day_of_month - 1) % 7 == 0 else (month_details.first_day_of_month + new_day_of_month - 1) % 7
-        total_day_of_year = DateConverters.calculate_day_of_year(year, month, new_day_of_month)
+        if new_day_of_month < 1:
+            raise ValueError(f"Day {day_of_month} is out of range for month {month}.")
 
-        return CustomCalendar(
-            year=year,
-            month=month,
-            day_of_month=new_day_of_month,
-            total_days_in_month=month_details.total_days_in_month,
-            first_day_of_month=month_details.first_day_of_month,
-            last_day_of_month=month_details.last_day_of_month,
-            day_of_week_in_month=(new_day_of_month - 1) // 7 + 1,
-            day_of_week=normalized_day_of_week,
-            era=2,
-            day_of_year=total_day_of_year,
-            week_of_month=DateConverters.calculate_week_of_month(
-                day_of_month=day_of_month,
-                first_day_of_month=month_details.first_day_of_month,
-            ),
-            week_of_year=DateConverters.calculate_week_of_year(
-                total_day_of_year,
-                DateConverters.calculate_nepali_month_details(year, 1).first_day_of_month,
-            )
-        )
+        month_index = NepaliOrdinalIndex.get_month_index(year, month)
+        ordinal = NepaliOrdinalIndex.month_start_ordinals[month_index] + new_day_of_month - 1
+
+        return DateConverters.get_nepali_calendar_from_ordinal(ordinal, month_index)
 
     @staticmethod
     def adjust_nepali_date_for_day_adjustments(year: int, month: int, day_of_month: int, days_to_adjust: int) -> CustomCalendar:
-        total_days_in_current_month = (
-            days_in_month_map.get(year, [None])[month]
-            if 1 <= month < len(days_in_month_map.get(year, [None]))
-            else None
-        )
-        if total_days_in_current_month is None:
+        if year not in NepaliOrdinalIndex.years or not 1 <= month <= 12:
             raise ValueError(f"Invalid year {year} or month {month}.")
 
-        if 1 <= day_of_month + days_to_adjust <= total_days_in_current_month:
-            new_day = day_of_month + days_to_adjust
-            return DateConverters.get_custom_calendar_using_day_month_year(year, month, new_day, True)
+        adjusted_ordinal = NepaliOrdinalIndex.nepali_to_ordinal(year, month, day_of_month) + days_to_adjust
 
-        if days_to_adjust > 0:
-            remaining_days = days_to_adjust - (total_days_in_current_month - day_of_month + 1)
-            new_month = month + 1
-            new_year = year + 1 if new_month > 12 else year
-            return DateConverters.adjust_nepali_date_for_day_adjustments(
-                new_year, 1 if new_month > 12 else new_month, 1, remaining_days
-            )
-        else:
-            new_month = month - 1
-            new_year = year - 1 if new_month < 1 else year
-            previous_month_days = days_in_month_map.get(new_year, [])[12 if new_month < 1 else new_month]
-
-            if previous_month_days == 0:
-                raise ValueError(f"Invalid year {new_year} or month {new_month}.")
-
-            return DateConverters.adjust_nepali_date_for_day_adjustments(
-                new_year,
-                12 if new_month < 1 else new_month,
-                previous_month_days,
-                days_to_adjust + day_of_month,
-            )
+        if adjusted_ordinal > NepaliOrdinalIndex.ending_ordinal:
+            raise ValueError(f"Invalid year {DateConverters.max_nepali_year + 1} or month 1.")
+        if adjusted_ordinal < NepaliOrdinalIndex.starting_ordinal:
+            raise ValueError(f"Invalid year {DateConverters.min_nepali_year - 1} or month 12.")
+
+        return DateConverters.get_nepali_calendar_from_ordinal(adjusted_ordinal)
     
     @staticmethod
     def adjust_year_and_month(year: int, month: int) -> Tuple[int, int]:
@@ -373,60 +367,115 @@ class DateConverters:
 
     @staticmethod
     def calculate_nepali_month_details(nepali_year: int, nepali_month: int) -> NepaliMonthCalendar:
-
-        if nepali_year not in days_in_month_map or nepali_month not in range(1, 13):
+        if nepali_year not in NepaliOrdinalIndex.years or nepali_month not in range(1, 13):
             raise ValueError(f"Invalid year {nepali_year} or month provided {nepali_month}.")
-        
-        total_days_in_month = days_in_month_map[nepali_year][nepali_month]
 
-        starting_nepali_calendar = (
-            nepali_date_map.get(nepali_year - 1, {}).nepaliDate 
-            if nepali_date_map.get(nepali_year - 1) else NepaliCalendarDefaults.startingNepaliCalendar
-        )
-        
-        day_offset = DateConverters.calculate_day_offset(starting_nepali_calendar.year, nepali_year, nepali_month)
+        return DateConverters.get_nepali_month_calendars()[NepaliOrdinalIndex.get_month_index(nepali_year, nepali_month)]
 
-        first_day_of_month = (starting_nepali_calendar.first_day_of_month + day_offset) % 7
-        normalized_first_day_of_month = 7 if first_day_of_month == 0 else first_day_of_month
+    @staticmethod
+    def get_nepali_month_calendars() -> Tuple[NepaliMonthCalendar, ...]:
+        """
+        Returns the shared NepaliMonthCalendar of every month in NepaliYearRange, built on first use.
+        The month at position `i` satisfies `month.index_in(NepaliCalendarDefaults.NepaliYearRange) == i`.
+        """
+        if DateConverters.nepali_month_calendars is None:
+            month_start_ordinals = NepaliOrdinalIndex.month_start_ordinals
+            nepali_month_calendars = []
+
+            for month_index in range(len(month_start_ordinals) - 1):
+                nepali_year = NepaliOrdinalIndex.years.start + month_index // 12
+                nepali_month = month_index % 12 + 1
+
+                nepali_month_calendars.append(NepaliMonthCalendar(
+                    year=nepali_year,
+                    month=nepali_month,
+                    first_day_of_month=NepaliOrdinalIndex.get_day_of_week(month_start_ordinals[month_index]),
+                    total_days_in_month=month_start_ordinals[month_index + 1] - month_start_ordinals[month_index],
+                    last_day_of_month=NepaliOrdinalIndex.get_day_of_week(month_start_ordinals[month_index + 1] - 1)
+                ))
+
+            DateConverters.nepali_month_calendars = tuple(nepali_month_calendars)
+
+        return DateConverters.nepali_month_calendars
 
-        normalized_last_day_of_month = ((normalized_first_day_of_month + total_days_in_month - 1) % 7)
-        normalized_last_day_of_month = 7 if normalized_last_day_of_month == 0 else normalized_last_day_of_month
+    @staticmethod
+    def intern_calendar(calendar: Union[CustomCalendar, NepaliMonthCalendar]) -> Union[CustomCalendar, NepaliMonthCalendar]:
+        """
+        Returns the shared instance equal to `calendar`, or `calendar` itself if it has no equal shared instance,
+        e.g. because it is out of the supported range, was built with other field values or its pool is full.
+        """
+        if isinstance(calendar, NepaliMonthCalendar):
+            if calendar.year not in NepaliOrdinalIndex.years or not 1 <= calendar.month <= 12:
+                return calendar
+            shared_calendar = DateConverters.calculate_nepali_month_details(calendar.year, calendar.month)
+        elif calendar.era == 2:
+            if not DateConverters.is_nepali_calendar_in_conversion_range(calendar.year, calendar.month, calendar.day_of_month):
+                return calendar
+            ordinal = NepaliOrdinalIndex.nepali_to_ordinal(calendar.year, calendar.month, calendar.day_of_month)
+            if not NepaliOrdinalIndex.is_ordinal_in_range(ordinal):
+                return calendar
+            shared_calendar = DateConverters.get_nepali_calendar_from_ordinal(ordinal)
+            if ordinal not in DateConverters.nepali_calendars_by_ordinal:
+                return calendar
+        elif calendar.era == 1:
+            try:
+                ordinal = DateConverters.get_english_ordinal(calendar.year, calendar.month, calendar.day_of_month)
+            except ValueError:
+                return calendar
+            shared_calendar = DateConverters.get_english_calendar_from_ordinal(ordinal)
+            if ordinal not in DateConverters.english_calendars_by_ordinal:
+                return calendar
+        else:
+            return calendar
 
-        return NepaliMonthCalendar(
-            year=nepali_year,
-            month=nepali_month,
-            first_day_of_month=normalized_first_day_of_month,
-            total_days_in_month=total_days_in_month,
-            last_day_of_month=normalized_last_day_of_month
-        )
+        return shared_calendar if shared_calendar == calendar else calendar
 
     @staticmethod
-    def calculate_day_offset(starting_year: int, target_year: int, target_month: int) -> int:        
-        for year in range(starting_year, target_year):
-            if year not in days_in_month_map:
-                raise ValueError(f"Year {year} is missing in days_in_month_map.")
-        
-        year_offset = sum(
-            sum(days_in_month_map[year][1:])
-            for year in range(starting_year, target_year)
+    def preload_calendars():
+        """
+        Builds the shared CustomCalendar of every supported day in both calendars, and every NepaliMonthCalendar,
+        so that later conversions only look them up. Lifts `calendar_pool_maxsize` until `clear_calendar_pools()`.
+        """
+        month_start_ordinals = NepaliOrdinalIndex.month_start_ordinals
+        DateConverters.calendar_pool_maxsize = NepaliOrdinalIndex.ending_ordinal - NepaliOrdinalIndex.starting_ordinal + 1
+
+        for month_index in range(len(month_start_ordinals) - 1):
+            for ordinal in range(month_start_ordinals[month_index], month_start_ordinals[month_index + 1]):
+                DateConverters.get_nepali_calendar_from_ordinal(ordinal, month_index)
+                DateConverters.get_english_calendar_from_ordinal(ordinal)
+
+        DateConverters.get_nepali_month_calendars()
+
+    @staticmethod
+    def clear_calendar_pools():
+        """
+        Drops every shared day calendar and restores the default `calendar_pool_maxsize`.
+        """
+        DateConverters.calendar_pool_maxsize = DateConverters.default_calendar_pool_maxsize
+        DateConverters.nepali_calendars_by_ordinal.clear()
+        DateConverters.english_calendars_by_ordinal.clear()
+
+    @staticmethod
+    def calculate_day_offset(starting_year: int, target_year: int, target_month: int) -> int:
+        for year in (starting_year, target_year):
+            if year not in NepaliOrdinalIndex.years:
+                raise ValueError(f"Out of Range: Nepali year {year} is out of range.")
+
+        month_start_ordinals = NepaliOrdinalIndex.month_start_ordinals
+
+        return (
+            month_start_ordinals[NepaliOrdinalIndex.get_month_index(target_year, target_month)]
+            - month_start_ordinals[NepaliOrdinalIndex.get_month_index(starting_year, 1)]
         )
-        
-        if target_year in days_in_month_map:
-            month_offset = sum(days_in_month_map[target_year][1:target_month])
-        else:
-            raise ValueError(f"Target year {target_year} is missing in days_in_month_map.")
-        
-        return year_offset + month_offset
 
     @staticmethod
     def calculate_day_of_year(year: int, month: int, day_of_month: int) -> int:
-        if year not in days_in_month_map:
-            raise ValueError(f"Year {year} is not present in the days_in_month_map.")
-        
-        days_in_year = days_in_month_map[year]
-        month_offset = sum(days_in_year[1:month])
+        if year not in NepaliOrdinalIndex.years:
+            raise ValueError(f"Out of Range: Nepali year {year} is out of range.")
+
+        year_start_ordinal = NepaliOrdinalIndex.month_start_ordinals[NepaliOrdinalIndex.get_month_index(year, 1)]
 
-        return month_offset + day_of_month
+        return NepaliOrdinalIndex.nepali_to_ordinal(year, month, day_of_month) - year_start_ordinal + 1
 
     @staticmethod
     def calculate_week_of_month(day_of_month: int, first_day_of_month: int) -> int:
@@ -443,12 +492,9 @@ class DateConverters:
         if not (1 <= month <= 12):
             raise ValueError(f"Invalid month: {month}. Month must be between 1 and 12.")
         
-        days_in_month = [0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
-        days_in_month_of_leap_year = [0, 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
-
         if DateConverters.is_english_leap_year(year):
-            return days_in_month_of_leap_year[month]
-        return days_in_month[month]
+            return DateConverters.english_days_in_month_of_leap_year[month]
+        return DateConverters.english_days_in_month[month]
 
     @staticmethod
     def is_nepali_calendar_in_conversion_range(nepali_yyyy: int, nepali_mm: int, nepali_dd: int) -> bool:
@@ -0,0 +1,68 @@
+from bisect import bisect_right
+from datetime import datetime, timedelta
+
+
+class KathmanduUtcOffsets:
+    """
+    Precomputed UTC offsets of Asia/Kathmandu, taken from the tz database.
+
+    Kathmandu used local mean time (+05:41:16) until 1920, +05:30 until 1986 and +05:45 since, so converting between
+    UTC and Kathmandu wall-clock time is a lookup in three entries and one naive `datetime` addition. Results match
+    `zoneinfo.ZoneInfo("Asia/Kathmandu")` with `fold=0`: wall-clock times that are repeated (1919-12-31 23:48:44 to
+    midnight) or skipped (1986-01-01 00:00 to 00:15) resolve to the offset in effect before the transition.
+    """
+
+    offsets = (
+        timedelta(hours=5, minutes=41, seconds=16),
+        timedelta(hours=5, minutes=30),
+        timedelta(hours=5, minutes=45),
+    )
+
+    # UTC instants from which `offsets[1]` and `offsets[2]` apply
+    utc_transitions = (
+        datetime(1919, 12, 31, 18, 18, 44),
+        datetime(1985, 12, 31, 18, 30),
+    )
+
+    # Wall-clock times from which `offsets[1]` and `offsets[2]` apply with fold=0,
+    # i.e. each UTC transition shifted by the larger of the two offsets around it
+    local_transitions = tuple(
+        utc_transition + max(offset_before, offset_after)
+        for utc_transition, offset_before, offset_after in zip(utc_transitions, offsets, offsets[1:])
+    )
+
+    @staticmethod
+    def get_utc_offset_of_local(local_date_time: datetime) -> timedelta:
+        """
+        Returns the UTC offset of a naive Kathmandu wall-clock datetime.
+        """
+        return KathmanduUtcOffsets.offsets[bisect_right(KathmanduUtcOffsets.local_transitions, local_date_time)]
+
+    @staticmethod
+    def get_utc_offset_of_utc(utc_date_time: datetime) -> timedelta:
+        """
+        Returns the Kathmandu UTC offset in effect at a naive UTC datetime.
+        """
+        return KathmanduUtcOffsets.offsets[bisect_right(KathmanduUtcOffsets.utc_transitions, utc_date_time)]
+
+    @staticmethod
+    def local_to_utc(local_date_time: datetime) -> datetime:
+        """
+        Converts a naive Kathmandu wall-clock datetime to a naive UTC datetime.
+        """
+        return local_date_time - KathmanduUtcOffsets.get_utc_offset_of_local(local_date_time)
+
+    @staticmethod
+    def utc_to_local(utc_date_time: datetime) -> datetime:
+        """
+        Converts a naive UTC datetime to a naive Kathmandu wall-clock datetime.
+        """
+        return utc_date_time + KathmanduUtcOffsets.get_utc_offset_of_utc(utc_date_time)
+
+    @staticmethod
+    def aware_to_local(aware_date_time: datetime) -> datetime:
+        """
+        Converts a timezone-aware datetime to a naive Kathmandu wall-clock datetime.
+        """
+        utc_date_time = aware_date_time.replace(tzinfo=None) - aware_date_time.utcoffset()
+        return KathmanduUtcOffsets.utc_to_local(utc_date_time)
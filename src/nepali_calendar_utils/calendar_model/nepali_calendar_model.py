@@ -1,59 +1,94 @@
-import re
-from datetime import datetime
-from zoneinfo import ZoneInfo
+from datetime import datetime, tzinfo
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO, Union
 from nepali_calendar_utils.data.custom_calendar import *
 from nepali_calendar_utils.data.nepali_date_locale import *
 from nepali_calendar_utils.calendar_model.date_converters import DateConverters
+from nepali_calendar_utils.calendar_model.nepali_clock import NepaliClock
+from nepali_calendar_utils.calendar_model.conversion_cache import ConversionCache, ConversionCacheInfo
+from nepali_calendar_utils.calendar_model.kathmandu_utc_offsets import KathmanduUtcOffsets
+from nepali_calendar_utils.calendar_model.nepali_date_parser import NepaliDateParser
+from nepali_calendar_utils.calendar_model.nepali_date_recognizer import NepaliDateRecognizer
+from nepali_calendar_utils.calendar_model.nepali_date_formatter import (
+    ENGLISH_DIGITS_TRANSLATION, NEPALI_DIGITS_TRANSLATION, NepaliDateFormatter
+)
 
 class NepaliCalendarModel:
+    # Opt-in cache of single conversions, see `enable_cache`
+    conversion_cache: Optional[ConversionCache] = None
+
     def __init__(self, locale: NepaliDateLocale = NepaliDateLocale()):
         self.locale = locale
-        self.time_zone = ZoneInfo("Asia/Kathmandu")
-        self.local_english_date_time = datetime.now(self.time_zone)
-        
+
+    @property
+    def time_zone(self) -> tzinfo:
+        return NepaliCalendarModel.get_kathmandu_time_zone()
+
+    @property
+    def local_english_date_time(self) -> datetime:
+        return NepaliClock.default.now()
+
+    @staticmethod
+    def get_kathmandu_time_zone() -> tzinfo:
+        return NepaliClock.get_kathmandu_time_zone()
+
     @property
     def today_nepali_calendar(self) -> CustomCalendar:
-        return self.get_nepali_date_instance()
+        return NepaliClock.default.today_nepali_calendar
     
     @property
     def today_english_calendar(self) -> CustomCalendar:
-        today_nepali_calendar = NepaliCalendarModel().today_nepali_calendar
-        return DateConverters.convert_to_english_calendar(nepali_yyyy=today_nepali_calendar.year, nepali_mm=today_nepali_calendar.month, nepali_dd=today_nepali_calendar.day_of_month)
+        return NepaliClock.default.today_english_calendar
 
     @property
     def today_english_simple_date(self) -> SimpleDate:
-        return SimpleDate(
-            year=self.local_english_date_time.year,
-            month=self.local_english_date_time.month,
-            day_of_month=self.local_english_date_time.day,
-        )
+        return NepaliClock.default.today_english_calendar.to_simple_date()
     
     @property
     def current_time(self) -> SimpleTime:
-        now_time = datetime.now(self.time_zone)
-        return SimpleTime(
-            hour=now_time.hour,
-            minute=now_time.minute,
-            second=now_time.second,
-            nanosecond=now_time.microsecond * 1000,  # Convert microseconds to nanoseconds
-        )
+        return NepaliClock.default.current_time
 
     def get_nepali_date_instance(self) -> CustomCalendar:
-        return DateConverters.convert_to_nepali_calendar(
-            englishYYYY=self.local_english_date_time.year,
-            englishMM=self.local_english_date_time.month,
-            englishDD=self.local_english_date_time.day,
-        )
+        return NepaliClock.default.today_nepali_calendar
         
     @staticmethod
     def convert_to_nepali_calendar(english_year, english_month, english_day) -> CustomCalendar:
+        cache = NepaliCalendarModel.conversion_cache
+        if cache is not None:
+            return cache.get_or_convert(
+                DateConverters.convert_to_nepali_calendar, english_year, english_month, english_day
+            )
+
         return DateConverters.convert_to_nepali_calendar(english_year, english_month, english_day)
 
 
+    @staticmethod
+    def convert_many_to_nepali_calendar(english_dates) -> List[CustomCalendar]:
+        return DateConverters.convert_many_to_nepali_calendar(
+            DateConverters.get_year_month_day(english_date) for english_date in english_dates
+        )
+
     @staticmethod
     def convert_to_english_calendar(nepali_year, nepali_month, nepali_day) -> CustomCalendar:
+        cache = NepaliCalendarModel.conversion_cache
+        if cache is not None:
+            return cache.get_or_convert(DateConverters.convert_to_english_calendar, nepali_year, nepali_month, nepali_day)
+
         return DateConverters.convert_to_english_calendar(nepali_year, nepali_month, nepali_day)
 
+    @staticmethod
+    def convert_many_to_english_calendar(nepali_dates, as_date=False) -> list:
+        return DateConverters.convert_many_to_english_calendar(
+            (DateConverters.get_year_month_day(nepali_date) for nepali_date in nepali_dates),
+            as_date
+        )
+
+    @staticmethod
+    def convert_many(dates, to_nepali=True, workers=None, chunk_size=10_000, as_date=False) -> Iterator:
+        # The process pool machinery takes longer to import than the rest of the package, so load it on first use
+        from nepali_calendar_utils.calendar_model.parallel_converters import ParallelConverters
+
+        return ParallelConverters.convert_many(dates, to_nepali, workers, chunk_size, as_date)
+
     @staticmethod
     def get_total_days_in_nepali_month(year, month):
         return DateConverters.get_total_days_in_nepali_month(year, month)
@@ -68,8 +103,46 @@ class NepaliCalendarModel:
 
     @staticmethod
     def get_nepali_calendar(simple_nepali_date):
+        cache = NepaliCalendarModel.conversion_cache
+        if cache is not None:
+            return cache.get_or_convert(DateConverters.get_nepali_calendar, simple_nepali_date)
+
         return DateConverters.get_nepali_calendar(simple_nepali_date)
 
+    @staticmethod
+    def intern_calendar(calendar):
+        return DateConverters.intern_calendar(calendar)
+
+    @staticmethod
+    def preload_calendars():
+        DateConverters.preload_calendars()
+
+    @staticmethod
+    def clear_calendar_pools():
+        DateConverters.clear_calendar_pools()
+
+    @staticmethod
+    def enable_cache(maxsize: int):
+        NepaliCalendarModel.conversion_cache = ConversionCache(maxsize)
+
+    @staticmethod
+    def disable_cache():
+        NepaliCalendarModel.conversion_cache = None
+
+    @staticmethod
+    def cache_info() -> ConversionCacheInfo:
+        cache = NepaliCalendarModel.conversion_cache
+        if cache is None:
+            return ConversionCacheInfo(hits=0, misses=0, evictions=0, maxsize=0, currsize=0)
+
+        return cache.cache_info()
+
+    @staticmethod
+    def cache_clear():
+        cache = NepaliCalendarModel.conversion_cache
+        if cache is not None:
+            cache.cache_clear()
+
     @staticmethod
     def parse(date_string):
         if len(date_string) != 8:
@@ -83,12 +156,33 @@ class NepaliCalendarModel:
             if month < 1 or month > 12 or day < 1 or day > 32:
                 return None  # Invalid month or day
 
-            return DateConverters.get_nepali_calendar({"year": year, "month": month, "day": day})
+            return DateConverters.get_nepali_calendar(SimpleDate(year, month, day))
         except ValueError:
             return None  # Invalid numeric values
         except Exception as e:
             return {"year": year, "month": month, "day": day, "status": -1}  # Error
 
+    @staticmethod
+    def parse_nepali_date(date_string, pattern, language: NepaliCalendarUtilsLang) -> CustomCalendar:
+        return NepaliDateParser.get_parser(NepaliCalendarModel.get_parser_pattern_key(pattern), language).parse(date_string)
+
+    @staticmethod
+    def parse_nepali_date_many(date_strings, pattern, language: NepaliCalendarUtilsLang, as_simple_date=False):
+        parser = NepaliDateParser.get_parser(NepaliCalendarModel.get_parser_pattern_key(pattern), language)
+        return parser.parse_many(date_strings, as_simple_date)
+
+    @staticmethod
+    def get_parser_pattern_key(pattern):
+        return pattern if isinstance(pattern, str) else tuple(pattern)
+
+    @staticmethod
+    def find_nepali_dates(text: str) -> List[RecognizedNepaliDate]:
+        return NepaliDateRecognizer.get_default().find_all(text)
+
+    @staticmethod
+    def find_nepali_dates_many(texts) -> List[List[RecognizedNepaliDate]]:
+        return NepaliDateRecognizer.get_default().find_all_many(texts)
+
     @staticmethod
     def remove_slash_delimiter(date_with_delimiter):
         return date_with_delimiter.replace("/", "")
@@ -109,9 +203,17 @@ class NepaliCalendarModel:
             from_nepali_calendar.year, from_nepali_calendar.month, -subtracted_months_count
         )
         
+    @staticmethod
+    def iter_nepali_dates(start_date, end_date, step: int = 1, with_english_date: bool = False) -> Iterator:
+        return DateConverters.iter_nepali_calendars(start_date, end_date, step, with_english_date)
+
     @staticmethod
     def nepali_days_in_between(start_date, end_date) -> int:
         return DateConverters.nepali_days_in_between(start_date, end_date)
+
+    @staticmethod
+    def nepali_days_in_between_many(date_pairs) -> List[int]:
+        return DateConverters.nepali_days_in_between_many(date_pairs)
         
     @staticmethod
     def format_nepali_date(year, month, day_of_month, day_of_week, locale: NepaliDateLocale) -> str:
@@ -208,7 +310,6 @@ class NepaliCalendarModel:
 
     @staticmethod
     def format_english_date_nepali_time_to_iso_format(english_date: SimpleDate, time: SimpleTime) -> str:
-        kathmandu_tz = ZoneInfo("Asia/Kathmandu")
         local_datetime = datetime(
             english_date.year,
             english_date.month,
@@ -216,15 +317,13 @@ class NepaliCalendarModel:
             time.hour,
             time.minute,
             time.second,
-            time.nanosecond // 1000,
-            tzinfo=kathmandu_tz
-        )    
-        utc_datetime = local_datetime.astimezone(ZoneInfo("UTC"))
-        return utc_datetime.isoformat().replace("+00:00", "Z")
+            time.nanosecond // 1000
+        )
+        utc_datetime = KathmanduUtcOffsets.local_to_utc(local_datetime)
+        return utc_datetime.isoformat() + "Z"
     
     @staticmethod
     def format_nepali_date_time_to_iso_format(nepali_date: SimpleDate, time: SimpleTime) -> str:
-        kathmandu_tz = ZoneInfo("Asia/Kathmandu")
         converted_english_date = NepaliCalendarModel.convert_to_english_calendar(
             nepali_date.year, nepali_date.month, nepali_date.day_of_month
         )
@@ -235,16 +334,23 @@ class NepaliCalendarModel:
             time.hour,
             time.minute,
             time.second,
-            time.nanosecond // 1000,
-            tzinfo=kathmandu_tz
+            time.nanosecond // 1000
         )
-        utc_datetime = local_datetime.astimezone(ZoneInfo("UTC"))
-        return utc_datetime.isoformat().replace("+00:00", "Z")
+        utc_datetime = KathmanduUtcOffsets.local_to_utc(local_datetime)
+        return utc_datetime.isoformat() + "Z"
     
+    @staticmethod
+    def to_kathmandu_local_date_time(instant: datetime) -> datetime:
+        if instant.tzinfo is None:
+            # A naive datetime is taken as system local time, the way `astimezone` treats it
+            return instant.astimezone(NepaliCalendarModel.get_kathmandu_time_zone())
+
+        return KathmanduUtcOffsets.aware_to_local(instant)
+
     @staticmethod
     def get_nepali_date_time_from_iso_format(iso_date_time: str) -> CustomDateTime:
         instant = datetime.fromisoformat(iso_date_time.replace("Z", "+00:00"))
-        local_date_time = instant.astimezone(ZoneInfo("Asia/Kathmandu"))
+        local_date_time = NepaliCalendarModel.to_kathmandu_local_date_time(instant)
 
         nepali_calendar = NepaliCalendarModel.convert_to_nepali_calendar(
             english_year=local_date_time.year,
@@ -263,7 +369,7 @@ class NepaliCalendarModel:
     @staticmethod
     def get_english_date_nepali_time_from_iso_format(iso_date_time: str) -> CustomDateTime:
         instant = datetime.fromisoformat(iso_date_time.replace("Z", "+00:00"))
-        local_date_time = instant.astimezone(ZoneInfo("Asia/Kathmandu"))
+        local_date_time = NepaliCalendarModel.to_kathmandu_local_date_time(instant)
 
         nepali_calendar = NepaliCalendarModel.convert_to_nepali_calendar(
             english_year=local_date_time.year,
@@ -286,53 +392,42 @@ class NepaliCalendarModel:
 
     @staticmethod
     def format_time_by_unicode_pattern(unicode_pattern: str, time: SimpleTime, language: NepaliCalendarUtilsLang=NepaliCalendarUtilsLang.ENGLISH) -> str:
-        calendar_model = NepaliCalendarModel()
-        replacements = calendar_model.get_time_format_replacements(time, language)
-        return calendar_model.apply_replacements(unicode_pattern, replacements)
+        formatter = NepaliDateFormatter.get_formatter(unicode_pattern, language)
+        return formatter.format_with_month_names(None, time, None)
 
     @staticmethod
     def format_english_date_by_unicode_pattern(unicode_pattern: str, calendar: CustomCalendar, language: NepaliCalendarUtilsLang=NepaliCalendarUtilsLang.ENGLISH) -> str:
-        calendar_model = NepaliCalendarModel()
-        replacements = calendar_model.get_date_format_replacements(
-            calendar=calendar,
-            language=language,
-            on_get_month_names=lambda i: language.english_months[i]
-        )
-        return calendar_model.apply_replacements(unicode_pattern, replacements)
+        formatter = NepaliDateFormatter.get_formatter(unicode_pattern, language)
+        return formatter.format_with_month_names(calendar, None, language.english_months)
 
     @staticmethod
     def format_nepali_date_by_unicode_pattern(unicode_pattern: str, calendar: CustomCalendar, language: NepaliCalendarUtilsLang=NepaliCalendarUtilsLang.NEPALI) -> str:
-        calendar_model = NepaliCalendarModel()
-        replacements = calendar_model.get_date_format_replacements(
-            calendar=calendar,
-            language=language,
-            on_get_month_names=lambda i: language.months[i]
-        )
-        return calendar_model.apply_replacements(unicode_pattern, replacements)
+        formatter = NepaliDateFormatter.get_formatter(unicode_pattern, language)
+        return formatter.format_with_month_names(calendar, None, language.months)
 
     @staticmethod
     def format_english_datetime_by_unicode_pattern(unicode_pattern: str, calendar: CustomCalendar, time:SimpleTime=None, language: NepaliCalendarUtilsLang=NepaliCalendarUtilsLang.ENGLISH) -> str:
-        calendar_model = NepaliCalendarModel()
-        replacements = calendar_model.get_date_format_replacements(
-            calendar=calendar,
-            language=language,
-            on_get_month_names=lambda i: language.english_months[i]
-        )
-        if time is not None:
-            replacements.update(calendar_model.get_time_format_replacements(time, language))
-        return calendar_model.apply_replacements(unicode_pattern, replacements)
+        formatter = NepaliDateFormatter.get_formatter(unicode_pattern, language)
+        return formatter.format_with_month_names(calendar, time, language.english_months)
 
     @staticmethod
     def format_nepali_datetime_by_unicode_pattern(unicode_pattern: str, calendar: CustomCalendar, time:SimpleTime=None, language: NepaliCalendarUtilsLang=NepaliCalendarUtilsLang.NEPALI) -> str:
-        calendar_model = NepaliCalendarModel()
-        replacements = calendar_model.get_date_format_replacements(
-            calendar=calendar,
-            language=language,
-            on_get_month_names=lambda i: language.months[i]
-        )
-        if time is not None:
-            replacements.update(calendar_model.get_time_format_replacements(time, language))
-        return calendar_model.apply_replacements(unicode_pattern, replacements)
+        formatter = NepaliDateFormatter.get_formatter(unicode_pattern, language)
+        return formatter.format_with_month_names(calendar, time, language.months)
+
+    @staticmethod
+    def format_many(
+        calendars: Iterable[CustomCalendar],
+        pattern_or_locale: Union[str, NepaliDateLocale],
+        language: NepaliCalendarUtilsLang = NepaliCalendarUtilsLang.NEPALI,
+        output: Optional[TextIO] = None
+    ) -> Union[List[str], int]:
+        if isinstance(pattern_or_locale, NepaliDateLocale):
+            formatter = NepaliDateFormatter.get_locale_formatter(pattern_or_locale)
+        else:
+            formatter = NepaliDateFormatter.get_formatter(pattern_or_locale, language)
+
+        return formatter.format_many(calendars, output)
 
     @staticmethod
     def compare_dates_custom(calendar: CustomCalendar, year, month, day_of_month):
@@ -407,18 +502,42 @@ class NepaliCalendarModel:
         '५': '5', '६': '6', '७': '7', '८': '8', '९': '9'
     }
 
+    # Converted short strings (days, months, years, times) are memoized, as the same few hundred values are
+    # converted over and over. Longer strings and strings beyond the memo size are only translated.
+    SHORT_NUMBER_MAX_LENGTH = 10
+    NUMBER_MEMO_MAX_SIZE = 4096
+    nepali_number_memo: Dict[str, str] = {}
+    english_number_memo: Dict[str, str] = {}
+
     @staticmethod
     def convert_to_nepali_number(string: str):
-        return ''.join(
-            NepaliCalendarModel.NEPALI_DIGITS[int(char)] if '0' <= char <= '9' else char
-            for char in string
-        )
+        converted = NepaliCalendarModel.nepali_number_memo.get(string)
+        if converted is None:
+            converted = string.translate(NEPALI_DIGITS_TRANSLATION)
+            NepaliCalendarModel.memoize_number(NepaliCalendarModel.nepali_number_memo, string, converted)
+
+        return converted
 
     @staticmethod
     def convert_to_english_number(string: str):
-        return ''.join(
-            NepaliCalendarModel.NEPALI_TO_ENGLISH_DIGITS.get(char, char) for char in string
-        )
+        converted = NepaliCalendarModel.english_number_memo.get(string)
+        if converted is None:
+            converted = string.translate(ENGLISH_DIGITS_TRANSLATION)
+            NepaliCalendarModel.memoize_number(NepaliCalendarModel.english_number_memo, string, converted)
+
+        return converted
+
+    @staticmethod
+    def memoize_number(memo: Dict[str, str], string: str, converted: str) -> None:
+        if len(string) <= NepaliCalendarModel.SHORT_NUMBER_MAX_LENGTH and len(memo) < NepaliCalendarModel.NUMBER_MEMO_MAX_SIZE:
+            memo[string] = converted
+
+    @staticmethod
+    def localize_digits(text_chunks: Iterable[str], lang: NepaliCalendarUtilsLang) -> Iterator[str]:
+        translation = NEPALI_DIGITS_TRANSLATION if lang == NepaliCalendarUtilsLang.NEPALI else ENGLISH_DIGITS_TRANSLATION
+
+        for chunk in text_chunks:
+            yield chunk.translate(translation)
 
     @staticmethod
     def get_time_format_replacements(time: SimpleTime, language: NepaliCalendarUtilsLang) -> dict[str, str]:
@@ -503,6 +622,8 @@ class NepaliCalendarModel:
 
     @staticmethod
     def apply_replacements(unicode_pattern: str, replacements: dict[str, str]) -> str:
+        import re
+
         sorted_keys = sorted(replacements.keys(), key=len, reverse=True)
         pattern_regex = re.compile("|".join(map(re.escape, sorted_keys)))
 
@@ -510,11 +631,4 @@ class NepaliCalendarModel:
     
     @staticmethod
     def get_nepali_am_pm(hour: int) -> str:
-        if 3 <= hour <= 11:
-            return "बिहान"
-        elif 12 <= hour <= 16:
-            return "दिउँसो"
-        elif 17 <= hour <= 19:
-            return "साँझ"
-        else:
-            return "राति"
\ No newline at end of file
+        return NepaliDateFormatter.get_nepali_am_pm(hour)
\ No newline at end of file
@@ -0,0 +1,101 @@
+import time
+from datetime import datetime, timedelta, tzinfo
+from typing import Callable, Optional, Tuple
+from nepali_calendar_utils.data.custom_calendar import CustomCalendar, SimpleTime
+from nepali_calendar_utils.calendar_model.date_converters import DateConverters
+
+
+class NepaliClock:
+    """
+    Source of the current date and time in Asia/Kathmandu.
+
+    Today's English and Nepali CustomCalendar are computed once and reused until the Kathmandu date changes, so
+    reading "today" is a single timestamp comparison. `NepaliClock.default` is shared by the whole process and is
+    what NepaliCalendarModel and NepaliDateConverter read.
+
+    Args:
+        time_source (Callable[[], float], optional): Returns the current POSIX timestamp in seconds.
+            Defaults to `time.time`. Pass a fake to control the clock in tests.
+
+    Example:
+        >>> clock = NepaliClock(time_source=lambda: 1713000000.0)  # 2024-04-13 14:55:00 in Kathmandu
+        >>> clock.today_nepali_calendar.to_simple_date()
+        SimpleDate(year=2081, month=1, day_of_month=1)
+    """
+
+    default: "NepaliClock"
+
+    def __init__(self, time_source: Optional[Callable[[], float]] = None):
+        self.time_source = time_source or time.time
+        # (start timestamp, end timestamp, english calendar, nepali calendar) of the cached Kathmandu day
+        self.cached_day: Optional[Tuple[float, float, CustomCalendar, CustomCalendar]] = None
+
+    @staticmethod
+    def get_kathmandu_time_zone() -> tzinfo:
+        # zoneinfo and its tz data are only needed for "now" and the ISO helpers, so load them on first use
+        from zoneinfo import ZoneInfo
+        return ZoneInfo("Asia/Kathmandu")
+
+    def set_time_source(self, time_source: Optional[Callable[[], float]] = None) -> None:
+        """
+        Replaces the time source and drops the cached day. Passing None restores `time.time`.
+        """
+        self.time_source = time_source or time.time
+        self.cached_day = None
+
+    def now(self) -> datetime:
+        """
+        Returns the current aware datetime in Asia/Kathmandu.
+        """
+        return datetime.fromtimestamp(self.time_source(), NepaliClock.get_kathmandu_time_zone())
+
+    @property
+    def current_time(self) -> SimpleTime:
+        now_time = self.now()
+        return SimpleTime(
+            hour=now_time.hour,
+            minute=now_time.minute,
+            second=now_time.second,
+            nanosecond=now_time.microsecond * 1000,
+        )
+
+    @property
+    def today_english_calendar(self) -> CustomCalendar:
+        return self.get_today()[2]
+
+    @property
+    def today_nepali_calendar(self) -> CustomCalendar:
+        return self.get_today()[3]
+
+    def get_today(self) -> Tuple[float, float, CustomCalendar, CustomCalendar]:
+        timestamp = self.time_source()
+        cached_day = self.cached_day
+
+        if cached_day is not None and cached_day[0] <= timestamp < cached_day[1]:
+            return cached_day
+
+        # The cache is replaced with one assignment, so concurrent readers see either the old or the new day.
+        cached_day = NepaliClock.compute_day(timestamp)
+        self.cached_day = cached_day
+        return cached_day
+
+    @staticmethod
+    def compute_day(timestamp: float) -> Tuple[float, float, CustomCalendar, CustomCalendar]:
+        kathmandu_tz = NepaliClock.get_kathmandu_time_zone()
+        local_date = datetime.fromtimestamp(timestamp, kathmandu_tz).date()
+
+        day_start = datetime(local_date.year, local_date.month, local_date.day, tzinfo=kathmandu_tz)
+        next_date = local_date + timedelta(days=1)
+        day_end = datetime(next_date.year, next_date.month, next_date.day, tzinfo=kathmandu_tz)
+
+        ordinal = local_date.toordinal()
+
+        return (
+            day_start.timestamp(),
+            day_end.timestamp(),
+            DateConverters.get_english_calendar_from_ordinal(ordinal),
+            DateConverters.get_nepali_calendar_from_ordinal(ordinal),
+        )
+
+
+NepaliClock.default = NepaliClock()
@@ -1,6 +1,8 @@
 from nepali_calendar_utils.data.custom_calendar import *
 from nepali_calendar_utils.calendar_model.nepali_calendar_model import NepaliCalendarModel
+from nepali_calendar_utils.calendar_model.conversion_cache import ConversionCacheInfo
 from datetime import date
+from typing import Iterable, Iterator, List, Optional, Sequence, TextIO, Tuple, Union
 from nepali_calendar_utils.data.nepali_date_locale import NameFormat, NepaliDateLocale, NepaliCalendarUtilsLang
 
 class NepaliDateConverter:
@@ -47,8 +49,25 @@ class NepaliDateConverter:
         Returns:
             CustomCalendar: Corresponding Nepali date.
         """
-        calendar_model = NepaliCalendarModel()
-        return calendar_model.convert_to_nepali_calendar(english_yyyy, english_mm, english_dd)
+        return NepaliCalendarModel.convert_to_nepali_calendar(english_yyyy, english_mm, english_dd)
+
+    @staticmethod
+    def convert_english_to_nepali_many(english_dates: Iterable[Union[Tuple[int, int, int], date, SimpleDate]]) -> List[CustomCalendar]:
+        """
+        Converts many English dates to Nepali dates in one call.
+
+        Each distinct date is resolved only once, so repeated dates in the input are cheap.
+
+        Args:
+            english_dates (Iterable): English dates as `(year, month, day)` tuples, `datetime.date` or `SimpleDate` objects.
+
+        Returns:
+            List[CustomCalendar]: Corresponding Nepali dates, in the same order as the input.
+
+        Raises:
+            ValueError: If any of the dates is out of the supported conversion range.
+        """
+        return NepaliCalendarModel.convert_many_to_nepali_calendar(english_dates)
 
     @staticmethod
     def convert_nepali_to_english(nepali_yyyy: int, nepali_mm: int, nepali_dd: int) -> CustomCalendar:
@@ -63,8 +82,73 @@ class NepaliDateConverter:
         Returns:
             CustomCalendar: Corresponding English date.
         """
-        calendar_model = NepaliCalendarModel()
-        return calendar_model.convert_to_english_calendar(nepali_yyyy, nepali_mm, nepali_dd)
+        return NepaliCalendarModel.convert_to_english_calendar(nepali_yyyy, nepali_mm, nepali_dd)
+
+    @staticmethod
+    def convert_nepali_to_english_many(
+        nepali_dates: Iterable[Union[Tuple[int, int, int], SimpleDate]],
+        as_date: bool = False
+    ) -> List[Union[CustomCalendar, date]]:
+        """
+        Converts many Nepali dates to English dates in one call.
+
+        Each distinct date is resolved only once, so repeated dates in the input are cheap.
+
+        Args:
+            nepali_dates (Iterable): Nepali dates as `(year, month, day)` tuples or `SimpleDate` objects.
+            as_date (bool): Return plain `datetime.date` objects instead of `CustomCalendar`. Defaults to False.
+
+        Returns:
+            List[CustomCalendar] or List[date]: Corresponding English dates, in the same order as the input.
+
+        Raises:
+            ValueError: If any of the dates is out of the supported conversion range.
+        """
+        return NepaliCalendarModel.convert_many_to_english_calendar(nepali_dates, as_date)
+
+    @staticmethod
+    def convert_many(
+        dates: Iterable[Union[Tuple[int, int, int], date, SimpleDate]],
+        to_nepali: bool = True,
+        workers: Optional[int] = None,
+        chunk_size: int = 10_000,
+        as_date: bool = False
+    ) -> Iterator[Union[CustomCalendar, date]]:
+        """
+        Converts a large stream of dates on several processes, to use every CPU core.
+
+        The input is split into chunks of `chunk_size` dates that are converted on a process pool. Only compact
+        integer buffers are sent between processes, results are produced in input order, and only a few chunks per
+        worker are held in memory at a time, so an iterator over a file of any size can be converted lazily.
+        Use `convert_english_to_nepali_many` or `convert_nepali_to_english_many` for small batches, where starting
+        the processes costs more than it saves. As with any process pool, scripts that call this on Windows or
+        macOS must do so under `if __name__ == "__main__":`.
+
+        Args:
+            dates (Iterable): English dates when `to_nepali` is True, else Nepali dates, as `(year, month, day)`
+                tuples, `datetime.date` or `SimpleDate` objects. Any iterable, consumed lazily.
+            to_nepali (bool): Convert English dates to Nepali dates if True, else Nepali dates to English dates.
+                Defaults to True.
+            workers (int, optional): Number of worker processes. Defaults to the number of CPUs. With 1, the
+                chunks are converted in the calling process.
+            chunk_size (int): Number of dates sent to a worker at a time. Defaults to 10,000.
+            as_date (bool): For Nepali to English conversion, yield plain `datetime.date` objects instead of
+                `CustomCalendar`. Defaults to False.
+
+        Returns:
+            Iterator[CustomCalendar] or Iterator[date]: The converted dates, in the same order as the input.
+
+        Raises:
+            ValueError: If `workers` or `chunk_size` is less than 1, or, while iterating, if any of the dates is
+                out of the supported conversion range.
+
+        Example:
+            >>> with open("dates.txt") as lines:
+            ...     english_dates = (date.fromisoformat(line.strip()) for line in lines)
+            ...     for nepali_calendar in NepaliDateConverter.convert_many(english_dates, workers=4):
+            ...         ...
+        """
+        return NepaliCalendarModel.convert_many(dates, to_nepali, workers, chunk_size, as_date)
 
     @staticmethod
     def get_nepali_calendar(nepali_yyyy: int, nepali_mm: int, nepali_dd: int) -> CustomCalendar:
@@ -81,6 +165,100 @@ class NepaliDateConverter:
         """
         return NepaliCalendarModel.get_nepali_calendar(SimpleDate(nepali_yyyy, nepali_mm, nepali_dd))
 
+    @staticmethod
+    def intern_calendar(calendar: Union[CustomCalendar, NepaliMonthCalendar]) -> Union[CustomCalendar, NepaliMonthCalendar]:
+        """
+        Returns the shared instance equal to `calendar`.
+
+        Conversions and lookups return one shared, immutable instance per day (and per Nepali month), so holding
+        many of them costs one reference each and comparing them is an identity check. Use this for copies made
+        elsewhere, e.g. unpickled from a cache, to share them too.
+
+        The first 4,096 distinct days converted in each calendar are shared, and later days are returned as new
+        instances, so that memory stays bounded; `preload_calendars()` shares every day.
+
+        Args:
+            calendar (CustomCalendar | NepaliMonthCalendar): A calendar, e.g. a copy of a converted date.
+
+        Returns:
+            CustomCalendar | NepaliMonthCalendar: The shared instance, or `calendar` itself if no shared instance is
+                equal to it (e.g. because it is out of the supported range).
+        """
+        return NepaliCalendarModel.intern_calendar(calendar)
+
+    @staticmethod
+    def preload_calendars():
+        """
+        Builds the shared CustomCalendar of every supported Nepali and English day, and every NepaliMonthCalendar,
+        up front instead of on first use.
+
+        Takes about a second and keeps the ~96,000 day calendars in memory until `clear_calendar_pools()`; useful
+        for long-running services that want predictable conversion latency.
+        """
+        NepaliCalendarModel.preload_calendars()
+
+    @staticmethod
+    def clear_calendar_pools():
+        """
+        Frees the shared day calendars, including those built by `preload_calendars()`, and restores the default
+        limit of 4,096 shared days per calendar.
+
+        Calendars already handed out stay valid; conversions after this return new shared instances.
+        """
+        NepaliCalendarModel.clear_calendar_pools()
+
+    @staticmethod
+    def enable_cache(maxsize: int = 1024):
+        """
+        Caches the results of `convert_english_to_nepali`, `convert_nepali_to_english` and `get_nepali_calendar`.
+
+        Useful when the same dates (today, month starts, fiscal year boundaries) are converted over and over, e.g.
+        by a web server. The cache is shared by the three conversions and by all threads, holds at most `maxsize`
+        dates and evicts the least recently used one when full. Enabling it again starts a new, empty cache.
+        Caching is off by default.
+
+        Args:
+            maxsize (int): Maximum number of cached conversions. Defaults to 1024.
+
+        Raises:
+            ValueError: If `maxsize` is less than 1.
+
+        Example:
+            >>> NepaliDateConverter.enable_cache(maxsize=4096)
+            >>> first = NepaliDateConverter.convert_english_to_nepali(2024, 4, 13)  # computed
+            >>> again = NepaliDateConverter.convert_english_to_nepali(2024, 4, 13)  # from the cache
+            >>> again is first
+            True
+            >>> NepaliDateConverter.cache_info().hit_rate
+            0.5
+        """
+        NepaliCalendarModel.enable_cache(maxsize)
+
+    @staticmethod
+    def disable_cache():
+        """
+        Turns off the cache enabled by `enable_cache` and drops its entries.
+        """
+        NepaliCalendarModel.disable_cache()
+
+    @staticmethod
+    def cache_info() -> ConversionCacheInfo:
+        """
+        Returns the statistics of the conversion cache: hits, misses, evictions, maximum and current size.
+        All of them are 0 while caching is disabled.
+
+        Returns:
+            ConversionCacheInfo: The statistics since the cache was enabled or last cleared.
+        """
+        return NepaliCalendarModel.cache_info()
+
+    @staticmethod
+    def cache_clear():
+        """
+        Removes every entry of the conversion cache and resets its statistics, keeping the cache enabled.
+        """
+        NepaliCalendarModel.cache_clear()
+
     @staticmethod
     def get_nepali_calendar_after_addition_or_subtraction(year: int, month: int, day_of_month: int, days_to_adjust: int) -> CustomCalendar:
         """
@@ -97,6 +275,36 @@ class NepaliDateConverter:
         """
         return NepaliCalendarModel.add_or_subtract_days_to_simple_date(year, month, day_of_month, days_to_adjust)
 
+    @staticmethod
+    def iter_nepali_dates(
+        start_date: Union[SimpleDate, Tuple[int, int, int]],
+        end_date: Union[SimpleDate, Tuple[int, int, int]],
+        step: int = 1,
+        with_english_date: bool = False
+    ) -> Iterator[Union[CustomCalendar, Tuple[CustomCalendar, date]]]:
+        """
+        Lazily iterates over the Nepali dates from `start_date` to `end_date`, both included.
+
+        Dates are produced one at a time as the iteration advances, so walking a range of any length uses
+        constant memory and does a constant amount of work per date.
+
+        Args:
+            start_date (SimpleDate | Tuple[int, int, int]): The first Nepali date.
+            end_date (SimpleDate | Tuple[int, int, int]): The last Nepali date. It is yielded only if it is reached
+                by stepping from `start_date`.
+            step (int): Number of days between consecutive dates. Use a negative step to iterate backwards
+                from a later `start_date` to an earlier `end_date`. Defaults to 1.
+            with_english_date (bool): If True, yields `(CustomCalendar, datetime.date)` pairs with the equivalent
+                English date. Defaults to False.
+
+        Returns:
+            Iterator[CustomCalendar | Tuple[CustomCalendar, date]]: The Nepali dates in the range.
+
+        Raises:
+            ValueError: If either date is out of the allowed Nepali year range or `step` is zero.
+        """
+        return NepaliCalendarModel.iter_nepali_dates(start_date, end_date, step, with_english_date)
+
     @staticmethod
     def get_nepali_month_calendar(nepali_year: int, nepali_month: int) -> NepaliMonthCalendar:
         """
@@ -159,6 +367,29 @@ class NepaliDateConverter:
             ValueError: If the year of either date is out of the allowed Nepali year range.
         """
         return NepaliCalendarModel.nepali_days_in_between(start_date, end_date)
+
+    @staticmethod
+    def get_nepali_days_in_between_many(
+        date_pairs: Iterable[Tuple[Union[SimpleDate, Tuple[int, int, int]], Union[SimpleDate, Tuple[int, int, int]]]]
+    ) -> List[int]:
+        """
+        Calculates the number of days between each pair of Nepali dates.
+
+        Every pair is resolved with two lookups in a precomputed month table, so the cost does not grow with the
+        distance between the dates.
+
+        Args:
+            date_pairs (Iterable[Tuple[SimpleDate, SimpleDate]]): `(start_date, end_date)` pairs. Each date can be a
+                SimpleDate or a `(year, month, day_of_month)` tuple.
+
+        Returns:
+            List[int]: The number of days between the dates of each pair, in input order. The end date is not
+                included in the count, and the value is negative when the end date comes before the start date.
+
+        Raises:
+            ValueError: If the year of any date is out of the allowed Nepali year range.
+        """
+        return NepaliCalendarModel.nepali_days_in_between_many(date_pairs)
     
     from datetime import date
 
@@ -257,6 +488,147 @@ class NepaliDateConverter:
             locale=locale,
         )
 
+    @staticmethod
+    def format_many(
+        dates: Iterable[CustomCalendar],
+        pattern_or_locale: Union[str, NepaliDateLocale],
+        language: NepaliCalendarUtilsLang = NepaliCalendarUtilsLang.NEPALI,
+        output: Optional[TextIO] = None
+    ) -> Union[List[str], int]:
+        """
+        Formats many dates with the same Unicode pattern or locale.
+
+        Localized numbers, month names and weekday names are precomputed once per language, so formatting each date
+        is a few table lookups and one string build. English dates (`era == 1`) use English month names and Nepali
+        dates use Nepali month names, as the single-date functions do.
+
+        Args:
+            dates (Iterable[CustomCalendar]): The dates to format. Any iterable, e.g. the result of
+                `convert_nepali_to_english_many` or `iter_nepali_dates`; it is consumed once.
+            pattern_or_locale (Union[str, NepaliDateLocale]): A Unicode date pattern (see
+                `format_nepali_date_by_unicode_pattern`), or a locale giving the same output as
+                `format_nepali_date_from_calendar` / `format_english_date_from_calendar`.
+            language (NepaliCalendarUtilsLang, optional): Language of a pattern. Defaults to
+                NepaliCalendarUtilsLang.NEPALI. Ignored for a locale, which has its own language.
+            output (TextIO, optional): A file-like object to write the formatted dates to, one per line, instead of
+                building a list.
+
+        Returns:
+            Union[List[str], int]: The formatted dates in input order, or the number of dates written when `output`
+                is given.
+
+        Example:
+            >>> dates = NepaliDateConverter.iter_nepali_dates(SimpleDate(2081, 1, 1), SimpleDate(2081, 1, 2))
+            >>> NepaliDateConverter.format_many(dates, "yyyy-MM-dd EEEE", NepaliCalendarUtilsLang.ENGLISH)
+            ['2081-01-01 Saturday', '2081-01-02 Sunday']
+        """
+        return NepaliCalendarModel.format_many(dates, pattern_or_locale, language, output)
+
+    @staticmethod
+    def parse_nepali_date(
+        date_string: str,
+        pattern: Union[str, Sequence[str]],
+        language: NepaliCalendarUtilsLang = NepaliCalendarUtilsLang.NEPALI
+    ) -> CustomCalendar:
+        """
+        Parses a Nepali date string written with a Unicode pattern, the inverse of
+        `format_nepali_date_by_unicode_pattern`.
+
+        Args:
+            date_string (str): The date to parse, with English or Nepali digits, e.g. "2081/01/15" or "२०८१/०१/१५".
+            pattern (Union[str, Sequence[str]]): The Unicode pattern of the date, e.g. "yyyy/MM/dd" or
+                "EEEE, MMMM d, yyyy", or several patterns tried in order. Supports the date placeholders of
+                `format_nepali_date_by_unicode_pattern`; weekday and week placeholders are matched but not checked.
+            language (NepaliCalendarUtilsLang, optional): Language of month and weekday names.
+                Defaults to NepaliCalendarUtilsLang.NEPALI.
+
+        Returns:
+            CustomCalendar: The parsed Nepali date.
+
+        Raises:
+            ValueError: If the string does not match the pattern or the date does not exist, or if the pattern
+                has time placeholders or lacks a year, month or day.
+
+        Example:
+            >>> NepaliDateConverter.parse_nepali_date("15 Baisakh 2081", "d MMMM yyyy", NepaliCalendarUtilsLang.ENGLISH)
+            CustomCalendar(year=2081, month=1, day_of_month=15, ...)
+        """
+        return NepaliCalendarModel.parse_nepali_date(date_string, pattern, language)
+
+    @staticmethod
+    def parse_nepali_date_many(
+        date_strings: Iterable[str],
+        pattern: Union[str, Sequence[str]],
+        language: NepaliCalendarUtilsLang = NepaliCalendarUtilsLang.NEPALI,
+        as_simple_date: bool = False
+    ) -> Tuple[List[Union[CustomCalendar, SimpleDate, None]], List[bool]]:
+        """
+        Parses many Nepali date strings with the same pattern(s), without raising for invalid rows.
+
+        The pattern is compiled once for all strings. Pass several patterns to accept a mix of formats, e.g.
+        `("yyyy/MM/dd", "yyyy-MM-dd", "d MMMM yyyy")`.
+
+        Args:
+            date_strings (Iterable[str]): The strings to parse. Any iterable, e.g. a column of a CSV file.
+            pattern (Union[str, Sequence[str]]): The Unicode pattern of the dates, or several tried in order.
+            language (NepaliCalendarUtilsLang, optional): Language of month and weekday names.
+                Defaults to NepaliCalendarUtilsLang.NEPALI.
+            as_simple_date (bool, optional): Return SimpleDate instead of CustomCalendar, which is cheaper.
+                Defaults to False.
+
+        Returns:
+            Tuple[List, List[bool]]: The parsed dates in input order, with None where a string could not be
+                parsed, and the error mask, which is True at the position of every string that could not be parsed.
+
+        Raises:
+            ValueError: If the pattern has time placeholders or lacks a year, month or day.
+
+        Example:
+            >>> dates, errors = NepaliDateConverter.parse_nepali_date_many(
+            ...     ["2081/01/15", "२०८१-०२-३२", "2081/13/01"], ("yyyy/MM/dd", "yyyy-MM-dd"), as_simple_date=True
+            ... )
+            >>> dates
+            [SimpleDate(year=2081, month=1, day_of_month=15), SimpleDate(year=2081, month=2, day_of_month=32), None]
+            >>> errors
+            [False, False, True]
+        """
+        return NepaliCalendarModel.parse_nepali_date_many(date_strings, pattern, language, as_simple_date)
+
+    @staticmethod
+    def find_nepali_dates(text: str) -> List[RecognizedNepaliDate]:
+        """
+        Finds the Nepali dates written in free text.
+
+        Recognizes year-month-day, day-month-year and month-day-year orders with month names in Nepali or English
+        and common spelling variants (e.g. "Baisakh", "Baishakh", "Vaishakh", "वैशाख"), English or Nepali digits,
+        and numeric dates such as "2081/01/15". Only dates that exist in the supported range are returned.
+
+        Args:
+            text (str): The text to search.
+
+        Returns:
+            List[RecognizedNepaliDate]: The dates found, in the order they appear, with their position in `text`.
+
+        Example:
+            >>> NepaliDateConverter.find_nepali_dates("Received २०८१ वैशाख १५, paid Baishakh 20, 2081")
+            [RecognizedNepaliDate(date=SimpleDate(year=2081, month=1, day_of_month=15), start=9, end=22),
+             RecognizedNepaliDate(date=SimpleDate(year=2081, month=1, day_of_month=20), start=29, end=46)]
+        """
+        return NepaliCalendarModel.find_nepali_dates(text)
+
+    @staticmethod
+    def find_nepali_dates_many(texts: Iterable[str]) -> List[List[RecognizedNepaliDate]]:
+        """
+        Finds the Nepali dates written in each of many texts, such as the rows of a free-text column.
+
+        Args:
+            texts (Iterable[str]): The texts to search. Values that are not strings (e.g. None) have no dates.
+
+        Returns:
+            List[List[RecognizedNepaliDate]]: The dates found in each text, in input order.
+        """
+        return NepaliCalendarModel.find_nepali_dates_many(texts)
+
     @staticmethod
     def get_weekday_name(day_of_week: int, format=NameFormat.FULL, language: NepaliCalendarUtilsLang=NepaliCalendarUtilsLang.ENGLISH):
         """
@@ -528,8 +900,7 @@ class NepaliDateConverter:
             ... )
             >>> # formatted_time: "03:30:45.123 PM"
         """
-        calendar_model = NepaliCalendarModel()
-        return calendar_model.format_time_by_unicode_pattern(
+        return NepaliCalendarModel.format_time_by_unicode_pattern(
             unicode_pattern=unicode_pattern,
             time=time,
             language=language
@@ -579,8 +950,7 @@ class NepaliDateConverter:
             ... )
             >>> # formatted_date: "2025-05-14 Tuesday"
         """
-        calendar_model = NepaliCalendarModel()
-        return calendar_model.format_english_date_by_unicode_pattern(
+        return NepaliCalendarModel.format_english_date_by_unicode_pattern(
             unicode_pattern=unicode_pattern,
             calendar=calendar,
             language=language
@@ -631,8 +1001,7 @@ class NepaliDateConverter:
             ... )
             >>> # formatted_date: "2025-05-14 Tuesday"
         """
-        calendar_model = NepaliCalendarModel()
-        return calendar_model.format_nepali_date_by_unicode_pattern(
+        return NepaliCalendarModel.format_nepali_date_by_unicode_pattern(
             unicode_pattern=unicode_pattern,
             calendar=calendar,
             language=language
@@ -706,8 +1075,7 @@ class NepaliDateConverter:
         ... )
         >>> # formatted: "2025-05-14 Tuesday 03:30:45 PM"
     """
-        calendar_model = NepaliCalendarModel()
-        return calendar_model.format_english_datetime_by_unicode_pattern(
+        return NepaliCalendarModel.format_english_datetime_by_unicode_pattern(
             unicode_pattern=unicode_pattern,
             calendar=calendar,
             time=time,
@@ -787,8 +1155,7 @@ class NepaliDateConverter:
             ... )
             '2025-05-14 Tuesday 03:30:45.123 PM'
         """
-        calendar_model = NepaliCalendarModel()
-        return calendar_model.format_nepali_datetime_by_unicode_pattern(
+        return NepaliCalendarModel.format_nepali_datetime_by_unicode_pattern(
             unicode_pattern=unicode_pattern,
             calendar=calendar,
             time=time,
@@ -895,4 +1262,27 @@ class NepaliDateConverter:
         Returns:
             str: English number string.
         """
-        return NepaliCalendarModel.convert_to_english_number(nepali_string)
\ No newline at end of file
+        return NepaliCalendarModel.convert_to_english_number(nepali_string)
+
+    @staticmethod
+    def localize_digits(
+        text_chunks: Iterable[str], lang: NepaliCalendarUtilsLang = NepaliCalendarUtilsLang.NEPALI
+    ) -> Iterator[str]:
+        """
+        Lazily converts the digits of a stream of text to the given language, one chunk at a time.
+
+        Only digits are changed, so chunks can be split anywhere, e.g. lines of a file or blocks of a large report.
+
+        Args:
+            text_chunks (Iterable[str]): The text to convert, in chunks.
+            lang (NepaliCalendarUtilsLang, optional): NEPALI converts English digits to Nepali digits, and ENGLISH
+                converts Nepali digits to English digits. Defaults to NepaliCalendarUtilsLang.NEPALI.
+
+        Returns:
+            Iterator[str]: The converted chunks, in input order.
+
+        Example:
+            >>> with open("report.txt", encoding="utf-8") as report, open("report_np.txt", "w", encoding="utf-8") as output:
+            ...     output.writelines(NepaliDateConverter.localize_digits(report))
+        """
+        return NepaliCalendarModel.localize_digits(text_chunks, lang)
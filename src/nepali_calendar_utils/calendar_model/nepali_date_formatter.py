@@ -0,0 +1,367 @@
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, TextIO, Tuple, Union
+from nepali_calendar_utils.data.custom_calendar import CustomCalendar, SimpleTime
+from nepali_calendar_utils.data.nepali_date_locale import (
+    NameFormat, NepaliCalendarUtilsLang, NepaliDateFormatStyle, NepaliDateLocale, NepaliMonthName
+)
+
+NEPALI_DIGITS_TRANSLATION = str.maketrans("0123456789", "०१२३४५६७८९")
+ENGLISH_DIGITS_TRANSLATION = str.maketrans("०१२३४५६७८९", "0123456789")
+
+# Field formatters return the field with English digits; numeric fields are localized afterwards.
+# Date fields take `(calendar, month_names, language)`, time fields take `(time, language)`.
+DATE_FIELDS: Dict[str, Callable[[CustomCalendar, Sequence[NepaliMonthName], NepaliCalendarUtilsLang], str]] = {
+    "yyyy": lambda calendar, month_names, language: str(calendar.year),
+    "yy": lambda calendar, month_names, language: str(calendar.year)[-2:],
+    "MMMM": lambda calendar, month_names, language: month_names[calendar.month - 1].full,
+    "MMM": lambda calendar, month_names, language: month_names[calendar.month - 1].short,
+    "MM": lambda calendar, month_names, language: str(calendar.month).zfill(2),
+    "M": lambda calendar, month_names, language: str(calendar.month),
+    "dd": lambda calendar, month_names, language: str(calendar.day_of_month).zfill(2),
+    "d": lambda calendar, month_names, language: str(calendar.day_of_month),
+    "D": lambda calendar, month_names, language: str(calendar.day_of_year),
+    "EEEEE": lambda calendar, month_names, language: language.weekdays[calendar.day_of_week - 1].short,
+    "EEEE": lambda calendar, month_names, language: language.weekdays[calendar.day_of_week - 1].full,
+    "E": lambda calendar, month_names, language: language.weekdays[calendar.day_of_week - 1].medium,
+    "ee": lambda calendar, month_names, language: str(calendar.day_of_week).zfill(2),
+    "e": lambda calendar, month_names, language: str(calendar.day_of_week),
+    "w": lambda calendar, month_names, language: str(calendar.week_of_year),
+}
+
+TIME_FIELDS: Dict[str, Callable[[SimpleTime, NepaliCalendarUtilsLang], str]] = {
+    "HH": lambda time, language: str(time.hour).zfill(2),
+    "H": lambda time, language: str(time.hour),
+    "hh": lambda time, language: str(NepaliDateFormatter.get_hour12(time.hour)).zfill(2),
+    "h": lambda time, language: str(NepaliDateFormatter.get_hour12(time.hour)),
+    "mm": lambda time, language: str(time.minute).zfill(2),
+    "m": lambda time, language: str(time.minute),
+    "ss": lambda time, language: str(time.second).zfill(2),
+    "s": lambda time, language: str(time.second),
+    "SSSS": lambda time, language: str(time.nanosecond).zfill(4)[:4],
+    "SSS": lambda time, language: str(time.nanosecond).zfill(3)[:3],
+    "SS": lambda time, language: str(time.nanosecond).zfill(2)[:2],
+    "S": lambda time, language: str(time.nanosecond)[:1],
+    "a": lambda time, language: NepaliDateFormatter.get_am_pm(time.hour, language).lower(),
+    "A": lambda time, language: NepaliDateFormatter.get_am_pm(time.hour, language),
+}
+
+NUMERIC_FIELDS = frozenset((
+    "yyyy", "yy", "MM", "M", "dd", "d", "D", "ee", "e", "w",
+    "HH", "H", "hh", "h", "mm", "m", "ss", "s", "SSSS", "SSS", "SS", "S",
+))
+
+# Longest first, so that e.g. "yyyy" is matched before "yy"
+FIELDS_BY_LENGTH = sorted((*DATE_FIELDS, *TIME_FIELDS), key=len, reverse=True)
+
+LITERAL = 0
+DATE_FIELD = 1
+TIME_FIELD = 2
+
+# `NepaliDateLocale` styles written as patterns. "{day}", "{weekday}" and "{month}" depend on the locale's name formats.
+LOCALE_PATTERNS = {
+    NepaliDateFormatStyle.FULL: "{weekday}, {month} {day}, yyyy",
+    NepaliDateFormatStyle.LONG: "{month} {day}, yyyy",
+    NepaliDateFormatStyle.MEDIUM: "yyyy {month} {day}",
+    NepaliDateFormatStyle.SHORT_MDY: "MM/{day}/yyyy",
+    NepaliDateFormatStyle.SHORT_YMD: "yyyy/MM/{day}",
+    NepaliDateFormatStyle.COMPACT_MDY: "MM/{day}/yy",
+    NepaliDateFormatStyle.COMPACT_YMD: "yy/MM/{day}",
+}
+WEEKDAY_NAME_FIELDS = {NameFormat.FULL: "EEEE", NameFormat.MEDIUM: "E", NameFormat.SHORT: "EEEEE"}
+MONTH_NAME_FIELDS = {NameFormat.FULL: "MMMM", NameFormat.MEDIUM: "MMMM", NameFormat.SHORT: "MMM"}
+
+# Years covered by the precomputed year strings: the English and Nepali years of the supported range
+TABLE_YEARS = range(1913, 2101)
+
+
+class LocalizedNumbers(dict):
+    """
+    Number to string table in one language, e.g. `{1: "१", 2: "२", ...}`.
+    Numbers outside the precomputed range are converted on lookup.
+    """
+
+    def __init__(self, numbers: Iterable[int], language: NepaliCalendarUtilsLang, width: int = 1):
+        super().__init__()
+        self.localize_digits = language != NepaliCalendarUtilsLang.ENGLISH
+        self.width = width
+        for number in numbers:
+            self[number] = self.localize(number)
+
+    def __missing__(self, number: int) -> str:
+        return self.localize(number)
+
+    def localize(self, number: int) -> str:
+        text = str(number).zfill(self.width)
+        return text.translate(NEPALI_DIGITS_TRANSLATION) if self.localize_digits else text
+
+
+class NepaliDateStringTables:
+    """
+    Every string a date field can produce in one language, computed once so that formatting a date is a few table
+    lookups. Numbers are localized, and month and weekday names are indexed by their 1-based number.
+    """
+
+    def __init__(self, language: NepaliCalendarUtilsLang):
+        self.numbers = LocalizedNumbers(range(367), language)
+        self.padded_numbers = LocalizedNumbers(range(100), language, width=2)
+        self.years = LocalizedNumbers(TABLE_YEARS, language)
+        self.weekdays = {
+            name_format: ("",) + tuple(getattr(weekday, name_format.value) for weekday in language.weekdays)
+            for name_format in NameFormat
+        }
+        # Keyed by whether the date is an English one, as in `NepaliDateFormatter.format`
+        self.months = {
+            is_english: {
+                "MMMM": ("",) + tuple(month.full for month in month_names),
+                "MMM": ("",) + tuple(month.short for month in month_names),
+            }
+            for is_english, month_names in ((False, language.months), (True, language.english_months))
+        }
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def get_tables(language: NepaliCalendarUtilsLang) -> "NepaliDateStringTables":
+        return NepaliDateStringTables(language)
+
+    def get_date_field_getter(self, field: str, is_english: bool) -> Callable[[CustomCalendar], str]:
+        numbers, padded_numbers, years = self.numbers, self.padded_numbers, self.years
+        months = self.months[is_english]
+
+        if field in ("MMMM", "MMM"):
+            month_names = months[field]
+            return lambda calendar: month_names[calendar.month]
+        if field in ("EEEE", "E", "EEEEE"):
+            weekday_names = self.weekdays[{"EEEE": NameFormat.FULL, "E": NameFormat.MEDIUM}.get(field, NameFormat.SHORT)]
+            return lambda calendar: weekday_names[calendar.day_of_week]
+
+        return {
+            "yyyy": lambda calendar: years[calendar.year],
+            "yy": lambda calendar: years[calendar.year][-2:],
+            "MM": lambda calendar: padded_numbers[calendar.month],
+            "M": lambda calendar: numbers[calendar.month],
+            "dd": lambda calendar: padded_numbers[calendar.day_of_month],
+            "d": lambda calendar: numbers[calendar.day_of_month],
+            "D": lambda calendar: numbers[calendar.day_of_year],
+            "ee": lambda calendar: padded_numbers[calendar.day_of_week],
+            "e": lambda calendar: numbers[calendar.day_of_week],
+            "w": lambda calendar: numbers[calendar.week_of_year],
+        }[field]
+
+
+class NepaliDateFormatter:
+    """
+    A date/time pattern compiled once and reusable for any number of dates.
+
+    The pattern is split into literal text and field tokens when the formatter is created, so `format` only
+    computes the fields the pattern uses. Supports the same Unicode pattern letters, and produces the same output,
+    as `NepaliDateConverter.format_*_by_unicode_pattern`. Use `NepaliDateFormatter.get_formatter` to share compiled
+    formatters, which are cached by `(pattern, language)`.
+
+    Args:
+        pattern (str): The Unicode pattern, e.g. "EEEE, MMMM dd, yyyy hh:mm a".
+        language (NepaliCalendarUtilsLang): Language of names, numbers and the AM/PM period.
+            Defaults to NepaliCalendarUtilsLang.NEPALI.
+
+    Example:
+        >>> formatter = NepaliDateFormatter.get_formatter("EEEE, MMMM dd, yyyy", NepaliCalendarUtilsLang.ENGLISH)
+        >>> formatter.format(NepaliDateConverter.get_nepali_calendar(2081, 1, 1))
+        'Saturday, Baisakh 01, 2081'
+    """
+
+    def __init__(self, pattern: str, language: NepaliCalendarUtilsLang = NepaliCalendarUtilsLang.NEPALI):
+        self.pattern = pattern
+        self.language = language
+        self.tokens = NepaliDateFormatter.tokenize(pattern)
+        self.bulk_templates: Optional[Dict[bool, Tuple[str, Tuple[Callable[[CustomCalendar], str], ...]]]] = None
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def get_formatter(pattern: str, language: NepaliCalendarUtilsLang = NepaliCalendarUtilsLang.NEPALI) -> "NepaliDateFormatter":
+        """
+        Returns the shared compiled formatter for `(pattern, language)`, creating it on first use.
+        """
+        return NepaliDateFormatter(pattern, language)
+
+    @staticmethod
+    def get_locale_formatter(locale: NepaliDateLocale) -> "NepaliDateFormatter":
+        """
+        Returns the shared formatter producing the same output as `format_nepali_date` and `format_english_date`
+        for `locale`.
+        """
+        return NepaliDateFormatter.get_formatter(NepaliDateFormatter.get_locale_pattern(locale), locale.language)
+
+    @staticmethod
+    def get_locale_pattern(locale: NepaliDateLocale) -> str:
+        show_month_name = locale.date_format in (
+            NepaliDateFormatStyle.FULL, NepaliDateFormatStyle.LONG, NepaliDateFormatStyle.MEDIUM
+        )
+
+        return LOCALE_PATTERNS[locale.date_format].format(
+            weekday=WEEKDAY_NAME_FIELDS[locale.week_day_name],
+            month=MONTH_NAME_FIELDS[locale.month_name],
+            day="d" if show_month_name else "dd",
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def tokenize(pattern: str) -> Tuple[Tuple[int, str], ...]:
+        tokens: List[Tuple[int, str]] = []
+        literal = ""
+        index = 0
+
+        while index < len(pattern):
+            field = next((field for field in FIELDS_BY_LENGTH if pattern.startswith(field, index)), None)
+            if field is None:
+                literal += pattern[index]
+                index += 1
+                continue
+
+            if literal:
+                tokens.append((LITERAL, literal))
+                literal = ""
+            tokens.append((DATE_FIELD if field in DATE_FIELDS else TIME_FIELD, field))
+            index += len(field)
+
+        if literal:
+            tokens.append((LITERAL, literal))
+
+        return tuple(tokens)
+
+    @property
+    def uses_date_fields(self) -> bool:
+        return any(kind == DATE_FIELD for kind, _ in self.tokens)
+
+    @property
+    def uses_time_fields(self) -> bool:
+        return any(kind == TIME_FIELD for kind, _ in self.tokens)
+
+    def format(self, calendar: Optional[CustomCalendar] = None, time: Optional[SimpleTime] = None) -> str:
+        """
+        Formats a date and/or time with this pattern.
+
+        Month names are English month names for an English calendar (`era == 1`) and Nepali month names otherwise.
+        Date fields are left as written in the pattern when `calendar` is None, and time fields when `time` is None.
+
+        Args:
+            calendar (CustomCalendar, optional): The date to format.
+            time (SimpleTime, optional): The time to format.
+
+        Returns:
+            str: The formatted date and/or time.
+        """
+        if calendar is None:
+            month_names = None
+        elif calendar.era == 1:
+            month_names = self.language.english_months
+        else:
+            month_names = self.language.months
+
+        return self.format_with_month_names(calendar, time, month_names)
+
+    def format_with_month_names(
+        self,
+        calendar: Optional[CustomCalendar],
+        time: Optional[SimpleTime],
+        month_names: Optional[Sequence[NepaliMonthName]]
+    ) -> str:
+        language = self.language
+        localize_digits = language != NepaliCalendarUtilsLang.ENGLISH
+        parts = []
+
+        for kind, text in self.tokens:
+            if kind == DATE_FIELD and calendar is not None:
+                value = DATE_FIELDS[text](calendar, month_names, language)
+            elif kind == TIME_FIELD and time is not None:
+                value = TIME_FIELDS[text](time, language)
+            else:
+                parts.append(text)
+                continue
+
+            if localize_digits and text in NUMERIC_FIELDS:
+                value = value.translate(NEPALI_DIGITS_TRANSLATION)
+            parts.append(value)
+
+        return "".join(parts)
+
+    def format_many(
+        self, calendars: Iterable[CustomCalendar], output: Optional[TextIO] = None
+    ) -> Union[List[str], int]:
+        """
+        Formats many dates with this pattern, using precomputed string tables so that each date costs a few table
+        lookups and one string build.
+
+        Produces the same strings as `format(calendar)`; time fields are left as written in the pattern.
+
+        Args:
+            calendars (Iterable[CustomCalendar]): The dates to format. Any iterable, consumed once.
+            output (TextIO, optional): A file-like object to write the formatted dates to, one per line.
+
+        Returns:
+            Union[List[str], int]: The formatted dates, or the number of dates written when `output` is given.
+        """
+        templates = self.get_bulk_templates()
+
+        def format_one(calendar: CustomCalendar) -> str:
+            template, getters = templates[calendar.era == 1]
+            return template.format(*[getter(calendar) for getter in getters])
+
+        if output is None:
+            return [format_one(calendar) for calendar in calendars]
+
+        count = 0
+        write = output.write
+        for calendar in calendars:
+            write(format_one(calendar))
+            write("\n")
+            count += 1
+
+        return count
+
+    def get_bulk_templates(self) -> Dict[bool, Tuple[str, Tuple[Callable[[CustomCalendar], str], ...]]]:
+        """
+        Returns, for Nepali (`False`) and English (`True`) dates, a `str.format` template of the pattern with one
+        placeholder per date field, and the table lookups filling those placeholders.
+        """
+        if self.bulk_templates is not None:
+            return self.bulk_templates
+
+        tables = NepaliDateStringTables.get_tables(self.language)
+        templates = {}
+        for is_english in (False, True):
+            template_parts = []
+            getters = []
+            for kind, text in self.tokens:
+                if kind == DATE_FIELD:
+                    template_parts.append("{}")
+                    getters.append(tables.get_date_field_getter(text, is_english))
+                else:
+                    template_parts.append(text.replace("{", "{{").replace("}", "}}"))
+            templates[is_english] = ("".join(template_parts), tuple(getters))
+
+        self.bulk_templates = templates
+        return templates
+
+    @staticmethod
+    def get_hour12(hour: int) -> int:
+        return 12 if hour == 0 else hour - 12 if hour > 12 else hour
+
+    @staticmethod
+    def get_am_pm(hour: int, language: NepaliCalendarUtilsLang) -> str:
+        if language == NepaliCalendarUtilsLang.NEPALI:
+            return NepaliDateFormatter.get_nepali_am_pm(hour)
+
+        return "AM" if hour < 12 else "PM"
+
+    @staticmethod
+    def get_nepali_am_pm(hour: int) -> str:
+        if 3 <= hour <= 11:
+            return "बिहान"
+        elif 12 <= hour <= 16:
+            return "दिउँसो"
+        elif 17 <= hour <= 19:
+            return "साँझ"
+        else:
+            return "राति"
+
+    def __repr__(self):
+        return f"NepaliDateFormatter({self.pattern!r}, {self.language})"
@@ -0,0 +1,260 @@
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Pattern, Sequence, Tuple, Union
+from nepali_calendar_utils.data.custom_calendar import CustomCalendar, SimpleDate
+from nepali_calendar_utils.data.nepali_date_locale import NepaliCalendarUtilsLang
+from nepali_calendar_utils.calendar_model.date_converters import DateConverters
+from nepali_calendar_utils.calendar_model.nepali_ordinal_index import NepaliOrdinalIndex
+from nepali_calendar_utils.calendar_model.nepali_date_formatter import (
+    DATE_FIELD, ENGLISH_DIGITS_TRANSLATION, LITERAL, NepaliDateFormatter
+)
+
+DIGIT = "[0-9०-९]"
+
+# Regular expression of every numeric date field. Fields not listed here are name fields.
+NUMERIC_FIELD_EXPRESSIONS = {
+    "yyyy": f"{DIGIT}{{4}}",
+    "yy": f"{DIGIT}{{2}}",
+    "MM": f"{DIGIT}{{2}}",
+    "M": f"{DIGIT}{{1,2}}",
+    "dd": f"{DIGIT}{{2}}",
+    "d": f"{DIGIT}{{1,2}}",
+    "D": f"{DIGIT}{{1,3}}",
+    "ee": f"{DIGIT}{{2}}",
+    "e": f"{DIGIT}",
+    "w": f"{DIGIT}{{1,2}}",
+}
+
+# Date fields whose parsed value is used; weekday and week fields only have to be present
+YEAR_FIELDS = ("yyyy", "yy")
+MONTH_FIELDS = ("MMMM", "MMM", "MM", "M")
+DAY_FIELDS = ("dd", "d")
+DAY_OF_YEAR_FIELD = "D"
+
+# Two-digit years are read as 20yy, which covers the Nepali years in common use
+TWO_DIGIT_YEAR_CENTURY = 2000
+
+
+class NepaliDateParser:
+    """
+    Parses Nepali (Bikram Sambat) date strings written with a Unicode date pattern, the inverse of
+    `NepaliDateFormatter`.
+
+    The pattern is compiled into a regular expression once, so parsing a string is one match and a few integer
+    conversions. Digits can be English or Nepali, and month and weekday names are those of `language` (English
+    names are matched case-insensitively). Weekday (`EEEE`, `E`, `EEEEE`, `ee`, `e`) and week (`w`) fields are
+    matched but not checked against the date. A date needs a year (`yyyy` or `yy`, read as 20yy) and either a month
+    and day of month, or a day of year (`D`). Several patterns can be given to accept a mix of formats; they are
+    tried in order.
+
+    Args:
+        pattern (Union[str, Sequence[str]]): The Unicode pattern, e.g. "yyyy/MM/dd" or "d MMMM yyyy", or several.
+        language (NepaliCalendarUtilsLang): Language of month and weekday names.
+            Defaults to NepaliCalendarUtilsLang.NEPALI.
+
+    Raises:
+        ValueError: If a pattern has time fields, or lacks the fields needed to find the date.
+
+    Example:
+        >>> parser = NepaliDateParser.get_parser(("yyyy-MM-dd", "d MMMM yyyy"), NepaliCalendarUtilsLang.ENGLISH)
+        >>> parser.parse_to_simple_date("२०८१-०१-१५")
+        SimpleDate(year=2081, month=1, day_of_month=15)
+        >>> parser.parse_to_simple_date("15 Baisakh 2081")
+        SimpleDate(year=2081, month=1, day_of_month=15)
+    """
+
+    def __init__(
+        self,
+        pattern: Union[str, Sequence[str]],
+        language: NepaliCalendarUtilsLang = NepaliCalendarUtilsLang.NEPALI
+    ):
+        self.patterns = (pattern,) if isinstance(pattern, str) else tuple(pattern)
+        self.language = language
+        self.month_numbers = NepaliDateParser.get_month_numbers(language)
+        self.expressions = tuple(
+            NepaliDateParser.compile_pattern(pattern, language, self.month_numbers) for pattern in self.patterns
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def get_parser(
+        pattern: Union[str, Tuple[str, ...]],
+        language: NepaliCalendarUtilsLang = NepaliCalendarUtilsLang.NEPALI
+    ) -> "NepaliDateParser":
+        """
+        Returns the shared compiled parser for `(pattern, language)`, creating it on first use.
+        Several patterns are passed as a tuple.
+        """
+        return NepaliDateParser(pattern, language)
+
+    @staticmethod
+    def get_month_numbers(language: NepaliCalendarUtilsLang) -> Dict[str, Optional[int]]:
+        """
+        Returns the month number of every full and short month name in `language`, lower-cased.
+        Names shared by two months (e.g. "अ" for Asar and Asoj) map to None.
+        """
+        month_numbers: Dict[str, Optional[int]] = {}
+
+        for month_number, month_name in enumerate(language.months, start=1):
+            for name in {month_name.full.lower(), month_name.short.lower()}:
+                month_numbers[name] = None if month_numbers.get(name, month_number) != month_number else month_number
+
+        return month_numbers
+
+    @staticmethod
+    def compile_pattern(
+        pattern: str, language: NepaliCalendarUtilsLang, month_numbers: Dict[str, Optional[int]]
+    ) -> Pattern:
+        tokens = NepaliDateFormatter.tokenize(pattern)
+        fields = {text for kind, text in tokens if kind == DATE_FIELD}
+
+        if any(kind != LITERAL and kind != DATE_FIELD for kind, _ in tokens):
+            raise ValueError(f"Time fields are not supported in date pattern {pattern!r}.")
+        if not fields.intersection(YEAR_FIELDS) or not (
+            fields.intersection(MONTH_FIELDS) and fields.intersection(DAY_FIELDS) or DAY_OF_YEAR_FIELD in fields
+        ):
+            raise ValueError(f"Date pattern {pattern!r} needs a year, and a month and day or a day of year.")
+
+        month_names = NepaliDateParser.get_names_expression(month_numbers)
+        weekday_names = NepaliDateParser.get_names_expression(
+            [name for weekday in language.weekdays for name in (weekday.full, weekday.medium, weekday.short)]
+        )
+
+        expression_parts = []
+        groups = set()
+        for kind, text in tokens:
+            if kind == LITERAL:
+                expression_parts.append(re.escape(text))
+                continue
+
+            field_expression = NUMERIC_FIELD_EXPRESSIONS.get(text)
+            if field_expression is None:
+                field_expression = month_names if text in MONTH_FIELDS else weekday_names
+
+            if text in groups:
+                # A field written twice has to be present twice, but only the first value is used
+                expression_parts.append(f"(?:{field_expression})")
+            else:
+                groups.add(text)
+                expression_parts.append(f"(?P<{NepaliDateParser.get_group_name(text)}>{field_expression})")
+
+        return re.compile("".join(expression_parts), re.IGNORECASE)
+
+    @staticmethod
+    def get_names_expression(names: Iterable[str]) -> str:
+        # Longest first, so that e.g. "Asar" is not matched as "Asa"
+        return "|".join(re.escape(name) for name in sorted(set(names), key=len, reverse=True))
+
+    @staticmethod
+    def get_group_name(field: str) -> str:
+        return {"D": "day_of_year", "MMMM": "month_name", "MMM": "month_name_short"}.get(field, field)
+
+    def parse_fields(self, date_string: str) -> Tuple[int, int, int]:
+        """
+        Returns the `(year, month, day_of_month)` written in `date_string`, without checking that the day exists.
+        Day-of-year dates are resolved to their month and day.
+        """
+        text = date_string.strip()
+
+        for expression in self.expressions:
+            match = expression.fullmatch(text)
+            if match is not None:
+                break
+        else:
+            raise ValueError(f"Date {date_string!r} does not match the pattern {' or '.join(map(repr, self.patterns))}.")
+
+        values = match.groupdict()
+
+        if values.get("yyyy") is not None:
+            year = int(values["yyyy"].translate(ENGLISH_DIGITS_TRANSLATION))
+        else:
+            year = TWO_DIGIT_YEAR_CENTURY + int(values["yy"].translate(ENGLISH_DIGITS_TRANSLATION))
+
+        month_text = values.get("MM") or values.get("M")
+        day_text = values.get("dd") or values.get("d")
+        month_name = values.get("month_name") or values.get("month_name_short")
+
+        if month_text is not None:
+            month = int(month_text.translate(ENGLISH_DIGITS_TRANSLATION))
+        elif month_name is not None:
+            month = self.month_numbers[month_name.lower()]
+            if month is None:
+                raise ValueError(f"Month name {month_name!r} in {date_string!r} is ambiguous.")
+        else:
+            month = None
+
+        if month is not None and day_text is not None:
+            return year, month, int(day_text.translate(ENGLISH_DIGITS_TRANSLATION))
+
+        day_of_year = int(values["day_of_year"].translate(ENGLISH_DIGITS_TRANSLATION))
+        if year not in NepaliOrdinalIndex.years:
+            raise ValueError(f"Out of Range: Nepali year {year} is out of range to convert.")
+
+        year_start_index = NepaliOrdinalIndex.get_month_index(year, 1)
+        year_start_ordinal = NepaliOrdinalIndex.month_start_ordinals[year_start_index]
+        days_in_year = NepaliOrdinalIndex.month_start_ordinals[year_start_index + 12] - year_start_ordinal
+        if not 1 <= day_of_year <= days_in_year:
+            raise ValueError(f"Day of year {day_of_year} is out of range for year {year}.")
+
+        calendar = DateConverters.get_nepali_calendar_from_ordinal(year_start_ordinal + day_of_year - 1)
+        return calendar.year, calendar.month, calendar.day_of_month
+
+    def parse_to_simple_date(self, date_string: str) -> SimpleDate:
+        """
+        Parses a Nepali date string into a SimpleDate.
+
+        Raises:
+            ValueError: If the string does not match the pattern, or the date does not exist.
+        """
+        year, month, day_of_month = self.parse_fields(date_string)
+
+        try:
+            days_in_month = NepaliOrdinalIndex.get_days_in_month(year, month)
+        except KeyError:
+            days_in_month = 0
+
+        if year not in NepaliOrdinalIndex.years or not 1 <= day_of_month <= days_in_month:
+            raise ValueError(f"Invalid Nepali date {year}/{month}/{day_of_month} in {date_string!r}.")
+
+        return SimpleDate(year, month, day_of_month)
+
+    def parse(self, date_string: str) -> CustomCalendar:
+        """
+        Parses a Nepali date string into a CustomCalendar.
+
+        Raises:
+            ValueError: If the string does not match the pattern, or the date does not exist.
+        """
+        return DateConverters.get_nepali_calendar(self.parse_to_simple_date(date_string))
+
+    def parse_many(
+        self, date_strings: Iterable[str], as_simple_date: bool = False
+    ) -> Tuple[List[Union[CustomCalendar, SimpleDate, None]], List[bool]]:
+        """
+        Parses many Nepali date strings without raising for invalid ones.
+
+        Args:
+            date_strings (Iterable[str]): The strings to parse. Any iterable, consumed once.
+            as_simple_date (bool): Return SimpleDate instead of CustomCalendar. Defaults to False.
+
+        Returns:
+            Tuple[List, List[bool]]: The parsed dates in input order, with None for strings that could not be parsed,
+                and the error mask: True where the string at the same position could not be parsed.
+        """
+        parse = self.parse_to_simple_date if as_simple_date else self.parse
+        dates = []
+        errors = []
+
+        for date_string in date_strings:
+            try:
+                dates.append(parse(date_string))
+                errors.append(False)
+            except (ValueError, AttributeError, TypeError):
+                dates.append(None)
+                errors.append(True)
+
+        return dates, errors
+
+    def __repr__(self):
+        pattern = self.patterns[0] if len(self.patterns) == 1 else self.patterns
+        return f"NepaliDateParser({pattern!r}, {self.language})"
@@ -0,0 +1,221 @@
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Pattern, Tuple
+from nepali_calendar_utils.data.custom_calendar import RecognizedNepaliDate, SimpleDate
+from nepali_calendar_utils.data.nepali_date_locale import (
+    nepali_month_spelling_variants, nepali_months, nepali_months_in_english
+)
+from nepali_calendar_utils.calendar_model.nepali_ordinal_index import NepaliOrdinalIndex
+from nepali_calendar_utils.calendar_model.nepali_date_formatter import ENGLISH_DIGITS_TRANSLATION
+
+# Latin and Devanagari letters, including Devanagari vowel signs; a month name must not touch another letter
+LETTER = "A-Za-zऀ-ॣॱ-ॿ"
+NUMBER_EXPRESSION = "([0-9०-९]+)"
+
+# Every recognized date has a four-digit year, so text without one is skipped without being scanned for tokens
+FOUR_DIGITS = re.compile(r"[0-9०-९]{4}")
+
+# Text allowed between the parts of a date, e.g. "15 Baisakh, 2081" or "२०८१ साल वैशाख १५ गते"
+SEPARATORS = " \t,.-/"
+FILLER_WORD = re.compile("साल|गते|gatey|gate|saal|sal", re.IGNORECASE | re.ASCII)
+
+# Postpositions that can be written onto a Nepali month name, e.g. "वैशाखको", "वैशाखमा"
+MONTH_NAME_SUFFIXES = ("देखि", "सम्म", "को", "मा", "ले", "का", "की")
+
+NUMERIC_DATE_SEPARATORS = ("/", "-", ".")
+
+# Trie node key marking the end of a month name; never a character of a name
+MONTH_NUMBER = ""
+
+# Token kinds
+NUMBER = 0
+MONTH = 1
+
+
+class NepaliDateRecognizer:
+    """
+    Finds Nepali (Bikram Sambat) dates in free text, e.g. "२०८१ वैशाख १५", "15 Baisakh 2081", "Baishakh 15, 2081"
+    or "2081/01/15".
+
+    Month names come from `nepali_months`, `nepali_months_in_english` and `nepali_month_spelling_variants`, and are
+    matched case-insensitively, also when a Nepali postposition is written onto them (e.g. "वैशाखको"). The names
+    are indexed by a prefix trie, which is compiled into a single regular expression together with numbers, so a
+    text is scanned once for its numbers and month names. Dates are read off consecutive tokens in one of these
+    orders: year month day, day month year, month day year, or a numeric year/month/day with one repeated
+    separator. Only dates that exist in the supported range are returned.
+
+    Args:
+        month_names (Iterable[Tuple[int, str]], optional): `(month_number, name)` pairs of the month names to
+            recognize. Defaults to the full names and spelling variants of the built-in tables.
+
+    Example:
+        >>> recognizer = NepaliDateRecognizer.get_default()
+        >>> recognizer.find_first("Paid on Baishakh 15, 2081 at the branch")
+        SimpleDate(year=2081, month=1, day_of_month=15)
+    """
+
+    def __init__(self, month_names: Optional[Iterable[Tuple[int, str]]] = None):
+        if month_names is None:
+            month_names = NepaliDateRecognizer.get_default_month_names()
+
+        self.month_trie: Dict[str, dict] = {}
+        self.month_numbers: Dict[str, int] = {}
+        for month_number, name in month_names:
+            node = self.month_trie
+            for character in name.lower():
+                node = node.setdefault(character, {})
+            node[MONTH_NUMBER] = month_number
+            self.month_numbers[name.lower()] = month_number
+
+        self.token_expression = NepaliDateRecognizer.compile_token_expression(self.month_trie)
+
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def get_default() -> "NepaliDateRecognizer":
+        """
+        Returns the shared recognizer of the built-in month names.
+        """
+        return NepaliDateRecognizer()
+
+    @staticmethod
+    def get_default_month_names() -> List[Tuple[int, str]]:
+        # Short names are left out, as most are also ordinary words or single letters
+        return [
+            (month_number, name)
+            for month_number, names in enumerate(
+                zip(nepali_months, nepali_months_in_english, nepali_month_spelling_variants), start=1
+            )
+            for name in (names[0].full, names[1].full, *names[2])
+        ]
+
+    @staticmethod
+    def compile_token_expression(month_trie: Dict[str, dict]) -> Pattern:
+        """
+        Returns the expression matching a number (group 1) or a whole-word month name (group 2) with an optional
+        postposition.
+        """
+        month_name = NepaliDateRecognizer.get_trie_expression(month_trie)
+        suffixes = "|".join(MONTH_NAME_SUFFIXES)
+
+        # Devanagari has no case, so ASCII-only case folding is enough and keeps the scan fast
+        return re.compile(
+            f"{NUMBER_EXPRESSION}|(?<![{LETTER}])({month_name})(?:{suffixes})?(?![{LETTER}])",
+            re.IGNORECASE | re.ASCII
+        )
+
+    @staticmethod
+    def get_trie_expression(node: Dict[str, dict]) -> str:
+        """
+        Writes a trie node as a regular expression, e.g. the node of "jestha" and "jeth" as "je(?:stha|th)".
+        The tail after a complete name is optional and greedy, so longer names are tried first.
+        """
+        alternatives = [
+            re.escape(character) + NepaliDateRecognizer.get_trie_expression(child)
+            for character, child in sorted(node.items())
+            if character != MONTH_NUMBER
+        ]
+
+        if not alternatives:
+            return ""
+
+        expression = alternatives[0] if len(alternatives) == 1 else f"(?:{'|'.join(alternatives)})"
+        if MONTH_NUMBER in node:
+            return f"(?:{expression})?"
+
+        return expression
+
+    def tokenize(self, text: str) -> List[Tuple[int, int, int, int, int]]:
+        """
+        Returns the numbers and month names of `text` as `(kind, value, digit_count, start, end)` tuples.
+        """
+        tokens = []
+        month_numbers = self.month_numbers
+
+        for match in self.token_expression.finditer(text):
+            digits = match.group(1)
+            if digits is not None:
+                tokens.append((NUMBER, int(digits.translate(ENGLISH_DIGITS_TRANSLATION)), len(digits), *match.span()))
+            else:
+                tokens.append((MONTH, month_numbers[match.group(2).lower()], 0, *match.span()))
+
+        return tokens
+
+    def find_all(self, text: str) -> List[RecognizedNepaliDate]:
+        """
+        Returns every Nepali date in `text`, in the order they appear.
+        """
+        if FOUR_DIGITS.search(text) is None:
+            return []
+
+        tokens = self.tokenize(text)
+        dates = []
+        index = 0
+
+        while index + 2 < len(tokens):
+            first, second, third = tokens[index], tokens[index + 1], tokens[index + 2]
+            date = NepaliDateRecognizer.read_date(text, first, second, third)
+
+            if (
+                date is None
+                or not NepaliDateRecognizer.are_adjacent(text, first, second)
+                or not NepaliDateRecognizer.are_adjacent(text, second, third)
+            ):
+                index += 1
+                continue
+
+            dates.append(RecognizedNepaliDate(date, first[3], third[4]))
+            index += 3
+
+        return dates
+
+    def find_first(self, text: str) -> Optional[SimpleDate]:
+        """
+        Returns the first Nepali date in `text`, or None.
+        """
+        dates = self.find_all(text)
+        return dates[0].date if dates else None
+
+    def find_all_many(self, texts: Iterable[str]) -> List[List[RecognizedNepaliDate]]:
+        """
+        Returns the Nepali dates of every text, in input order. Texts that are not strings have no dates.
+        """
+        find_all = self.find_all
+        return [find_all(text) if isinstance(text, str) else [] for text in texts]
+
+    @staticmethod
+    def are_adjacent(text: str, token: tuple, next_token: tuple) -> bool:
+        separator = text[token[4]:next_token[3]]
+        if not separator.strip(SEPARATORS):
+            return True
+
+        # Words other than month names are not tokens, so check that the tokens are only separated by filler words
+        return not FILLER_WORD.sub(" ", separator).strip(SEPARATORS)
+
+    @staticmethod
+    def read_date(text: str, first: tuple, second: tuple, third: tuple) -> Optional[SimpleDate]:
+        """
+        Returns the date written by three consecutive tokens, or None. Does not check what is between the tokens,
+        except for numeric dates.
+        """
+        kinds = (first[0], second[0], third[0])
+
+        if kinds == (NUMBER, MONTH, NUMBER) and first[2] == 4 and third[2] <= 2:
+            year, month, day_of_month = first[1], second[1], third[1]
+        elif kinds == (NUMBER, MONTH, NUMBER) and first[2] <= 2 and third[2] == 4:
+            year, month, day_of_month = third[1], second[1], first[1]
+        elif kinds == (MONTH, NUMBER, NUMBER) and second[2] <= 2 and third[2] == 4:
+            year, month, day_of_month = third[1], first[1], second[1]
+        elif kinds == (NUMBER, NUMBER, NUMBER) and first[2] == 4 and second[2] <= 2 and third[2] <= 2:
+            separator = text[first[4]:second[3]]
+            if separator not in NUMERIC_DATE_SEPARATORS or text[second[4]:third[3]] != separator:
+                return None
+            year, month, day_of_month = first[1], second[1], third[1]
+        else:
+            return None
+
+        if year not in NepaliOrdinalIndex.years or not 1 <= month <= 12:
+            return None
+        if not 1 <= day_of_month <= NepaliOrdinalIndex.get_days_in_month(year, month):
+            return None
+
+        return SimpleDate(year, month, day_of_month)
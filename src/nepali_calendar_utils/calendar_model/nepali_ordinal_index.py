@@ -0,0 +1,91 @@
+from array import array
+from bisect import bisect_right
+from datetime import date
+from typing import Tuple
+from nepali_calendar_utils.calendar_model.nepali_calendar_defaults import NepaliCalendarDefaults
+from nepali_calendar_utils.data.nepali_year_month_map import packed_days_in_month, packed_days_in_month_start_year
+
+
+def _build_month_start_ordinals(years: range, starting_ordinal: int) -> array:
+    first_month = (years.start - packed_days_in_month_start_year) * 12
+    last_month = (years.stop - packed_days_in_month_start_year) * 12
+
+    month_start_ordinals = array("i", [starting_ordinal])
+    ordinal = starting_ordinal
+
+    for days_in_month in packed_days_in_month[first_month:last_month]:
+        ordinal += days_in_month
+        month_start_ordinals.append(ordinal)
+
+    # The last entry is a sentinel: the ordinal of the day after the last supported Nepali date
+    return month_start_ordinals
+
+
+class NepaliOrdinalIndex:
+    """
+    Cumulative day-ordinal index over `packed_days_in_month`.
+
+    Every day is addressed by its proleptic Gregorian ordinal (the value returned by `date.toordinal()`),
+    so a Nepali date and its English equivalent share the same ordinal. `month_start_ordinals` holds the
+    ordinal of the first day of every Nepali month in `NepaliCalendarDefaults.NepaliYearRange`, addressed
+    by `SimpleDate.index_in(NepaliYearRange)`, followed by a single sentinel entry.
+    """
+
+    years = NepaliCalendarDefaults.NepaliYearRange
+
+    starting_ordinal = date(
+        NepaliCalendarDefaults.startingEnglishCalendar.year,
+        NepaliCalendarDefaults.startingEnglishCalendar.month,
+        NepaliCalendarDefaults.startingEnglishCalendar.day_of_month,
+    ).toordinal()
+
+    month_start_ordinals = _build_month_start_ordinals(years, starting_ordinal)
+
+    ending_ordinal = month_start_ordinals[-1] - 1
+
+    @staticmethod
+    def get_month_index(nepali_year: int, nepali_month: int) -> int:
+        return (nepali_year - NepaliOrdinalIndex.years.start) * 12 + nepali_month - 1
+
+    @staticmethod
+    def get_days_in_month(nepali_year: int, nepali_month: int) -> int:
+        if not 1 <= nepali_month <= 12:
+            raise KeyError(nepali_month)
+
+        month_offset = (nepali_year - packed_days_in_month_start_year) * 12 + nepali_month - 1
+        if not 0 <= month_offset < len(packed_days_in_month):
+            raise KeyError(nepali_year)
+
+        return packed_days_in_month[month_offset]
+
+    @staticmethod
+    def is_ordinal_in_range(ordinal: int) -> bool:
+        return NepaliOrdinalIndex.starting_ordinal <= ordinal <= NepaliOrdinalIndex.ending_ordinal
+
+    @staticmethod
+    def nepali_to_ordinal(nepali_year: int, nepali_month: int, nepali_day: int) -> int:
+        month_index = NepaliOrdinalIndex.get_month_index(nepali_year, nepali_month)
+        return NepaliOrdinalIndex.month_start_ordinals[month_index] + nepali_day - 1
+
+    @staticmethod
+    def ordinal_to_month_index(ordinal: int) -> int:
+        if not NepaliOrdinalIndex.is_ordinal_in_range(ordinal):
+            raise ValueError(f"Out of Range: Day ordinal {ordinal} is out of range to convert.")
+
+        return bisect_right(NepaliOrdinalIndex.month_start_ordinals, ordinal) - 1
+
+    @staticmethod
+    def ordinal_to_nepali(ordinal: int) -> Tuple[int, int, int]:
+        month_index = NepaliOrdinalIndex.ordinal_to_month_index(ordinal)
+        year_offset, month_offset = divmod(month_index, 12)
+
+        return (
+            NepaliOrdinalIndex.years.start + year_offset,
+            month_offset + 1,
+            ordinal - NepaliOrdinalIndex.month_start_ordinals[month_index] + 1,
+        )
+
+    @staticmethod
+    def get_day_of_week(ordinal: int) -> int:
+        # Ordinal 1 (0001-01-01) is a Monday, so `ordinal % 7` is 0 for every Sunday.
+        return ordinal % 7 + 1
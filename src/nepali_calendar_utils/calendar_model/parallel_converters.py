@@ -0,0 +1,182 @@
+import os
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from functools import partial
+from itertools import chain, islice
+from operator import attrgetter
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from nepali_calendar_utils.data.custom_calendar import CustomCalendar
+from nepali_calendar_utils.calendar_model.date_converters import DateConverters
+
+# Stored fields of a CustomCalendar in the order they are packed; the others are derived from these
+CALENDAR_FIELDS = (
+    "year", "month", "day_of_month", "era", "first_day_of_month", "last_day_of_month", "total_days_in_month",
+    "day_of_week", "day_of_year",
+)
+
+# Chunks submitted ahead of the one being returned, per worker; bounds memory when streaming
+CHUNKS_IN_FLIGHT_PER_WORKER = 2
+
+
+def _convert_packed_dates(packed_dates: array, to_nepali: bool, as_date: bool) -> array:
+    # Runs in the worker processes, so it is a module-level function that pickles by name.
+    # Dates come in and go out as flat `array("i")` buffers, which pickle as raw bytes.
+    dates = zip(packed_dates[0::3], packed_dates[1::3], packed_dates[2::3])
+
+    if as_date:
+        return array("i", (DateConverters.get_nepali_ordinal(*nepali_date) for nepali_date in dates))
+
+    if to_nepali:
+        calendars = DateConverters.convert_many_to_nepali_calendar(dates)
+    else:
+        calendars = DateConverters.convert_many_to_english_calendar(dates)
+
+    return ParallelConverters.pack_calendars(calendars)
+
+
+class ParallelConverters:
+    """
+    Converts large streams of dates on several processes.
+
+    The input is read in chunks of `chunk_size` dates. The dates of a chunk that have not been seen before are sent
+    to a worker process as a flat `array("i")` of `(year, month, day)` triples, and come back as a flat `array("i")`
+    of CustomCalendar fields (or of day ordinals for `datetime.date` results), so only raw integer buffers cross
+    process boundaries. As in the sequential batch conversions, every distinct date is converted once: the supported
+    range only has a few tens of thousands of days, so on long inputs most dates are repeats that are resolved in
+    the calling process. Results are yielded in input order, and only a few chunks per worker are held at a time,
+    so an input iterator of any length is converted in bounded memory.
+    """
+
+    @staticmethod
+    def convert_many(
+        dates: Iterable,
+        to_nepali: bool = True,
+        workers: Optional[int] = None,
+        chunk_size: int = 10_000,
+        as_date: bool = False
+    ) -> Iterator[Union[CustomCalendar, date]]:
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1.")
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers < 1:
+            raise ValueError("workers must be at least 1.")
+
+        # `datetime.date` results only exist for Nepali to English conversion
+        as_date = as_date and not to_nepali
+        chunks = ParallelConverters.read_chunks(dates, chunk_size)
+        # Nepali dates are checked before they are submitted, so that a bad date raises here and not in a worker
+        check_date = None if to_nepali else ParallelConverters.check_nepali_date
+
+        if workers == 1:
+            # Convert each chunk in this process, when its results are needed
+            submit = lambda packed_dates: partial(_convert_packed_dates, packed_dates, to_nepali, as_date)
+            return ParallelConverters.convert_chunks(chunks, submit, 1, as_date, check_date)
+
+        return ParallelConverters.convert_on_process_pool(chunks, to_nepali, as_date, workers, check_date)
+
+    @staticmethod
+    def read_chunks(dates: Iterable, chunk_size: int) -> Iterator[List[Tuple[int, int, int]]]:
+        dates = iter(dates)
+        get_year_month_day = DateConverters.get_year_month_day
+
+        while True:
+            chunk = list(map(get_year_month_day, islice(dates, chunk_size)))
+            if not chunk:
+                return
+
+            yield chunk
+
+    @staticmethod
+    def check_nepali_date(nepali_date: Tuple[int, int, int]) -> None:
+        # Raises the ValueError the sequential conversion raises for a date out of the supported range
+        DateConverters.get_nepali_ordinal(*nepali_date)
+
+    @staticmethod
+    def convert_on_process_pool(
+        chunks: Iterator[List[Tuple[int, int, int]]],
+        to_nepali: bool,
+        as_date: bool,
+        workers: int,
+        check_date: Optional[Callable[[Tuple[int, int, int]], None]] = None
+    ) -> Iterator[Union[CustomCalendar, date]]:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            submit = lambda packed_dates: executor.submit(_convert_packed_dates, packed_dates, to_nepali, as_date).result
+            yield from ParallelConverters.convert_chunks(
+                chunks, submit, workers * CHUNKS_IN_FLIGHT_PER_WORKER, as_date, check_date
+            )
+
+    @staticmethod
+    def convert_chunks(
+        chunks: Iterator[List[Tuple[int, int, int]]],
+        submit: Callable[[array], Callable[[], array]],
+        max_pending_chunks: int,
+        as_date: bool,
+        check_date: Optional[Callable[[Tuple[int, int, int]], None]] = None
+    ) -> Iterator[Union[CustomCalendar, date]]:
+        """
+        Yields the converted dates of `chunks` in order. `submit` starts converting packed dates and returns a
+        function that waits for the packed result. Unlike `Executor.map`, which submits the whole input up front,
+        at most `max_pending_chunks` chunks are read ahead. `check_date`, if given, is called on every distinct
+        date before it is submitted and raises for dates that can't be converted.
+        """
+        converted_dates = {}
+        submitted_dates = set()
+        pending_chunks = deque()
+
+        for chunk in chunks:
+            new_dates = [date_fields for date_fields in dict.fromkeys(chunk) if date_fields not in submitted_dates]
+            if check_date is not None:
+                for date_fields in new_dates:
+                    check_date(date_fields)
+            submitted_dates.update(new_dates)
+
+            get_packed_result = submit(array("i", chain.from_iterable(new_dates))) if new_dates else None
+            pending_chunks.append((chunk, new_dates, get_packed_result))
+
+            if len(pending_chunks) >= max_pending_chunks:
+                yield from ParallelConverters.resolve_chunk(*pending_chunks.popleft(), converted_dates, as_date)
+
+        while pending_chunks:
+            yield from ParallelConverters.resolve_chunk(*pending_chunks.popleft(), converted_dates, as_date)
+
+    @staticmethod
+    def resolve_chunk(
+        chunk: List[Tuple[int, int, int]],
+        new_dates: List[Tuple[int, int, int]],
+        get_packed_result: Optional[Callable[[], array]],
+        converted_dates: Dict[Tuple[int, int, int], Union[CustomCalendar, date]],
+        as_date: bool
+    ) -> Iterator[Union[CustomCalendar, date]]:
+        if get_packed_result is not None:
+            packed_result = get_packed_result()
+            if as_date:
+                converted_dates.update(zip(new_dates, map(date.fromordinal, packed_result)))
+            else:
+                converted_dates.update(zip(new_dates, ParallelConverters.unpack_calendars(packed_result)))
+
+        return map(converted_dates.__getitem__, chunk)
+
+    @staticmethod
+    def pack_calendars(calendars: Iterable[CustomCalendar]) -> array:
+        packed_calendars = array("i")
+        get_fields = attrgetter(*CALENDAR_FIELDS)
+        for calendar in calendars:
+            packed_calendars.extend(get_fields(calendar))
+
+        return packed_calendars
+
+    @staticmethod
+    def unpack_calendars(packed_calendars: array) -> List[CustomCalendar]:
+        # Return the shared instances that sequential conversions return too
+        field_count = len(CALENDAR_FIELDS)
+        unpacked_calendars = []
+
+        for start in range(0, len(packed_calendars), field_count):
+            fields = packed_calendars[start:start + field_count]
+            calendar = CustomCalendar(*fields[:7], day_of_week=fields[7], day_of_year=fields[8])
+            unpacked_calendars.append(DateConverters.intern_calendar(calendar))
+
+        return unpacked_calendars
@@ -0,0 +1,347 @@
+"""
+Command-line interface, run with `python -m nepali_calendar_utils`.
+
+    python -m nepali_calendar_utils convert --columns date_of_birth --to bs people.csv > people_bs.csv
+    python -m nepali_calendar_utils convert --columns miti --to ad --input-pattern "yyyy/MM/dd" --format jsonl < rows.jsonl
+
+Rows are read and written in chunks of `--chunk-size`, so memory use does not grow with the size of the input.
+JSON Lines rows that do not have a date column are written unchanged, without a converted value for it.
+Dates are converted with `NepaliDateConverter`, parsed with `NepaliDateParser` and formatted with `format_many`.
+"""
+
+import argparse
+import csv
+import json
+import re
+import sys
+import time
+from datetime import date
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, TextIO, Tuple
+from nepali_calendar_utils.calendar_model.nepali_date_converter import NepaliDateConverter
+from nepali_calendar_utils.data.custom_calendar import CustomCalendar
+from nepali_calendar_utils.data.nepali_date_locale import NepaliCalendarUtilsLang
+
+DEFAULT_CHUNK_SIZE = 10_000
+DEFAULT_PATTERN = "yyyy-MM-dd"
+
+LANGUAGES = {"english": NepaliCalendarUtilsLang.ENGLISH, "nepali": NepaliCalendarUtilsLang.NEPALI}
+JSON_LINES_EXTENSIONS = (".jsonl", ".ndjson")
+
+# "YYYY-MM-DD", optionally followed by the time of a datetime. Checked before parsing, as `date.fromisoformat`
+# accepts other ISO 8601 forms (e.g. "20240413") only on Python 3.11 and later.
+ISO_DATE_PATTERN = re.compile(r"(\d{4})-(\d{2})-(\d{2})(?:[T ]|\Z)", re.ASCII)
+
+ON_ERROR_KEEP = "keep"
+ON_ERROR_EMPTY = "empty"
+ON_ERROR_FAIL = "fail"
+
+
+class ConversionError(Exception):
+    """
+    Raised to stop a conversion with `--on-error fail`, or when the input does not have the requested columns.
+    """
+
+
+def build_argument_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m nepali_calendar_utils", description="Nepali calendar utilities.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    convert = commands.add_parser(
+        "convert",
+        help="Convert date columns of CSV or JSON Lines between AD and BS.",
+        description="Convert date columns of CSV or JSON Lines files between AD (English) and BS (Nepali) dates.",
+    )
+    convert.add_argument("inputs", nargs="*", metavar="INPUT", help="Input files. Reads stdin when none are given.")
+    convert.add_argument("-c", "--columns", required=True, help="Comma-separated names of the date columns.")
+    convert.add_argument(
+        "--to", required=True, choices=("bs", "ad"), help="bs: AD dates to BS dates, ad: BS dates to AD dates."
+    )
+    convert.add_argument("-o", "--output", help="Output file. Writes to stdout when not given.")
+    convert.add_argument(
+        "-f", "--format", choices=("csv", "jsonl"),
+        help="Input and output format. Defaults to jsonl for .jsonl/.ndjson inputs and csv otherwise.",
+    )
+    convert.add_argument(
+        "--input-pattern", default=DEFAULT_PATTERN,
+        help=f"Unicode pattern of BS input dates (default {DEFAULT_PATTERN!r}). AD input dates are YYYY-MM-DD.",
+    )
+    convert.add_argument(
+        "--output-pattern", default=DEFAULT_PATTERN,
+        help=f"Unicode pattern of the converted dates (default {DEFAULT_PATTERN!r}).",
+    )
+    convert.add_argument(
+        "--language", choices=tuple(LANGUAGES), default="english",
+        help="Language of month names and digits in the patterns (default english).",
+    )
+    convert.add_argument(
+        "--suffix", default="",
+        help="Write converted dates to new columns named <column><suffix> instead of replacing the column.",
+    )
+    convert.add_argument(
+        "--on-error", choices=(ON_ERROR_KEEP, ON_ERROR_EMPTY, ON_ERROR_FAIL), default=ON_ERROR_KEEP,
+        help="What to write for a value that is not a valid date: the value as is (default), nothing, or stop.",
+    )
+    convert.add_argument(
+        "--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+        help=f"Number of rows converted at a time (default {DEFAULT_CHUNK_SIZE}).",
+    )
+    convert.add_argument("-q", "--quiet", action="store_true", help="Do not report progress and throughput.")
+
+    return parser
+
+
+def parse_english_dates(values: Sequence[object]) -> Tuple[List[Optional[date]], List[bool]]:
+    """
+    Parses "YYYY-MM-DD" dates and datetimes, e.g. "2024-04-13" or "2024-04-13T10:00:00Z", using only the date part.
+    """
+    dates: List[Optional[date]] = []
+    errors = []
+    match_iso_date = ISO_DATE_PATTERN.match
+
+    for value in values:
+        try:
+            year, month, day = match_iso_date(value).groups()
+            dates.append(date(int(year), int(month), int(day)))
+            errors.append(False)
+        except (AttributeError, ValueError, TypeError):
+            dates.append(None)
+            errors.append(True)
+
+    return dates, errors
+
+
+def convert_valid_dates(
+    dates: Sequence[object], errors: List[bool], convert_many: Callable[[List[object]], List[CustomCalendar]]
+) -> List[Optional[CustomCalendar]]:
+    """
+    Converts the dates that were parsed with `convert_many`, in one call when all of them are in the conversion range.
+    Out-of-range dates are marked in `errors` and converted to None.
+    """
+    valid_dates = [parsed_date for parsed_date, error in zip(dates, errors) if not error]
+
+    try:
+        converted_dates = iter(convert_many(valid_dates))
+        return [None if error else next(converted_dates) for error in errors]
+    except ValueError:
+        pass
+
+    # At least one date is out of range, so find which by converting them one at a time
+    converted = []
+    for index, (parsed_date, error) in enumerate(zip(dates, errors)):
+        try:
+            converted.append(None if error else convert_many([parsed_date])[0])
+        except ValueError:
+            errors[index] = True
+            converted.append(None)
+
+    return converted
+
+
+def convert_column(values: Sequence[object], arguments: argparse.Namespace) -> Tuple[List[object], int]:
+    """
+    Converts the values of one column of a chunk. Returns the values to write and the number of invalid values.
+    """
+    language = LANGUAGES[arguments.language]
+
+    if arguments.to == "bs":
+        dates, errors = parse_english_dates(values)
+        calendars = convert_valid_dates(dates, errors, NepaliDateConverter.convert_english_to_nepali_many)
+    else:
+        dates, errors = NepaliDateConverter.parse_nepali_date_many(
+            values, arguments.input_pattern, language, as_simple_date=True
+        )
+        calendars = convert_valid_dates(dates, errors, NepaliDateConverter.convert_nepali_to_english_many)
+
+    formatted_dates = iter(NepaliDateConverter.format_many(
+        [calendar for calendar in calendars if calendar is not None], arguments.output_pattern, language
+    ))
+
+    converted_values = []
+    error_count = 0
+    for value, calendar in zip(values, calendars):
+        if calendar is not None:
+            converted_values.append(next(formatted_dates))
+            continue
+
+        error_count += 1
+        if arguments.on_error == ON_ERROR_FAIL:
+            raise ConversionError(f"Invalid date {value!r}.")
+        converted_values.append(value if arguments.on_error == ON_ERROR_KEEP else "")
+
+    return converted_values, error_count
+
+
+def convert_rows(rows: Iterable[Dict[str, object]], arguments: argparse.Namespace, report: "ProgressReport") -> Iterator[Dict[str, object]]:
+    columns = arguments.column_names
+    chunk_iterator = iter(rows)
+
+    while True:
+        chunk = list(islice(chunk_iterator, arguments.chunk_size))
+        if not chunk:
+            return
+
+        for column in columns:
+            # JSON Lines rows may lack a column; they are written unchanged instead of gaining a null value
+            rows_with_column = [row for row in chunk if column in row]
+            converted_values, error_count = convert_column([row[column] for row in rows_with_column], arguments)
+            report.error_count += error_count
+            for row, converted_value in zip(rows_with_column, converted_values):
+                row[column + arguments.suffix] = converted_value
+
+        report.add_rows(len(chunk))
+        yield from chunk
+
+
+def read_json_lines(input_file: TextIO) -> Iterator[Dict[str, object]]:
+    for line_number, line in enumerate(input_file, start=1):
+        if not line.strip():
+            continue
+        row = json.loads(line)
+        if not isinstance(row, dict):
+            raise ConversionError(f"Line {line_number} is not a JSON object.")
+        yield row
+
+
+def write_json_lines(rows: Iterable[Dict[str, object]], output: TextIO) -> None:
+    write = output.write
+    for row in rows:
+        write(json.dumps(row, ensure_ascii=False))
+        write("\n")
+
+
+def read_csv_files(input_files: Iterable[TextIO], columns: Sequence[str], header: List[str]) -> Iterator[Dict[str, object]]:
+    """
+    Reads the rows of every CSV file in turn. The header of the first file is stored in `header`, and every other
+    file must have the same header.
+    """
+    for input_file in input_files:
+        reader = csv.DictReader(input_file)
+        fieldnames = reader.fieldnames or []
+
+        if not header:
+            missing_columns = [column for column in columns if column not in fieldnames]
+            if missing_columns:
+                raise ConversionError(f"Column(s) {', '.join(missing_columns)} not found in the CSV header.")
+            header.extend(fieldnames)
+        elif fieldnames != header:
+            raise ConversionError("All CSV inputs must have the same header.")
+
+        yield from reader
+
+
+def write_csv(rows: Iterable[Dict[str, object]], output: TextIO, header: List[str], columns: Sequence[str], suffix: str) -> None:
+    rows = iter(rows)
+    # The header is known once the first row has been read
+    first_row = next(rows, None)
+    if not header:
+        return
+
+    fieldnames = header + [column + suffix for column in columns if column + suffix not in header]
+    writer = csv.DictWriter(output, fieldnames=fieldnames, lineterminator="\n")
+    writer.writeheader()
+
+    if first_row is not None:
+        writer.writerow(first_row)
+        writer.writerows(rows)
+
+
+class ProgressReport:
+    """
+    Counts converted rows and reports throughput to `stream` at the end, and after every chunk when `stream`
+    is a terminal.
+    """
+
+    def __init__(self, stream: Optional[TextIO]):
+        self.stream = stream
+        self.is_live = stream is not None and stream.isatty()
+        self.row_count = 0
+        self.error_count = 0
+        self.start_time = time.perf_counter()
+
+    def add_rows(self, row_count: int) -> None:
+        self.row_count += row_count
+        if self.is_live:
+            self.stream.write(f"\r{self.describe()}")
+            self.stream.flush()
+
+    def finish(self) -> None:
+        if self.stream is not None:
+            # Overwrite the live progress line
+            prefix = "\r" if self.is_live else ""
+            self.stream.write(f"{prefix}{self.describe()}\n")
+            self.stream.flush()
+
+    def describe(self) -> str:
+        elapsed_seconds = time.perf_counter() - self.start_time
+        rows_per_second = self.row_count / elapsed_seconds if elapsed_seconds > 0 else 0.0
+        return (
+            f"{self.row_count:,} rows in {elapsed_seconds:.1f} s ({rows_per_second:,.0f} rows/s), "
+            f"{self.error_count:,} invalid dates"
+        )
+
+
+def run_convert(arguments: argparse.Namespace, stdin: TextIO, stdout: TextIO, stderr: TextIO) -> None:
+    arguments.column_names = [column.strip() for column in arguments.columns.split(",") if column.strip()]
+    if not arguments.column_names:
+        raise ConversionError("No column names given.")
+    if arguments.chunk_size < 1:
+        raise ConversionError("--chunk-size must be at least 1.")
+
+    file_format = arguments.format
+    if file_format is None:
+        is_json_lines = bool(arguments.inputs) and arguments.inputs[0].lower().endswith(JSON_LINES_EXTENSIONS)
+        file_format = "jsonl" if is_json_lines else "csv"
+
+    # Compile the input pattern before reading anything, so that an invalid pattern fails fast
+    if arguments.to == "ad":
+        NepaliDateConverter.parse_nepali_date_many([], arguments.input_pattern, LANGUAGES[arguments.language])
+
+    report = ProgressReport(None if arguments.quiet else stderr)
+    newline = "" if file_format == "csv" else None
+
+    def open_inputs() -> Iterator[TextIO]:
+        if not arguments.inputs:
+            yield stdin
+            return
+        for path in arguments.inputs:
+            with open(path, encoding="utf-8-sig", newline=newline) as input_file:
+                yield input_file
+
+    output = open(arguments.output, "w", encoding="utf-8", newline=newline) if arguments.output else stdout
+    try:
+        if file_format == "jsonl":
+            rows = (row for input_file in open_inputs() for row in read_json_lines(input_file))
+            write_json_lines(convert_rows(rows, arguments, report), output)
+        else:
+            header: List[str] = []
+            rows = read_csv_files(open_inputs(), arguments.column_names, header)
+            write_csv(convert_rows(rows, arguments, report), output, header, arguments.column_names, arguments.suffix)
+    finally:
+        if output is not stdout:
+            output.close()
+        report.finish()
+
+
+def main(
+    argv: Optional[Sequence[str]] = None,
+    stdin: Optional[TextIO] = None,
+    stdout: Optional[TextIO] = None,
+    stderr: Optional[TextIO] = None,
+) -> int:
+    """
+    Runs the command line with `argv` (defaults to `sys.argv[1:]`) and returns the exit status.
+    """
+    stdin = stdin or sys.stdin
+    stdout = stdout or sys.stdout
+    stderr = stderr or sys.stderr
+
+    arguments = build_argument_parser().parse_args(argv)
+
+    try:
+        run_convert(arguments, stdin, stdout, stderr)
+    except (ConversionError, ValueError, OSError) as error:
+        stderr.write(f"error: {error}\n")
+        return 1
+
+    return 0
@@ -1,7 +1,26 @@
-from dataclasses import dataclass, field
+from dataclasses import FrozenInstanceError, dataclass
+from typing import Optional
 
-@dataclass(frozen=True)
-class SimpleDate:
+
+class FrozenSlots:
+    """
+    Base of the immutable, slotted data classes of this module and of `NepaliDate`.
+
+    Instances have no `__dict__`, only one slot per stored field, which keeps the millions of dates a batch
+    conversion can return small and quick to build. Fields are set once in `__init__`; assigning or deleting one
+    later raises `dataclasses.FrozenInstanceError`, as for a frozen dataclass.
+    """
+
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        raise FrozenInstanceError(f"cannot assign to field {name!r}")
+
+    def __delattr__(self, name):
+        raise FrozenInstanceError(f"cannot delete field {name!r}")
+
+
+class SimpleDate(FrozenSlots):
     """
     Represents a simple date with year, month, and day of the month.
 
@@ -10,10 +29,15 @@ class SimpleDate:
         month (int): The month (1-12).
         day_of_month (int): The day of the month (1-32). Defaults to 1.
     """
-    
-    year: int
-    month: int
-    day_of_month: int = 1
+
+    __slots__ = ("year", "month", "day_of_month")
+    __match_args__ = __slots__
+
+    def __init__(self, year: int, month: int, day_of_month: int = 1):
+        set_field = object.__setattr__
+        set_field(self, "year", year)
+        set_field(self, "month", month)
+        set_field(self, "day_of_month", day_of_month)
 
     def index_in(self, years: range) -> int:
         """
@@ -21,9 +45,23 @@ class SimpleDate:
         """
         return (self.year - years.start) * 12 + self.month - 1
 
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
 
-@dataclass(frozen=True)
-class SimpleTime:
+        return (self.year, self.month, self.day_of_month) == (other.year, other.month, other.day_of_month)
+
+    def __hash__(self):
+        return hash((self.year, self.month, self.day_of_month))
+
+    def __reduce__(self):
+        return self.__class__, (self.year, self.month, self.day_of_month)
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}(year={self.year!r}, month={self.month!r}, day_of_month={self.day_of_month!r})"
+
+
+class SimpleTime(FrozenSlots):
     """
     Represents a 24-hour format time of day (hour, minute, second, nanosecond).
     Strictly adjusted to the `Asia/Kathmandu` time zone.
@@ -34,14 +72,40 @@ class SimpleTime:
         second (int): Second of the minute (0-59).
         nanosecond (int): Nanosecond of the second (0-999,999,999).
     """
-    
-    hour: int
-    minute: int
-    second: int
-    nanosecond: int
 
-@dataclass(frozen=True)
-class NepaliMonthCalendar:
+    __slots__ = ("hour", "minute", "second", "nanosecond")
+    __match_args__ = __slots__
+
+    def __init__(self, hour: int, minute: int, second: int, nanosecond: int):
+        set_field = object.__setattr__
+        set_field(self, "hour", hour)
+        set_field(self, "minute", minute)
+        set_field(self, "second", second)
+        set_field(self, "nanosecond", nanosecond)
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+
+        return (
+            (self.hour, self.minute, self.second, self.nanosecond)
+            == (other.hour, other.minute, other.second, other.nanosecond)
+        )
+
+    def __hash__(self):
+        return hash((self.hour, self.minute, self.second, self.nanosecond))
+
+    def __reduce__(self):
+        return self.__class__, (self.hour, self.minute, self.second, self.nanosecond)
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__qualname__}(hour={self.hour!r}, minute={self.minute!r}, second={self.second!r}, "
+            f"nanosecond={self.nanosecond!r})"
+        )
+
+
+class NepaliMonthCalendar(FrozenSlots):
     """
     Represents a calendar month in the Nepali calendar system.
 
@@ -56,34 +120,72 @@ class NepaliMonthCalendar:
         first_day_of_month (int): The day of the week (1-7, where 1 is Sunday) for the first day of the month.
         last_day_of_month (int): The day of the week (1-7, where 1 is Sunday) for the last day of the month.
         days_from_start_of_week_to_first_of_month (int): The number of days from the start of the week 
-            (Sunday) to the first day of the month.
+            (Sunday) to the first day of the month. Derived from `first_day_of_month`.
     """
-    
-    year: int
-    month: int
-    total_days_in_month: int
-    first_day_of_month: int
-    last_day_of_month: int
-    days_from_start_of_week_to_first_of_month: int = field(init=False)
-
-    def __post_init__(self):
-        object.__setattr__(self, 'days_from_start_of_week_to_first_of_month', self.first_day_of_month - 1)
-        
+
+    __slots__ = ("year", "month", "total_days_in_month", "first_day_of_month", "last_day_of_month")
+    __match_args__ = __slots__
+
+    def __init__(
+        self, year: int, month: int, total_days_in_month: int, first_day_of_month: int, last_day_of_month: int
+    ):
+        set_field = object.__setattr__
+        set_field(self, "year", year)
+        set_field(self, "month", month)
+        set_field(self, "total_days_in_month", total_days_in_month)
+        set_field(self, "first_day_of_month", first_day_of_month)
+        set_field(self, "last_day_of_month", last_day_of_month)
+
+    @property
+    def days_from_start_of_week_to_first_of_month(self) -> int:
+        return self.first_day_of_month - 1
+
     def index_in(self, years: range) -> int:
         """
         Returns the position of a NepaliMonthCalendar within a given years range.
         """
         return (self.year - years.start) * 12 + self.month - 1
 
+    def __eq__(self, other):
+        # Conversions return shared instances, so equal month calendars are usually the same object
+        if self is other:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
 
-@dataclass(frozen=True)
-class CustomCalendar:
+        return (
+            self.year, self.month, self.total_days_in_month, self.first_day_of_month, self.last_day_of_month
+        ) == (
+            other.year, other.month, other.total_days_in_month, other.first_day_of_month, other.last_day_of_month
+        )
+
+    def __hash__(self):
+        return hash((self.year, self.month, self.total_days_in_month, self.first_day_of_month, self.last_day_of_month))
+
+    def __reduce__(self):
+        return self.__class__, (
+            self.year, self.month, self.total_days_in_month, self.first_day_of_month, self.last_day_of_month
+        )
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__qualname__}(year={self.year!r}, month={self.month!r}, "
+            f"total_days_in_month={self.total_days_in_month!r}, first_day_of_month={self.first_day_of_month!r}, "
+            f"last_day_of_month={self.last_day_of_month!r}, "
+            f"days_from_start_of_week_to_first_of_month={self.days_from_start_of_week_to_first_of_month!r})"
+        )
+
+
+class CustomCalendar(FrozenSlots):
     """
     Represents a date in a custom calendar system with detailed information.
 
     This data class holds information about a specific date, including its year, month, day,
     era (AD or BS), and various other properties related to the day and week within the month and year.
 
+    `day_of_week_in_month`, `week_of_month` and `week_of_year` are rarely used, so the converters leave them out
+    and they are derived from the other fields when read.
+
     Attributes:
         year (int): The year in the custom calendar.
         month (int): The month in the custom calendar (1-12).
@@ -93,33 +195,83 @@ class CustomCalendar:
         last_day_of_month (int): The day of the week (1-7) for the last day of the month.
         total_days_in_month (int): The total number of days in the month.
         day_of_week_in_month (int): The number of times the day of the week occurs in the month
-            (e.g., 5 for the fifth Friday of the month). Defaults to -1 if not applicable.
+            (e.g., 5 for the fifth Friday of the month). Derived from `day_of_month` if not given.
         day_of_week (int): The day of the week (1-7, e.g., 1 for Sunday). Defaults to -1 if not applicable.
         day_of_year (int): The day of the year (1-366). Defaults to -1 if not applicable.
-        week_of_month (int): The week of the month (1-5). Defaults to -1 if not applicable.
-        week_of_year (int): The week of the year (1-53). Defaults to -1 if not applicable.
+        week_of_month (int): The week of the month (1-5). Derived from `day_of_month` and `first_day_of_month`
+            if not given.
+        week_of_year (int): The week of the year (1-53). Derived from `day_of_year` and `day_of_week` if not given,
+            or -1 if either of them is not known.
     """
-    
-    year: int
-    month: int
-    day_of_month: int
-    era: int  # 1 for AD, 2 for BS
-    first_day_of_month: int
-    last_day_of_month: int
-    total_days_in_month: int
-    day_of_week_in_month: int = -1
-    day_of_week: int = -1
-    day_of_year: int = -1
-    week_of_month: int = -1
-    week_of_year: int = -1
+
+    __slots__ = (
+        "year", "month", "day_of_month", "era", "first_day_of_month", "last_day_of_month", "total_days_in_month",
+        "day_of_week", "day_of_year", "_day_of_week_in_month", "_week_of_month", "_week_of_year",
+    )
+    __match_args__ = (
+        "year", "month", "day_of_month", "era", "first_day_of_month", "last_day_of_month", "total_days_in_month",
+        "day_of_week_in_month", "day_of_week", "day_of_year", "week_of_month", "week_of_year",
+    )
+
+    def __init__(
+        self,
+        year: int,
+        month: int,
+        day_of_month: int,
+        era: int,  # 1 for AD, 2 for BS
+        first_day_of_month: int,
+        last_day_of_month: int,
+        total_days_in_month: int,
+        day_of_week_in_month: Optional[int] = None,
+        day_of_week: int = -1,
+        day_of_year: int = -1,
+        week_of_month: Optional[int] = None,
+        week_of_year: Optional[int] = None
+    ):
+        set_field = object.__setattr__
+        set_field(self, "year", year)
+        set_field(self, "month", month)
+        set_field(self, "day_of_month", day_of_month)
+        set_field(self, "era", era)
+        set_field(self, "first_day_of_month", first_day_of_month)
+        set_field(self, "last_day_of_month", last_day_of_month)
+        set_field(self, "total_days_in_month", total_days_in_month)
+        set_field(self, "day_of_week", day_of_week)
+        set_field(self, "day_of_year", day_of_year)
+        # None means derived when read; the derivations are a few integer operations, so they are not stored
+        set_field(self, "_day_of_week_in_month", day_of_week_in_month)
+        set_field(self, "_week_of_month", week_of_month)
+        set_field(self, "_week_of_year", week_of_year)
+
+    @property
+    def day_of_week_in_month(self) -> int:
+        if self._day_of_week_in_month is not None:
+            return self._day_of_week_in_month
+
+        return (self.day_of_month - 1) // 7 + 1
+
+    @property
+    def week_of_month(self) -> int:
+        if self._week_of_month is not None:
+            return self._week_of_month
+
+        return (self.day_of_month + self.first_day_of_month - 2) // 7 + 1
+
+    @property
+    def week_of_year(self) -> int:
+        if self._week_of_year is not None:
+            return self._week_of_year
+        if self.day_of_week == -1 or self.day_of_year == -1:
+            return -1
+
+        first_day_of_year = (self.day_of_week - self.day_of_year) % 7 + 1
+        return (self.day_of_year + first_day_of_year + 5) // 7
 
     def to_simple_date(self) -> SimpleDate:
         """
         Converts this CustomCalendar object to a SimpleDate object.
         """
-        return SimpleDate(
-            year=self.year, month=self.month, day_of_month=self.day_of_month
-        )
+        return SimpleDate(self.year, self.month, self.day_of_month)
 
     def to_nepali_month_calendar(self) -> NepaliMonthCalendar:
         """
@@ -131,10 +283,44 @@ class CustomCalendar:
             total_days_in_month=self.total_days_in_month,
             first_day_of_month=self.first_day_of_month,
             last_day_of_month=self.last_day_of_month,
-            # days_from_start_of_week_to_first_of_month=self.first_day_of_month - 1,
         )
-        
-        
+
+    def get_field_values(self) -> tuple:
+        """
+        Returns the values of all fields, in the order of the constructor arguments.
+        """
+        return (
+            self.year, self.month, self.day_of_month, self.era, self.first_day_of_month, self.last_day_of_month,
+            self.total_days_in_month, self.day_of_week_in_month, self.day_of_week, self.day_of_year,
+            self.week_of_month, self.week_of_year
+        )
+
+    def __eq__(self, other):
+        # Conversions return shared instances, so equal calendars are usually the same object
+        if self is other:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+
+        return self.get_field_values() == other.get_field_values()
+
+    def __hash__(self):
+        return hash(self.get_field_values())
+
+    def __reduce__(self):
+        return self.__class__, (
+            self.year, self.month, self.day_of_month, self.era, self.first_day_of_month, self.last_day_of_month,
+            self.total_days_in_month, self._day_of_week_in_month, self.day_of_week, self.day_of_year,
+            self._week_of_month, self._week_of_year
+        )
+
+    def __repr__(self):
+        field_values = ", ".join(
+            f"{name}={value!r}" for name, value in zip(CustomCalendar.__match_args__, self.get_field_values())
+        )
+        return f"{self.__class__.__qualname__}({field_values})"
+
+
 @dataclass(frozen=True)
 class CustomDateTime:
     """
@@ -149,3 +335,18 @@ class CustomDateTime:
     """
     custom_calendar: CustomCalendar
     simple_time: SimpleTime
+
+
+@dataclass(frozen=True)
+class RecognizedNepaliDate:
+    """
+    A Nepali date found in free text.
+
+    Attributes:
+        date (SimpleDate): The Nepali date.
+        start (int): Index of the first character of the date in the text.
+        end (int): Index just past the last character of the date, so `text[start:end]` is the date as written.
+    """
+    date: SimpleDate
+    start: int
+    end: int
@@ -0,0 +1,152 @@
+from datetime import date, timedelta
+from nepali_calendar_utils.calendar_model.date_converters import DateConverters
+from nepali_calendar_utils.calendar_model.nepali_ordinal_index import NepaliOrdinalIndex
+from nepali_calendar_utils.data.custom_calendar import CustomCalendar, FrozenSlots, SimpleDate
+
+
+class NepaliDate(FrozenSlots):
+    """
+    Represents a date in the Nepali (BS) calendar as a single day ordinal.
+
+    The ordinal is the same number `date.toordinal()` returns for the equivalent English date, so a NepaliDate
+    costs one int per instance, and equality, hashing and ordering are plain integer operations. Year, month,
+    day and weekday are derived from the calendar tables on access. Like the other date classes, a NepaliDate is
+    immutable, so it can't change its hash once it's in a set or used as a dict key.
+
+    Attributes:
+        year (int): The Nepali year.
+        month (int): The Nepali month (1-12).
+        day_of_month (int): The day of the month (1-32).
+        day_of_week (int): The day of the week (1-7, where 1 is Sunday).
+
+    Example:
+        >>> new_year = NepaliDate(2081, 1, 1)
+        >>> new_year + timedelta(days=31)
+        NepaliDate(2081, 2, 1)
+        >>> new_year.to_english_date()
+        datetime.date(2024, 4, 13)
+    """
+
+    __slots__ = ("_ordinal",)
+
+    def __init__(self, year: int, month: int, day_of_month: int = 1):
+        if year not in NepaliOrdinalIndex.years or not 1 <= month <= 12:
+            raise ValueError(f"Out of Range: Nepali year {year} or month {month} is out of range.")
+        if not 1 <= day_of_month <= NepaliOrdinalIndex.get_days_in_month(year, month):
+            raise ValueError(f"Day {day_of_month} is out of range for month {month}.")
+
+        object.__setattr__(self, "_ordinal", NepaliOrdinalIndex.nepali_to_ordinal(year, month, day_of_month))
+
+    @classmethod
+    def fromordinal(cls, ordinal: int) -> "NepaliDate":
+        """
+        Creates a NepaliDate from a day ordinal, as returned by `toordinal()` or `date.toordinal()`.
+        """
+        if not NepaliOrdinalIndex.is_ordinal_in_range(ordinal):
+            raise ValueError(f"Out of Range: Day ordinal {ordinal} is out of range to convert.")
+
+        nepali_date = cls.__new__(cls)
+        object.__setattr__(nepali_date, "_ordinal", ordinal)
+        return nepali_date
+
+    @classmethod
+    def from_english_date(cls, english_date: date) -> "NepaliDate":
+        """
+        Creates the NepaliDate that falls on the given English date.
+        """
+        return cls.fromordinal(english_date.toordinal())
+
+    def toordinal(self) -> int:
+        """
+        Returns the day ordinal of this date, which is shared with the equivalent English `date`.
+        """
+        return self._ordinal
+
+    @property
+    def year(self) -> int:
+        return NepaliOrdinalIndex.years.start + NepaliOrdinalIndex.ordinal_to_month_index(self._ordinal) // 12
+
+    @property
+    def month(self) -> int:
+        return NepaliOrdinalIndex.ordinal_to_month_index(self._ordinal) % 12 + 1
+
+    @property
+    def day_of_month(self) -> int:
+        month_index = NepaliOrdinalIndex.ordinal_to_month_index(self._ordinal)
+        return self._ordinal - NepaliOrdinalIndex.month_start_ordinals[month_index] + 1
+
+    @property
+    def day_of_week(self) -> int:
+        return NepaliOrdinalIndex.get_day_of_week(self._ordinal)
+
+    def to_simple_date(self) -> SimpleDate:
+        """
+        Converts this NepaliDate object to a SimpleDate object.
+        """
+        return SimpleDate(*NepaliOrdinalIndex.ordinal_to_nepali(self._ordinal))
+
+    def to_english_date(self) -> date:
+        """
+        Converts this NepaliDate object to the equivalent English `date`.
+        """
+        return date.fromordinal(self._ordinal)
+
+    def to_custom_calendar(self) -> CustomCalendar:
+        """
+        Converts this NepaliDate object to a fully populated Nepali CustomCalendar object.
+        """
+        return DateConverters.get_nepali_calendar_from_ordinal(self._ordinal)
+
+    def __add__(self, other):
+        if isinstance(other, timedelta):
+            return NepaliDate.fromordinal(self._ordinal + other.days)
+        return NotImplemented
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if isinstance(other, NepaliDate):
+            return timedelta(days=self._ordinal - other._ordinal)
+        if isinstance(other, timedelta):
+            return NepaliDate.fromordinal(self._ordinal - other.days)
+        return NotImplemented
+
+    def __eq__(self, other):
+        if isinstance(other, NepaliDate):
+            return self._ordinal == other._ordinal
+        return NotImplemented
+
+    def __ne__(self, other):
+        if isinstance(other, NepaliDate):
+            return self._ordinal != other._ordinal
+        return NotImplemented
+
+    def __lt__(self, other):
+        if isinstance(other, NepaliDate):
+            return self._ordinal < other._ordinal
+        return NotImplemented
+
+    def __le__(self, other):
+        if isinstance(other, NepaliDate):
+            return self._ordinal <= other._ordinal
+        return NotImplemented
+
+    def __gt__(self, other):
+        if isinstance(other, NepaliDate):
+            return self._ordinal > other._ordinal
+        return NotImplemented
+
+    def __ge__(self, other):
+        if isinstance(other, NepaliDate):
+            return self._ordinal >= other._ordinal
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self._ordinal)
+
+    def __reduce__(self):
+        return NepaliDate.fromordinal, (self._ordinal,)
+
+    def __repr__(self):
+        year, month, day_of_month = NepaliOrdinalIndex.ordinal_to_nepali(self._ordinal)
+        return f"NepaliDate({year}, {month}, {day_of_month})"
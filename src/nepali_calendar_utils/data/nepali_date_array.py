@@ -0,0 +1,250 @@
+from array import array
+from bisect import bisect_right
+from datetime import date
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from nepali_calendar_utils.calendar_model.nepali_ordinal_index import NepaliOrdinalIndex
+from nepali_calendar_utils.data.nepali_date import NepaliDate
+
+
+class NepaliDateArray:
+    """
+    Column of Nepali (BS) dates stored as day ordinals in a single `array('i')` buffer.
+
+    Each date costs 4 bytes instead of one Python object, which is what matters when a pipeline holds millions
+    of them. The ordinals are the ones `NepaliDate.toordinal()` and `date.toordinal()` return, so conversion to
+    English dates, sorting and range filters are plain integer operations; year, month, day and weekday columns
+    are derived from the `NepaliOrdinalIndex` tables in bulk when asked for. The array is immutable: slicing,
+    sorting and filtering return new arrays.
+
+    The ordinals can be read without copying through `toordinals()`, a read-only `memoryview` of format `"i"`
+    (e.g. `numpy.frombuffer(dates.toordinals(), dtype=numpy.int32)`), or with `memoryview(dates)` on Python 3.12+.
+
+    Args:
+        nepali_dates (Iterable): NepaliDate objects, or (year, month, day_of_month) tuples.
+
+    Raises:
+        ValueError: If any of the dates is out of the supported range.
+
+    Example:
+        >>> dates = NepaliDateArray([(2081, 1, 1), (2080, 12, 30), (2081, 2, 15)])
+        >>> dates.sorted().filter(year=2081).to_dict()
+        {'year': [2081, 2081], 'month': [1, 2], 'day_of_month': [1, 15], 'day_of_week': [7, 3]}
+        >>> dates.to_english_dates()[0]
+        datetime.date(2024, 4, 13)
+    """
+
+    __slots__ = ("_ordinals",)
+
+    def __init__(self, nepali_dates: Iterable[Union[NepaliDate, Tuple[int, int, int]]] = ()):
+        ordinals = array("i")
+        append = ordinals.append
+
+        for nepali_date in nepali_dates:
+            if isinstance(nepali_date, NepaliDate):
+                append(nepali_date.toordinal())
+            else:
+                append(NepaliDateArray._nepali_to_ordinal(*nepali_date))
+
+        self._ordinals = ordinals
+
+    @classmethod
+    def fromordinals(cls, ordinals: Iterable[int]) -> "NepaliDateArray":
+        """
+        Creates a NepaliDateArray from day ordinals, e.g. another array's `toordinals()` or `date.toordinal()` values.
+        """
+        return cls._from_array(array("i", ordinals))
+
+    @classmethod
+    def from_english_dates(cls, english_dates: Iterable[date]) -> "NepaliDateArray":
+        """
+        Converts English dates to a NepaliDateArray of the same dates.
+        """
+        return cls._from_array(array("i", map(date.toordinal, english_dates)))
+
+    @classmethod
+    def from_columns(cls, years: Iterable[int], months: Iterable[int], days_of_month: Iterable[int]) -> "NepaliDateArray":
+        """
+        Creates a NepaliDateArray from separate Nepali year, month and day columns of the same length.
+
+        Raises:
+            ValueError: If the columns differ in length, or any of the dates is out of the supported range.
+        """
+        years, months, days_of_month = (
+            column if hasattr(column, "__len__") else list(column) for column in (years, months, days_of_month)
+        )
+        if not len(years) == len(months) == len(days_of_month):
+            raise ValueError(
+                f"Columns differ in length: {len(years)} years, {len(months)} months, {len(days_of_month)} days."
+            )
+
+        nepali_to_ordinal = NepaliDateArray._nepali_to_ordinal
+        nepali_dates = cls.__new__(cls)
+        nepali_dates._ordinals = array("i", map(nepali_to_ordinal, years, months, days_of_month))
+        return nepali_dates
+
+    @classmethod
+    def _from_array(cls, ordinals: array) -> "NepaliDateArray":
+        if ordinals and not (
+            NepaliOrdinalIndex.is_ordinal_in_range(min(ordinals))
+            and NepaliOrdinalIndex.is_ordinal_in_range(max(ordinals))
+        ):
+            raise ValueError("Out of Range: Day ordinals are out of range to convert.")
+
+        nepali_dates = cls.__new__(cls)
+        nepali_dates._ordinals = ordinals
+        return nepali_dates
+
+    @staticmethod
+    def _nepali_to_ordinal(year: int, month: int, day_of_month: int) -> int:
+        if year not in NepaliOrdinalIndex.years or not 1 <= month <= 12:
+            raise ValueError(f"Out of Range: Nepali year {year} or month {month} is out of range.")
+
+        month_index = NepaliOrdinalIndex.get_month_index(year, month)
+        month_start_ordinal = NepaliOrdinalIndex.month_start_ordinals[month_index]
+
+        if not 1 <= day_of_month <= NepaliOrdinalIndex.month_start_ordinals[month_index + 1] - month_start_ordinal:
+            raise ValueError(f"Day {day_of_month} is out of range for month {month}.")
+
+        return month_start_ordinal + day_of_month - 1
+
+    def toordinals(self) -> memoryview:
+        """
+        Returns a read-only view of the day ordinals, without copying them.
+        """
+        view = memoryview(self._ordinals)
+        # `memoryview.toreadonly()` is new in Python 3.8
+        return view.toreadonly() if hasattr(view, "toreadonly") else view
+
+    def __buffer__(self, flags: int) -> memoryview:
+        return self.toordinals()
+
+    def _get_month_indexes(self) -> array:
+        month_start_ordinals = NepaliOrdinalIndex.month_start_ordinals
+        return array("i", [bisect_right(month_start_ordinals, ordinal) - 1 for ordinal in self._ordinals])
+
+    @property
+    def years(self) -> array:
+        first_year = NepaliOrdinalIndex.years.start
+        return array("i", [first_year + month_index // 12 for month_index in self._get_month_indexes()])
+
+    @property
+    def months(self) -> array:
+        return array("i", [month_index % 12 + 1 for month_index in self._get_month_indexes()])
+
+    @property
+    def days_of_month(self) -> array:
+        month_start_ordinals = NepaliOrdinalIndex.month_start_ordinals
+        return array("i", [
+            ordinal - month_start_ordinals[month_index] + 1
+            for ordinal, month_index in zip(self._ordinals, self._get_month_indexes())
+        ])
+
+    @property
+    def days_of_week(self) -> array:
+        # Same as `NepaliOrdinalIndex.get_day_of_week`, without a call per date
+        return array("i", [ordinal % 7 + 1 for ordinal in self._ordinals])
+
+    def to_columns(self) -> Dict[str, array]:
+        """
+        Returns the year, month, day_of_month and day_of_week columns as `array('i')` buffers.
+        """
+        month_start_ordinals = NepaliOrdinalIndex.month_start_ordinals
+        first_year = NepaliOrdinalIndex.years.start
+        years, months, days_of_month = array("i"), array("i"), array("i")
+
+        for ordinal in self._ordinals:
+            month_index = bisect_right(month_start_ordinals, ordinal) - 1
+            years.append(first_year + month_index // 12)
+            months.append(month_index % 12 + 1)
+            days_of_month.append(ordinal - month_start_ordinals[month_index] + 1)
+
+        return {"year": years, "month": months, "day_of_month": days_of_month, "day_of_week": self.days_of_week}
+
+    def to_dict(self) -> Dict[str, List[int]]:
+        """
+        Returns the year, month, day_of_month and day_of_week columns as lists, e.g. to build a DataFrame.
+        """
+        return {name: column.tolist() for name, column in self.to_columns().items()}
+
+    def to_english_dates(self) -> List[date]:
+        """
+        Converts every date to the equivalent English `date`.
+        """
+        return list(map(date.fromordinal, self._ordinals))
+
+    def sorted(self, reverse: bool = False) -> "NepaliDateArray":
+        """
+        Returns a new array with the dates in chronological order, or latest first when `reverse` is True.
+        """
+        return self._with_ordinals(array("i", sorted(self._ordinals, reverse=reverse)))
+
+    def argsort(self, reverse: bool = False) -> array:
+        """
+        Returns the positions that would sort the dates, to reorder columns stored alongside this array.
+        """
+        ordinals = self._ordinals
+        return array("i", sorted(range(len(ordinals)), key=ordinals.__getitem__, reverse=reverse))
+
+    def filter(self, year: Optional[int] = None, month: Optional[int] = None) -> "NepaliDateArray":
+        """
+        Returns a new array with only the dates in the given Nepali year and/or month, keeping their order.
+
+        A year alone keeps the whole year, a month alone keeps that month of every year.
+        """
+        if month is not None and not 1 <= month <= 12:
+            raise ValueError(f"Month {month} is out of range.")
+
+        ordinals = self._ordinals
+
+        if year is not None:
+            if year not in NepaliOrdinalIndex.years:
+                return self._with_ordinals(array("i"))
+
+            first_month, last_month = (1, 12) if month is None else (month, month)
+            month_start_ordinals = NepaliOrdinalIndex.month_start_ordinals
+            start = month_start_ordinals[NepaliOrdinalIndex.get_month_index(year, first_month)]
+            stop = month_start_ordinals[NepaliOrdinalIndex.get_month_index(year, last_month) + 1]
+            return self._with_ordinals(array("i", [ordinal for ordinal in ordinals if start <= ordinal < stop]))
+
+        if month is not None:
+            month_offset = month - 1
+            return self._with_ordinals(array("i", [
+                ordinal for ordinal, month_index in zip(ordinals, self._get_month_indexes())
+                if month_index % 12 == month_offset
+            ]))
+
+        return self
+
+    def _with_ordinals(self, ordinals: array) -> "NepaliDateArray":
+        nepali_dates = self.__class__.__new__(self.__class__)
+        nepali_dates._ordinals = ordinals
+        return nepali_dates
+
+    def __len__(self) -> int:
+        return len(self._ordinals)
+
+    def __iter__(self) -> Iterator[NepaliDate]:
+        return map(NepaliDate.fromordinal, self._ordinals)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._with_ordinals(self._ordinals[index])
+        return NepaliDate.fromordinal(self._ordinals[index])
+
+    def __contains__(self, nepali_date) -> bool:
+        return isinstance(nepali_date, NepaliDate) and nepali_date.toordinal() in self._ordinals
+
+    def __eq__(self, other):
+        if isinstance(other, NepaliDateArray):
+            return self._ordinals == other._ordinals
+        return NotImplemented
+
+    __hash__ = None
+
+    def __reduce__(self):
+        return self.__class__.fromordinals, (self._ordinals,)
+
+    def __repr__(self):
+        columns = self.to_columns()
+        nepali_dates = ", ".join(map(repr, zip(columns["year"], columns["month"], columns["day_of_month"])))
+        return f"{self.__class__.__name__}([{nepali_dates}])"
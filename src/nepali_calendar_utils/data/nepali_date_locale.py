@@ -106,6 +106,23 @@ english_months_in_nepali = [
     NepaliMonthName(short="डिसे", full="डिसेम्बर"),
 ]
 
+# Other spellings of the Nepali months seen in free text, in month order. The names in `nepali_months` and
+# `nepali_months_in_english` are recognized as well.
+nepali_month_spelling_variants = [
+    ("Baishakh", "Baisakh", "Baishak", "Baisak", "Vaishakh", "Vaisakh", "Vaishakha", "बैसाख", "वैशाख", "वैसाख"),
+    ("Jestha", "Jeth", "Jesth", "Jeshtha", "Jyestha", "Jyeshtha", "जेष्ठ", "ज्येष्ठ", "जेठ"),
+    ("Asar", "Ashar", "Asadh", "Ashadh", "Ashad", "Aasar", "Asaar", "आषाढ", "असाढ", "असार"),
+    ("Shrawan", "Shrawn", "Shravan", "Srawan", "Sawan", "Saun", "Sauna", "Shrawana", "श्रावण", "साउन"),
+    ("Bhadra", "Bhadau", "Bhadaw", "Bhado", "Bhadrapad", "भाद्र", "भाद्रपद", "भदौ"),
+    ("Asoj", "Ashoj", "Ashwin", "Aswin", "Ashwina", "Ashwoj", "आश्विन", "असोज"),
+    ("Kartik", "Kartika", "Kattik", "Kartick", "कात्तिक", "कार्तिक"),
+    ("Mangsir", "Mansir", "Mangshir", "Marga", "Margashirsha", "मङ्सिर", "मार्ग", "मार्गशीर्ष", "मंसिर"),
+    ("Poush", "Push", "Paush", "Pus", "Poos", "पुष", "पुस", "पौष"),
+    ("Magh", "Maagh", "Magha", "माघ"),
+    ("Falgun", "Phalgun", "Fagun", "Phagun", "Falgoon", "फागुन", "फाल्गुण", "फाल्गुन"),
+    ("Chaitra", "Chait", "Chaite", "Chaitr", "चैत्र", "चैते", "चैत"),
+]
+
 class NepaliCalendarUtilsLang(Enum):
     ENGLISH = {
         "weekdays": english_weekdays,
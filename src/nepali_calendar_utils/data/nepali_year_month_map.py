@@ -6,404 +6,209 @@ class ReferenceDate:
     englishDate: 'CustomCalendar'
     nepaliDate: 'CustomCalendar'
 
-days_in_month_map = {
-    1969 : [0, 31, 32, 31, 32, 31, 30, 30, 30, 29, 30, 29, 31],
-    1970 : [0, 31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30],
-    1971 : [0, 31, 31, 32, 31, 32, 30, 30, 29, 30, 29, 30, 30],
-    1972 : [0, 31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31],
-    1973 : [0, 30, 32, 31, 32, 31, 30, 30, 30, 29, 30, 29, 31],
-    1974 : [0, 30, 32, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30],
-    1975 : [0, 31, 31, 32, 32, 31, 30, 30, 29, 30, 29, 30, 30],
-    1976 : [0, 31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31],
-    1977 : [0, 30, 32, 31, 32, 31, 31, 29, 30, 29, 30, 29, 31],
-    1978 : [0, 31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30],
-    1979 : [0, 31, 31, 32, 32, 31, 30, 30, 29, 30, 29, 30, 30],
-    1980 : [0, 31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31],
-    1981 : [0, 31, 31, 31, 32, 31, 31, 29, 30, 30, 29, 30, 30],
-    1982 : [0, 31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30],
-    1983 : [0, 31, 31, 32, 32, 31, 30, 30, 29, 30, 29, 30, 30],
-    1984 : [0, 31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31],
-    1985 : [0, 31, 31, 31, 32, 31, 31, 29, 30, 30, 29, 30, 30],
-    1986 : [0, 31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30],
-    1987 : [0, 31, 32, 31, 32, 31, 30, 30, 29, 30, 29, 30, 30],
-    1988 : [0, 31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31],
-    1989 : [0, 31, 31, 31, 32, 31, 31, 30, 29, 30, 29, 30, 30],
-    1990 : [0, 31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30],
-    1991 : [0, 31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 30],
-    1992 : [0, 31, 32, 31, 32, 31, 30, 30, 30, 29, 30, 29, 31],
-    1993 : [0, 31, 31, 31, 32, 31, 31, 30, 29, 30, 29, 30, 30],
-    1994 : [0, 31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30],
-    1995 : [0, 31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 30],
-    1996 : [0, 31, 32, 31, 32, 31, 30, 30, 30, 29, 30, 29, 31],
-    1997 : [0, 31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30],
-    1998 : [0, 31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30],
-    1999 : [0, 31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31],
-    2000 : [0, 30, 32, 31, 32, 31, 30, 30, 30, 29, 30, 29, 31],
-    2001 : [0, 31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30],
-    2002 : [0, 31, 31, 32, 32, 31, 30, 30, 29, 30, 29, 30, 30],
-    2003 : [0, 31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31],
-    2004 : [0, 30, 32, 31, 32, 31, 30, 30, 30, 29, 30, 29, 31],
-    2005 : [0, 31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30],
-    2006 : [0, 31, 31, 32, 32, 31, 30, 30, 29, 30, 29, 30, 30],
-    2007 : [0, 31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31],
-    2008 : [0, 31, 31, 31, 32, 31, 31, 29, 30, 30, 29, 29, 31],
-    2009 : [0, 31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30],
-    2010 : [0, 31, 31, 32, 32, 31, 30, 30, 29, 30, 29, 30, 30],
-    2011 : [0, 31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31],
-    2012 : [0, 31, 31, 31, 32, 31, 31, 29, 30, 30, 29, 30, 30],
-    2013 : [0, 31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30],
-    2014 : [0, 31, 31, 32, 32, 31, 30, 30, 29, 30, 29, 30, 30],
-    2015 : [0, 31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31],
-    2016 : [0, 31, 31, 31, 32, 31, 31, 29, 30, 30, 29, 30, 30],
-    2017 : [0, 31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30],
-    2018 : [0, 31, 32, 31, 32, 31, 30, 30, 29, 30, 29, 30, 30],
-    2019 : [0, 31, 32, 31, 32, 31, 30, 30, 30, 29, 30, 29, 31],
-    2020 : [0, 31, 31, 31, 32, 31, 31, 30, 29, 30, 29, 30, 30],
-    2021 : [0, 31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30],
-    2022 : [0, 31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 30],
-    2023 : [0, 31, 32, 31, 32, 31, 30, 30, 30, 29, 30, 29, 31],
-    2024 : [0, 31, 31, 31, 32, 31, 31, 30, 29, 30, 29, 30, 30],
-    2025 : [0, 31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30],
-    2026 : [0, 31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31],
-    2027 : [0, 30, 32, 31, 32, 31, 30, 30, 30, 29, 30, 29, 31],
-    2028 : [0, 31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30],
-    2029 : [0, 31, 31, 32, 31, 32, 30, 30, 29, 30, 29, 30, 30],
-    2030 : [0, 31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31],
-    2031 : [0, 30, 32, 31, 32, 31, 30, 30, 30, 29, 30, 29, 31],
-    2032 : [0, 31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30],
-    2033 : [0, 31, 31, 32, 32, 31, 30, 30, 29, 30, 29, 30, 30],
-    2034 : [0, 31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31],
-    2035 : [0, 30, 32, 31, 32, 31, 31, 29, 30, 30, 29, 29, 31],
-    2036 : [0, 31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30],
-    2037 : [0, 31, 31, 32, 32, 31, 30, 30, 29, 30, 29, 30, 30],
-    2038 : [0, 31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31],
-    2039 : [0, 31, 31, 31, 32, 31, 31, 29, 30, 30, 29, 30, 30],
-    2040 : [0, 31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30],
-    2041 : [0, 31, 31, 32, 32, 31, 30, 30, 29, 30, 29, 30, 30],
-    2042 : [0, 31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31],
-    2043 : [0, 31, 31, 31, 32, 31, 31, 29, 30, 30, 29, 30, 30],
-    2044 : [0, 31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30],
-    2045 : [0, 31, 32, 31, 32, 31, 30, 30, 29, 30, 29, 30, 30],
-    2046 : [0, 31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31],
-    2047 : [0, 31, 31, 31, 32, 31, 31, 30, 29, 30, 29, 30, 30],
-    2048 : [0, 31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30],
-    2049 : [0, 31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 30],
-    2050 : [0, 31, 32, 31, 32, 31, 30, 30, 30, 29, 30, 29, 31],
-    2051 : [0, 31, 31, 31, 32, 31, 31, 30, 29, 30, 29, 30, 30],
-    2052 : [0, 31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30],
-    2053 : [0, 31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 30],
-    2054 : [0, 31, 32, 31, 32, 31, 30, 30, 30, 29, 30, 29, 31],
-    2055 : [0, 31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30],
-    2056 : [0, 31, 31, 32, 31, 32, 30, 30, 29, 30, 29, 30, 30],
-    2057 : [0, 31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31],
-    2058 : [0, 30, 32, 31, 32, 31, 30, 30, 30, 29, 30, 29, 31],
-    2059 : [0, 31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30],
-    2060 : [0, 31, 31, 32, 32, 31, 30, 30, 29, 30, 29, 30, 30],
-    2061 : [0, 31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31],
-    2062 : [0, 30, 32, 31, 32, 31, 31, 29, 30, 29, 30, 29, 31],
-    2063 : [0, 31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30],
-    2064 : [0, 31, 31, 32, 32, 31, 30, 30, 29, 30, 29, 30, 30],
-    2065 : [0, 31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31],
-    2066 : [0, 31, 31, 31, 32, 31, 31, 29, 30, 30, 29, 29, 31],
-    2067 : [0, 31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30],
-    2068 : [0, 31, 31, 32, 32, 31, 30, 30, 29, 30, 29, 30, 30],
-    2069 : [0, 31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31],
-    2070 : [0, 31, 31, 31, 32, 31, 31, 29, 30, 30, 29, 30, 30],
-    2071 : [0, 31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30],
-    2072 : [0, 31, 32, 31, 32, 31, 30, 30, 29, 30, 29, 30, 30],
-    2073 : [0, 31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31],
-    2074 : [0, 31, 31, 31, 32, 31, 31, 30, 29, 30, 29, 30, 30],
-    2075 : [0, 31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30],
-    2076 : [0, 31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 30],
-    2077 : [0, 31, 32, 31, 32, 31, 30, 30, 30, 29, 30, 29, 31],
-    2078 : [0, 31, 31, 31, 32, 31, 31, 30, 29, 30, 29, 30, 30],
-    2079 : [0, 31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30],
-    2080 : [0, 31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 30],
-    2081 : [0, 31, 32, 31, 32, 31, 30, 30, 30, 29, 30, 29, 31],
-    2082 : [0, 31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30],
-    2083 : [0, 31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30],
-    2084 : [0, 31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31],
-    2085 : [0, 30, 32, 31, 32, 31, 30, 30, 30, 29, 30, 29, 31],
-    2086 : [0, 31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30],
-    2087 : [0, 31, 31, 32, 32, 31, 30, 30, 29, 30, 29, 30, 30],
-    2088 : [0, 31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31],
-    2089 : [0, 30, 32, 31, 32, 31, 30, 30, 30, 29, 30, 29, 31],
-    2090 : [0, 31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30],
-    2091 : [0, 31, 31, 32, 32, 31, 30, 30, 29, 30, 29, 30, 30],
-    2092 : [0, 31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31],
-    2093 : [0, 31, 31, 31, 32, 31, 31, 29, 30, 30, 29, 29, 31],
-    2094 : [0, 31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30],
-    2095 : [0, 31, 31, 32, 32, 31, 30, 30, 29, 30, 29, 30, 30],
-    2096 : [0, 31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31],
-    2097 : [0, 31, 31, 31, 32, 31, 31, 29, 30, 30, 29, 30, 30],
-    2098 : [0, 31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30],
-    2099 : [0, 31, 31, 32, 32, 31, 30, 30, 29, 30, 29, 30, 30],
-    2100 : [0, 31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31]
-}
+# The first Nepali year stored in `packed_days_in_month`
+packed_days_in_month_start_year = 1969
 
-# For optimization
-english_date_map = {
-    1914 : ReferenceDate(englishDate = CustomCalendar(year=1914, month=4, day_of_month=13, era=1, first_day_of_month=4, last_day_of_month=5, total_days_in_month=30, day_of_week_in_month=2, day_of_week=2, day_of_year=103, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=1971, month=1, day_of_month=1, era=2, first_day_of_month=2, last_day_of_month=4, total_days_in_month=31, day_of_week_in_month=1, day_of_week=2, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1915 : ReferenceDate(englishDate = CustomCalendar(year=1915, month=4, day_of_month=13, era=1, first_day_of_month=5, last_day_of_month=6, total_days_in_month=30, day_of_week_in_month=2, day_of_week=3, day_of_year=103, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=1972, month=1, day_of_month=1, era=2, first_day_of_month=3, last_day_of_month=5, total_days_in_month=31, day_of_week_in_month=1, day_of_week=3, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1916 : ReferenceDate(englishDate = CustomCalendar(year=1916, month=4, day_of_month=13, era=1, first_day_of_month=7, last_day_of_month=1, total_days_in_month=30, day_of_week_in_month=2, day_of_week=5, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=1973, month=1, day_of_month=1, era=2, first_day_of_month=5, last_day_of_month=6, total_days_in_month=30, day_of_week_in_month=1, day_of_week=5, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1917 : ReferenceDate(englishDate = CustomCalendar(year=1917, month=4, day_of_month=13, era=1, first_day_of_month=1, last_day_of_month=2, total_days_in_month=30, day_of_week_in_month=2, day_of_week=6, day_of_year=103, week_of_month=2, week_of_year=15), nepaliDate = CustomCalendar(year=1974, month=1, day_of_month=1, era=2, first_day_of_month=6, last_day_of_month=7, total_days_in_month=30, day_of_week_in_month=1, day_of_week=6, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1918 : ReferenceDate(englishDate = CustomCalendar(year=1918, month=4, day_of_month=13, era=1, first_day_of_month=2, last_day_of_month=3, total_days_in_month=30, day_of_week_in_month=2, day_of_week=7, day_of_year=103, week_of_month=2, week_of_year=15), nepaliDate = CustomCalendar(year=1975, month=1, day_of_month=1, era=2, first_day_of_month=7, last_day_of_month=2, total_days_in_month=31, day_of_week_in_month=1, day_of_week=7, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1919 : ReferenceDate(englishDate = CustomCalendar(year=1919, month=4, day_of_month=13, era=1, first_day_of_month=3, last_day_of_month=4, total_days_in_month=30, day_of_week_in_month=2, day_of_week=1, day_of_year=103, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=1976, month=1, day_of_month=1, era=2, first_day_of_month=1, last_day_of_month=3, total_days_in_month=31, day_of_week_in_month=1, day_of_week=1, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1920 : ReferenceDate(englishDate = CustomCalendar(year=1920, month=4, day_of_month=13, era=1, first_day_of_month=5, last_day_of_month=6, total_days_in_month=30, day_of_week_in_month=2, day_of_week=3, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=1977, month=1, day_of_month=1, era=2, first_day_of_month=3, last_day_of_month=4, total_days_in_month=30, day_of_week_in_month=1, day_of_week=3, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1921 : ReferenceDate(englishDate = CustomCalendar(year=1921, month=4, day_of_month=13, era=1, first_day_of_month=6, last_day_of_month=7, total_days_in_month=30, day_of_week_in_month=2, day_of_week=4, day_of_year=103, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=1978, month=1, day_of_month=1, era=2, first_day_of_month=4, last_day_of_month=6, total_days_in_month=31, day_of_week_in_month=1, day_of_week=4, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1922 : ReferenceDate(englishDate = CustomCalendar(year=1922, month=4, day_of_month=13, era=1, first_day_of_month=7, last_day_of_month=1, total_days_in_month=30, day_of_week_in_month=2, day_of_week=5, day_of_year=103, week_of_month=3, week_of_year=15), nepaliDate = CustomCalendar(year=1979, month=1, day_of_month=1, era=2, first_day_of_month=5, last_day_of_month=7, total_days_in_month=31, day_of_week_in_month=1, day_of_week=5, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1923 : ReferenceDate(englishDate = CustomCalendar(year=1923, month=4, day_of_month=13, era=1, first_day_of_month=1, last_day_of_month=2, total_days_in_month=30, day_of_week_in_month=2, day_of_week=6, day_of_year=103, week_of_month=2, week_of_year=15), nepaliDate = CustomCalendar(year=1980, month=1, day_of_month=1, era=2, first_day_of_month=6, last_day_of_month=1, total_days_in_month=31, day_of_week_in_month=1, day_of_week=6, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1924 : ReferenceDate(englishDate = CustomCalendar(year=1924, month=4, day_of_month=13, era=1, first_day_of_month=3, last_day_of_month=4, total_days_in_month=30, day_of_week_in_month=2, day_of_week=1, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=1981, month=1, day_of_month=1, era=2, first_day_of_month=1, last_day_of_month=3, total_days_in_month=31, day_of_week_in_month=1, day_of_week=1, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1925 : ReferenceDate(englishDate = CustomCalendar(year=1925, month=4, day_of_month=13, era=1, first_day_of_month=4, last_day_of_month=5, total_days_in_month=30, day_of_week_in_month=2, day_of_week=2, day_of_year=103, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=1982, month=1, day_of_month=1, era=2, first_day_of_month=2, last_day_of_month=4, total_days_in_month=31, day_of_week_in_month=1, day_of_week=2, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1926 : ReferenceDate(englishDate = CustomCalendar(year=1926, month=4, day_of_month=13, era=1, first_day_of_month=5, last_day_of_month=6, total_days_in_month=30, day_of_week_in_month=2, day_of_week=3, day_of_year=103, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=1983, month=1, day_of_month=1, era=2, first_day_of_month=3, last_day_of_month=5, total_days_in_month=31, day_of_week_in_month=1, day_of_week=3, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1927 : ReferenceDate(englishDate = CustomCalendar(year=1927, month=4, day_of_month=13, era=1, first_day_of_month=6, last_day_of_month=7, total_days_in_month=30, day_of_week_in_month=2, day_of_week=4, day_of_year=103, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=1984, month=1, day_of_month=1, era=2, first_day_of_month=4, last_day_of_month=6, total_days_in_month=31, day_of_week_in_month=1, day_of_week=4, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1928 : ReferenceDate(englishDate = CustomCalendar(year=1928, month=4, day_of_month=13, era=1, first_day_of_month=1, last_day_of_month=2, total_days_in_month=30, day_of_week_in_month=2, day_of_week=6, day_of_year=104, week_of_month=2, week_of_year=15), nepaliDate = CustomCalendar(year=1985, month=1, day_of_month=1, era=2, first_day_of_month=6, last_day_of_month=1, total_days_in_month=31, day_of_week_in_month=1, day_of_week=6, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1929 : ReferenceDate(englishDate = CustomCalendar(year=1929, month=4, day_of_month=13, era=1, first_day_of_month=2, last_day_of_month=3, total_days_in_month=30, day_of_week_in_month=2, day_of_week=7, day_of_year=103, week_of_month=2, week_of_year=15), nepaliDate = CustomCalendar(year=1986, month=1, day_of_month=1, era=2, first_day_of_month=7, last_day_of_month=2, total_days_in_month=31, day_of_week_in_month=1, day_of_week=7, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1930 : ReferenceDate(englishDate = CustomCalendar(year=1930, month=4, day_of_month=13, era=1, first_day_of_month=3, last_day_of_month=4, total_days_in_month=30, day_of_week_in_month=2, day_of_week=1, day_of_year=103, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=1987, month=1, day_of_month=1, era=2, first_day_of_month=1, last_day_of_month=3, total_days_in_month=31, day_of_week_in_month=1, day_of_week=1, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1931 : ReferenceDate(englishDate = CustomCalendar(year=1931, month=4, day_of_month=13, era=1, first_day_of_month=4, last_day_of_month=5, total_days_in_month=30, day_of_week_in_month=2, day_of_week=2, day_of_year=103, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=1988, month=1, day_of_month=1, era=2, first_day_of_month=2, last_day_of_month=4, total_days_in_month=31, day_of_week_in_month=1, day_of_week=2, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1932 : ReferenceDate(englishDate = CustomCalendar(year=1932, month=4, day_of_month=13, era=1, first_day_of_month=6, last_day_of_month=7, total_days_in_month=30, day_of_week_in_month=2, day_of_week=4, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=1989, month=1, day_of_month=1, era=2, first_day_of_month=4, last_day_of_month=6, total_days_in_month=31, day_of_week_in_month=1, day_of_week=4, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1933 : ReferenceDate(englishDate = CustomCalendar(year=1933, month=4, day_of_month=13, era=1, first_day_of_month=7, last_day_of_month=1, total_days_in_month=30, day_of_week_in_month=2, day_of_week=5, day_of_year=103, week_of_month=3, week_of_year=15), nepaliDate = CustomCalendar(year=1990, month=1, day_of_month=1, era=2, first_day_of_month=5, last_day_of_month=7, total_days_in_month=31, day_of_week_in_month=1, day_of_week=5, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1934 : ReferenceDate(englishDate = CustomCalendar(year=1934, month=4, day_of_month=13, era=1, first_day_of_month=1, last_day_of_month=2, total_days_in_month=30, day_of_week_in_month=2, day_of_week=6, day_of_year=103, week_of_month=2, week_of_year=15), nepaliDate = CustomCalendar(year=1991, month=1, day_of_month=1, era=2, first_day_of_month=6, last_day_of_month=1, total_days_in_month=31, day_of_week_in_month=1, day_of_week=6, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1935 : ReferenceDate(englishDate = CustomCalendar(year=1935, month=4, day_of_month=13, era=1, first_day_of_month=2, last_day_of_month=3, total_days_in_month=30, day_of_week_in_month=2, day_of_week=7, day_of_year=103, week_of_month=2, week_of_year=15), nepaliDate = CustomCalendar(year=1992, month=1, day_of_month=1, era=2, first_day_of_month=7, last_day_of_month=2, total_days_in_month=31, day_of_week_in_month=1, day_of_week=7, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1936 : ReferenceDate(englishDate = CustomCalendar(year=1936, month=4, day_of_month=13, era=1, first_day_of_month=4, last_day_of_month=5, total_days_in_month=30, day_of_week_in_month=2, day_of_week=2, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=1993, month=1, day_of_month=1, era=2, first_day_of_month=2, last_day_of_month=4, total_days_in_month=31, day_of_week_in_month=1, day_of_week=2, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1937 : ReferenceDate(englishDate = CustomCalendar(year=1937, month=4, day_of_month=13, era=1, first_day_of_month=5, last_day_of_month=6, total_days_in_month=30, day_of_week_in_month=2, day_of_week=3, day_of_year=103, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=1994, month=1, day_of_month=1, era=2, first_day_of_month=3, last_day_of_month=5, total_days_in_month=31, day_of_week_in_month=1, day_of_week=3, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1938 : ReferenceDate(englishDate = CustomCalendar(year=1938, month=4, day_of_month=13, era=1, first_day_of_month=6, last_day_of_month=7, total_days_in_month=30, day_of_week_in_month=2, day_of_week=4, day_of_year=103, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=1995, month=1, day_of_month=1, era=2, first_day_of_month=4, last_day_of_month=6, total_days_in_month=31, day_of_week_in_month=1, day_of_week=4, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1939 : ReferenceDate(englishDate = CustomCalendar(year=1939, month=4, day_of_month=13, era=1, first_day_of_month=7, last_day_of_month=1, total_days_in_month=30, day_of_week_in_month=2, day_of_week=5, day_of_year=103, week_of_month=3, week_of_year=15), nepaliDate = CustomCalendar(year=1996, month=1, day_of_month=1, era=2, first_day_of_month=5, last_day_of_month=7, total_days_in_month=31, day_of_week_in_month=1, day_of_week=5, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1940 : ReferenceDate(englishDate = CustomCalendar(year=1940, month=4, day_of_month=13, era=1, first_day_of_month=2, last_day_of_month=3, total_days_in_month=30, day_of_week_in_month=2, day_of_week=7, day_of_year=104, week_of_month=2, week_of_year=15), nepaliDate = CustomCalendar(year=1997, month=1, day_of_month=1, era=2, first_day_of_month=7, last_day_of_month=2, total_days_in_month=31, day_of_week_in_month=1, day_of_week=7, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1941 : ReferenceDate(englishDate = CustomCalendar(year=1941, month=4, day_of_month=13, era=1, first_day_of_month=3, last_day_of_month=4, total_days_in_month=30, day_of_week_in_month=2, day_of_week=1, day_of_year=103, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=1998, month=1, day_of_month=1, era=2, first_day_of_month=1, last_day_of_month=3, total_days_in_month=31, day_of_week_in_month=1, day_of_week=1, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1942 : ReferenceDate(englishDate = CustomCalendar(year=1942, month=4, day_of_month=13, era=1, first_day_of_month=4, last_day_of_month=5, total_days_in_month=30, day_of_week_in_month=2, day_of_week=2, day_of_year=103, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=1999, month=1, day_of_month=1, era=2, first_day_of_month=2, last_day_of_month=4, total_days_in_month=31, day_of_week_in_month=1, day_of_week=2, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1943 : ReferenceDate(englishDate = CustomCalendar(year=1943, month=4, day_of_month=14, era=1, first_day_of_month=5, last_day_of_month=6, total_days_in_month=30, day_of_week_in_month=2, day_of_week=4, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2000, month=1, day_of_month=1, era=2, first_day_of_month=4, last_day_of_month=5, total_days_in_month=30, day_of_week_in_month=1, day_of_week=4, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1944 : ReferenceDate(englishDate = CustomCalendar(year=1944, month=4, day_of_month=13, era=1, first_day_of_month=7, last_day_of_month=1, total_days_in_month=30, day_of_week_in_month=2, day_of_week=5, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2001, month=1, day_of_month=1, era=2, first_day_of_month=5, last_day_of_month=7, total_days_in_month=31, day_of_week_in_month=1, day_of_week=5, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1945 : ReferenceDate(englishDate = CustomCalendar(year=1945, month=4, day_of_month=13, era=1, first_day_of_month=1, last_day_of_month=2, total_days_in_month=30, day_of_week_in_month=2, day_of_week=6, day_of_year=103, week_of_month=2, week_of_year=15), nepaliDate = CustomCalendar(year=2002, month=1, day_of_month=1, era=2, first_day_of_month=6, last_day_of_month=1, total_days_in_month=31, day_of_week_in_month=1, day_of_week=6, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1946 : ReferenceDate(englishDate = CustomCalendar(year=1946, month=4, day_of_month=13, era=1, first_day_of_month=2, last_day_of_month=3, total_days_in_month=30, day_of_week_in_month=2, day_of_week=7, day_of_year=103, week_of_month=2, week_of_year=15), nepaliDate = CustomCalendar(year=2003, month=1, day_of_month=1, era=2, first_day_of_month=7, last_day_of_month=2, total_days_in_month=31, day_of_week_in_month=1, day_of_week=7, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1947 : ReferenceDate(englishDate = CustomCalendar(year=1947, month=4, day_of_month=14, era=1, first_day_of_month=3, last_day_of_month=4, total_days_in_month=30, day_of_week_in_month=2, day_of_week=2, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2004, month=1, day_of_month=1, era=2, first_day_of_month=2, last_day_of_month=3, total_days_in_month=30, day_of_week_in_month=1, day_of_week=2, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1948 : ReferenceDate(englishDate = CustomCalendar(year=1948, month=4, day_of_month=13, era=1, first_day_of_month=5, last_day_of_month=6, total_days_in_month=30, day_of_week_in_month=2, day_of_week=3, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2005, month=1, day_of_month=1, era=2, first_day_of_month=3, last_day_of_month=5, total_days_in_month=31, day_of_week_in_month=1, day_of_week=3, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1949 : ReferenceDate(englishDate = CustomCalendar(year=1949, month=4, day_of_month=13, era=1, first_day_of_month=6, last_day_of_month=7, total_days_in_month=30, day_of_week_in_month=2, day_of_week=4, day_of_year=103, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2006, month=1, day_of_month=1, era=2, first_day_of_month=4, last_day_of_month=6, total_days_in_month=31, day_of_week_in_month=1, day_of_week=4, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1950 : ReferenceDate(englishDate = CustomCalendar(year=1950, month=4, day_of_month=13, era=1, first_day_of_month=7, last_day_of_month=1, total_days_in_month=30, day_of_week_in_month=2, day_of_week=5, day_of_year=103, week_of_month=3, week_of_year=15), nepaliDate = CustomCalendar(year=2007, month=1, day_of_month=1, era=2, first_day_of_month=5, last_day_of_month=7, total_days_in_month=31, day_of_week_in_month=1, day_of_week=5, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1951 : ReferenceDate(englishDate = CustomCalendar(year=1951, month=4, day_of_month=14, era=1, first_day_of_month=1, last_day_of_month=2, total_days_in_month=30, day_of_week_in_month=2, day_of_week=7, day_of_year=104, week_of_month=2, week_of_year=15), nepaliDate = CustomCalendar(year=2008, month=1, day_of_month=1, era=2, first_day_of_month=7, last_day_of_month=2, total_days_in_month=31, day_of_week_in_month=1, day_of_week=7, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1952 : ReferenceDate(englishDate = CustomCalendar(year=1952, month=4, day_of_month=13, era=1, first_day_of_month=3, last_day_of_month=4, total_days_in_month=30, day_of_week_in_month=2, day_of_week=1, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2009, month=1, day_of_month=1, era=2, first_day_of_month=1, last_day_of_month=3, total_days_in_month=31, day_of_week_in_month=1, day_of_week=1, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1953 : ReferenceDate(englishDate = CustomCalendar(year=1953, month=4, day_of_month=13, era=1, first_day_of_month=4, last_day_of_month=5, total_days_in_month=30, day_of_week_in_month=2, day_of_week=2, day_of_year=103, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2010, month=1, day_of_month=1, era=2, first_day_of_month=2, last_day_of_month=4, total_days_in_month=31, day_of_week_in_month=1, day_of_week=2, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1954 : ReferenceDate(englishDate = CustomCalendar(year=1954, month=4, day_of_month=13, era=1, first_day_of_month=5, last_day_of_month=6, total_days_in_month=30, day_of_week_in_month=2, day_of_week=3, day_of_year=103, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2011, month=1, day_of_month=1, era=2, first_day_of_month=3, last_day_of_month=5, total_days_in_month=31, day_of_week_in_month=1, day_of_week=3, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1955 : ReferenceDate(englishDate = CustomCalendar(year=1955, month=4, day_of_month=14, era=1, first_day_of_month=6, last_day_of_month=7, total_days_in_month=30, day_of_week_in_month=2, day_of_week=5, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2012, month=1, day_of_month=1, era=2, first_day_of_month=5, last_day_of_month=7, total_days_in_month=31, day_of_week_in_month=1, day_of_week=5, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1956 : ReferenceDate(englishDate = CustomCalendar(year=1956, month=4, day_of_month=13, era=1, first_day_of_month=1, last_day_of_month=2, total_days_in_month=30, day_of_week_in_month=2, day_of_week=6, day_of_year=104, week_of_month=2, week_of_year=15), nepaliDate = CustomCalendar(year=2013, month=1, day_of_month=1, era=2, first_day_of_month=6, last_day_of_month=1, total_days_in_month=31, day_of_week_in_month=1, day_of_week=6, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1957 : ReferenceDate(englishDate = CustomCalendar(year=1957, month=4, day_of_month=13, era=1, first_day_of_month=2, last_day_of_month=3, total_days_in_month=30, day_of_week_in_month=2, day_of_week=7, day_of_year=103, week_of_month=2, week_of_year=15), nepaliDate = CustomCalendar(year=2014, month=1, day_of_month=1, era=2, first_day_of_month=7, last_day_of_month=2, total_days_in_month=31, day_of_week_in_month=1, day_of_week=7, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1958 : ReferenceDate(englishDate = CustomCalendar(year=1958, month=4, day_of_month=13, era=1, first_day_of_month=3, last_day_of_month=4, total_days_in_month=30, day_of_week_in_month=2, day_of_week=1, day_of_year=103, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2015, month=1, day_of_month=1, era=2, first_day_of_month=1, last_day_of_month=3, total_days_in_month=31, day_of_week_in_month=1, day_of_week=1, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1959 : ReferenceDate(englishDate = CustomCalendar(year=1959, month=4, day_of_month=14, era=1, first_day_of_month=4, last_day_of_month=5, total_days_in_month=30, day_of_week_in_month=2, day_of_week=3, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2016, month=1, day_of_month=1, era=2, first_day_of_month=3, last_day_of_month=5, total_days_in_month=31, day_of_week_in_month=1, day_of_week=3, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1960 : ReferenceDate(englishDate = CustomCalendar(year=1960, month=4, day_of_month=13, era=1, first_day_of_month=6, last_day_of_month=7, total_days_in_month=30, day_of_week_in_month=2, day_of_week=4, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2017, month=1, day_of_month=1, era=2, first_day_of_month=4, last_day_of_month=6, total_days_in_month=31, day_of_week_in_month=1, day_of_week=4, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1961 : ReferenceDate(englishDate = CustomCalendar(year=1961, month=4, day_of_month=13, era=1, first_day_of_month=7, last_day_of_month=1, total_days_in_month=30, day_of_week_in_month=2, day_of_week=5, day_of_year=103, week_of_month=3, week_of_year=15), nepaliDate = CustomCalendar(year=2018, month=1, day_of_month=1, era=2, first_day_of_month=5, last_day_of_month=7, total_days_in_month=31, day_of_week_in_month=1, day_of_week=5, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1962 : ReferenceDate(englishDate = CustomCalendar(year=1962, month=4, day_of_month=13, era=1, first_day_of_month=1, last_day_of_month=2, total_days_in_month=30, day_of_week_in_month=2, day_of_week=6, day_of_year=103, week_of_month=2, week_of_year=15), nepaliDate = CustomCalendar(year=2019, month=1, day_of_month=1, era=2, first_day_of_month=6, last_day_of_month=1, total_days_in_month=31, day_of_week_in_month=1, day_of_week=6, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1963 : ReferenceDate(englishDate = CustomCalendar(year=1963, month=4, day_of_month=14, era=1, first_day_of_month=2, last_day_of_month=3, total_days_in_month=30, day_of_week_in_month=2, day_of_week=1, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2020, month=1, day_of_month=1, era=2, first_day_of_month=1, last_day_of_month=3, total_days_in_month=31, day_of_week_in_month=1, day_of_week=1, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1964 : ReferenceDate(englishDate = CustomCalendar(year=1964, month=4, day_of_month=13, era=1, first_day_of_month=4, last_day_of_month=5, total_days_in_month=30, day_of_week_in_month=2, day_of_week=2, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2021, month=1, day_of_month=1, era=2, first_day_of_month=2, last_day_of_month=4, total_days_in_month=31, day_of_week_in_month=1, day_of_week=2, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1965 : ReferenceDate(englishDate = CustomCalendar(year=1965, month=4, day_of_month=13, era=1, first_day_of_month=5, last_day_of_month=6, total_days_in_month=30, day_of_week_in_month=2, day_of_week=3, day_of_year=103, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2022, month=1, day_of_month=1, era=2, first_day_of_month=3, last_day_of_month=5, total_days_in_month=31, day_of_week_in_month=1, day_of_week=3, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1966 : ReferenceDate(englishDate = CustomCalendar(year=1966, month=4, day_of_month=13, era=1, first_day_of_month=6, last_day_of_month=7, total_days_in_month=30, day_of_week_in_month=2, day_of_week=4, day_of_year=103, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2023, month=1, day_of_month=1, era=2, first_day_of_month=4, last_day_of_month=6, total_days_in_month=31, day_of_week_in_month=1, day_of_week=4, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1967 : ReferenceDate(englishDate = CustomCalendar(year=1967, month=4, day_of_month=14, era=1, first_day_of_month=7, last_day_of_month=1, total_days_in_month=30, day_of_week_in_month=2, day_of_week=6, day_of_year=104, week_of_month=3, week_of_year=15), nepaliDate = CustomCalendar(year=2024, month=1, day_of_month=1, era=2, first_day_of_month=6, last_day_of_month=1, total_days_in_month=31, day_of_week_in_month=1, day_of_week=6, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1968 : ReferenceDate(englishDate = CustomCalendar(year=1968, month=4, day_of_month=13, era=1, first_day_of_month=2, last_day_of_month=3, total_days_in_month=30, day_of_week_in_month=2, day_of_week=7, day_of_year=104, week_of_month=2, week_of_year=15), nepaliDate = CustomCalendar(year=2025, month=1, day_of_month=1, era=2, first_day_of_month=7, last_day_of_month=2, total_days_in_month=31, day_of_week_in_month=1, day_of_week=7, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1969 : ReferenceDate(englishDate = CustomCalendar(year=1969, month=4, day_of_month=13, era=1, first_day_of_month=3, last_day_of_month=4, total_days_in_month=30, day_of_week_in_month=2, day_of_week=1, day_of_year=103, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2026, month=1, day_of_month=1, era=2, first_day_of_month=1, last_day_of_month=3, total_days_in_month=31, day_of_week_in_month=1, day_of_week=1, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1970 : ReferenceDate(englishDate = CustomCalendar(year=1970, month=4, day_of_month=14, era=1, first_day_of_month=4, last_day_of_month=5, total_days_in_month=30, day_of_week_in_month=2, day_of_week=3, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2027, month=1, day_of_month=1, era=2, first_day_of_month=3, last_day_of_month=4, total_days_in_month=30, day_of_week_in_month=1, day_of_week=3, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1971 : ReferenceDate(englishDate = CustomCalendar(year=1971, month=4, day_of_month=14, era=1, first_day_of_month=5, last_day_of_month=6, total_days_in_month=30, day_of_week_in_month=2, day_of_week=4, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2028, month=1, day_of_month=1, era=2, first_day_of_month=4, last_day_of_month=6, total_days_in_month=31, day_of_week_in_month=1, day_of_week=4, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1972 : ReferenceDate(englishDate = CustomCalendar(year=1972, month=4, day_of_month=13, era=1, first_day_of_month=7, last_day_of_month=1, total_days_in_month=30, day_of_week_in_month=2, day_of_week=5, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2029, month=1, day_of_month=1, era=2, first_day_of_month=5, last_day_of_month=7, total_days_in_month=31, day_of_week_in_month=1, day_of_week=5, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1973 : ReferenceDate(englishDate = CustomCalendar(year=1973, month=4, day_of_month=13, era=1, first_day_of_month=1, last_day_of_month=2, total_days_in_month=30, day_of_week_in_month=2, day_of_week=6, day_of_year=103, week_of_month=2, week_of_year=15), nepaliDate = CustomCalendar(year=2030, month=1, day_of_month=1, era=2, first_day_of_month=6, last_day_of_month=1, total_days_in_month=31, day_of_week_in_month=1, day_of_week=6, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1974 : ReferenceDate(englishDate = CustomCalendar(year=1974, month=4, day_of_month=14, era=1, first_day_of_month=2, last_day_of_month=3, total_days_in_month=30, day_of_week_in_month=2, day_of_week=1, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2031, month=1, day_of_month=1, era=2, first_day_of_month=1, last_day_of_month=2, total_days_in_month=30, day_of_week_in_month=1, day_of_week=1, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1975 : ReferenceDate(englishDate = CustomCalendar(year=1975, month=4, day_of_month=14, era=1, first_day_of_month=3, last_day_of_month=4, total_days_in_month=30, day_of_week_in_month=2, day_of_week=2, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2032, month=1, day_of_month=1, era=2, first_day_of_month=2, last_day_of_month=4, total_days_in_month=31, day_of_week_in_month=1, day_of_week=2, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1976 : ReferenceDate(englishDate = CustomCalendar(year=1976, month=4, day_of_month=13, era=1, first_day_of_month=5, last_day_of_month=6, total_days_in_month=30, day_of_week_in_month=2, day_of_week=3, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2033, month=1, day_of_month=1, era=2, first_day_of_month=3, last_day_of_month=5, total_days_in_month=31, day_of_week_in_month=1, day_of_week=3, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1977 : ReferenceDate(englishDate = CustomCalendar(year=1977, month=4, day_of_month=13, era=1, first_day_of_month=6, last_day_of_month=7, total_days_in_month=30, day_of_week_in_month=2, day_of_week=4, day_of_year=103, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2034, month=1, day_of_month=1, era=2, first_day_of_month=4, last_day_of_month=6, total_days_in_month=31, day_of_week_in_month=1, day_of_week=4, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1978 : ReferenceDate(englishDate = CustomCalendar(year=1978, month=4, day_of_month=14, era=1, first_day_of_month=7, last_day_of_month=1, total_days_in_month=30, day_of_week_in_month=2, day_of_week=6, day_of_year=104, week_of_month=3, week_of_year=15), nepaliDate = CustomCalendar(year=2035, month=1, day_of_month=1, era=2, first_day_of_month=6, last_day_of_month=7, total_days_in_month=30, day_of_week_in_month=1, day_of_week=6, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1979 : ReferenceDate(englishDate = CustomCalendar(year=1979, month=4, day_of_month=14, era=1, first_day_of_month=1, last_day_of_month=2, total_days_in_month=30, day_of_week_in_month=2, day_of_week=7, day_of_year=104, week_of_month=2, week_of_year=15), nepaliDate = CustomCalendar(year=2036, month=1, day_of_month=1, era=2, first_day_of_month=7, last_day_of_month=2, total_days_in_month=31, day_of_week_in_month=1, day_of_week=7, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1980 : ReferenceDate(englishDate = CustomCalendar(year=1980, month=4, day_of_month=13, era=1, first_day_of_month=3, last_day_of_month=4, total_days_in_month=30, day_of_week_in_month=2, day_of_week=1, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2037, month=1, day_of_month=1, era=2, first_day_of_month=1, last_day_of_month=3, total_days_in_month=31, day_of_week_in_month=1, day_of_week=1, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1981 : ReferenceDate(englishDate = CustomCalendar(year=1981, month=4, day_of_month=13, era=1, first_day_of_month=4, last_day_of_month=5, total_days_in_month=30, day_of_week_in_month=2, day_of_week=2, day_of_year=103, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2038, month=1, day_of_month=1, era=2, first_day_of_month=2, last_day_of_month=4, total_days_in_month=31, day_of_week_in_month=1, day_of_week=2, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1982 : ReferenceDate(englishDate = CustomCalendar(year=1982, month=4, day_of_month=14, era=1, first_day_of_month=5, last_day_of_month=6, total_days_in_month=30, day_of_week_in_month=2, day_of_week=4, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2039, month=1, day_of_month=1, era=2, first_day_of_month=4, last_day_of_month=6, total_days_in_month=31, day_of_week_in_month=1, day_of_week=4, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1983 : ReferenceDate(englishDate = CustomCalendar(year=1983, month=4, day_of_month=14, era=1, first_day_of_month=6, last_day_of_month=7, total_days_in_month=30, day_of_week_in_month=2, day_of_week=5, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2040, month=1, day_of_month=1, era=2, first_day_of_month=5, last_day_of_month=7, total_days_in_month=31, day_of_week_in_month=1, day_of_week=5, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1984 : ReferenceDate(englishDate = CustomCalendar(year=1984, month=4, day_of_month=13, era=1, first_day_of_month=1, last_day_of_month=2, total_days_in_month=30, day_of_week_in_month=2, day_of_week=6, day_of_year=104, week_of_month=2, week_of_year=15), nepaliDate = CustomCalendar(year=2041, month=1, day_of_month=1, era=2, first_day_of_month=6, last_day_of_month=1, total_days_in_month=31, day_of_week_in_month=1, day_of_week=6, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1985 : ReferenceDate(englishDate = CustomCalendar(year=1985, month=4, day_of_month=13, era=1, first_day_of_month=2, last_day_of_month=3, total_days_in_month=30, day_of_week_in_month=2, day_of_week=7, day_of_year=103, week_of_month=2, week_of_year=15), nepaliDate = CustomCalendar(year=2042, month=1, day_of_month=1, era=2, first_day_of_month=7, last_day_of_month=2, total_days_in_month=31, day_of_week_in_month=1, day_of_week=7, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1986 : ReferenceDate(englishDate = CustomCalendar(year=1986, month=4, day_of_month=14, era=1, first_day_of_month=3, last_day_of_month=4, total_days_in_month=30, day_of_week_in_month=2, day_of_week=2, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2043, month=1, day_of_month=1, era=2, first_day_of_month=2, last_day_of_month=4, total_days_in_month=31, day_of_week_in_month=1, day_of_week=2, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1987 : ReferenceDate(englishDate = CustomCalendar(year=1987, month=4, day_of_month=14, era=1, first_day_of_month=4, last_day_of_month=5, total_days_in_month=30, day_of_week_in_month=2, day_of_week=3, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2044, month=1, day_of_month=1, era=2, first_day_of_month=3, last_day_of_month=5, total_days_in_month=31, day_of_week_in_month=1, day_of_week=3, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1988 : ReferenceDate(englishDate = CustomCalendar(year=1988, month=4, day_of_month=13, era=1, first_day_of_month=6, last_day_of_month=7, total_days_in_month=30, day_of_week_in_month=2, day_of_week=4, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2045, month=1, day_of_month=1, era=2, first_day_of_month=4, last_day_of_month=6, total_days_in_month=31, day_of_week_in_month=1, day_of_week=4, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1989 : ReferenceDate(englishDate = CustomCalendar(year=1989, month=4, day_of_month=13, era=1, first_day_of_month=7, last_day_of_month=1, total_days_in_month=30, day_of_week_in_month=2, day_of_week=5, day_of_year=103, week_of_month=3, week_of_year=15), nepaliDate = CustomCalendar(year=2046, month=1, day_of_month=1, era=2, first_day_of_month=5, last_day_of_month=7, total_days_in_month=31, day_of_week_in_month=1, day_of_week=5, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1990 : ReferenceDate(englishDate = CustomCalendar(year=1990, month=4, day_of_month=14, era=1, first_day_of_month=1, last_day_of_month=2, total_days_in_month=30, day_of_week_in_month=2, day_of_week=7, day_of_year=104, week_of_month=2, week_of_year=15), nepaliDate = CustomCalendar(year=2047, month=1, day_of_month=1, era=2, first_day_of_month=7, last_day_of_month=2, total_days_in_month=31, day_of_week_in_month=1, day_of_week=7, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1991 : ReferenceDate(englishDate = CustomCalendar(year=1991, month=4, day_of_month=14, era=1, first_day_of_month=2, last_day_of_month=3, total_days_in_month=30, day_of_week_in_month=2, day_of_week=1, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2048, month=1, day_of_month=1, era=2, first_day_of_month=1, last_day_of_month=3, total_days_in_month=31, day_of_week_in_month=1, day_of_week=1, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1992 : ReferenceDate(englishDate = CustomCalendar(year=1992, month=4, day_of_month=13, era=1, first_day_of_month=4, last_day_of_month=5, total_days_in_month=30, day_of_week_in_month=2, day_of_week=2, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2049, month=1, day_of_month=1, era=2, first_day_of_month=2, last_day_of_month=4, total_days_in_month=31, day_of_week_in_month=1, day_of_week=2, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1993 : ReferenceDate(englishDate = CustomCalendar(year=1993, month=4, day_of_month=13, era=1, first_day_of_month=5, last_day_of_month=6, total_days_in_month=30, day_of_week_in_month=2, day_of_week=3, day_of_year=103, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2050, month=1, day_of_month=1, era=2, first_day_of_month=3, last_day_of_month=5, total_days_in_month=31, day_of_week_in_month=1, day_of_week=3, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1994 : ReferenceDate(englishDate = CustomCalendar(year=1994, month=4, day_of_month=14, era=1, first_day_of_month=6, last_day_of_month=7, total_days_in_month=30, day_of_week_in_month=2, day_of_week=5, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2051, month=1, day_of_month=1, era=2, first_day_of_month=5, last_day_of_month=7, total_days_in_month=31, day_of_week_in_month=1, day_of_week=5, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1995 : ReferenceDate(englishDate = CustomCalendar(year=1995, month=4, day_of_month=14, era=1, first_day_of_month=7, last_day_of_month=1, total_days_in_month=30, day_of_week_in_month=2, day_of_week=6, day_of_year=104, week_of_month=3, week_of_year=15), nepaliDate = CustomCalendar(year=2052, month=1, day_of_month=1, era=2, first_day_of_month=6, last_day_of_month=1, total_days_in_month=31, day_of_week_in_month=1, day_of_week=6, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1996 : ReferenceDate(englishDate = CustomCalendar(year=1996, month=4, day_of_month=13, era=1, first_day_of_month=2, last_day_of_month=3, total_days_in_month=30, day_of_week_in_month=2, day_of_week=7, day_of_year=104, week_of_month=2, week_of_year=15), nepaliDate = CustomCalendar(year=2053, month=1, day_of_month=1, era=2, first_day_of_month=7, last_day_of_month=2, total_days_in_month=31, day_of_week_in_month=1, day_of_week=7, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1997 : ReferenceDate(englishDate = CustomCalendar(year=1997, month=4, day_of_month=13, era=1, first_day_of_month=3, last_day_of_month=4, total_days_in_month=30, day_of_week_in_month=2, day_of_week=1, day_of_year=103, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2054, month=1, day_of_month=1, era=2, first_day_of_month=1, last_day_of_month=3, total_days_in_month=31, day_of_week_in_month=1, day_of_week=1, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1998 : ReferenceDate(englishDate = CustomCalendar(year=1998, month=4, day_of_month=14, era=1, first_day_of_month=4, last_day_of_month=5, total_days_in_month=30, day_of_week_in_month=2, day_of_week=3, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2055, month=1, day_of_month=1, era=2, first_day_of_month=3, last_day_of_month=5, total_days_in_month=31, day_of_week_in_month=1, day_of_week=3, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1999 : ReferenceDate(englishDate = CustomCalendar(year=1999, month=4, day_of_month=14, era=1, first_day_of_month=5, last_day_of_month=6, total_days_in_month=30, day_of_week_in_month=2, day_of_week=4, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2056, month=1, day_of_month=1, era=2, first_day_of_month=4, last_day_of_month=6, total_days_in_month=31, day_of_week_in_month=1, day_of_week=4, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2000 : ReferenceDate(englishDate = CustomCalendar(year=2000, month=4, day_of_month=13, era=1, first_day_of_month=7, last_day_of_month=1, total_days_in_month=30, day_of_week_in_month=2, day_of_week=5, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2057, month=1, day_of_month=1, era=2, first_day_of_month=5, last_day_of_month=7, total_days_in_month=31, day_of_week_in_month=1, day_of_week=5, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2001 : ReferenceDate(englishDate = CustomCalendar(year=2001, month=4, day_of_month=14, era=1, first_day_of_month=1, last_day_of_month=2, total_days_in_month=30, day_of_week_in_month=2, day_of_week=7, day_of_year=104, week_of_month=2, week_of_year=15), nepaliDate = CustomCalendar(year=2058, month=1, day_of_month=1, era=2, first_day_of_month=7, last_day_of_month=1, total_days_in_month=30, day_of_week_in_month=1, day_of_week=7, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2002 : ReferenceDate(englishDate = CustomCalendar(year=2002, month=4, day_of_month=14, era=1, first_day_of_month=2, last_day_of_month=3, total_days_in_month=30, day_of_week_in_month=2, day_of_week=1, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2059, month=1, day_of_month=1, era=2, first_day_of_month=1, last_day_of_month=3, total_days_in_month=31, day_of_week_in_month=1, day_of_week=1, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2003 : ReferenceDate(englishDate = CustomCalendar(year=2003, month=4, day_of_month=14, era=1, first_day_of_month=3, last_day_of_month=4, total_days_in_month=30, day_of_week_in_month=2, day_of_week=2, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2060, month=1, day_of_month=1, era=2, first_day_of_month=2, last_day_of_month=4, total_days_in_month=31, day_of_week_in_month=1, day_of_week=2, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2004 : ReferenceDate(englishDate = CustomCalendar(year=2004, month=4, day_of_month=13, era=1, first_day_of_month=5, last_day_of_month=6, total_days_in_month=30, day_of_week_in_month=2, day_of_week=3, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2061, month=1, day_of_month=1, era=2, first_day_of_month=3, last_day_of_month=5, total_days_in_month=31, day_of_week_in_month=1, day_of_week=3, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2005 : ReferenceDate(englishDate = CustomCalendar(year=2005, month=4, day_of_month=14, era=1, first_day_of_month=6, last_day_of_month=7, total_days_in_month=30, day_of_week_in_month=2, day_of_week=5, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2062, month=1, day_of_month=1, era=2, first_day_of_month=5, last_day_of_month=6, total_days_in_month=30, day_of_week_in_month=1, day_of_week=5, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2006 : ReferenceDate(englishDate = CustomCalendar(year=2006, month=4, day_of_month=14, era=1, first_day_of_month=7, last_day_of_month=1, total_days_in_month=30, day_of_week_in_month=2, day_of_week=6, day_of_year=104, week_of_month=3, week_of_year=15), nepaliDate = CustomCalendar(year=2063, month=1, day_of_month=1, era=2, first_day_of_month=6, last_day_of_month=1, total_days_in_month=31, day_of_week_in_month=1, day_of_week=6, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2007 : ReferenceDate(englishDate = CustomCalendar(year=2007, month=4, day_of_month=14, era=1, first_day_of_month=1, last_day_of_month=2, total_days_in_month=30, day_of_week_in_month=2, day_of_week=7, day_of_year=104, week_of_month=2, week_of_year=15), nepaliDate = CustomCalendar(year=2064, month=1, day_of_month=1, era=2, first_day_of_month=7, last_day_of_month=2, total_days_in_month=31, day_of_week_in_month=1, day_of_week=7, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2008 : ReferenceDate(englishDate = CustomCalendar(year=2008, month=4, day_of_month=13, era=1, first_day_of_month=3, last_day_of_month=4, total_days_in_month=30, day_of_week_in_month=2, day_of_week=1, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2065, month=1, day_of_month=1, era=2, first_day_of_month=1, last_day_of_month=3, total_days_in_month=31, day_of_week_in_month=1, day_of_week=1, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2009 : ReferenceDate(englishDate = CustomCalendar(year=2009, month=4, day_of_month=14, era=1, first_day_of_month=4, last_day_of_month=5, total_days_in_month=30, day_of_week_in_month=2, day_of_week=3, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2066, month=1, day_of_month=1, era=2, first_day_of_month=3, last_day_of_month=5, total_days_in_month=31, day_of_week_in_month=1, day_of_week=3, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2010 : ReferenceDate(englishDate = CustomCalendar(year=2010, month=4, day_of_month=14, era=1, first_day_of_month=5, last_day_of_month=6, total_days_in_month=30, day_of_week_in_month=2, day_of_week=4, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2067, month=1, day_of_month=1, era=2, first_day_of_month=4, last_day_of_month=6, total_days_in_month=31, day_of_week_in_month=1, day_of_week=4, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2011 : ReferenceDate(englishDate = CustomCalendar(year=2011, month=4, day_of_month=14, era=1, first_day_of_month=6, last_day_of_month=7, total_days_in_month=30, day_of_week_in_month=2, day_of_week=5, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2068, month=1, day_of_month=1, era=2, first_day_of_month=5, last_day_of_month=7, total_days_in_month=31, day_of_week_in_month=1, day_of_week=5, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2012 : ReferenceDate(englishDate = CustomCalendar(year=2012, month=4, day_of_month=13, era=1, first_day_of_month=1, last_day_of_month=2, total_days_in_month=30, day_of_week_in_month=2, day_of_week=6, day_of_year=104, week_of_month=2, week_of_year=15), nepaliDate = CustomCalendar(year=2069, month=1, day_of_month=1, era=2, first_day_of_month=6, last_day_of_month=1, total_days_in_month=31, day_of_week_in_month=1, day_of_week=6, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2013 : ReferenceDate(englishDate = CustomCalendar(year=2013, month=4, day_of_month=14, era=1, first_day_of_month=2, last_day_of_month=3, total_days_in_month=30, day_of_week_in_month=2, day_of_week=1, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2070, month=1, day_of_month=1, era=2, first_day_of_month=1, last_day_of_month=3, total_days_in_month=31, day_of_week_in_month=1, day_of_week=1, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2014 : ReferenceDate(englishDate = CustomCalendar(year=2014, month=4, day_of_month=14, era=1, first_day_of_month=3, last_day_of_month=4, total_days_in_month=30, day_of_week_in_month=2, day_of_week=2, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2071, month=1, day_of_month=1, era=2, first_day_of_month=2, last_day_of_month=4, total_days_in_month=31, day_of_week_in_month=1, day_of_week=2, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2015 : ReferenceDate(englishDate = CustomCalendar(year=2015, month=4, day_of_month=14, era=1, first_day_of_month=4, last_day_of_month=5, total_days_in_month=30, day_of_week_in_month=2, day_of_week=3, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2072, month=1, day_of_month=1, era=2, first_day_of_month=3, last_day_of_month=5, total_days_in_month=31, day_of_week_in_month=1, day_of_week=3, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2016 : ReferenceDate(englishDate = CustomCalendar(year=2016, month=4, day_of_month=13, era=1, first_day_of_month=6, last_day_of_month=7, total_days_in_month=30, day_of_week_in_month=2, day_of_week=4, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2073, month=1, day_of_month=1, era=2, first_day_of_month=4, last_day_of_month=6, total_days_in_month=31, day_of_week_in_month=1, day_of_week=4, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2017 : ReferenceDate(englishDate = CustomCalendar(year=2017, month=4, day_of_month=14, era=1, first_day_of_month=7, last_day_of_month=1, total_days_in_month=30, day_of_week_in_month=2, day_of_week=6, day_of_year=104, week_of_month=3, week_of_year=15), nepaliDate = CustomCalendar(year=2074, month=1, day_of_month=1, era=2, first_day_of_month=6, last_day_of_month=1, total_days_in_month=31, day_of_week_in_month=1, day_of_week=6, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2018 : ReferenceDate(englishDate = CustomCalendar(year=2018, month=4, day_of_month=14, era=1, first_day_of_month=1, last_day_of_month=2, total_days_in_month=30, day_of_week_in_month=2, day_of_week=7, day_of_year=104, week_of_month=2, week_of_year=15), nepaliDate = CustomCalendar(year=2075, month=1, day_of_month=1, era=2, first_day_of_month=7, last_day_of_month=2, total_days_in_month=31, day_of_week_in_month=1, day_of_week=7, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2019 : ReferenceDate(englishDate = CustomCalendar(year=2019, month=4, day_of_month=14, era=1, first_day_of_month=2, last_day_of_month=3, total_days_in_month=30, day_of_week_in_month=2, day_of_week=1, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2076, month=1, day_of_month=1, era=2, first_day_of_month=1, last_day_of_month=3, total_days_in_month=31, day_of_week_in_month=1, day_of_week=1, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2020 : ReferenceDate(englishDate = CustomCalendar(year=2020, month=4, day_of_month=13, era=1, first_day_of_month=4, last_day_of_month=5, total_days_in_month=30, day_of_week_in_month=2, day_of_week=2, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2077, month=1, day_of_month=1, era=2, first_day_of_month=2, last_day_of_month=4, total_days_in_month=31, day_of_week_in_month=1, day_of_week=2, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2021 : ReferenceDate(englishDate = CustomCalendar(year=2021, month=4, day_of_month=14, era=1, first_day_of_month=5, last_day_of_month=6, total_days_in_month=30, day_of_week_in_month=2, day_of_week=4, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2078, month=1, day_of_month=1, era=2, first_day_of_month=4, last_day_of_month=6, total_days_in_month=31, day_of_week_in_month=1, day_of_week=4, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2022 : ReferenceDate(englishDate = CustomCalendar(year=2022, month=4, day_of_month=14, era=1, first_day_of_month=6, last_day_of_month=7, total_days_in_month=30, day_of_week_in_month=2, day_of_week=5, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2079, month=1, day_of_month=1, era=2, first_day_of_month=5, last_day_of_month=7, total_days_in_month=31, day_of_week_in_month=1, day_of_week=5, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2023 : ReferenceDate(englishDate = CustomCalendar(year=2023, month=4, day_of_month=14, era=1, first_day_of_month=7, last_day_of_month=1, total_days_in_month=30, day_of_week_in_month=2, day_of_week=6, day_of_year=104, week_of_month=3, week_of_year=15), nepaliDate = CustomCalendar(year=2080, month=1, day_of_month=1, era=2, first_day_of_month=6, last_day_of_month=1, total_days_in_month=31, day_of_week_in_month=1, day_of_week=6, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2024 : ReferenceDate(englishDate = CustomCalendar(year=2024, month=4, day_of_month=13, era=1, first_day_of_month=2, last_day_of_month=3, total_days_in_month=30, day_of_week_in_month=2, day_of_week=7, day_of_year=104, week_of_month=2, week_of_year=15), nepaliDate = CustomCalendar(year=2081, month=1, day_of_month=1, era=2, first_day_of_month=7, last_day_of_month=2, total_days_in_month=31, day_of_week_in_month=1, day_of_week=7, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2025 : ReferenceDate(englishDate = CustomCalendar(year=2025, month=4, day_of_month=14, era=1, first_day_of_month=3, last_day_of_month=4, total_days_in_month=30, day_of_week_in_month=2, day_of_week=2, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2082, month=1, day_of_month=1, era=2, first_day_of_month=2, last_day_of_month=4, total_days_in_month=31, day_of_week_in_month=1, day_of_week=2, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2026 : ReferenceDate(englishDate = CustomCalendar(year=2026, month=4, day_of_month=14, era=1, first_day_of_month=4, last_day_of_month=5, total_days_in_month=30, day_of_week_in_month=2, day_of_week=3, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2083, month=1, day_of_month=1, era=2, first_day_of_month=3, last_day_of_month=5, total_days_in_month=31, day_of_week_in_month=1, day_of_week=3, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2027 : ReferenceDate(englishDate = CustomCalendar(year=2027, month=4, day_of_month=14, era=1, first_day_of_month=5, last_day_of_month=6, total_days_in_month=30, day_of_week_in_month=2, day_of_week=4, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2084, month=1, day_of_month=1, era=2, first_day_of_month=4, last_day_of_month=6, total_days_in_month=31, day_of_week_in_month=1, day_of_week=4, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2028 : ReferenceDate(englishDate = CustomCalendar(year=2028, month=4, day_of_month=14, era=1, first_day_of_month=7, last_day_of_month=1, total_days_in_month=30, day_of_week_in_month=2, day_of_week=6, day_of_year=105, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2085, month=1, day_of_month=1, era=2, first_day_of_month=6, last_day_of_month=7, total_days_in_month=30, day_of_week_in_month=1, day_of_week=6, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2029 : ReferenceDate(englishDate = CustomCalendar(year=2029, month=4, day_of_month=14, era=1, first_day_of_month=1, last_day_of_month=2, total_days_in_month=30, day_of_week_in_month=2, day_of_week=7, day_of_year=104, week_of_month=2, week_of_year=15), nepaliDate = CustomCalendar(year=2086, month=1, day_of_month=1, era=2, first_day_of_month=7, last_day_of_month=2, total_days_in_month=31, day_of_week_in_month=1, day_of_week=7, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2030 : ReferenceDate(englishDate = CustomCalendar(year=2030, month=4, day_of_month=14, era=1, first_day_of_month=2, last_day_of_month=3, total_days_in_month=30, day_of_week_in_month=2, day_of_week=1, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2087, month=1, day_of_month=1, era=2, first_day_of_month=1, last_day_of_month=3, total_days_in_month=31, day_of_week_in_month=1, day_of_week=1, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2031 : ReferenceDate(englishDate = CustomCalendar(year=2031, month=4, day_of_month=14, era=1, first_day_of_month=3, last_day_of_month=4, total_days_in_month=30, day_of_week_in_month=2, day_of_week=2, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2088, month=1, day_of_month=1, era=2, first_day_of_month=2, last_day_of_month=4, total_days_in_month=31, day_of_week_in_month=1, day_of_week=2, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2032 : ReferenceDate(englishDate = CustomCalendar(year=2032, month=4, day_of_month=14, era=1, first_day_of_month=5, last_day_of_month=6, total_days_in_month=30, day_of_week_in_month=2, day_of_week=4, day_of_year=105, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2089, month=1, day_of_month=1, era=2, first_day_of_month=4, last_day_of_month=5, total_days_in_month=30, day_of_week_in_month=1, day_of_week=4, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2033 : ReferenceDate(englishDate = CustomCalendar(year=2033, month=4, day_of_month=14, era=1, first_day_of_month=6, last_day_of_month=7, total_days_in_month=30, day_of_week_in_month=2, day_of_week=5, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2090, month=1, day_of_month=1, era=2, first_day_of_month=5, last_day_of_month=7, total_days_in_month=31, day_of_week_in_month=1, day_of_week=5, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2034 : ReferenceDate(englishDate = CustomCalendar(year=2034, month=4, day_of_month=14, era=1, first_day_of_month=7, last_day_of_month=1, total_days_in_month=30, day_of_week_in_month=2, day_of_week=6, day_of_year=104, week_of_month=3, week_of_year=15), nepaliDate = CustomCalendar(year=2091, month=1, day_of_month=1, era=2, first_day_of_month=6, last_day_of_month=1, total_days_in_month=31, day_of_week_in_month=1, day_of_week=6, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2035 : ReferenceDate(englishDate = CustomCalendar(year=2035, month=4, day_of_month=14, era=1, first_day_of_month=1, last_day_of_month=2, total_days_in_month=30, day_of_week_in_month=2, day_of_week=7, day_of_year=104, week_of_month=2, week_of_year=15), nepaliDate = CustomCalendar(year=2092, month=1, day_of_month=1, era=2, first_day_of_month=7, last_day_of_month=2, total_days_in_month=31, day_of_week_in_month=1, day_of_week=7, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2036 : ReferenceDate(englishDate = CustomCalendar(year=2036, month=4, day_of_month=14, era=1, first_day_of_month=3, last_day_of_month=4, total_days_in_month=30, day_of_week_in_month=2, day_of_week=2, day_of_year=105, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2093, month=1, day_of_month=1, era=2, first_day_of_month=2, last_day_of_month=4, total_days_in_month=31, day_of_week_in_month=1, day_of_week=2, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2037 : ReferenceDate(englishDate = CustomCalendar(year=2037, month=4, day_of_month=14, era=1, first_day_of_month=4, last_day_of_month=5, total_days_in_month=30, day_of_week_in_month=2, day_of_week=3, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2094, month=1, day_of_month=1, era=2, first_day_of_month=3, last_day_of_month=5, total_days_in_month=31, day_of_week_in_month=1, day_of_week=3, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2038 : ReferenceDate(englishDate = CustomCalendar(year=2038, month=4, day_of_month=14, era=1, first_day_of_month=5, last_day_of_month=6, total_days_in_month=30, day_of_week_in_month=2, day_of_week=4, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2095, month=1, day_of_month=1, era=2, first_day_of_month=4, last_day_of_month=6, total_days_in_month=31, day_of_week_in_month=1, day_of_week=4, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2039 : ReferenceDate(englishDate = CustomCalendar(year=2039, month=4, day_of_month=14, era=1, first_day_of_month=6, last_day_of_month=7, total_days_in_month=30, day_of_week_in_month=2, day_of_week=5, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2096, month=1, day_of_month=1, era=2, first_day_of_month=5, last_day_of_month=7, total_days_in_month=31, day_of_week_in_month=1, day_of_week=5, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2040 : ReferenceDate(englishDate = CustomCalendar(year=2040, month=4, day_of_month=14, era=1, first_day_of_month=1, last_day_of_month=2, total_days_in_month=30, day_of_week_in_month=2, day_of_week=7, day_of_year=105, week_of_month=2, week_of_year=15), nepaliDate = CustomCalendar(year=2097, month=1, day_of_month=1, era=2, first_day_of_month=7, last_day_of_month=2, total_days_in_month=31, day_of_week_in_month=1, day_of_week=7, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2041 : ReferenceDate(englishDate = CustomCalendar(year=2041, month=4, day_of_month=14, era=1, first_day_of_month=2, last_day_of_month=3, total_days_in_month=30, day_of_week_in_month=2, day_of_week=1, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2098, month=1, day_of_month=1, era=2, first_day_of_month=1, last_day_of_month=3, total_days_in_month=31, day_of_week_in_month=1, day_of_week=1, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2042 : ReferenceDate(englishDate = CustomCalendar(year=2042, month=4, day_of_month=14, era=1, first_day_of_month=3, last_day_of_month=4, total_days_in_month=30, day_of_week_in_month=2, day_of_week=2, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2099, month=1, day_of_month=1, era=2, first_day_of_month=2, last_day_of_month=4, total_days_in_month=31, day_of_week_in_month=1, day_of_week=2, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2043 : ReferenceDate(englishDate = CustomCalendar(year=2043, month=4, day_of_month=14, era=1, first_day_of_month=4, last_day_of_month=5, total_days_in_month=30, day_of_week_in_month=2, day_of_week=3, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2100, month=1, day_of_month=1, era=2, first_day_of_month=3, last_day_of_month=5, total_days_in_month=31, day_of_week_in_month=1, day_of_week=3, day_of_year=1, week_of_month=1, week_of_year=1))
-}
+# Number of days in every Nepali month from 1969 to 2100, one byte per month and twelve bytes per year.
+# The day count of month `m` of year `y` is at index `(y - packed_days_in_month_start_year) * 12 + m - 1`.
+packed_days_in_month = bytes((
+    31, 32, 31, 32, 31, 30, 30, 30, 29, 30, 29, 31,  # 1969
+    31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30,  # 1970
+    31, 31, 32, 31, 32, 30, 30, 29, 30, 29, 30, 30,  # 1971
+    31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31,  # 1972
+    30, 32, 31, 32, 31, 30, 30, 30, 29, 30, 29, 31,  # 1973
+    30, 32, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30,  # 1974
+    31, 31, 32, 32, 31, 30, 30, 29, 30, 29, 30, 30,  # 1975
+    31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31,  # 1976
+    30, 32, 31, 32, 31, 31, 29, 30, 29, 30, 29, 31,  # 1977
+    31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30,  # 1978
+    31, 31, 32, 32, 31, 30, 30, 29, 30, 29, 30, 30,  # 1979
+    31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31,  # 1980
+    31, 31, 31, 32, 31, 31, 29, 30, 30, 29, 30, 30,  # 1981
+    31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30,  # 1982
+    31, 31, 32, 32, 31, 30, 30, 29, 30, 29, 30, 30,  # 1983
+    31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31,  # 1984
+    31, 31, 31, 32, 31, 31, 29, 30, 30, 29, 30, 30,  # 1985
+    31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30,  # 1986
+    31, 32, 31, 32, 31, 30, 30, 29, 30, 29, 30, 30,  # 1987
+    31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31,  # 1988
+    31, 31, 31, 32, 31, 31, 30, 29, 30, 29, 30, 30,  # 1989
+    31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30,  # 1990
+    31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 30,  # 1991
+    31, 32, 31, 32, 31, 30, 30, 30, 29, 30, 29, 31,  # 1992
+    31, 31, 31, 32, 31, 31, 30, 29, 30, 29, 30, 30,  # 1993
+    31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30,  # 1994
+    31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 30,  # 1995
+    31, 32, 31, 32, 31, 30, 30, 30, 29, 30, 29, 31,  # 1996
+    31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30,  # 1997
+    31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30,  # 1998
+    31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31,  # 1999
+    30, 32, 31, 32, 31, 30, 30, 30, 29, 30, 29, 31,  # 2000
+    31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30,  # 2001
+    31, 31, 32, 32, 31, 30, 30, 29, 30, 29, 30, 30,  # 2002
+    31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31,  # 2003
+    30, 32, 31, 32, 31, 30, 30, 30, 29, 30, 29, 31,  # 2004
+    31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30,  # 2005
+    31, 31, 32, 32, 31, 30, 30, 29, 30, 29, 30, 30,  # 2006
+    31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31,  # 2007
+    31, 31, 31, 32, 31, 31, 29, 30, 30, 29, 29, 31,  # 2008
+    31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30,  # 2009
+    31, 31, 32, 32, 31, 30, 30, 29, 30, 29, 30, 30,  # 2010
+    31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31,  # 2011
+    31, 31, 31, 32, 31, 31, 29, 30, 30, 29, 30, 30,  # 2012
+    31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30,  # 2013
+    31, 31, 32, 32, 31, 30, 30, 29, 30, 29, 30, 30,  # 2014
+    31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31,  # 2015
+    31, 31, 31, 32, 31, 31, 29, 30, 30, 29, 30, 30,  # 2016
+    31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30,  # 2017
+    31, 32, 31, 32, 31, 30, 30, 29, 30, 29, 30, 30,  # 2018
+    31, 32, 31, 32, 31, 30, 30, 30, 29, 30, 29, 31,  # 2019
+    31, 31, 31, 32, 31, 31, 30, 29, 30, 29, 30, 30,  # 2020
+    31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30,  # 2021
+    31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 30,  # 2022
+    31, 32, 31, 32, 31, 30, 30, 30, 29, 30, 29, 31,  # 2023
+    31, 31, 31, 32, 31, 31, 30, 29, 30, 29, 30, 30,  # 2024
+    31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30,  # 2025
+    31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31,  # 2026
+    30, 32, 31, 32, 31, 30, 30, 30, 29, 30, 29, 31,  # 2027
+    31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30,  # 2028
+    31, 31, 32, 31, 32, 30, 30, 29, 30, 29, 30, 30,  # 2029
+    31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31,  # 2030
+    30, 32, 31, 32, 31, 30, 30, 30, 29, 30, 29, 31,  # 2031
+    31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30,  # 2032
+    31, 31, 32, 32, 31, 30, 30, 29, 30, 29, 30, 30,  # 2033
+    31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31,  # 2034
+    30, 32, 31, 32, 31, 31, 29, 30, 30, 29, 29, 31,  # 2035
+    31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30,  # 2036
+    31, 31, 32, 32, 31, 30, 30, 29, 30, 29, 30, 30,  # 2037
+    31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31,  # 2038
+    31, 31, 31, 32, 31, 31, 29, 30, 30, 29, 30, 30,  # 2039
+    31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30,  # 2040
+    31, 31, 32, 32, 31, 30, 30, 29, 30, 29, 30, 30,  # 2041
+    31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31,  # 2042
+    31, 31, 31, 32, 31, 31, 29, 30, 30, 29, 30, 30,  # 2043
+    31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30,  # 2044
+    31, 32, 31, 32, 31, 30, 30, 29, 30, 29, 30, 30,  # 2045
+    31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31,  # 2046
+    31, 31, 31, 32, 31, 31, 30, 29, 30, 29, 30, 30,  # 2047
+    31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30,  # 2048
+    31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 30,  # 2049
+    31, 32, 31, 32, 31, 30, 30, 30, 29, 30, 29, 31,  # 2050
+    31, 31, 31, 32, 31, 31, 30, 29, 30, 29, 30, 30,  # 2051
+    31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30,  # 2052
+    31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 30,  # 2053
+    31, 32, 31, 32, 31, 30, 30, 30, 29, 30, 29, 31,  # 2054
+    31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30,  # 2055
+    31, 31, 32, 31, 32, 30, 30, 29, 30, 29, 30, 30,  # 2056
+    31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31,  # 2057
+    30, 32, 31, 32, 31, 30, 30, 30, 29, 30, 29, 31,  # 2058
+    31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30,  # 2059
+    31, 31, 32, 32, 31, 30, 30, 29, 30, 29, 30, 30,  # 2060
+    31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31,  # 2061
+    30, 32, 31, 32, 31, 31, 29, 30, 29, 30, 29, 31,  # 2062
+    31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30,  # 2063
+    31, 31, 32, 32, 31, 30, 30, 29, 30, 29, 30, 30,  # 2064
+    31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31,  # 2065
+    31, 31, 31, 32, 31, 31, 29, 30, 30, 29, 29, 31,  # 2066
+    31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30,  # 2067
+    31, 31, 32, 32, 31, 30, 30, 29, 30, 29, 30, 30,  # 2068
+    31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31,  # 2069
+    31, 31, 31, 32, 31, 31, 29, 30, 30, 29, 30, 30,  # 2070
+    31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30,  # 2071
+    31, 32, 31, 32, 31, 30, 30, 29, 30, 29, 30, 30,  # 2072
+    31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31,  # 2073
+    31, 31, 31, 32, 31, 31, 30, 29, 30, 29, 30, 30,  # 2074
+    31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30,  # 2075
+    31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 30,  # 2076
+    31, 32, 31, 32, 31, 30, 30, 30, 29, 30, 29, 31,  # 2077
+    31, 31, 31, 32, 31, 31, 30, 29, 30, 29, 30, 30,  # 2078
+    31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30,  # 2079
+    31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 30,  # 2080
+    31, 32, 31, 32, 31, 30, 30, 30, 29, 30, 29, 31,  # 2081
+    31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30,  # 2082
+    31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30,  # 2083
+    31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31,  # 2084
+    30, 32, 31, 32, 31, 30, 30, 30, 29, 30, 29, 31,  # 2085
+    31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30,  # 2086
+    31, 31, 32, 32, 31, 30, 30, 29, 30, 29, 30, 30,  # 2087
+    31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31,  # 2088
+    30, 32, 31, 32, 31, 30, 30, 30, 29, 30, 29, 31,  # 2089
+    31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30,  # 2090
+    31, 31, 32, 32, 31, 30, 30, 29, 30, 29, 30, 30,  # 2091
+    31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31,  # 2092
+    31, 31, 31, 32, 31, 31, 29, 30, 30, 29, 29, 31,  # 2093
+    31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30,  # 2094
+    31, 31, 32, 32, 31, 30, 30, 29, 30, 29, 30, 30,  # 2095
+    31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31,  # 2096
+    31, 31, 31, 32, 31, 31, 29, 30, 30, 29, 30, 30,  # 2097
+    31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30,  # 2098
+    31, 31, 32, 32, 31, 30, 30, 29, 30, 29, 30, 30,  # 2099
+    31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31,  # 2100
+))
 
-nepali_date_map = {
-    1971 : ReferenceDate(englishDate = CustomCalendar(year=1914, month=4, day_of_month=13, era=1, first_day_of_month=4, last_day_of_month=5, total_days_in_month=30, day_of_week_in_month=2, day_of_week=2, day_of_year=103, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=1971, month=1, day_of_month=1, era=2, first_day_of_month=2, last_day_of_month=4, total_days_in_month=31, day_of_week_in_month=1, day_of_week=2, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1972 : ReferenceDate(englishDate = CustomCalendar(year=1915, month=4, day_of_month=13, era=1, first_day_of_month=5, last_day_of_month=6, total_days_in_month=30, day_of_week_in_month=2, day_of_week=3, day_of_year=103, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=1972, month=1, day_of_month=1, era=2, first_day_of_month=3, last_day_of_month=5, total_days_in_month=31, day_of_week_in_month=1, day_of_week=3, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1973 : ReferenceDate(englishDate = CustomCalendar(year=1916, month=4, day_of_month=13, era=1, first_day_of_month=7, last_day_of_month=1, total_days_in_month=30, day_of_week_in_month=2, day_of_week=5, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=1973, month=1, day_of_month=1, era=2, first_day_of_month=5, last_day_of_month=6, total_days_in_month=30, day_of_week_in_month=1, day_of_week=5, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1974 : ReferenceDate(englishDate = CustomCalendar(year=1917, month=4, day_of_month=13, era=1, first_day_of_month=1, last_day_of_month=2, total_days_in_month=30, day_of_week_in_month=2, day_of_week=6, day_of_year=103, week_of_month=2, week_of_year=15), nepaliDate = CustomCalendar(year=1974, month=1, day_of_month=1, era=2, first_day_of_month=6, last_day_of_month=7, total_days_in_month=30, day_of_week_in_month=1, day_of_week=6, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1975 : ReferenceDate(englishDate = CustomCalendar(year=1918, month=4, day_of_month=13, era=1, first_day_of_month=2, last_day_of_month=3, total_days_in_month=30, day_of_week_in_month=2, day_of_week=7, day_of_year=103, week_of_month=2, week_of_year=15), nepaliDate = CustomCalendar(year=1975, month=1, day_of_month=1, era=2, first_day_of_month=7, last_day_of_month=2, total_days_in_month=31, day_of_week_in_month=1, day_of_week=7, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1976 : ReferenceDate(englishDate = CustomCalendar(year=1919, month=4, day_of_month=13, era=1, first_day_of_month=3, last_day_of_month=4, total_days_in_month=30, day_of_week_in_month=2, day_of_week=1, day_of_year=103, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=1976, month=1, day_of_month=1, era=2, first_day_of_month=1, last_day_of_month=3, total_days_in_month=31, day_of_week_in_month=1, day_of_week=1, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1977 : ReferenceDate(englishDate = CustomCalendar(year=1920, month=4, day_of_month=13, era=1, first_day_of_month=5, last_day_of_month=6, total_days_in_month=30, day_of_week_in_month=2, day_of_week=3, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=1977, month=1, day_of_month=1, era=2, first_day_of_month=3, last_day_of_month=4, total_days_in_month=30, day_of_week_in_month=1, day_of_week=3, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1978 : ReferenceDate(englishDate = CustomCalendar(year=1921, month=4, day_of_month=13, era=1, first_day_of_month=6, last_day_of_month=7, total_days_in_month=30, day_of_week_in_month=2, day_of_week=4, day_of_year=103, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=1978, month=1, day_of_month=1, era=2, first_day_of_month=4, last_day_of_month=6, total_days_in_month=31, day_of_week_in_month=1, day_of_week=4, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1979 : ReferenceDate(englishDate = CustomCalendar(year=1922, month=4, day_of_month=13, era=1, first_day_of_month=7, last_day_of_month=1, total_days_in_month=30, day_of_week_in_month=2, day_of_week=5, day_of_year=103, week_of_month=3, week_of_year=15), nepaliDate = CustomCalendar(year=1979, month=1, day_of_month=1, era=2, first_day_of_month=5, last_day_of_month=7, total_days_in_month=31, day_of_week_in_month=1, day_of_week=5, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1980 : ReferenceDate(englishDate = CustomCalendar(year=1923, month=4, day_of_month=13, era=1, first_day_of_month=1, last_day_of_month=2, total_days_in_month=30, day_of_week_in_month=2, day_of_week=6, day_of_year=103, week_of_month=2, week_of_year=15), nepaliDate = CustomCalendar(year=1980, month=1, day_of_month=1, era=2, first_day_of_month=6, last_day_of_month=1, total_days_in_month=31, day_of_week_in_month=1, day_of_week=6, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1981 : ReferenceDate(englishDate = CustomCalendar(year=1924, month=4, day_of_month=13, era=1, first_day_of_month=3, last_day_of_month=4, total_days_in_month=30, day_of_week_in_month=2, day_of_week=1, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=1981, month=1, day_of_month=1, era=2, first_day_of_month=1, last_day_of_month=3, total_days_in_month=31, day_of_week_in_month=1, day_of_week=1, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1982 : ReferenceDate(englishDate = CustomCalendar(year=1925, month=4, day_of_month=13, era=1, first_day_of_month=4, last_day_of_month=5, total_days_in_month=30, day_of_week_in_month=2, day_of_week=2, day_of_year=103, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=1982, month=1, day_of_month=1, era=2, first_day_of_month=2, last_day_of_month=4, total_days_in_month=31, day_of_week_in_month=1, day_of_week=2, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1983 : ReferenceDate(englishDate = CustomCalendar(year=1926, month=4, day_of_month=13, era=1, first_day_of_month=5, last_day_of_month=6, total_days_in_month=30, day_of_week_in_month=2, day_of_week=3, day_of_year=103, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=1983, month=1, day_of_month=1, era=2, first_day_of_month=3, last_day_of_month=5, total_days_in_month=31, day_of_week_in_month=1, day_of_week=3, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1984 : ReferenceDate(englishDate = CustomCalendar(year=1927, month=4, day_of_month=13, era=1, first_day_of_month=6, last_day_of_month=7, total_days_in_month=30, day_of_week_in_month=2, day_of_week=4, day_of_year=103, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=1984, month=1, day_of_month=1, era=2, first_day_of_month=4, last_day_of_month=6, total_days_in_month=31, day_of_week_in_month=1, day_of_week=4, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1985 : ReferenceDate(englishDate = CustomCalendar(year=1928, month=4, day_of_month=13, era=1, first_day_of_month=1, last_day_of_month=2, total_days_in_month=30, day_of_week_in_month=2, day_of_week=6, day_of_year=104, week_of_month=2, week_of_year=15), nepaliDate = CustomCalendar(year=1985, month=1, day_of_month=1, era=2, first_day_of_month=6, last_day_of_month=1, total_days_in_month=31, day_of_week_in_month=1, day_of_week=6, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1986 : ReferenceDate(englishDate = CustomCalendar(year=1929, month=4, day_of_month=13, era=1, first_day_of_month=2, last_day_of_month=3, total_days_in_month=30, day_of_week_in_month=2, day_of_week=7, day_of_year=103, week_of_month=2, week_of_year=15), nepaliDate = CustomCalendar(year=1986, month=1, day_of_month=1, era=2, first_day_of_month=7, last_day_of_month=2, total_days_in_month=31, day_of_week_in_month=1, day_of_week=7, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1987 : ReferenceDate(englishDate = CustomCalendar(year=1930, month=4, day_of_month=13, era=1, first_day_of_month=3, last_day_of_month=4, total_days_in_month=30, day_of_week_in_month=2, day_of_week=1, day_of_year=103, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=1987, month=1, day_of_month=1, era=2, first_day_of_month=1, last_day_of_month=3, total_days_in_month=31, day_of_week_in_month=1, day_of_week=1, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1988 : ReferenceDate(englishDate = CustomCalendar(year=1931, month=4, day_of_month=13, era=1, first_day_of_month=4, last_day_of_month=5, total_days_in_month=30, day_of_week_in_month=2, day_of_week=2, day_of_year=103, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=1988, month=1, day_of_month=1, era=2, first_day_of_month=2, last_day_of_month=4, total_days_in_month=31, day_of_week_in_month=1, day_of_week=2, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1989 : ReferenceDate(englishDate = CustomCalendar(year=1932, month=4, day_of_month=13, era=1, first_day_of_month=6, last_day_of_month=7, total_days_in_month=30, day_of_week_in_month=2, day_of_week=4, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=1989, month=1, day_of_month=1, era=2, first_day_of_month=4, last_day_of_month=6, total_days_in_month=31, day_of_week_in_month=1, day_of_week=4, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1990 : ReferenceDate(englishDate = CustomCalendar(year=1933, month=4, day_of_month=13, era=1, first_day_of_month=7, last_day_of_month=1, total_days_in_month=30, day_of_week_in_month=2, day_of_week=5, day_of_year=103, week_of_month=3, week_of_year=15), nepaliDate = CustomCalendar(year=1990, month=1, day_of_month=1, era=2, first_day_of_month=5, last_day_of_month=7, total_days_in_month=31, day_of_week_in_month=1, day_of_week=5, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1991 : ReferenceDate(englishDate = CustomCalendar(year=1934, month=4, day_of_month=13, era=1, first_day_of_month=1, last_day_of_month=2, total_days_in_month=30, day_of_week_in_month=2, day_of_week=6, day_of_year=103, week_of_month=2, week_of_year=15), nepaliDate = CustomCalendar(year=1991, month=1, day_of_month=1, era=2, first_day_of_month=6, last_day_of_month=1, total_days_in_month=31, day_of_week_in_month=1, day_of_week=6, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1992 : ReferenceDate(englishDate = CustomCalendar(year=1935, month=4, day_of_month=13, era=1, first_day_of_month=2, last_day_of_month=3, total_days_in_month=30, day_of_week_in_month=2, day_of_week=7, day_of_year=103, week_of_month=2, week_of_year=15), nepaliDate = CustomCalendar(year=1992, month=1, day_of_month=1, era=2, first_day_of_month=7, last_day_of_month=2, total_days_in_month=31, day_of_week_in_month=1, day_of_week=7, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1993 : ReferenceDate(englishDate = CustomCalendar(year=1936, month=4, day_of_month=13, era=1, first_day_of_month=4, last_day_of_month=5, total_days_in_month=30, day_of_week_in_month=2, day_of_week=2, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=1993, month=1, day_of_month=1, era=2, first_day_of_month=2, last_day_of_month=4, total_days_in_month=31, day_of_week_in_month=1, day_of_week=2, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1994 : ReferenceDate(englishDate = CustomCalendar(year=1937, month=4, day_of_month=13, era=1, first_day_of_month=5, last_day_of_month=6, total_days_in_month=30, day_of_week_in_month=2, day_of_week=3, day_of_year=103, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=1994, month=1, day_of_month=1, era=2, first_day_of_month=3, last_day_of_month=5, total_days_in_month=31, day_of_week_in_month=1, day_of_week=3, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1995 : ReferenceDate(englishDate = CustomCalendar(year=1938, month=4, day_of_month=13, era=1, first_day_of_month=6, last_day_of_month=7, total_days_in_month=30, day_of_week_in_month=2, day_of_week=4, day_of_year=103, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=1995, month=1, day_of_month=1, era=2, first_day_of_month=4, last_day_of_month=6, total_days_in_month=31, day_of_week_in_month=1, day_of_week=4, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1996 : ReferenceDate(englishDate = CustomCalendar(year=1939, month=4, day_of_month=13, era=1, first_day_of_month=7, last_day_of_month=1, total_days_in_month=30, day_of_week_in_month=2, day_of_week=5, day_of_year=103, week_of_month=3, week_of_year=15), nepaliDate = CustomCalendar(year=1996, month=1, day_of_month=1, era=2, first_day_of_month=5, last_day_of_month=7, total_days_in_month=31, day_of_week_in_month=1, day_of_week=5, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1997 : ReferenceDate(englishDate = CustomCalendar(year=1940, month=4, day_of_month=13, era=1, first_day_of_month=2, last_day_of_month=3, total_days_in_month=30, day_of_week_in_month=2, day_of_week=7, day_of_year=104, week_of_month=2, week_of_year=15), nepaliDate = CustomCalendar(year=1997, month=1, day_of_month=1, era=2, first_day_of_month=7, last_day_of_month=2, total_days_in_month=31, day_of_week_in_month=1, day_of_week=7, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1998 : ReferenceDate(englishDate = CustomCalendar(year=1941, month=4, day_of_month=13, era=1, first_day_of_month=3, last_day_of_month=4, total_days_in_month=30, day_of_week_in_month=2, day_of_week=1, day_of_year=103, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=1998, month=1, day_of_month=1, era=2, first_day_of_month=1, last_day_of_month=3, total_days_in_month=31, day_of_week_in_month=1, day_of_week=1, day_of_year=1, week_of_month=1, week_of_year=1)),
-    1999 : ReferenceDate(englishDate = CustomCalendar(year=1942, month=4, day_of_month=13, era=1, first_day_of_month=4, last_day_of_month=5, total_days_in_month=30, day_of_week_in_month=2, day_of_week=2, day_of_year=103, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=1999, month=1, day_of_month=1, era=2, first_day_of_month=2, last_day_of_month=4, total_days_in_month=31, day_of_week_in_month=1, day_of_week=2, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2000 : ReferenceDate(englishDate = CustomCalendar(year=1943, month=4, day_of_month=14, era=1, first_day_of_month=5, last_day_of_month=6, total_days_in_month=30, day_of_week_in_month=2, day_of_week=4, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2000, month=1, day_of_month=1, era=2, first_day_of_month=4, last_day_of_month=5, total_days_in_month=30, day_of_week_in_month=1, day_of_week=4, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2001 : ReferenceDate(englishDate = CustomCalendar(year=1944, month=4, day_of_month=13, era=1, first_day_of_month=7, last_day_of_month=1, total_days_in_month=30, day_of_week_in_month=2, day_of_week=5, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2001, month=1, day_of_month=1, era=2, first_day_of_month=5, last_day_of_month=7, total_days_in_month=31, day_of_week_in_month=1, day_of_week=5, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2002 : ReferenceDate(englishDate = CustomCalendar(year=1945, month=4, day_of_month=13, era=1, first_day_of_month=1, last_day_of_month=2, total_days_in_month=30, day_of_week_in_month=2, day_of_week=6, day_of_year=103, week_of_month=2, week_of_year=15), nepaliDate = CustomCalendar(year=2002, month=1, day_of_month=1, era=2, first_day_of_month=6, last_day_of_month=1, total_days_in_month=31, day_of_week_in_month=1, day_of_week=6, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2003 : ReferenceDate(englishDate = CustomCalendar(year=1946, month=4, day_of_month=13, era=1, first_day_of_month=2, last_day_of_month=3, total_days_in_month=30, day_of_week_in_month=2, day_of_week=7, day_of_year=103, week_of_month=2, week_of_year=15), nepaliDate = CustomCalendar(year=2003, month=1, day_of_month=1, era=2, first_day_of_month=7, last_day_of_month=2, total_days_in_month=31, day_of_week_in_month=1, day_of_week=7, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2004 : ReferenceDate(englishDate = CustomCalendar(year=1947, month=4, day_of_month=14, era=1, first_day_of_month=3, last_day_of_month=4, total_days_in_month=30, day_of_week_in_month=2, day_of_week=2, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2004, month=1, day_of_month=1, era=2, first_day_of_month=2, last_day_of_month=3, total_days_in_month=30, day_of_week_in_month=1, day_of_week=2, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2005 : ReferenceDate(englishDate = CustomCalendar(year=1948, month=4, day_of_month=13, era=1, first_day_of_month=5, last_day_of_month=6, total_days_in_month=30, day_of_week_in_month=2, day_of_week=3, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2005, month=1, day_of_month=1, era=2, first_day_of_month=3, last_day_of_month=5, total_days_in_month=31, day_of_week_in_month=1, day_of_week=3, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2006 : ReferenceDate(englishDate = CustomCalendar(year=1949, month=4, day_of_month=13, era=1, first_day_of_month=6, last_day_of_month=7, total_days_in_month=30, day_of_week_in_month=2, day_of_week=4, day_of_year=103, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2006, month=1, day_of_month=1, era=2, first_day_of_month=4, last_day_of_month=6, total_days_in_month=31, day_of_week_in_month=1, day_of_week=4, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2007 : ReferenceDate(englishDate = CustomCalendar(year=1950, month=4, day_of_month=13, era=1, first_day_of_month=7, last_day_of_month=1, total_days_in_month=30, day_of_week_in_month=2, day_of_week=5, day_of_year=103, week_of_month=3, week_of_year=15), nepaliDate = CustomCalendar(year=2007, month=1, day_of_month=1, era=2, first_day_of_month=5, last_day_of_month=7, total_days_in_month=31, day_of_week_in_month=1, day_of_week=5, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2008 : ReferenceDate(englishDate = CustomCalendar(year=1951, month=4, day_of_month=14, era=1, first_day_of_month=1, last_day_of_month=2, total_days_in_month=30, day_of_week_in_month=2, day_of_week=7, day_of_year=104, week_of_month=2, week_of_year=15), nepaliDate = CustomCalendar(year=2008, month=1, day_of_month=1, era=2, first_day_of_month=7, last_day_of_month=2, total_days_in_month=31, day_of_week_in_month=1, day_of_week=7, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2009 : ReferenceDate(englishDate = CustomCalendar(year=1952, month=4, day_of_month=13, era=1, first_day_of_month=3, last_day_of_month=4, total_days_in_month=30, day_of_week_in_month=2, day_of_week=1, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2009, month=1, day_of_month=1, era=2, first_day_of_month=1, last_day_of_month=3, total_days_in_month=31, day_of_week_in_month=1, day_of_week=1, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2010 : ReferenceDate(englishDate = CustomCalendar(year=1953, month=4, day_of_month=13, era=1, first_day_of_month=4, last_day_of_month=5, total_days_in_month=30, day_of_week_in_month=2, day_of_week=2, day_of_year=103, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2010, month=1, day_of_month=1, era=2, first_day_of_month=2, last_day_of_month=4, total_days_in_month=31, day_of_week_in_month=1, day_of_week=2, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2011 : ReferenceDate(englishDate = CustomCalendar(year=1954, month=4, day_of_month=13, era=1, first_day_of_month=5, last_day_of_month=6, total_days_in_month=30, day_of_week_in_month=2, day_of_week=3, day_of_year=103, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2011, month=1, day_of_month=1, era=2, first_day_of_month=3, last_day_of_month=5, total_days_in_month=31, day_of_week_in_month=1, day_of_week=3, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2012 : ReferenceDate(englishDate = CustomCalendar(year=1955, month=4, day_of_month=14, era=1, first_day_of_month=6, last_day_of_month=7, total_days_in_month=30, day_of_week_in_month=2, day_of_week=5, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2012, month=1, day_of_month=1, era=2, first_day_of_month=5, last_day_of_month=7, total_days_in_month=31, day_of_week_in_month=1, day_of_week=5, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2013 : ReferenceDate(englishDate = CustomCalendar(year=1956, month=4, day_of_month=13, era=1, first_day_of_month=1, last_day_of_month=2, total_days_in_month=30, day_of_week_in_month=2, day_of_week=6, day_of_year=104, week_of_month=2, week_of_year=15), nepaliDate = CustomCalendar(year=2013, month=1, day_of_month=1, era=2, first_day_of_month=6, last_day_of_month=1, total_days_in_month=31, day_of_week_in_month=1, day_of_week=6, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2014 : ReferenceDate(englishDate = CustomCalendar(year=1957, month=4, day_of_month=13, era=1, first_day_of_month=2, last_day_of_month=3, total_days_in_month=30, day_of_week_in_month=2, day_of_week=7, day_of_year=103, week_of_month=2, week_of_year=15), nepaliDate = CustomCalendar(year=2014, month=1, day_of_month=1, era=2, first_day_of_month=7, last_day_of_month=2, total_days_in_month=31, day_of_week_in_month=1, day_of_week=7, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2015 : ReferenceDate(englishDate = CustomCalendar(year=1958, month=4, day_of_month=13, era=1, first_day_of_month=3, last_day_of_month=4, total_days_in_month=30, day_of_week_in_month=2, day_of_week=1, day_of_year=103, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2015, month=1, day_of_month=1, era=2, first_day_of_month=1, last_day_of_month=3, total_days_in_month=31, day_of_week_in_month=1, day_of_week=1, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2016 : ReferenceDate(englishDate = CustomCalendar(year=1959, month=4, day_of_month=14, era=1, first_day_of_month=4, last_day_of_month=5, total_days_in_month=30, day_of_week_in_month=2, day_of_week=3, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2016, month=1, day_of_month=1, era=2, first_day_of_month=3, last_day_of_month=5, total_days_in_month=31, day_of_week_in_month=1, day_of_week=3, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2017 : ReferenceDate(englishDate = CustomCalendar(year=1960, month=4, day_of_month=13, era=1, first_day_of_month=6, last_day_of_month=7, total_days_in_month=30, day_of_week_in_month=2, day_of_week=4, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2017, month=1, day_of_month=1, era=2, first_day_of_month=4, last_day_of_month=6, total_days_in_month=31, day_of_week_in_month=1, day_of_week=4, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2018 : ReferenceDate(englishDate = CustomCalendar(year=1961, month=4, day_of_month=13, era=1, first_day_of_month=7, last_day_of_month=1, total_days_in_month=30, day_of_week_in_month=2, day_of_week=5, day_of_year=103, week_of_month=3, week_of_year=15), nepaliDate = CustomCalendar(year=2018, month=1, day_of_month=1, era=2, first_day_of_month=5, last_day_of_month=7, total_days_in_month=31, day_of_week_in_month=1, day_of_week=5, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2019 : ReferenceDate(englishDate = CustomCalendar(year=1962, month=4, day_of_month=13, era=1, first_day_of_month=1, last_day_of_month=2, total_days_in_month=30, day_of_week_in_month=2, day_of_week=6, day_of_year=103, week_of_month=2, week_of_year=15), nepaliDate = CustomCalendar(year=2019, month=1, day_of_month=1, era=2, first_day_of_month=6, last_day_of_month=1, total_days_in_month=31, day_of_week_in_month=1, day_of_week=6, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2020 : ReferenceDate(englishDate = CustomCalendar(year=1963, month=4, day_of_month=14, era=1, first_day_of_month=2, last_day_of_month=3, total_days_in_month=30, day_of_week_in_month=2, day_of_week=1, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2020, month=1, day_of_month=1, era=2, first_day_of_month=1, last_day_of_month=3, total_days_in_month=31, day_of_week_in_month=1, day_of_week=1, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2021 : ReferenceDate(englishDate = CustomCalendar(year=1964, month=4, day_of_month=13, era=1, first_day_of_month=4, last_day_of_month=5, total_days_in_month=30, day_of_week_in_month=2, day_of_week=2, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2021, month=1, day_of_month=1, era=2, first_day_of_month=2, last_day_of_month=4, total_days_in_month=31, day_of_week_in_month=1, day_of_week=2, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2022 : ReferenceDate(englishDate = CustomCalendar(year=1965, month=4, day_of_month=13, era=1, first_day_of_month=5, last_day_of_month=6, total_days_in_month=30, day_of_week_in_month=2, day_of_week=3, day_of_year=103, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2022, month=1, day_of_month=1, era=2, first_day_of_month=3, last_day_of_month=5, total_days_in_month=31, day_of_week_in_month=1, day_of_week=3, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2023 : ReferenceDate(englishDate = CustomCalendar(year=1966, month=4, day_of_month=13, era=1, first_day_of_month=6, last_day_of_month=7, total_days_in_month=30, day_of_week_in_month=2, day_of_week=4, day_of_year=103, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2023, month=1, day_of_month=1, era=2, first_day_of_month=4, last_day_of_month=6, total_days_in_month=31, day_of_week_in_month=1, day_of_week=4, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2024 : ReferenceDate(englishDate = CustomCalendar(year=1967, month=4, day_of_month=14, era=1, first_day_of_month=7, last_day_of_month=1, total_days_in_month=30, day_of_week_in_month=2, day_of_week=6, day_of_year=104, week_of_month=3, week_of_year=15), nepaliDate = CustomCalendar(year=2024, month=1, day_of_month=1, era=2, first_day_of_month=6, last_day_of_month=1, total_days_in_month=31, day_of_week_in_month=1, day_of_week=6, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2025 : ReferenceDate(englishDate = CustomCalendar(year=1968, month=4, day_of_month=13, era=1, first_day_of_month=2, last_day_of_month=3, total_days_in_month=30, day_of_week_in_month=2, day_of_week=7, day_of_year=104, week_of_month=2, week_of_year=15), nepaliDate = CustomCalendar(year=2025, month=1, day_of_month=1, era=2, first_day_of_month=7, last_day_of_month=2, total_days_in_month=31, day_of_week_in_month=1, day_of_week=7, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2026 : ReferenceDate(englishDate = CustomCalendar(year=1969, month=4, day_of_month=13, era=1, first_day_of_month=3, last_day_of_month=4, total_days_in_month=30, day_of_week_in_month=2, day_of_week=1, day_of_year=103, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2026, month=1, day_of_month=1, era=2, first_day_of_month=1, last_day_of_month=3, total_days_in_month=31, day_of_week_in_month=1, day_of_week=1, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2027 : ReferenceDate(englishDate = CustomCalendar(year=1970, month=4, day_of_month=14, era=1, first_day_of_month=4, last_day_of_month=5, total_days_in_month=30, day_of_week_in_month=2, day_of_week=3, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2027, month=1, day_of_month=1, era=2, first_day_of_month=3, last_day_of_month=4, total_days_in_month=30, day_of_week_in_month=1, day_of_week=3, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2028 : ReferenceDate(englishDate = CustomCalendar(year=1971, month=4, day_of_month=14, era=1, first_day_of_month=5, last_day_of_month=6, total_days_in_month=30, day_of_week_in_month=2, day_of_week=4, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2028, month=1, day_of_month=1, era=2, first_day_of_month=4, last_day_of_month=6, total_days_in_month=31, day_of_week_in_month=1, day_of_week=4, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2029 : ReferenceDate(englishDate = CustomCalendar(year=1972, month=4, day_of_month=13, era=1, first_day_of_month=7, last_day_of_month=1, total_days_in_month=30, day_of_week_in_month=2, day_of_week=5, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2029, month=1, day_of_month=1, era=2, first_day_of_month=5, last_day_of_month=7, total_days_in_month=31, day_of_week_in_month=1, day_of_week=5, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2030 : ReferenceDate(englishDate = CustomCalendar(year=1973, month=4, day_of_month=13, era=1, first_day_of_month=1, last_day_of_month=2, total_days_in_month=30, day_of_week_in_month=2, day_of_week=6, day_of_year=103, week_of_month=2, week_of_year=15), nepaliDate = CustomCalendar(year=2030, month=1, day_of_month=1, era=2, first_day_of_month=6, last_day_of_month=1, total_days_in_month=31, day_of_week_in_month=1, day_of_week=6, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2031 : ReferenceDate(englishDate = CustomCalendar(year=1974, month=4, day_of_month=14, era=1, first_day_of_month=2, last_day_of_month=3, total_days_in_month=30, day_of_week_in_month=2, day_of_week=1, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2031, month=1, day_of_month=1, era=2, first_day_of_month=1, last_day_of_month=2, total_days_in_month=30, day_of_week_in_month=1, day_of_week=1, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2032 : ReferenceDate(englishDate = CustomCalendar(year=1975, month=4, day_of_month=14, era=1, first_day_of_month=3, last_day_of_month=4, total_days_in_month=30, day_of_week_in_month=2, day_of_week=2, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2032, month=1, day_of_month=1, era=2, first_day_of_month=2, last_day_of_month=4, total_days_in_month=31, day_of_week_in_month=1, day_of_week=2, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2033 : ReferenceDate(englishDate = CustomCalendar(year=1976, month=4, day_of_month=13, era=1, first_day_of_month=5, last_day_of_month=6, total_days_in_month=30, day_of_week_in_month=2, day_of_week=3, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2033, month=1, day_of_month=1, era=2, first_day_of_month=3, last_day_of_month=5, total_days_in_month=31, day_of_week_in_month=1, day_of_week=3, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2034 : ReferenceDate(englishDate = CustomCalendar(year=1977, month=4, day_of_month=13, era=1, first_day_of_month=6, last_day_of_month=7, total_days_in_month=30, day_of_week_in_month=2, day_of_week=4, day_of_year=103, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2034, month=1, day_of_month=1, era=2, first_day_of_month=4, last_day_of_month=6, total_days_in_month=31, day_of_week_in_month=1, day_of_week=4, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2035 : ReferenceDate(englishDate = CustomCalendar(year=1978, month=4, day_of_month=14, era=1, first_day_of_month=7, last_day_of_month=1, total_days_in_month=30, day_of_week_in_month=2, day_of_week=6, day_of_year=104, week_of_month=3, week_of_year=15), nepaliDate = CustomCalendar(year=2035, month=1, day_of_month=1, era=2, first_day_of_month=6, last_day_of_month=7, total_days_in_month=30, day_of_week_in_month=1, day_of_week=6, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2036 : ReferenceDate(englishDate = CustomCalendar(year=1979, month=4, day_of_month=14, era=1, first_day_of_month=1, last_day_of_month=2, total_days_in_month=30, day_of_week_in_month=2, day_of_week=7, day_of_year=104, week_of_month=2, week_of_year=15), nepaliDate = CustomCalendar(year=2036, month=1, day_of_month=1, era=2, first_day_of_month=7, last_day_of_month=2, total_days_in_month=31, day_of_week_in_month=1, day_of_week=7, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2037 : ReferenceDate(englishDate = CustomCalendar(year=1980, month=4, day_of_month=13, era=1, first_day_of_month=3, last_day_of_month=4, total_days_in_month=30, day_of_week_in_month=2, day_of_week=1, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2037, month=1, day_of_month=1, era=2, first_day_of_month=1, last_day_of_month=3, total_days_in_month=31, day_of_week_in_month=1, day_of_week=1, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2038 : ReferenceDate(englishDate = CustomCalendar(year=1981, month=4, day_of_month=13, era=1, first_day_of_month=4, last_day_of_month=5, total_days_in_month=30, day_of_week_in_month=2, day_of_week=2, day_of_year=103, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2038, month=1, day_of_month=1, era=2, first_day_of_month=2, last_day_of_month=4, total_days_in_month=31, day_of_week_in_month=1, day_of_week=2, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2039 : ReferenceDate(englishDate = CustomCalendar(year=1982, month=4, day_of_month=14, era=1, first_day_of_month=5, last_day_of_month=6, total_days_in_month=30, day_of_week_in_month=2, day_of_week=4, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2039, month=1, day_of_month=1, era=2, first_day_of_month=4, last_day_of_month=6, total_days_in_month=31, day_of_week_in_month=1, day_of_week=4, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2040 : ReferenceDate(englishDate = CustomCalendar(year=1983, month=4, day_of_month=14, era=1, first_day_of_month=6, last_day_of_month=7, total_days_in_month=30, day_of_week_in_month=2, day_of_week=5, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2040, month=1, day_of_month=1, era=2, first_day_of_month=5, last_day_of_month=7, total_days_in_month=31, day_of_week_in_month=1, day_of_week=5, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2041 : ReferenceDate(englishDate = CustomCalendar(year=1984, month=4, day_of_month=13, era=1, first_day_of_month=1, last_day_of_month=2, total_days_in_month=30, day_of_week_in_month=2, day_of_week=6, day_of_year=104, week_of_month=2, week_of_year=15), nepaliDate = CustomCalendar(year=2041, month=1, day_of_month=1, era=2, first_day_of_month=6, last_day_of_month=1, total_days_in_month=31, day_of_week_in_month=1, day_of_week=6, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2042 : ReferenceDate(englishDate = CustomCalendar(year=1985, month=4, day_of_month=13, era=1, first_day_of_month=2, last_day_of_month=3, total_days_in_month=30, day_of_week_in_month=2, day_of_week=7, day_of_year=103, week_of_month=2, week_of_year=15), nepaliDate = CustomCalendar(year=2042, month=1, day_of_month=1, era=2, first_day_of_month=7, last_day_of_month=2, total_days_in_month=31, day_of_week_in_month=1, day_of_week=7, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2043 : ReferenceDate(englishDate = CustomCalendar(year=1986, month=4, day_of_month=14, era=1, first_day_of_month=3, last_day_of_month=4, total_days_in_month=30, day_of_week_in_month=2, day_of_week=2, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2043, month=1, day_of_month=1, era=2, first_day_of_month=2, last_day_of_month=4, total_days_in_month=31, day_of_week_in_month=1, day_of_week=2, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2044 : ReferenceDate(englishDate = CustomCalendar(year=1987, month=4, day_of_month=14, era=1, first_day_of_month=4, last_day_of_month=5, total_days_in_month=30, day_of_week_in_month=2, day_of_week=3, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2044, month=1, day_of_month=1, era=2, first_day_of_month=3, last_day_of_month=5, total_days_in_month=31, day_of_week_in_month=1, day_of_week=3, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2045 : ReferenceDate(englishDate = CustomCalendar(year=1988, month=4, day_of_month=13, era=1, first_day_of_month=6, last_day_of_month=7, total_days_in_month=30, day_of_week_in_month=2, day_of_week=4, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2045, month=1, day_of_month=1, era=2, first_day_of_month=4, last_day_of_month=6, total_days_in_month=31, day_of_week_in_month=1, day_of_week=4, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2046 : ReferenceDate(englishDate = CustomCalendar(year=1989, month=4, day_of_month=13, era=1, first_day_of_month=7, last_day_of_month=1, total_days_in_month=30, day_of_week_in_month=2, day_of_week=5, day_of_year=103, week_of_month=3, week_of_year=15), nepaliDate = CustomCalendar(year=2046, month=1, day_of_month=1, era=2, first_day_of_month=5, last_day_of_month=7, total_days_in_month=31, day_of_week_in_month=1, day_of_week=5, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2047 : ReferenceDate(englishDate = CustomCalendar(year=1990, month=4, day_of_month=14, era=1, first_day_of_month=1, last_day_of_month=2, total_days_in_month=30, day_of_week_in_month=2, day_of_week=7, day_of_year=104, week_of_month=2, week_of_year=15), nepaliDate = CustomCalendar(year=2047, month=1, day_of_month=1, era=2, first_day_of_month=7, last_day_of_month=2, total_days_in_month=31, day_of_week_in_month=1, day_of_week=7, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2048 : ReferenceDate(englishDate = CustomCalendar(year=1991, month=4, day_of_month=14, era=1, first_day_of_month=2, last_day_of_month=3, total_days_in_month=30, day_of_week_in_month=2, day_of_week=1, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2048, month=1, day_of_month=1, era=2, first_day_of_month=1, last_day_of_month=3, total_days_in_month=31, day_of_week_in_month=1, day_of_week=1, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2049 : ReferenceDate(englishDate = CustomCalendar(year=1992, month=4, day_of_month=13, era=1, first_day_of_month=4, last_day_of_month=5, total_days_in_month=30, day_of_week_in_month=2, day_of_week=2, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2049, month=1, day_of_month=1, era=2, first_day_of_month=2, last_day_of_month=4, total_days_in_month=31, day_of_week_in_month=1, day_of_week=2, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2050 : ReferenceDate(englishDate = CustomCalendar(year=1993, month=4, day_of_month=13, era=1, first_day_of_month=5, last_day_of_month=6, total_days_in_month=30, day_of_week_in_month=2, day_of_week=3, day_of_year=103, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2050, month=1, day_of_month=1, era=2, first_day_of_month=3, last_day_of_month=5, total_days_in_month=31, day_of_week_in_month=1, day_of_week=3, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2051 : ReferenceDate(englishDate = CustomCalendar(year=1994, month=4, day_of_month=14, era=1, first_day_of_month=6, last_day_of_month=7, total_days_in_month=30, day_of_week_in_month=2, day_of_week=5, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2051, month=1, day_of_month=1, era=2, first_day_of_month=5, last_day_of_month=7, total_days_in_month=31, day_of_week_in_month=1, day_of_week=5, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2052 : ReferenceDate(englishDate = CustomCalendar(year=1995, month=4, day_of_month=14, era=1, first_day_of_month=7, last_day_of_month=1, total_days_in_month=30, day_of_week_in_month=2, day_of_week=6, day_of_year=104, week_of_month=3, week_of_year=15), nepaliDate = CustomCalendar(year=2052, month=1, day_of_month=1, era=2, first_day_of_month=6, last_day_of_month=1, total_days_in_month=31, day_of_week_in_month=1, day_of_week=6, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2053 : ReferenceDate(englishDate = CustomCalendar(year=1996, month=4, day_of_month=13, era=1, first_day_of_month=2, last_day_of_month=3, total_days_in_month=30, day_of_week_in_month=2, day_of_week=7, day_of_year=104, week_of_month=2, week_of_year=15), nepaliDate = CustomCalendar(year=2053, month=1, day_of_month=1, era=2, first_day_of_month=7, last_day_of_month=2, total_days_in_month=31, day_of_week_in_month=1, day_of_week=7, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2054 : ReferenceDate(englishDate = CustomCalendar(year=1997, month=4, day_of_month=13, era=1, first_day_of_month=3, last_day_of_month=4, total_days_in_month=30, day_of_week_in_month=2, day_of_week=1, day_of_year=103, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2054, month=1, day_of_month=1, era=2, first_day_of_month=1, last_day_of_month=3, total_days_in_month=31, day_of_week_in_month=1, day_of_week=1, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2055 : ReferenceDate(englishDate = CustomCalendar(year=1998, month=4, day_of_month=14, era=1, first_day_of_month=4, last_day_of_month=5, total_days_in_month=30, day_of_week_in_month=2, day_of_week=3, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2055, month=1, day_of_month=1, era=2, first_day_of_month=3, last_day_of_month=5, total_days_in_month=31, day_of_week_in_month=1, day_of_week=3, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2056 : ReferenceDate(englishDate = CustomCalendar(year=1999, month=4, day_of_month=14, era=1, first_day_of_month=5, last_day_of_month=6, total_days_in_month=30, day_of_week_in_month=2, day_of_week=4, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2056, month=1, day_of_month=1, era=2, first_day_of_month=4, last_day_of_month=6, total_days_in_month=31, day_of_week_in_month=1, day_of_week=4, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2057 : ReferenceDate(englishDate = CustomCalendar(year=2000, month=4, day_of_month=13, era=1, first_day_of_month=7, last_day_of_month=1, total_days_in_month=30, day_of_week_in_month=2, day_of_week=5, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2057, month=1, day_of_month=1, era=2, first_day_of_month=5, last_day_of_month=7, total_days_in_month=31, day_of_week_in_month=1, day_of_week=5, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2058 : ReferenceDate(englishDate = CustomCalendar(year=2001, month=4, day_of_month=14, era=1, first_day_of_month=1, last_day_of_month=2, total_days_in_month=30, day_of_week_in_month=2, day_of_week=7, day_of_year=104, week_of_month=2, week_of_year=15), nepaliDate = CustomCalendar(year=2058, month=1, day_of_month=1, era=2, first_day_of_month=7, last_day_of_month=1, total_days_in_month=30, day_of_week_in_month=1, day_of_week=7, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2059 : ReferenceDate(englishDate = CustomCalendar(year=2002, month=4, day_of_month=14, era=1, first_day_of_month=2, last_day_of_month=3, total_days_in_month=30, day_of_week_in_month=2, day_of_week=1, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2059, month=1, day_of_month=1, era=2, first_day_of_month=1, last_day_of_month=3, total_days_in_month=31, day_of_week_in_month=1, day_of_week=1, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2060 : ReferenceDate(englishDate = CustomCalendar(year=2003, month=4, day_of_month=14, era=1, first_day_of_month=3, last_day_of_month=4, total_days_in_month=30, day_of_week_in_month=2, day_of_week=2, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2060, month=1, day_of_month=1, era=2, first_day_of_month=2, last_day_of_month=4, total_days_in_month=31, day_of_week_in_month=1, day_of_week=2, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2061 : ReferenceDate(englishDate = CustomCalendar(year=2004, month=4, day_of_month=13, era=1, first_day_of_month=5, last_day_of_month=6, total_days_in_month=30, day_of_week_in_month=2, day_of_week=3, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2061, month=1, day_of_month=1, era=2, first_day_of_month=3, last_day_of_month=5, total_days_in_month=31, day_of_week_in_month=1, day_of_week=3, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2062 : ReferenceDate(englishDate = CustomCalendar(year=2005, month=4, day_of_month=14, era=1, first_day_of_month=6, last_day_of_month=7, total_days_in_month=30, day_of_week_in_month=2, day_of_week=5, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2062, month=1, day_of_month=1, era=2, first_day_of_month=5, last_day_of_month=6, total_days_in_month=30, day_of_week_in_month=1, day_of_week=5, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2063 : ReferenceDate(englishDate = CustomCalendar(year=2006, month=4, day_of_month=14, era=1, first_day_of_month=7, last_day_of_month=1, total_days_in_month=30, day_of_week_in_month=2, day_of_week=6, day_of_year=104, week_of_month=3, week_of_year=15), nepaliDate = CustomCalendar(year=2063, month=1, day_of_month=1, era=2, first_day_of_month=6, last_day_of_month=1, total_days_in_month=31, day_of_week_in_month=1, day_of_week=6, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2064 : ReferenceDate(englishDate = CustomCalendar(year=2007, month=4, day_of_month=14, era=1, first_day_of_month=1, last_day_of_month=2, total_days_in_month=30, day_of_week_in_month=2, day_of_week=7, day_of_year=104, week_of_month=2, week_of_year=15), nepaliDate = CustomCalendar(year=2064, month=1, day_of_month=1, era=2, first_day_of_month=7, last_day_of_month=2, total_days_in_month=31, day_of_week_in_month=1, day_of_week=7, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2065 : ReferenceDate(englishDate = CustomCalendar(year=2008, month=4, day_of_month=13, era=1, first_day_of_month=3, last_day_of_month=4, total_days_in_month=30, day_of_week_in_month=2, day_of_week=1, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2065, month=1, day_of_month=1, era=2, first_day_of_month=1, last_day_of_month=3, total_days_in_month=31, day_of_week_in_month=1, day_of_week=1, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2066 : ReferenceDate(englishDate = CustomCalendar(year=2009, month=4, day_of_month=14, era=1, first_day_of_month=4, last_day_of_month=5, total_days_in_month=30, day_of_week_in_month=2, day_of_week=3, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2066, month=1, day_of_month=1, era=2, first_day_of_month=3, last_day_of_month=5, total_days_in_month=31, day_of_week_in_month=1, day_of_week=3, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2067 : ReferenceDate(englishDate = CustomCalendar(year=2010, month=4, day_of_month=14, era=1, first_day_of_month=5, last_day_of_month=6, total_days_in_month=30, day_of_week_in_month=2, day_of_week=4, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2067, month=1, day_of_month=1, era=2, first_day_of_month=4, last_day_of_month=6, total_days_in_month=31, day_of_week_in_month=1, day_of_week=4, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2068 : ReferenceDate(englishDate = CustomCalendar(year=2011, month=4, day_of_month=14, era=1, first_day_of_month=6, last_day_of_month=7, total_days_in_month=30, day_of_week_in_month=2, day_of_week=5, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2068, month=1, day_of_month=1, era=2, first_day_of_month=5, last_day_of_month=7, total_days_in_month=31, day_of_week_in_month=1, day_of_week=5, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2069 : ReferenceDate(englishDate = CustomCalendar(year=2012, month=4, day_of_month=13, era=1, first_day_of_month=1, last_day_of_month=2, total_days_in_month=30, day_of_week_in_month=2, day_of_week=6, day_of_year=104, week_of_month=2, week_of_year=15), nepaliDate = CustomCalendar(year=2069, month=1, day_of_month=1, era=2, first_day_of_month=6, last_day_of_month=1, total_days_in_month=31, day_of_week_in_month=1, day_of_week=6, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2070 : ReferenceDate(englishDate = CustomCalendar(year=2013, month=4, day_of_month=14, era=1, first_day_of_month=2, last_day_of_month=3, total_days_in_month=30, day_of_week_in_month=2, day_of_week=1, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2070, month=1, day_of_month=1, era=2, first_day_of_month=1, last_day_of_month=3, total_days_in_month=31, day_of_week_in_month=1, day_of_week=1, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2071 : ReferenceDate(englishDate = CustomCalendar(year=2014, month=4, day_of_month=14, era=1, first_day_of_month=3, last_day_of_month=4, total_days_in_month=30, day_of_week_in_month=2, day_of_week=2, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2071, month=1, day_of_month=1, era=2, first_day_of_month=2, last_day_of_month=4, total_days_in_month=31, day_of_week_in_month=1, day_of_week=2, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2072 : ReferenceDate(englishDate = CustomCalendar(year=2015, month=4, day_of_month=14, era=1, first_day_of_month=4, last_day_of_month=5, total_days_in_month=30, day_of_week_in_month=2, day_of_week=3, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2072, month=1, day_of_month=1, era=2, first_day_of_month=3, last_day_of_month=5, total_days_in_month=31, day_of_week_in_month=1, day_of_week=3, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2073 : ReferenceDate(englishDate = CustomCalendar(year=2016, month=4, day_of_month=13, era=1, first_day_of_month=6, last_day_of_month=7, total_days_in_month=30, day_of_week_in_month=2, day_of_week=4, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2073, month=1, day_of_month=1, era=2, first_day_of_month=4, last_day_of_month=6, total_days_in_month=31, day_of_week_in_month=1, day_of_week=4, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2074 : ReferenceDate(englishDate = CustomCalendar(year=2017, month=4, day_of_month=14, era=1, first_day_of_month=7, last_day_of_month=1, total_days_in_month=30, day_of_week_in_month=2, day_of_week=6, day_of_year=104, week_of_month=3, week_of_year=15), nepaliDate = CustomCalendar(year=2074, month=1, day_of_month=1, era=2, first_day_of_month=6, last_day_of_month=1, total_days_in_month=31, day_of_week_in_month=1, day_of_week=6, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2075 : ReferenceDate(englishDate = CustomCalendar(year=2018, month=4, day_of_month=14, era=1, first_day_of_month=1, last_day_of_month=2, total_days_in_month=30, day_of_week_in_month=2, day_of_week=7, day_of_year=104, week_of_month=2, week_of_year=15), nepaliDate = CustomCalendar(year=2075, month=1, day_of_month=1, era=2, first_day_of_month=7, last_day_of_month=2, total_days_in_month=31, day_of_week_in_month=1, day_of_week=7, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2076 : ReferenceDate(englishDate = CustomCalendar(year=2019, month=4, day_of_month=14, era=1, first_day_of_month=2, last_day_of_month=3, total_days_in_month=30, day_of_week_in_month=2, day_of_week=1, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2076, month=1, day_of_month=1, era=2, first_day_of_month=1, last_day_of_month=3, total_days_in_month=31, day_of_week_in_month=1, day_of_week=1, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2077 : ReferenceDate(englishDate = CustomCalendar(year=2020, month=4, day_of_month=13, era=1, first_day_of_month=4, last_day_of_month=5, total_days_in_month=30, day_of_week_in_month=2, day_of_week=2, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2077, month=1, day_of_month=1, era=2, first_day_of_month=2, last_day_of_month=4, total_days_in_month=31, day_of_week_in_month=1, day_of_week=2, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2078 : ReferenceDate(englishDate = CustomCalendar(year=2021, month=4, day_of_month=14, era=1, first_day_of_month=5, last_day_of_month=6, total_days_in_month=30, day_of_week_in_month=2, day_of_week=4, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2078, month=1, day_of_month=1, era=2, first_day_of_month=4, last_day_of_month=6, total_days_in_month=31, day_of_week_in_month=1, day_of_week=4, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2079 : ReferenceDate(englishDate = CustomCalendar(year=2022, month=4, day_of_month=14, era=1, first_day_of_month=6, last_day_of_month=7, total_days_in_month=30, day_of_week_in_month=2, day_of_week=5, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2079, month=1, day_of_month=1, era=2, first_day_of_month=5, last_day_of_month=7, total_days_in_month=31, day_of_week_in_month=1, day_of_week=5, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2080 : ReferenceDate(englishDate = CustomCalendar(year=2023, month=4, day_of_month=14, era=1, first_day_of_month=7, last_day_of_month=1, total_days_in_month=30, day_of_week_in_month=2, day_of_week=6, day_of_year=104, week_of_month=3, week_of_year=15), nepaliDate = CustomCalendar(year=2080, month=1, day_of_month=1, era=2, first_day_of_month=6, last_day_of_month=1, total_days_in_month=31, day_of_week_in_month=1, day_of_week=6, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2081 : ReferenceDate(englishDate = CustomCalendar(year=2024, month=4, day_of_month=13, era=1, first_day_of_month=2, last_day_of_month=3, total_days_in_month=30, day_of_week_in_month=2, day_of_week=7, day_of_year=104, week_of_month=2, week_of_year=15), nepaliDate = CustomCalendar(year=2081, month=1, day_of_month=1, era=2, first_day_of_month=7, last_day_of_month=2, total_days_in_month=31, day_of_week_in_month=1, day_of_week=7, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2082 : ReferenceDate(englishDate = CustomCalendar(year=2025, month=4, day_of_month=14, era=1, first_day_of_month=3, last_day_of_month=4, total_days_in_month=30, day_of_week_in_month=2, day_of_week=2, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2082, month=1, day_of_month=1, era=2, first_day_of_month=2, last_day_of_month=4, total_days_in_month=31, day_of_week_in_month=1, day_of_week=2, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2083 : ReferenceDate(englishDate = CustomCalendar(year=2026, month=4, day_of_month=14, era=1, first_day_of_month=4, last_day_of_month=5, total_days_in_month=30, day_of_week_in_month=2, day_of_week=3, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2083, month=1, day_of_month=1, era=2, first_day_of_month=3, last_day_of_month=5, total_days_in_month=31, day_of_week_in_month=1, day_of_week=3, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2084 : ReferenceDate(englishDate = CustomCalendar(year=2027, month=4, day_of_month=14, era=1, first_day_of_month=5, last_day_of_month=6, total_days_in_month=30, day_of_week_in_month=2, day_of_week=4, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2084, month=1, day_of_month=1, era=2, first_day_of_month=4, last_day_of_month=6, total_days_in_month=31, day_of_week_in_month=1, day_of_week=4, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2085 : ReferenceDate(englishDate = CustomCalendar(year=2028, month=4, day_of_month=14, era=1, first_day_of_month=7, last_day_of_month=1, total_days_in_month=30, day_of_week_in_month=2, day_of_week=6, day_of_year=105, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2085, month=1, day_of_month=1, era=2, first_day_of_month=6, last_day_of_month=7, total_days_in_month=30, day_of_week_in_month=1, day_of_week=6, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2086 : ReferenceDate(englishDate = CustomCalendar(year=2029, month=4, day_of_month=14, era=1, first_day_of_month=1, last_day_of_month=2, total_days_in_month=30, day_of_week_in_month=2, day_of_week=7, day_of_year=104, week_of_month=2, week_of_year=15), nepaliDate = CustomCalendar(year=2086, month=1, day_of_month=1, era=2, first_day_of_month=7, last_day_of_month=2, total_days_in_month=31, day_of_week_in_month=1, day_of_week=7, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2087 : ReferenceDate(englishDate = CustomCalendar(year=2030, month=4, day_of_month=14, era=1, first_day_of_month=2, last_day_of_month=3, total_days_in_month=30, day_of_week_in_month=2, day_of_week=1, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2087, month=1, day_of_month=1, era=2, first_day_of_month=1, last_day_of_month=3, total_days_in_month=31, day_of_week_in_month=1, day_of_week=1, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2088 : ReferenceDate(englishDate = CustomCalendar(year=2031, month=4, day_of_month=14, era=1, first_day_of_month=3, last_day_of_month=4, total_days_in_month=30, day_of_week_in_month=2, day_of_week=2, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2088, month=1, day_of_month=1, era=2, first_day_of_month=2, last_day_of_month=4, total_days_in_month=31, day_of_week_in_month=1, day_of_week=2, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2089 : ReferenceDate(englishDate = CustomCalendar(year=2032, month=4, day_of_month=14, era=1, first_day_of_month=5, last_day_of_month=6, total_days_in_month=30, day_of_week_in_month=2, day_of_week=4, day_of_year=105, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2089, month=1, day_of_month=1, era=2, first_day_of_month=4, last_day_of_month=5, total_days_in_month=30, day_of_week_in_month=1, day_of_week=4, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2090 : ReferenceDate(englishDate = CustomCalendar(year=2033, month=4, day_of_month=14, era=1, first_day_of_month=6, last_day_of_month=7, total_days_in_month=30, day_of_week_in_month=2, day_of_week=5, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2090, month=1, day_of_month=1, era=2, first_day_of_month=5, last_day_of_month=7, total_days_in_month=31, day_of_week_in_month=1, day_of_week=5, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2091 : ReferenceDate(englishDate = CustomCalendar(year=2034, month=4, day_of_month=14, era=1, first_day_of_month=7, last_day_of_month=1, total_days_in_month=30, day_of_week_in_month=2, day_of_week=6, day_of_year=104, week_of_month=3, week_of_year=15), nepaliDate = CustomCalendar(year=2091, month=1, day_of_month=1, era=2, first_day_of_month=6, last_day_of_month=1, total_days_in_month=31, day_of_week_in_month=1, day_of_week=6, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2092 : ReferenceDate(englishDate = CustomCalendar(year=2035, month=4, day_of_month=14, era=1, first_day_of_month=1, last_day_of_month=2, total_days_in_month=30, day_of_week_in_month=2, day_of_week=7, day_of_year=104, week_of_month=2, week_of_year=15), nepaliDate = CustomCalendar(year=2092, month=1, day_of_month=1, era=2, first_day_of_month=7, last_day_of_month=2, total_days_in_month=31, day_of_week_in_month=1, day_of_week=7, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2093 : ReferenceDate(englishDate = CustomCalendar(year=2036, month=4, day_of_month=14, era=1, first_day_of_month=3, last_day_of_month=4, total_days_in_month=30, day_of_week_in_month=2, day_of_week=2, day_of_year=105, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2093, month=1, day_of_month=1, era=2, first_day_of_month=2, last_day_of_month=4, total_days_in_month=31, day_of_week_in_month=1, day_of_week=2, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2094 : ReferenceDate(englishDate = CustomCalendar(year=2037, month=4, day_of_month=14, era=1, first_day_of_month=4, last_day_of_month=5, total_days_in_month=30, day_of_week_in_month=2, day_of_week=3, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2094, month=1, day_of_month=1, era=2, first_day_of_month=3, last_day_of_month=5, total_days_in_month=31, day_of_week_in_month=1, day_of_week=3, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2095 : ReferenceDate(englishDate = CustomCalendar(year=2038, month=4, day_of_month=14, era=1, first_day_of_month=5, last_day_of_month=6, total_days_in_month=30, day_of_week_in_month=2, day_of_week=4, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2095, month=1, day_of_month=1, era=2, first_day_of_month=4, last_day_of_month=6, total_days_in_month=31, day_of_week_in_month=1, day_of_week=4, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2096 : ReferenceDate(englishDate = CustomCalendar(year=2039, month=4, day_of_month=14, era=1, first_day_of_month=6, last_day_of_month=7, total_days_in_month=30, day_of_week_in_month=2, day_of_week=5, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2096, month=1, day_of_month=1, era=2, first_day_of_month=5, last_day_of_month=7, total_days_in_month=31, day_of_week_in_month=1, day_of_week=5, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2097 : ReferenceDate(englishDate = CustomCalendar(year=2040, month=4, day_of_month=14, era=1, first_day_of_month=1, last_day_of_month=2, total_days_in_month=30, day_of_week_in_month=2, day_of_week=7, day_of_year=105, week_of_month=2, week_of_year=15), nepaliDate = CustomCalendar(year=2097, month=1, day_of_month=1, era=2, first_day_of_month=7, last_day_of_month=2, total_days_in_month=31, day_of_week_in_month=1, day_of_week=7, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2098 : ReferenceDate(englishDate = CustomCalendar(year=2041, month=4, day_of_month=14, era=1, first_day_of_month=2, last_day_of_month=3, total_days_in_month=30, day_of_week_in_month=2, day_of_week=1, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2098, month=1, day_of_month=1, era=2, first_day_of_month=1, last_day_of_month=3, total_days_in_month=31, day_of_week_in_month=1, day_of_week=1, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2099 : ReferenceDate(englishDate = CustomCalendar(year=2042, month=4, day_of_month=14, era=1, first_day_of_month=3, last_day_of_month=4, total_days_in_month=30, day_of_week_in_month=2, day_of_week=2, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2099, month=1, day_of_month=1, era=2, first_day_of_month=2, last_day_of_month=4, total_days_in_month=31, day_of_week_in_month=1, day_of_week=2, day_of_year=1, week_of_month=1, week_of_year=1)),
-    2100 : ReferenceDate(englishDate = CustomCalendar(year=2043, month=4, day_of_month=14, era=1, first_day_of_month=4, last_day_of_month=5, total_days_in_month=30, day_of_week_in_month=2, day_of_week=3, day_of_year=104, week_of_month=3, week_of_year=16), nepaliDate = CustomCalendar(year=2100, month=1, day_of_month=1, era=2, first_day_of_month=3, last_day_of_month=5, total_days_in_month=31, day_of_week_in_month=1, day_of_week=3, day_of_year=1, week_of_month=1, week_of_year=1))
-}
\ No newline at end of file
+# English day of April on which Baisakh 1 falls, for every Nepali year from 1970 to 2100 (English year = Nepali year - 57).
+# These are the anchors the month lengths above are checked against.
+new_year_days_in_april = bytes((
+    13, 13, 13, 13, 13, 13, 13, 13, 13, 13,  # 1970-1979
+    13, 13, 13, 13, 13, 13, 13, 13, 13, 13,  # 1980-1989
+    13, 13, 13, 13, 13, 13, 13, 13, 13, 13,  # 1990-1999
+    14, 13, 13, 13, 14, 13, 13, 13, 14, 13,  # 2000-2009
+    13, 13, 14, 13, 13, 13, 14, 13, 13, 13,  # 2010-2019
+    14, 13, 13, 13, 14, 13, 13, 14, 14, 13,  # 2020-2029
+    13, 14, 14, 13, 13, 14, 14, 13, 13, 14,  # 2030-2039
+    14, 13, 13, 14, 14, 13, 13, 14, 14, 13,  # 2040-2049
+    13, 14, 14, 13, 13, 14, 14, 13, 14, 14,  # 2050-2059
+    14, 13, 14, 14, 14, 13, 14, 14, 14, 13,  # 2060-2069
+    14, 14, 14, 13, 14, 14, 14, 13, 14, 14,  # 2070-2079
+    14, 13, 14, 14, 14, 14, 14, 14, 14, 14,  # 2080-2089
+    14, 14, 14, 14, 14, 14, 14, 14, 14, 14,  # 2090-2099
+    14,  # 2100
+))
+
+
+def unpack_days_in_month_map(packed: bytes = packed_days_in_month, start_year: int = packed_days_in_month_start_year) -> dict:
+    """
+    Expands packed month lengths into the `{year: [0, days_in_month_1, ..., days_in_month_12]}` layout.
+    """
+    return {
+        start_year + offset // 12: [0, *packed[offset:offset + 12]]
+        for offset in range(0, len(packed), 12)
+    }
+
+
+def pack_days_in_month_map(days_in_month_map: dict) -> bytes:
+    """
+    Packs a `{year: [0, days_in_month_1, ..., days_in_month_12]}` map into one byte per month, ordered by year.
+    """
+    return bytes(days for year in sorted(days_in_month_map) for days in days_in_month_map[year][1:13])
+
+
+def build_reference_date_map(first_nepali_year: int, is_nepali_year_key: bool) -> dict:
+    from nepali_calendar_utils.calendar_model.date_converters import DateConverters
+
+    reference_date_map = {}
+    for offset, english_day in enumerate(new_year_days_in_april[first_nepali_year - 1970:]):
+        nepali_year = first_nepali_year + offset
+        english_year = nepali_year - 57
+
+        reference_date_map[nepali_year if is_nepali_year_key else english_year] = ReferenceDate(
+            englishDate=DateConverters.convert_to_english_calendar(nepali_year, 1, 1),
+            nepaliDate=DateConverters.convert_to_nepali_calendar(english_year, 4, english_day),
+        )
+
+    return reference_date_map
+
+
+def __getattr__(name: str):
+    # Dict-based views of the packed tables, built on first access only. The package itself does not use them.
+    if name == "days_in_month_map":
+        value = unpack_days_in_month_map()
+    elif name == "english_date_map":
+        value = build_reference_date_map(1971, is_nepali_year_key=False)
+    elif name == "nepali_date_map":
+        value = build_reference_date_map(1971, is_nepali_year_key=True)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
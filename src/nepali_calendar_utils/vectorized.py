@@ -0,0 +1,171 @@
+"""
+NumPy-vectorized Nepali (BS) <-> English (AD) date conversion.
+
+This module is optional and is only usable when NumPy is installed (`pip install nepali_calendar_utils[numpy]`).
+The rest of the package does not depend on it.
+
+Both kernels work on whole arrays at once using the cumulative month-ordinal table of `NepaliOrdinalIndex`,
+so they return exactly the same dates as `DateConverters` without a Python-level loop per date.
+
+Example:
+    >>> import numpy as np
+    >>> from nepali_calendar_utils.vectorized import ad_to_bs, bs_to_ad
+    >>> bs = ad_to_bs(np.array(["2022-04-14", "2025-04-14"], dtype="datetime64[D]"))
+    >>> bs.year, bs.month, bs.day
+    (array([2079, 2082], dtype=int32), array([1, 1], dtype=int32), array([1, 1], dtype=int32))
+    >>> ad = bs_to_ad(bs.year, bs.month, bs.day)
+    >>> ad.year, ad.month, ad.day
+    (array([2022, 2025], dtype=int32), array([4, 4], dtype=int32), array([14, 14], dtype=int32))
+"""
+
+from dataclasses import dataclass
+from datetime import date
+
+try:
+    import numpy as np
+except ImportError as error:  # pragma: no cover - exercised only without NumPy
+    raise ImportError(
+        "nepali_calendar_utils.vectorized requires NumPy. Install it with `pip install numpy`."
+    ) from error
+
+from nepali_calendar_utils.calendar_model.date_converters import DateConverters
+from nepali_calendar_utils.calendar_model.nepali_ordinal_index import NepaliOrdinalIndex
+
+__all__ = ["DateColumns", "ad_to_bs", "bs_to_ad", "bs_to_datetime64"]
+
+# `date.toordinal()` of 1970-01-01, the zero of `datetime64[D]`
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+MONTH_START_ORDINALS = np.asarray(NepaliOrdinalIndex.month_start_ordinals, dtype=np.int64)
+# Days in each Nepali month, by month index; the start ordinals end with the day after the last month
+MONTH_LENGTHS = np.diff(MONTH_START_ORDINALS)
+
+MIN_ENGLISH_ORDINAL = max(NepaliOrdinalIndex.starting_ordinal, date(DateConverters.min_english_year, 1, 1).toordinal())
+MAX_ENGLISH_ORDINAL = min(NepaliOrdinalIndex.ending_ordinal, date(DateConverters.max_english_year, 12, 31).toordinal())
+
+
+@dataclass(frozen=True)
+class DateColumns:
+    """
+    Column-oriented result of a vectorized conversion. Every attribute is an `int32` array of the input's shape.
+
+    Attributes:
+        year (np.ndarray): The year.
+        month (np.ndarray): The month (1-12).
+        day (np.ndarray): The day of the month.
+        weekday (np.ndarray): The day of the week (1-7, where 1 is Sunday).
+        day_of_year (np.ndarray): The day of the year (1-366).
+    """
+
+    year: "np.ndarray"
+    month: "np.ndarray"
+    day: "np.ndarray"
+    weekday: "np.ndarray"
+    day_of_year: "np.ndarray"
+
+
+def ad_to_bs(english_dates) -> DateColumns:
+    """
+    Converts an array of English dates to Nepali date columns.
+
+    Args:
+        english_dates (array_like): `datetime64` values, or integers counting days since 1970-01-01
+            (the integer representation of `datetime64[D]`).
+
+    Returns:
+        DateColumns: Nepali year, month, day, weekday and day of year for every input date.
+
+    Raises:
+        ValueError: If any of the dates is out of the supported conversion range.
+    """
+    english_dates = np.asarray(english_dates)
+    if np.issubdtype(english_dates.dtype, np.datetime64):
+        english_dates = english_dates.astype("datetime64[D]").astype(np.int64)
+    elif np.issubdtype(english_dates.dtype, np.integer):
+        english_dates = english_dates.astype(np.int64)
+    else:
+        raise TypeError(f"Expected datetime64 or integer array, got {english_dates.dtype}.")
+
+    ordinals = english_dates + EPOCH_ORDINAL
+
+    if ordinals.size and (ordinals.min() < MIN_ENGLISH_ORDINAL or ordinals.max() > MAX_ENGLISH_ORDINAL):
+        raise ValueError("Out of Range: English dates are out of range to convert.")
+
+    month_index = np.searchsorted(MONTH_START_ORDINALS, ordinals, side="right") - 1
+    year_offset, month_offset = np.divmod(month_index, 12)
+
+    return DateColumns(
+        year=(year_offset + NepaliOrdinalIndex.years.start).astype(np.int32),
+        month=(month_offset + 1).astype(np.int32),
+        day=(ordinals - MONTH_START_ORDINALS[month_index] + 1).astype(np.int32),
+        weekday=(ordinals % 7 + 1).astype(np.int32),
+        day_of_year=(ordinals - MONTH_START_ORDINALS[month_index - month_offset] + 1).astype(np.int32),
+    )
+
+
+def bs_to_datetime64(years, months, days) -> "np.ndarray":
+    """
+    Converts Nepali year, month and day arrays to a `datetime64[D]` array of English dates.
+
+    The three inputs are broadcast against each other.
+
+    Raises:
+        ValueError: If any of the dates is out of the supported conversion range, or a day is past the end of
+            its month.
+    """
+    return (_nepali_to_ordinals(years, months, days) - EPOCH_ORDINAL).astype("datetime64[D]")
+
+
+def bs_to_ad(years, months, days) -> DateColumns:
+    """
+    Converts Nepali year, month and day arrays to English date columns.
+
+    The three inputs are broadcast against each other.
+
+    Args:
+        years (array_like): Nepali years.
+        months (array_like): Nepali months (1-12).
+        days (array_like): Nepali days of the month, from 1 to the length of the month.
+
+    Returns:
+        DateColumns: English year, month, day, weekday and day of year for every input date.
+
+    Raises:
+        ValueError: If any of the dates is out of the supported conversion range, or a day is past the end of
+            its month.
+    """
+    ordinals = _nepali_to_ordinals(years, months, days)
+    english_dates = (ordinals - EPOCH_ORDINAL).astype("datetime64[D]")
+
+    year_starts = english_dates.astype("datetime64[Y]")
+    month_starts = english_dates.astype("datetime64[M]")
+
+    return DateColumns(
+        year=(year_starts.astype(np.int64) + 1970).astype(np.int32),
+        month=((month_starts - year_starts.astype("datetime64[M]")).astype(np.int64) + 1).astype(np.int32),
+        day=((english_dates - month_starts.astype("datetime64[D]")).astype(np.int64) + 1).astype(np.int32),
+        weekday=(ordinals % 7 + 1).astype(np.int32),
+        day_of_year=((english_dates - year_starts.astype("datetime64[D]")).astype(np.int64) + 1).astype(np.int32),
+    )
+
+
+def _nepali_to_ordinals(years, months, days) -> "np.ndarray":
+    years, months, days = (np.asarray(values, dtype=np.int64) for values in np.broadcast_arrays(years, months, days))
+
+    is_in_range = (
+        (years >= DateConverters.min_nepali_year) & (years <= DateConverters.max_nepali_year)
+        & (months >= 1) & (months <= 12)
+        & (days >= 1) & (days <= 32)
+    )
+    if not is_in_range.all():
+        raise ValueError("Out of Range: Nepali dates are out of range to convert.")
+
+    month_index = (years - NepaliOrdinalIndex.years.start) * 12 + months - 1
+    if (days > MONTH_LENGTHS[month_index]).any():
+        raise ValueError("Out of Range: Nepali days are out of range for their month.")
+
+    ordinals = MONTH_START_ORDINALS[month_index] + days - 1
+    if ordinals.size and ordinals.max() > NepaliOrdinalIndex.ending_ordinal:
+        raise ValueError("Out of Range: Nepali dates are out of range to convert.")
+
+    return ordinals
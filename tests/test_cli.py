@@ -0,0 +1,108 @@
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+import nepali_calendar_utils
+from nepali_calendar_utils.cli import main
+
+
+def run_main(argv, stdin_text=""):
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    status = main(argv, stdin=io.StringIO(stdin_text), stdout=stdout, stderr=stderr)
+    return status, stdout.getvalue(), stderr.getvalue()
+
+
+class TestCommandLine(unittest.TestCase):
+    def test_convert_csv_ad_to_bs_in_chunks(self):
+        csv_input = 'id,dob,note\n1,2024-04-13,new year\n2,2024-02-29T10:00:00Z,"leap, day"\n3,bad,x\n4,1800-01-01,old\n'
+
+        status, output, report = run_main(
+            ["convert", "-c", "dob", "--to", "bs", "--suffix", "_bs", "--output-pattern", "EEEE, MMMM d, yyyy",
+             "--chunk-size", "3"],
+            csv_input
+        )
+
+        self.assertEqual(0, status)
+        self.assertEqual(
+            "id,dob,note,dob_bs\n"
+            '1,2024-04-13,new year,"Saturday, Baisakh 1, 2081"\n'
+            '2,2024-02-29T10:00:00Z,"leap, day","Thursday, Falgun 17, 2080"\n'
+            "3,bad,x,bad\n"
+            "4,1800-01-01,old,1800-01-01\n",
+            output
+        )
+        self.assertIn("4 rows in", report)
+        self.assertIn("rows/s), 2 invalid dates", report)
+
+    def test_convert_json_lines_bs_to_ad_from_files(self):
+        with tempfile.TemporaryDirectory() as directory:
+            input_path = os.path.join(directory, "rows.jsonl")
+            output_path = os.path.join(directory, "out.jsonl")
+            with open(input_path, "w", encoding="utf-8") as input_file:
+                input_file.write('{"miti": "२०८१/०१/०१", "n": 1}\n\n{"miti": "2081/02/32"}\n{"miti": null}\n')
+
+            status, _, _ = run_main(
+                ["convert", "-c", "miti", "--to", "ad", "--input-pattern", "yyyy/MM/dd", "--on-error", "empty",
+                 "-q", "-o", output_path, input_path]
+            )
+
+            with open(output_path, encoding="utf-8") as output_file:
+                rows = [json.loads(line) for line in output_file]
+
+        self.assertEqual(0, status)
+        self.assertEqual([{"miti": "2024-04-13", "n": 1}, {"miti": "2024-06-14"}, {"miti": ""}], rows)
+
+    def test_json_lines_rows_without_the_column_are_unchanged(self):
+        jsonl_input = '{"dob": "2024-04-13"}\n{"name": "no date"}\n{"dob": null}\n'
+
+        status, output, report = run_main(["convert", "-c", "dob", "--to", "bs", "--suffix", "_bs", "-f", "jsonl"], jsonl_input)
+
+        self.assertEqual(0, status)
+        self.assertEqual(
+            [{"dob": "2024-04-13", "dob_bs": "2081-01-01"}, {"name": "no date"}, {"dob": None, "dob_bs": None}],
+            [json.loads(line) for line in output.splitlines()]
+        )
+        self.assertIn("3 rows in", report)
+        self.assertIn("rows/s), 1 invalid dates", report)
+
+    def test_only_yyyy_mm_dd_english_dates_are_accepted(self):
+        csv_input = "dob\n2024-04-13\n2024-04-13 10:00\n20240413\n2024-W15-6\n2024-04-1\n2024-04-13x\n२०२४-०४-१३\n"
+
+        status, output, _ = run_main(["convert", "-c", "dob", "--to", "bs", "--on-error", "empty", "-q"], csv_input)
+
+        self.assertEqual(0, status)
+        self.assertEqual('dob\n2081-01-01\n2081-01-01\n""\n""\n""\n""\n""\n', output)
+
+    def test_convert_errors(self):
+        status, _, report = run_main(["convert", "-c", "dob", "--to", "ad", "--on-error", "fail", "-q"], "dob\n2081-13-01\n")
+        self.assertEqual(1, status)
+        self.assertIn("Invalid date '2081-13-01'", report)
+
+        status, _, report = run_main(["convert", "-c", "missing", "--to", "bs", "-q"], "dob\n2024-04-13\n")
+        self.assertEqual(1, status)
+        self.assertIn("missing not found", report)
+
+        status, _, report = run_main(["convert", "-c", "dob", "--to", "ad", "--input-pattern", "HH:mm", "-q"], "dob\n")
+        self.assertEqual(1, status)
+        self.assertIn("Time fields are not supported", report)
+
+    def test_run_as_module(self):
+        package_parent = os.path.dirname(os.path.dirname(os.path.abspath(nepali_calendar_utils.__file__)))
+        result = subprocess.run(
+            [sys.executable, "-m", "nepali_calendar_utils", "convert", "-c", "date", "--to", "bs", "-q"],
+            input="date\n2024-04-13\n",
+            capture_output=True,
+            text=True,
+            env=dict(os.environ, PYTHONPATH=package_parent),
+            check=True,
+        )
+
+        self.assertEqual("date\n2081-01-01\n", result.stdout)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from nepali_calendar_utils.calendar_model.conversion_cache import ConversionCache, ConversionCacheInfo
+from nepali_calendar_utils.calendar_model.date_converters import DateConverters
+from nepali_calendar_utils.calendar_model.nepali_date_converter import NepaliDateConverter
+
+
+class TestConversionCache(unittest.TestCase):
+    def tearDown(self):
+        NepaliDateConverter.disable_cache()
+
+    def test_cache_is_opt_in_and_returns_the_same_conversions(self):
+        self.assertEqual(ConversionCacheInfo(0, 0, 0, 0, 0), NepaliDateConverter.cache_info())
+        NepaliDateConverter.convert_english_to_nepali(2024, 4, 13)
+        self.assertEqual(0, NepaliDateConverter.cache_info().misses)
+
+        NepaliDateConverter.enable_cache(maxsize=8)
+        for _ in range(3):
+            self.assertEqual(
+                DateConverters.convert_to_nepali_calendar(2024, 4, 13),
+                NepaliDateConverter.convert_english_to_nepali(2024, 4, 13)
+            )
+            self.assertEqual(
+                DateConverters.convert_to_english_calendar(2081, 1, 1),
+                NepaliDateConverter.convert_nepali_to_english(2081, 1, 1)
+            )
+            self.assertEqual(
+                DateConverters.convert_to_nepali_calendar(2024, 4, 13),
+                NepaliDateConverter.get_nepali_calendar(2081, 1, 1)
+            )
+
+        self.assertEqual(ConversionCacheInfo(hits=6, misses=3, evictions=0, maxsize=8, currsize=3), NepaliDateConverter.cache_info())
+        self.assertEqual(6 / 9, NepaliDateConverter.cache_info().hit_rate)
+
+        NepaliDateConverter.cache_clear()
+        self.assertEqual(ConversionCacheInfo(0, 0, 0, 8, 0), NepaliDateConverter.cache_info())
+
+    def test_least_recently_used_entries_are_evicted(self):
+        NepaliDateConverter.enable_cache(maxsize=2)
+
+        NepaliDateConverter.convert_english_to_nepali(2024, 4, 13)
+        NepaliDateConverter.convert_english_to_nepali(2024, 4, 14)
+        NepaliDateConverter.convert_english_to_nepali(2024, 4, 13)  # 2024-04-14 is now the least recently used
+        NepaliDateConverter.convert_english_to_nepali(2024, 4, 15)
+        NepaliDateConverter.convert_english_to_nepali(2024, 4, 13)
+
+        self.assertEqual(ConversionCacheInfo(hits=2, misses=3, evictions=1, maxsize=2, currsize=2), NepaliDateConverter.cache_info())
+
+        with self.assertRaises(ValueError):
+            NepaliDateConverter.convert_nepali_to_english(2081, 13, 1)
+        self.assertEqual(2, NepaliDateConverter.cache_info().currsize)
+
+        with self.assertRaises(ValueError):
+            NepaliDateConverter.enable_cache(maxsize=0)
+
+    def test_cache_is_thread_safe(self):
+        cache = ConversionCache(maxsize=50)
+        english_dates = [(2024, 1 + index % 12, 1 + index % 28) for index in range(120)]
+
+        def convert_all(_):
+            return [cache.get_or_convert(DateConverters.convert_to_nepali_calendar, *english_date) for english_date in english_dates]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(convert_all, range(40)))
+
+        expected = [DateConverters.convert_to_nepali_calendar(*english_date) for english_date in english_dates]
+        self.assertTrue(all(result == expected for result in results))
+
+        info = cache.cache_info()
+        self.assertEqual(40 * len(english_dates), info.hits + info.misses)
+        # Threads missing the same date at once store it once, so misses can exceed the entries stored
+        self.assertLessEqual(info.currsize, info.misses - info.evictions)
+        self.assertEqual(50, info.currsize)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import os
+import subprocess
+import sys
+import unittest
+import nepali_calendar_utils
+
+# Import budgets as multiples of the time `import json` takes in the same run, so that they scale with the speed of
+# the machine instead of failing on slow or busy CI runners. On a development machine the bare import costs about
+# 0.08 and the converter about 6 json imports, so a change that roughly doubles either still fails. Known heavy
+# modules are checked exactly through `sys.modules` below.
+REFERENCE_MODULE = "json"
+BARE_IMPORT_BUDGET_RATIO = 0.5
+CONVERTER_IMPORT_BUDGET_RATIO = 10
+
+
+def run_python(code: str, *options: str) -> subprocess.CompletedProcess:
+    package_parent = os.path.dirname(os.path.dirname(os.path.abspath(nepali_calendar_utils.__file__)))
+    environment = dict(os.environ, PYTHONPATH=os.pathsep.join([package_parent, os.environ.get("PYTHONPATH", "")]))
+
+    return subprocess.run(
+        [sys.executable, *options, "-c", code], capture_output=True, text=True, env=environment, check=True
+    )
+
+
+def measure_import_time(statement: str) -> float:
+    """
+    Returns the wall time in seconds of the import `statement` in a fresh interpreter. Unlike `python -X importtime`,
+    which reports modules loaded through the package's lazy `__getattr__` as unrelated top-level imports, this
+    includes every module the statement loads.
+    """
+    code = f"import time; started = time.perf_counter(); {statement}; print(time.perf_counter() - started)"
+    return float(run_python(code).stdout)
+
+
+class TestImportTime(unittest.TestCase):
+    def test_bare_package_import_loads_no_submodules(self):
+        result = run_python(
+            "import sys, nepali_calendar_utils; "
+            "print(sorted(name for name in sys.modules if name.startswith('nepali_calendar_utils.')))"
+        )
+
+        self.assertEqual("[]", result.stdout.strip())
+
+    def test_conversion_does_not_load_zone_data_or_process_pool(self):
+        result = run_python(
+            "import sys; from nepali_calendar_utils import NepaliDateConverter; "
+            "NepaliDateConverter.convert_english_to_nepali(2024, 4, 13); "
+            "NepaliDateConverter.convert_nepali_to_english(2081, 1, 1); "
+            "print('zoneinfo' in sys.modules, 'concurrent.futures.process' in sys.modules)"
+        )
+
+        self.assertEqual("False False", result.stdout.strip())
+
+    def test_public_names_resolve_lazily(self):
+        for name in nepali_calendar_utils.__all__:
+            with self.subTest(name=name):
+                self.assertEqual(name, getattr(nepali_calendar_utils, name).__name__)
+
+        with self.assertRaises(AttributeError):
+            nepali_calendar_utils.does_not_exist
+
+    def test_import_time_is_within_budget(self):
+        reference_import_time = min(measure_import_time(f"import {REFERENCE_MODULE}") for _ in range(3))
+        bare_import_time = min(measure_import_time("import nepali_calendar_utils") for _ in range(3))
+        converter_import_time = min(
+            measure_import_time("from nepali_calendar_utils import NepaliDateConverter") for _ in range(3)
+        )
+
+        self.assertLess(bare_import_time, BARE_IMPORT_BUDGET_RATIO * reference_import_time)
+        self.assertLess(converter_import_time, CONVERTER_IMPORT_BUDGET_RATIO * reference_import_time)
+
+
+if __name__ == "__main__":
+    unittest.main()
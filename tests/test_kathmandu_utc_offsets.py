@@ -0,0 +1,52 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+from nepali_calendar_utils.calendar_model.kathmandu_utc_offsets import KathmanduUtcOffsets
+from nepali_calendar_utils.calendar_model.nepali_date_converter import NepaliDateConverter
+from nepali_calendar_utils.data.custom_calendar import SimpleDate, SimpleTime
+
+
+class TestKathmanduUtcOffsets(unittest.TestCase):
+    kathmandu_tz = ZoneInfo("Asia/Kathmandu")
+
+    def test_local_to_utc_matches_zoneinfo_around_every_transition(self):
+        for transition in (datetime(1920, 1, 1), datetime(1986, 1, 1)):
+            for seconds in range(-1800, 1800, 4):
+                local_date_time = transition + timedelta(seconds=seconds)
+                with self.subTest(local_date_time=local_date_time):
+                    self.assertEqual(
+                        local_date_time.replace(tzinfo=self.kathmandu_tz).astimezone(timezone.utc).replace(tzinfo=None),
+                        KathmanduUtcOffsets.local_to_utc(local_date_time)
+                    )
+
+    def test_utc_to_local_matches_zoneinfo_around_every_transition(self):
+        for transition in KathmanduUtcOffsets.utc_transitions:
+            for seconds in range(-1800, 1800, 4):
+                utc_date_time = transition + timedelta(seconds=seconds)
+                with self.subTest(utc_date_time=utc_date_time):
+                    self.assertEqual(
+                        utc_date_time.replace(tzinfo=timezone.utc).astimezone(self.kathmandu_tz).replace(tzinfo=None),
+                        KathmanduUtcOffsets.utc_to_local(utc_date_time)
+                    )
+
+    def test_iso_helpers_use_the_offset_of_the_date(self):
+        self.assertEqual(
+            "1985-06-01T06:30:00Z",
+            NepaliDateConverter.format_english_date_nepali_time_to_iso(SimpleDate(1985, 6, 1), SimpleTime(12, 0, 0, 0))
+        )
+        self.assertEqual(
+            "2024-06-01T06:15:00.000123Z",
+            NepaliDateConverter.format_english_date_nepali_time_to_iso(SimpleDate(2024, 6, 1), SimpleTime(12, 0, 0, 123000))
+        )
+
+        parsed = NepaliDateConverter.get_english_date_nepali_time_from_iso_format("1985-12-31T18:29:59+00:00")
+        self.assertEqual(SimpleDate(1985, 12, 31), parsed.custom_calendar.to_simple_date())
+        self.assertEqual(SimpleTime(23, 59, 59, 0), parsed.simple_time)
+
+        parsed = NepaliDateConverter.get_english_date_nepali_time_from_iso_format("1985-12-31T18:30:00Z")
+        self.assertEqual(SimpleDate(1986, 1, 1), parsed.custom_calendar.to_simple_date())
+        self.assertEqual(SimpleTime(0, 15, 0, 0), parsed.simple_time)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+from nepali_calendar_utils.calendar_model.nepali_clock import NepaliClock
+from nepali_calendar_utils.calendar_model.nepali_date_converter import NepaliDateConverter
+from nepali_calendar_utils.data.custom_calendar import SimpleDate, SimpleTime
+
+# Kathmandu midnight starting 2024-04-13 (Baisakh 1, 2081), which is 18:15 UTC of the previous day
+KATHMANDU_MIDNIGHT = datetime(2024, 4, 12, 18, 15, tzinfo=timezone.utc).timestamp()
+
+
+class FakeTimeSource:
+    def __init__(self, timestamp: float):
+        self.timestamp = timestamp
+        self.calls = 0
+
+    def __call__(self) -> float:
+        self.calls += 1
+        return self.timestamp
+
+
+class TestNepaliClock(unittest.TestCase):
+    def tearDown(self):
+        NepaliClock.default.set_time_source(None)
+
+    def test_today_rolls_over_at_kathmandu_midnight(self):
+        time_source = FakeTimeSource(KATHMANDU_MIDNIGHT - 1)
+        clock = NepaliClock(time_source)
+
+        self.assertEqual(SimpleDate(2080, 12, 30), clock.today_nepali_calendar.to_simple_date())
+        self.assertEqual(SimpleDate(2024, 4, 12), clock.today_english_calendar.to_simple_date())
+
+        time_source.timestamp = KATHMANDU_MIDNIGHT
+
+        self.assertEqual(SimpleDate(2081, 1, 1), clock.today_nepali_calendar.to_simple_date())
+        self.assertEqual(SimpleDate(2024, 4, 13), clock.today_english_calendar.to_simple_date())
+        self.assertEqual(SimpleTime(hour=0, minute=0, second=0, nanosecond=0), clock.current_time)
+
+    def test_today_is_reused_within_the_same_day(self):
+        time_source = FakeTimeSource(KATHMANDU_MIDNIGHT)
+        clock = NepaliClock(time_source)
+        today = clock.today_nepali_calendar
+
+        time_source.timestamp = KATHMANDU_MIDNIGHT + timedelta(hours=23, minutes=59).total_seconds()
+
+        self.assertIs(today, clock.today_nepali_calendar)
+        self.assertEqual(NepaliDateConverter.get_nepali_calendar(2081, 1, 1), today)
+        self.assertEqual(NepaliDateConverter.convert_nepali_to_english(2081, 1, 1), clock.today_english_calendar)
+
+    def test_default_clock_drives_nepali_date_converter(self):
+        NepaliClock.default.set_time_source(FakeTimeSource(KATHMANDU_MIDNIGHT + 3600))
+        converter = NepaliDateConverter()
+
+        self.assertEqual(SimpleDate(2081, 1, 1), converter.today_nepali_simple_date)
+        self.assertEqual(SimpleDate(2024, 4, 13), converter.today_english_simple_date)
+        self.assertEqual(NepaliDateConverter.convert_nepali_to_english(2081, 1, 1), converter.today_english_calendar)
+        self.assertEqual(SimpleTime(hour=1, minute=0, second=0, nanosecond=0), converter.current_time)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+import pickle
+import unittest
+from array import array
+from datetime import date, timedelta
+from nepali_calendar_utils.calendar_model.date_converters import DateConverters
+from nepali_calendar_utils.data.nepali_date import NepaliDate
+from nepali_calendar_utils.data.nepali_date_array import NepaliDateArray
+
+
+class TestNepaliDateArray(unittest.TestCase):
+    def setUp(self):
+        self.english_dates = [date(2022, 1, 1) + timedelta(days=offset * 37 % 1_500) for offset in range(2_000)]
+        self.nepali_dates = NepaliDateArray.from_english_dates(self.english_dates)
+
+    def test_conversions_match_date_converters(self):
+        nepali_calendars = DateConverters.convert_many_to_nepali_calendar(
+            (english_date.year, english_date.month, english_date.day) for english_date in self.english_dates
+        )
+        columns = self.nepali_dates.to_columns()
+
+        self.assertEqual(
+            [
+                (nepali_calendar.year, nepali_calendar.month, nepali_calendar.day_of_month, nepali_calendar.day_of_week)
+                for nepali_calendar in nepali_calendars
+            ],
+            list(zip(columns["year"], columns["month"], columns["day_of_month"], columns["day_of_week"]))
+        )
+        self.assertEqual(columns["year"], self.nepali_dates.years)
+        self.assertEqual(columns["month"], self.nepali_dates.months)
+        self.assertEqual(columns["day_of_month"], self.nepali_dates.days_of_month)
+        self.assertEqual(columns["day_of_week"], self.nepali_dates.days_of_week)
+        self.assertEqual({name: column.tolist() for name, column in columns.items()}, self.nepali_dates.to_dict())
+
+        self.assertEqual(self.english_dates, self.nepali_dates.to_english_dates())
+        self.assertEqual(self.nepali_dates, NepaliDateArray.from_columns(columns["year"], columns["month"], columns["day_of_month"]))
+        self.assertEqual(self.nepali_dates, NepaliDateArray(zip(columns["year"], columns["month"], columns["day_of_month"])))
+        self.assertEqual(self.nepali_dates, NepaliDateArray(self.nepali_dates))
+        self.assertEqual(list(map(NepaliDate.from_english_date, self.english_dates)), list(self.nepali_dates))
+
+    def test_slicing_sorting_and_filtering(self):
+        nepali_dates = self.nepali_dates
+
+        self.assertEqual(NepaliDate.from_english_date(self.english_dates[-1]), nepali_dates[-1])
+        self.assertEqual(NepaliDateArray.from_english_dates(self.english_dates[10:100:3]), nepali_dates[10:100:3])
+        self.assertIn(nepali_dates[5], nepali_dates)
+
+        self.assertEqual(NepaliDateArray(sorted(nepali_dates)), nepali_dates.sorted())
+        self.assertEqual(NepaliDateArray(sorted(nepali_dates, reverse=True)), nepali_dates.sorted(reverse=True))
+        self.assertEqual(nepali_dates.sorted(), NepaliDateArray(nepali_dates[index] for index in nepali_dates.argsort()))
+
+        for year, month in ((2080, None), (2080, 12), (None, 12), (2200, 1), (None, None)):
+            with self.subTest(year=year, month=month):
+                self.assertEqual(
+                    NepaliDateArray(
+                        nepali_date for nepali_date in nepali_dates
+                        if year in (None, nepali_date.year) and month in (None, nepali_date.month)
+                    ),
+                    nepali_dates.filter(year=year, month=month)
+                )
+
+        with self.assertRaises(ValueError):
+            nepali_dates.filter(year=2080, month=13)
+
+    def test_buffer_export_and_pickling(self):
+        ordinals = self.nepali_dates.toordinals()
+
+        self.assertEqual("i", ordinals.format)
+        self.assertTrue(ordinals.readonly)
+        self.assertEqual([english_date.toordinal() for english_date in self.english_dates], ordinals.tolist())
+        self.assertEqual(self.nepali_dates, NepaliDateArray.fromordinals(ordinals))
+        self.assertEqual(self.nepali_dates, pickle.loads(pickle.dumps(self.nepali_dates)))
+
+        self.assertEqual("NepaliDateArray([(2081, 1, 1), (2080, 12, 30)])", repr(NepaliDateArray([(2081, 1, 1), (2080, 12, 30)])))
+        self.assertEqual(array("i"), NepaliDateArray().years)
+
+    def test_out_of_range_dates_and_mismatched_columns_raise(self):
+        for create in (
+            lambda: NepaliDateArray([(2081, 1, 1), (2081, 1, 32)]),
+            lambda: NepaliDateArray([(2200, 1, 1)]),
+            lambda: NepaliDateArray.from_columns([2081], [13], [1]),
+            lambda: NepaliDateArray.from_columns([2081, 2081], [1], [1, 2]),
+            lambda: NepaliDateArray.from_columns(iter([2081]), iter([1]), iter([1, 2])),
+            lambda: NepaliDateArray.fromordinals([1]),
+            lambda: NepaliDateArray.from_english_dates([date(1900, 1, 1)]),
+        ):
+            with self.subTest(create=create):
+                with self.assertRaises(ValueError):
+                    create()
+
+
+if __name__ == "__main__":
+    unittest.main()
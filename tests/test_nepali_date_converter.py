@@ -1,8 +1,19 @@
 import unittest
+import pickle
+from dataclasses import FrozenInstanceError
+from datetime import date, timedelta
 from nepali_calendar_utils.data.custom_calendar import *
+from nepali_calendar_utils.data.nepali_date import NepaliDate
 from nepali_calendar_utils.calendar_model.nepali_calendar_model import NepaliCalendarModel
 from nepali_calendar_utils.calendar_model.nepali_date_converter import NepaliDateConverter
 from nepali_calendar_utils.data.nepali_date_locale import NameFormat, NepaliDateFormatStyle, NepaliDateLocale, NepaliCalendarUtilsLang
+from nepali_calendar_utils.data import nepali_year_month_map
+from nepali_calendar_utils.data.nepali_year_month_map import (
+    new_year_days_in_april, pack_days_in_month_map, packed_days_in_month, unpack_days_in_month_map
+)
+from tests.reference_calendar_tables import days_in_month_map, english_date_map, nepali_date_map
+from nepali_calendar_utils.calendar_model.nepali_calendar_defaults import NepaliCalendarDefaults
+from nepali_calendar_utils.calendar_model.date_converters import DateConverters
 
 class TestNepaliDateConverter(unittest.TestCase):
     def setUp(self):
@@ -142,6 +153,92 @@ class TestNepaliDateConverter(unittest.TestCase):
 
         self.assertEqual(correct_english_custom_calendar, to_test_english_calendar)
 
+    def test_nepali_to_english_date_converter_matches_every_reference_date(self):
+        for nepali_year, reference_date in nepali_date_map.items():
+            with self.subTest(nepali_year=nepali_year):
+                nepali_date = reference_date.nepaliDate
+                to_test_english_calendar = NepaliDateConverter.convert_nepali_to_english(
+                    nepali_yyyy=nepali_date.year, nepali_mm=nepali_date.month, nepali_dd=nepali_date.day_of_month
+                )
+
+                self.assertEqual(reference_date.englishDate, to_test_english_calendar)
+
+    def test_packed_days_in_month_and_new_year_anchors_match_reference_tables(self):
+        self.assertEqual(packed_days_in_month, pack_days_in_month_map(days_in_month_map))
+        self.assertEqual(days_in_month_map, unpack_days_in_month_map())
+        self.assertEqual(days_in_month_map, nepali_year_month_map.days_in_month_map)
+        self.assertEqual(english_date_map, nepali_year_month_map.english_date_map)
+        self.assertEqual(nepali_date_map, nepali_year_month_map.nepali_date_map)
+
+        for nepali_year, reference_date in nepali_date_map.items():
+            with self.subTest(nepali_year=nepali_year):
+                english_date = reference_date.englishDate
+                self.assertEqual(english_date.day_of_month, new_year_days_in_april[nepali_year - 1970])
+                self.assertEqual(
+                    date(english_date.year, english_date.month, english_date.day_of_month),
+                    NepaliDate(nepali_year, 1, 1).to_english_date()
+                )
+
+        for offset, english_day in enumerate(new_year_days_in_april):
+            nepali_year = NepaliCalendarDefaults.NepaliYearRange.start + offset
+            with self.subTest(nepali_year=nepali_year):
+                self.assertEqual(
+                    date(nepali_year - 57, 4, english_day),
+                    NepaliDate(nepali_year, 1, 1).to_english_date()
+                )
+
+    def test_calculate_day_offset_and_day_of_year_match_reference_month_lengths(self):
+        for year, month in ((1970, 1), (2000, 7), (2081, 12), (2100, 12)):
+            with self.subTest(year=year, month=month):
+                self.assertEqual(
+                    sum(sum(days_in_month_map[previous_year][1:]) for previous_year in range(1970, year))
+                    + sum(days_in_month_map[year][1:month]),
+                    DateConverters.calculate_day_offset(1970, year, month)
+                )
+                self.assertEqual(
+                    sum(days_in_month_map[year][1:month]) + 5,
+                    DateConverters.calculate_day_of_year(year, month, 5)
+                )
+
+        with self.assertRaises(ValueError):
+            DateConverters.calculate_day_of_year(2101, 1, 1)
+
+    def test_nepali_to_english_date_converter_many_matches_single_conversion_in_input_order(self):
+        nepali_dates = [(2079, 1, 1), SimpleDate(2100, 11, 12), (1970, 1, 1), SimpleDate(2079, 1, 1)]
+
+        to_test_english_calendars = NepaliDateConverter.convert_nepali_to_english_many(nepali_dates)
+        to_test_english_dates = NepaliDateConverter.convert_nepali_to_english_many(nepali_dates, as_date=True)
+
+        self.assertEqual(
+            [
+                NepaliDateConverter.convert_nepali_to_english(2079, 1, 1),
+                NepaliDateConverter.convert_nepali_to_english(2100, 11, 12),
+                NepaliDateConverter.convert_nepali_to_english(1970, 1, 1),
+                NepaliDateConverter.convert_nepali_to_english(2079, 1, 1),
+            ],
+            to_test_english_calendars
+        )
+        self.assertEqual(
+            [date(2022, 4, 14), date(2044, 2, 24), date(1913, 4, 13), date(2022, 4, 14)],
+            to_test_english_dates
+        )
+
+        self.assertEqual(
+            [NepaliDateConverter.convert_nepali_to_english(2100, 12, 31)],
+            NepaliDateConverter.convert_nepali_to_english_many([(2100, 12, 31)])
+        )
+        self.assertEqual([date(2044, 4, 13)], NepaliDateConverter.convert_nepali_to_english_many([(2100, 12, 31)], as_date=True))
+
+        for convert in (
+            lambda: NepaliDateConverter.convert_nepali_to_english(2100, 12, 32),
+            lambda: NepaliDateConverter.convert_nepali_to_english_many([(2079, 1, 1), (2100, 12, 32)]),
+            lambda: NepaliDateConverter.convert_nepali_to_english_many([(2079, 1, 1), (2100, 12, 32)], as_date=True),
+            lambda: NepaliDateConverter.convert_nepali_to_english_many([(2079, 1, 1), (2101, 1, 1)]),
+        ):
+            with self.subTest(convert=convert):
+                with self.assertRaises(ValueError):
+                    convert()
+
     def test_english_to_nepali_date_converter_english_year_2000_6_24(self):
         to_test_nepali_calendar = NepaliDateConverter.convert_english_to_nepali(
             english_yyyy=2000, english_mm=6, english_dd=24
@@ -364,6 +461,151 @@ class TestNepaliDateConverter(unittest.TestCase):
 
         self.assertEqual(correct_nepali_custom_calendar, to_test_nepali_calendar)
 
+    def test_english_to_nepali_date_converter_matches_every_reference_date(self):
+        for english_year, reference_date in english_date_map.items():
+            with self.subTest(english_year=english_year):
+                english_date = reference_date.englishDate
+                to_test_nepali_calendar = NepaliDateConverter.convert_english_to_nepali(
+                    english_yyyy=english_date.year, english_mm=english_date.month, english_dd=english_date.day_of_month
+                )
+
+                self.assertEqual(reference_date.nepaliDate, to_test_nepali_calendar)
+
+    def test_english_to_nepali_date_converter_starting_and_before_starting_date(self):
+        to_test_nepali_calendar = NepaliDateConverter.convert_english_to_nepali(
+            english_yyyy=1913, english_mm=4, english_dd=13
+        )
+
+        self.assertEqual(NepaliCalendarDefaults.startingNepaliCalendar, to_test_nepali_calendar)
+
+        with self.assertRaises(ValueError):
+            NepaliDateConverter.convert_english_to_nepali(english_yyyy=1913, english_mm=4, english_dd=12)
+
+    def test_english_to_nepali_date_converter_many_matches_single_conversion_in_input_order(self):
+        english_dates = [
+            (2024, 2, 29),
+            date(2000, 6, 24),
+            SimpleDate(1914, 8, 8),
+            (2024, 2, 29),
+            date(2043, 10, 14),
+            SimpleDate(2000, 6, 24),
+        ]
+
+        to_test_nepali_calendars = NepaliDateConverter.convert_english_to_nepali_many(english_dates)
+
+        self.assertEqual(
+            [
+                NepaliDateConverter.convert_english_to_nepali(2024, 2, 29),
+                NepaliDateConverter.convert_english_to_nepali(2000, 6, 24),
+                NepaliDateConverter.convert_english_to_nepali(1914, 8, 8),
+                NepaliDateConverter.convert_english_to_nepali(2024, 2, 29),
+                NepaliDateConverter.convert_english_to_nepali(2043, 10, 14),
+                NepaliDateConverter.convert_english_to_nepali(2000, 6, 24),
+            ],
+            to_test_nepali_calendars
+        )
+        self.assertEqual([], NepaliDateConverter.convert_english_to_nepali_many([]))
+
+        with self.assertRaises(ValueError):
+            NepaliDateConverter.convert_english_to_nepali_many([(2024, 2, 29), (2044, 1, 1)])
+
+    def test_conversions_return_shared_calendar_instances(self):
+        # Other tests may have filled the pools with other days
+        NepaliDateConverter.clear_calendar_pools()
+        nepali_calendar = NepaliDateConverter.convert_english_to_nepali(2024, 4, 13)
+
+        self.assertIs(nepali_calendar, NepaliDateConverter.get_nepali_calendar(2081, 1, 1))
+        self.assertIs(nepali_calendar, NepaliDateConverter.convert_english_to_nepali_many([date(2024, 4, 13)])[0])
+        self.assertIs(nepali_calendar, NepaliDate(2081, 1, 1).to_custom_calendar())
+        self.assertIs(
+            NepaliDateConverter.convert_nepali_to_english(2081, 1, 1),
+            NepaliDateConverter.convert_nepali_to_english_many([(2081, 1, 1)])[0]
+        )
+        self.assertIs(
+            NepaliDateConverter.get_nepali_month_calendar(2081, 1),
+            NepaliDateConverter.intern_calendar(nepali_calendar.to_nepali_month_calendar())
+        )
+
+        copied_calendar = DateConverters.create_nepali_calendar_from_ordinal(date(2024, 4, 13).toordinal())
+        self.assertIsNot(nepali_calendar, copied_calendar)
+        self.assertEqual(nepali_calendar, copied_calendar)
+        self.assertIs(nepali_calendar, NepaliDateConverter.intern_calendar(copied_calendar))
+
+        for not_shared_calendar in (
+            CustomCalendar(year=2081, month=1, day_of_month=1, era=2, first_day_of_month=1, last_day_of_month=1, total_days_in_month=31),
+            CustomCalendar(year=2200, month=1, day_of_month=1, era=2, first_day_of_month=1, last_day_of_month=1, total_days_in_month=31),
+            NepaliMonthCalendar(year=2081, month=1, total_days_in_month=30, first_day_of_month=7, last_day_of_month=1),
+        ):
+            with self.subTest(calendar=not_shared_calendar):
+                self.assertIs(not_shared_calendar, NepaliDateConverter.intern_calendar(not_shared_calendar))
+
+    def test_calendar_pools_are_bounded_until_preloaded_and_can_be_cleared(self):
+        NepaliDateConverter.clear_calendar_pools()
+        self.addCleanup(NepaliDateConverter.clear_calendar_pools)
+        maxsize = DateConverters.default_calendar_pool_maxsize
+
+        nepali_calendars = list(NepaliDateConverter.iter_nepali_dates((2000, 1, 1), (2039, 12, 30)))
+        self.assertGreater(len(nepali_calendars), maxsize)
+        self.assertEqual(maxsize, len(DateConverters.nepali_calendars_by_ordinal))
+
+        shared_calendar, unshared_calendar = nepali_calendars[0], nepali_calendars[-1]
+        self.assertIs(shared_calendar, NepaliDateConverter.get_nepali_calendar(2000, 1, 1))
+        self.assertIsNot(unshared_calendar, NepaliDateConverter.get_nepali_calendar(2039, 12, 30))
+        self.assertEqual(unshared_calendar, NepaliDateConverter.get_nepali_calendar(2039, 12, 30))
+        self.assertIs(unshared_calendar, NepaliDateConverter.intern_calendar(unshared_calendar))
+
+        NepaliDateConverter.preload_calendars()
+        self.assertIs(NepaliDateConverter.get_nepali_calendar(2039, 12, 30), NepaliDateConverter.get_nepali_calendar(2039, 12, 30))
+        self.assertGreater(len(DateConverters.english_calendars_by_ordinal), 40_000)
+
+        NepaliDateConverter.clear_calendar_pools()
+        self.assertEqual({}, DateConverters.nepali_calendars_by_ordinal)
+        self.assertEqual({}, DateConverters.english_calendars_by_ordinal)
+        self.assertEqual(maxsize, DateConverters.calendar_pool_maxsize)
+
+    def test_calendars_are_slotted_frozen_and_derive_week_fields(self):
+        nepali_calendar = NepaliDateConverter.convert_english_to_nepali(2024, 4, 13)
+        explicit_calendar = CustomCalendar(
+            year=2081, month=1, day_of_month=1, era=2, first_day_of_month=7, last_day_of_month=2,
+            total_days_in_month=31, day_of_week_in_month=1, day_of_week=7, day_of_year=1, week_of_month=1,
+            week_of_year=1
+        )
+
+        self.assertEqual(explicit_calendar, nepali_calendar)
+        self.assertEqual(hash(explicit_calendar), hash(nepali_calendar))
+        self.assertEqual(repr(explicit_calendar), repr(nepali_calendar))
+        self.assertEqual(
+            "CustomCalendar(year=2081, month=1, day_of_month=1, era=2, first_day_of_month=7, last_day_of_month=2, "
+            "total_days_in_month=31, day_of_week_in_month=1, day_of_week=7, day_of_year=1, week_of_month=1, "
+            "week_of_year=1)",
+            repr(nepali_calendar)
+        )
+        self.assertEqual(-1, CustomCalendar(2081, 1, 1, 2, 7, 1, 31).week_of_year)
+
+        for calendar in (
+            nepali_calendar, nepali_calendar.to_simple_date(), nepali_calendar.to_nepali_month_calendar(),
+            SimpleTime(9, 45, 30, 0)
+        ):
+            with self.subTest(calendar=calendar):
+                self.assertFalse(hasattr(calendar, "__dict__"))
+                self.assertEqual(calendar, pickle.loads(pickle.dumps(calendar)))
+                with self.assertRaises(FrozenInstanceError):
+                    calendar.year = 2000
+
+        for ordinal in range(date(2023, 12, 25).toordinal(), date(2025, 1, 10).toordinal()):
+            english_calendar = DateConverters.get_english_calendar_from_ordinal(ordinal)
+            first_day_of_year = (english_calendar.day_of_week - english_calendar.day_of_year) % 7 + 1
+            with self.subTest(english_calendar=english_calendar):
+                self.assertEqual(
+                    DateConverters.calculate_week_of_month(english_calendar.day_of_month, english_calendar.first_day_of_month),
+                    english_calendar.week_of_month
+                )
+                self.assertEqual(
+                    DateConverters.calculate_week_of_year(english_calendar.day_of_year, first_day_of_year),
+                    english_calendar.week_of_year
+                )
+                self.assertEqual((english_calendar.day_of_month - 1) // 7 + 1, english_calendar.day_of_week_in_month)
+
     def test_date_conversion_convert_to_english_get_same_from_convert_to_nepali(self):
         nepali_calendar = NepaliDateConverter.convert_english_to_nepali(
             english_yyyy=2021, english_mm=2, english_dd=28
@@ -380,6 +622,45 @@ class TestNepaliDateConverter(unittest.TestCase):
         self.assertEqual(28, english_calendar.day_of_month)
         
 
+    def test_nepali_date_matches_custom_calendar_and_english_date(self):
+        nepali_date = NepaliDate(2081, 6, 12)
+
+        self.assertEqual(NepaliDateConverter.get_nepali_calendar(2081, 6, 12), nepali_date.to_custom_calendar())
+        self.assertEqual(SimpleDate(2081, 6, 12), nepali_date.to_simple_date())
+        self.assertEqual((2081, 6, 12, 7), (nepali_date.year, nepali_date.month, nepali_date.day_of_month, nepali_date.day_of_week))
+        self.assertEqual(date(2024, 9, 28), nepali_date.to_english_date())
+        self.assertEqual(nepali_date, NepaliDate.from_english_date(date(2024, 9, 28)))
+        self.assertEqual(nepali_date, NepaliDate.fromordinal(nepali_date.toordinal()))
+        self.assertEqual("NepaliDate(2081, 6, 12)", repr(nepali_date))
+
+    def test_nepali_date_arithmetic_comparison_and_hashing(self):
+        start_date = NepaliDate(2081, 12, 30)
+        end_date = NepaliDate(2082, 1, 2)
+
+        self.assertEqual(NepaliDate(2082, 1, 1), start_date + timedelta(days=2))
+        self.assertEqual(NepaliDate(2082, 1, 1), timedelta(days=2) + start_date)
+        self.assertEqual(start_date, end_date - timedelta(days=3))
+        self.assertEqual(timedelta(days=3), end_date - start_date)
+        self.assertTrue(start_date < end_date <= NepaliDate(2082, 1, 2))
+        self.assertNotEqual(start_date, end_date)
+        self.assertEqual(1, len({end_date, NepaliDate(2082, 1, 2)}))
+        self.assertEqual([start_date, end_date], sorted([end_date, start_date]))
+
+        with self.assertRaises(FrozenInstanceError):
+            end_date._ordinal = start_date.toordinal()
+        with self.assertRaises(FrozenInstanceError):
+            del end_date._ordinal
+        with self.assertRaises(AttributeError):
+            end_date.note = "new year"
+        self.assertEqual(NepaliDate(2082, 1, 2), end_date)
+        self.assertEqual(end_date, pickle.loads(pickle.dumps(end_date)))
+
+        with self.assertRaises(ValueError):
+            NepaliDate(2081, 12, 32)
+
+        with self.assertRaises(ValueError):
+            NepaliDate(2100, 12, 31) + timedelta(days=1)
+
     def test_get_nepali_month_today_nepali_date_get_same_custom_month_and_nepali_calendar_properties(self):
         today = self.calendar_model.today_nepali_calendar
 
@@ -441,6 +722,23 @@ class TestNepaliDateConverter(unittest.TestCase):
         self.assertEqual(36675, days_between)
         
         
+    def test_get_nepali_month_calendar_returns_shared_instance_addressed_by_index_in(self):
+        nepali_month_calendar = NepaliDateConverter.get_nepali_month_calendar(2078, 3)
+
+        self.assertIs(nepali_month_calendar, NepaliDateConverter.get_nepali_month_calendar(2078, 3))
+        self.assertEqual(
+            NepaliDateConverter.get_nepali_calendar(2078, 3, 1).to_nepali_month_calendar(),
+            nepali_month_calendar
+        )
+
+        nepali_month_calendars = DateConverters.get_nepali_month_calendars()
+        self.assertEqual(len(NepaliCalendarDefaults.NepaliYearRange) * 12, len(nepali_month_calendars))
+        for index, month_calendar in enumerate(nepali_month_calendars):
+            self.assertEqual(index, month_calendar.index_in(NepaliCalendarDefaults.NepaliYearRange))
+
+        with self.assertRaises(ValueError):
+            NepaliDateConverter.get_nepali_month_calendar(1969, 12)
+
     def test_get_nepali_month_today(self):
         today = self.calendar_model.today_nepali_calendar
 
@@ -619,6 +917,27 @@ class TestNepaliDateConverter(unittest.TestCase):
 
         self.assertEqual(days_between, -36675)
 
+    def test_calculate_nepali_days_in_between_many_matches_single_calculation(self):
+        date_pairs = [
+            (SimpleDate(1980, 12, 31), SimpleDate(2081, 5, 24)),
+            (SimpleDate(2081, 5, 24), SimpleDate(1980, 12, 31)),
+            ((1970, 1, 1), (2100, 12, 30)),
+            ((2081, 1, 1), (2081, 1, 1)),
+        ]
+
+        days_between = NepaliDateConverter.get_nepali_days_in_between_many(date_pairs)
+
+        self.assertEqual(days_between[:2], [36675, -36675])
+        self.assertEqual(days_between[3], 0)
+        self.assertEqual(
+            days_between[2],
+            NepaliDateConverter.get_nepali_days_in_between(SimpleDate(1970, 1, 1), SimpleDate(2100, 12, 30))
+        )
+
+    def test_calculate_nepali_days_in_between_many_raises_for_out_of_range_year(self):
+        with self.assertRaises(ValueError):
+            NepaliDateConverter.get_nepali_days_in_between_many([(SimpleDate(2081, 1, 1), SimpleDate(2101, 1, 1))])
+
 
     def test_compare_both_english_and_nepali_days_in_between(self):
         english_start_date = SimpleDate(1998, 4, 12)
@@ -746,6 +1065,73 @@ class TestNepaliDateConverter(unittest.TestCase):
 
         self.assertEqual(get_nepali_calendar_2084, adjusted_nepali_calendar_2083)
 
+    def test_nepali_calendar_after_large_day_adjustments_and_out_of_range(self):
+        adjusted_forward = NepaliDateConverter.get_nepali_calendar_after_addition_or_subtraction(1970, 1, 1, 47000)
+        adjusted_backward = NepaliDateConverter.get_nepali_calendar_after_addition_or_subtraction(
+            adjusted_forward.year, adjusted_forward.month, adjusted_forward.day_of_month, -47000
+        )
+
+        self.assertEqual(NepaliDateConverter.convert_english_to_nepali(2041, 12, 17), adjusted_forward)
+        self.assertEqual(NepaliCalendarDefaults.startingNepaliCalendar, adjusted_backward)
+
+        with self.assertRaises(ValueError):
+            NepaliDateConverter.get_nepali_calendar_after_addition_or_subtraction(2100, 12, 31, 1)
+
+        with self.assertRaises(ValueError):
+            NepaliDateConverter.get_nepali_calendar_after_addition_or_subtraction(1970, 1, 1, -1)
+
+    def test_iter_nepali_dates_matches_get_nepali_calendar_across_year_boundary(self):
+        nepali_dates = list(NepaliDateConverter.iter_nepali_dates(SimpleDate(2080, 12, 25), SimpleDate(2081, 1, 5)))
+
+        self.assertEqual(len(nepali_dates), 11)
+        for nepali_calendar in nepali_dates:
+            self.assertEqual(
+                NepaliDateConverter.get_nepali_calendar(nepali_calendar.year, nepali_calendar.month, nepali_calendar.day_of_month),
+                nepali_calendar
+            )
+
+    def test_iter_nepali_dates_with_step_and_english_date(self):
+        nepali_dates = list(NepaliDateConverter.iter_nepali_dates((2081, 1, 1), (2081, 3, 1), step=7, with_english_date=True))
+
+        self.assertEqual(len(nepali_dates), 10)
+        for index, (nepali_calendar, english_date) in enumerate(nepali_dates):
+            self.assertEqual(date(2024, 4, 13) + timedelta(days=7 * index), english_date)
+            self.assertEqual(
+                NepaliDateConverter.convert_english_to_nepali(english_date.year, english_date.month, english_date.day),
+                nepali_calendar
+            )
+
+    def test_iter_nepali_dates_backwards_and_invalid_arguments(self):
+        nepali_dates = list(NepaliDateConverter.iter_nepali_dates((2081, 1, 2), (2080, 12, 29), step=-1))
+
+        self.assertEqual(
+            [(2081, 1, 2), (2081, 1, 1), (2080, 12, 30), (2080, 12, 29)],
+            [(nepali_calendar.year, nepali_calendar.month, nepali_calendar.day_of_month) for nepali_calendar in nepali_dates]
+        )
+        self.assertEqual([], list(NepaliDateConverter.iter_nepali_dates((2081, 1, 2), (2081, 1, 1))))
+
+        with self.assertRaises(ValueError):
+            NepaliDateConverter.iter_nepali_dates((2081, 1, 1), (2081, 1, 2), step=0)
+
+        with self.assertRaises(ValueError):
+            NepaliDateConverter.iter_nepali_dates((2100, 12, 1), (2101, 1, 1))
+
+    def test_iter_nepali_dates_checks_both_endpoints(self):
+        last_days = list(NepaliDateConverter.iter_nepali_dates((2100, 12, 30), (2100, 12, 31)))
+        self.assertEqual([(2100, 12, 30), (2100, 12, 31)], [(calendar.year, calendar.month, calendar.day_of_month) for calendar in last_days])
+        self.assertEqual(31, len(list(NepaliDateConverter.iter_nepali_dates((2081, 1, 31), (2081, 1, 1), step=-1))))
+
+        for start_date, end_date in (
+            ((2100, 12, 1), (2100, 12, 32)),
+            ((2081, 1, 1), (2081, 1, 32)),
+            ((2081, 1, 32), (2081, 2, 5)),
+            ((2101, 1, 1), (2101, 1, 2)),
+            ((2081, 1, 1), (2150, 1, 1)),
+        ):
+            with self.subTest(start_date=start_date, end_date=end_date):
+                with self.assertRaises(ValueError):
+                    NepaliDateConverter.iter_nepali_dates(start_date, end_date)
+
     def test_compare_end_week_day_specifically_for_get_nepali_calendar(self):
         nepali_calendar_for_end_weekday_using_english_date = NepaliDateConverter.convert_english_to_nepali(2024, 9, 28)
         nepali_calendar_for_end_weekday_using_nepali_date = NepaliDateConverter.get_nepali_calendar(2081, 6, 12)
@@ -1146,7 +1532,28 @@ class TestNepaliDateConverter(unittest.TestCase):
         corrected_formatted_time_with_space = "09 45 AM"
         self.assertEqual(corrected_formatted_time_with_space, formatted_time_with_space)
 
-    
+    def test_convert_numbers_between_english_and_nepali_digits(self):
+        long_text = "Invoice 10234, due 2081/01/24 " * 3
+
+        for english, nepali in (("2081/01/24", "२०८१/०१/२४"), ("0123456789", "०१२३४५६७८९"), ("Q4, १२", "Q४, १२"), ("", "")):
+            self.assertEqual(nepali, NepaliDateConverter.convert_to_nepali_number(english))
+            # Memoized the second time
+            self.assertEqual(nepali, NepaliDateConverter.convert_to_nepali_number(english))
+
+        self.assertEqual("2081/01/24", NepaliDateConverter.convert_to_english_number("२०८१/०१/२४"))
+        self.assertEqual("Q4, 12", NepaliDateConverter.convert_to_english_number("Q4, १२"))
+        self.assertEqual(long_text, NepaliDateConverter.convert_to_english_number(NepaliDateConverter.convert_to_nepali_number(long_text)))
+
+    def test_localize_digits_converts_chunks_lazily(self):
+        chunks = iter(["Total: 15", "30.50\n", "२०८१"])
+        localized_chunks = NepaliDateConverter.localize_digits(chunks)
+
+        self.assertEqual("Total: १५", next(localized_chunks))
+        self.assertEqual(["३०.५०\n", "२०८१"], list(localized_chunks))
+        self.assertEqual(
+            ["Total: 15", "2081"], list(NepaliDateConverter.localize_digits(["Total: १५", "2081"], NepaliCalendarUtilsLang.ENGLISH))
+        )
+
     def test_format_nepali_datetime_full_pattern_returns_correct_format(self):
         test_calendar = NepaliDateConverter.get_nepali_calendar(2081, 5, 24)
         test_time = SimpleTime(14, 45, 15, 123000000)
@@ -0,0 +1,92 @@
+import io
+import unittest
+from nepali_calendar_utils.calendar_model.nepali_date_converter import NepaliDateConverter
+from nepali_calendar_utils.calendar_model.nepali_date_formatter import DATE_FIELD, LITERAL, TIME_FIELD, NepaliDateFormatter
+from nepali_calendar_utils.data.custom_calendar import SimpleDate, SimpleTime
+from nepali_calendar_utils.data.nepali_date_locale import (
+    NameFormat, NepaliCalendarUtilsLang, NepaliDateFormatStyle, NepaliDateLocale
+)
+
+
+class TestNepaliDateFormatter(unittest.TestCase):
+    nepali_calendar = NepaliDateConverter.get_nepali_calendar(2081, 5, 24)
+    english_calendar = NepaliDateConverter.convert_nepali_to_english(2081, 5, 24)
+    time = SimpleTime(hour=15, minute=5, second=9, nanosecond=123456789)
+
+    def test_formatters_are_cached_by_pattern_and_language(self):
+        formatter = NepaliDateFormatter.get_formatter("yyyy-MM-dd", NepaliCalendarUtilsLang.ENGLISH)
+
+        self.assertIs(formatter, NepaliDateFormatter.get_formatter("yyyy-MM-dd", NepaliCalendarUtilsLang.ENGLISH))
+        self.assertIsNot(formatter, NepaliDateFormatter.get_formatter("yyyy-MM-dd", NepaliCalendarUtilsLang.NEPALI))
+
+    def test_pattern_is_tokenized_longest_field_first(self):
+        self.assertEqual(
+            (
+                (DATE_FIELD, "yyyy"), (DATE_FIELD, "yy"), (LITERAL, " "), (DATE_FIELD, "MMMM"), (DATE_FIELD, "M"),
+                (LITERAL, " Q "), (TIME_FIELD, "SSSS")
+            ),
+            NepaliDateFormatter.tokenize("yyyyyy MMMMM Q SSSS")
+        )
+
+    def test_format_matches_unicode_pattern_functions(self):
+        pattern = "EEEE EEEEE E, MMMM MMM MM M, dd d D ee e w, yyyy yy | HH H hh h mm m ss s SSSS SSS SS S a A"
+
+        for language in NepaliCalendarUtilsLang:
+            with self.subTest(language=language):
+                formatter = NepaliDateFormatter(pattern, language)
+
+                self.assertEqual(
+                    NepaliDateConverter.format_nepali_date_time_by_unicode_pattern(pattern, self.nepali_calendar, self.time, language),
+                    formatter.format(self.nepali_calendar, self.time)
+                )
+                self.assertEqual(
+                    NepaliDateConverter.format_english_date_time_by_unicode_pattern(pattern, self.english_calendar, self.time, language),
+                    formatter.format(self.english_calendar, self.time)
+                )
+                self.assertEqual(
+                    NepaliDateConverter.format_time_by_unicode_pattern(pattern, self.time, language),
+                    formatter.format(time=self.time)
+                )
+
+    def test_format_output(self):
+        formatter = NepaliDateFormatter.get_formatter("EEEE, MMMM dd, yyyy hh:mm:ss.SSS a", NepaliCalendarUtilsLang.ENGLISH)
+
+        self.assertEqual("Monday, Bhadra 24, 2081 03:05:09.123 pm", formatter.format(self.nepali_calendar, self.time))
+        self.assertEqual("Monday, September 09, 2024 hh:mm:ss.SSS a", formatter.format(self.english_calendar))
+
+        formatter = NepaliDateFormatter.get_formatter("yyyy MMMM d, A h बजे", NepaliCalendarUtilsLang.NEPALI)
+
+        self.assertEqual("२०८१ भदौ २४, दिउँसो ३ बजे", formatter.format(self.nepali_calendar, self.time))
+
+    def test_format_many_matches_single_date_formatting(self):
+        nepali_dates = list(NepaliDateConverter.iter_nepali_dates(SimpleDate(2081, 11, 25), SimpleDate(2082, 1, 5)))
+        dates = nepali_dates + NepaliDateConverter.convert_nepali_to_english_many(nepali_dates)
+        pattern = "{EEEE EEEEE E} MMMM MMM MM M dd d D ee e w yyyy yy HH a"
+
+        for language in NepaliCalendarUtilsLang:
+            with self.subTest(language=language):
+                formatter = NepaliDateFormatter.get_formatter(pattern, language)
+                self.assertEqual(
+                    [formatter.format(date) for date in dates], NepaliDateConverter.format_many(dates, pattern, language)
+                )
+
+            for date_format in NepaliDateFormatStyle:
+                for name_format in NameFormat:
+                    locale = NepaliDateLocale(language, date_format, name_format, name_format)
+                    with self.subTest(locale=locale):
+                        self.assertEqual(
+                            [NepaliDateConverter.format_nepali_date_from_calendar(date, locale) for date in nepali_dates]
+                            + [NepaliDateConverter.format_english_date_from_calendar(date, locale) for date in dates[len(nepali_dates):]],
+                            NepaliDateConverter.format_many(iter(dates), locale)
+                        )
+
+    def test_format_many_writes_to_file_like_object(self):
+        output = io.StringIO()
+        dates = NepaliDateConverter.iter_nepali_dates(SimpleDate(2081, 1, 1), SimpleDate(2081, 1, 2))
+
+        self.assertEqual(2, NepaliDateConverter.format_many(dates, "yyyy/MM/dd", output=output))
+        self.assertEqual("२०८१/०१/०१\n२०८१/०१/०२\n", output.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+import unittest
+from nepali_calendar_utils.calendar_model.nepali_calendar_model import NepaliCalendarModel
+from nepali_calendar_utils.calendar_model.nepali_date_converter import NepaliDateConverter
+from nepali_calendar_utils.calendar_model.nepali_date_formatter import NepaliDateFormatter
+from nepali_calendar_utils.calendar_model.nepali_date_parser import NepaliDateParser
+from nepali_calendar_utils.data.custom_calendar import SimpleDate
+from nepali_calendar_utils.data.nepali_date_locale import NepaliCalendarUtilsLang
+
+
+class TestNepaliDateParser(unittest.TestCase):
+    def test_parse_is_inverse_of_format(self):
+        patterns = ("yyyy/MM/dd", "yyyyMMdd", "EEEE, MMMM d, yyyy", "E dd MMM yyyy", "yy-M-d", "yyyy D", "e w yyyy.MM.dd")
+        dates = list(NepaliDateConverter.iter_nepali_dates(SimpleDate(2080, 11, 20), SimpleDate(2081, 2, 10)))
+
+        for language in NepaliCalendarUtilsLang:
+            for pattern in patterns:
+                if pattern.startswith("E dd MMM") and language == NepaliCalendarUtilsLang.NEPALI:
+                    continue  # "अ" is the short name of both Asar and Asoj
+
+                with self.subTest(language=language, pattern=pattern):
+                    formatter = NepaliDateFormatter.get_formatter(pattern, language)
+                    parser = NepaliDateParser.get_parser(pattern, language)
+
+                    self.assertEqual(dates, [parser.parse(formatter.format(date)) for date in dates])
+
+    def test_parse_accepts_english_and_nepali_digits_and_several_patterns(self):
+        parser = NepaliDateParser.get_parser(("yyyy-MM-dd", "d MMMM yyyy"), NepaliCalendarUtilsLang.ENGLISH)
+
+        self.assertIs(parser, NepaliDateParser.get_parser(("yyyy-MM-dd", "d MMMM yyyy"), NepaliCalendarUtilsLang.ENGLISH))
+        self.assertEqual(SimpleDate(2081, 1, 15), parser.parse_to_simple_date("२०८१-०१-१५"))
+        self.assertEqual(SimpleDate(2081, 1, 15), parser.parse_to_simple_date(" 15 baisakh 2081 "))
+        self.assertEqual(SimpleDate(2081, 12, 30), parser.parse("2081-12-30").to_simple_date())
+
+        self.assertEqual(
+            SimpleDate(2081, 2, 32),
+            NepaliDateConverter.parse_nepali_date("जेठ ३२, २०८१", "MMMM d, yyyy").to_simple_date()
+        )
+
+    def test_parse_invalid_dates_and_patterns(self):
+        parser = NepaliDateParser("yyyy/MM/dd")
+
+        for date_string in ("2081/13/01", "2081/01/32", "2081/02/33", "2101/01/01", "2081-01-01", "2081/1/01"):
+            with self.subTest(date_string=date_string):
+                with self.assertRaises(ValueError):
+                    parser.parse(date_string)
+
+        with self.assertRaisesRegex(ValueError, "ambiguous"):
+            NepaliDateParser("MMM d, yyyy").parse("अ 3, 2081")
+
+        for pattern in ("yyyy/MM/dd HH:mm", "MM/dd", "yyyy/MM"):
+            with self.subTest(pattern=pattern):
+                with self.assertRaises(ValueError):
+                    NepaliDateParser(pattern)
+
+    def test_parse_many_returns_error_mask(self):
+        dates, errors = NepaliDateConverter.parse_nepali_date_many(
+            ["2081/01/15", "२०८१-०२-३२", "2081/13/01", "", None, "2081-01-01"],
+            ("yyyy/MM/dd", "yyyy-MM-dd"),
+            as_simple_date=True
+        )
+
+        self.assertEqual(
+            [SimpleDate(2081, 1, 15), SimpleDate(2081, 2, 32), None, None, None, SimpleDate(2081, 1, 1)], dates
+        )
+        self.assertEqual([False, False, True, True, True, False], errors)
+
+        dates, errors = NepaliDateConverter.parse_nepali_date_many(iter(["20810101"]), "yyyyMMdd")
+        self.assertEqual([NepaliDateConverter.get_nepali_calendar(2081, 1, 1)], dates)
+        self.assertEqual([False], errors)
+
+    def test_model_parse_compact_date(self):
+        self.assertEqual(NepaliDateConverter.get_nepali_calendar(2081, 1, 15), NepaliCalendarModel.parse("20810115"))
+        self.assertIsNone(NepaliCalendarModel.parse("20811301"))
+        self.assertIsNone(NepaliCalendarModel.parse("2081011"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+from nepali_calendar_utils.calendar_model.nepali_date_converter import NepaliDateConverter
+from nepali_calendar_utils.calendar_model.nepali_date_recognizer import NepaliDateRecognizer
+from nepali_calendar_utils.data.custom_calendar import RecognizedNepaliDate, SimpleDate
+from nepali_calendar_utils.data.nepali_date_locale import nepali_month_spelling_variants
+
+
+class TestNepaliDateRecognizer(unittest.TestCase):
+    def test_find_dates_in_different_orders_scripts_and_spellings(self):
+        expected = SimpleDate(2081, 1, 15)
+
+        for text in (
+            "२०८१ वैशाख १५", "15 Baisakh 2081", "Baishakh 15, 2081", "2081/01/15", "२०८१-०१-१५", "2081.1.15",
+            "vaishakh 15 2081", "15 BAISAKH, 2081", "२०८१ साल बैशाख १५ गते", "२०८१ वैशाखको १५", "15-Baishakh-2081",
+        ):
+            with self.subTest(text=text):
+                self.assertEqual([RecognizedNepaliDate(expected, 0, len(text.replace(" गते", "")))],
+                                 NepaliDateConverter.find_nepali_dates(text))
+
+    def test_every_month_spelling_is_recognized(self):
+        recognizer = NepaliDateRecognizer.get_default()
+
+        for month, spellings in enumerate(nepali_month_spelling_variants, start=1):
+            for spelling in spellings:
+                with self.subTest(spelling=spelling):
+                    self.assertEqual(SimpleDate(2081, month, 5), recognizer.find_first(f"on 5 {spelling} 2081."))
+
+    def test_find_dates_in_running_text(self):
+        text = "Paid on Baishakh 15, 2081 at branch 12; due २०८१/०२/३२, ref 998877, Jeth 33 2081 and 2081/1-15"
+
+        self.assertEqual(
+            [
+                RecognizedNepaliDate(SimpleDate(2081, 1, 15), 8, 25),
+                RecognizedNepaliDate(SimpleDate(2081, 2, 32), 44, 54),
+            ],
+            NepaliDateConverter.find_nepali_dates(text)
+        )
+
+    def test_reject_words_between_parts_and_names_inside_words(self):
+        recognizer = NepaliDateRecognizer.get_default()
+
+        for text in ("15 Baisakh salary 2081", "Baisakh 15 x 2081", "15 Baishakhs 2081", "15 Man 2081", "2081 Magh\n5"):
+            with self.subTest(text=text):
+                self.assertEqual([], recognizer.find_all(text))
+
+    def test_find_dates_many(self):
+        self.assertEqual(
+            [[RecognizedNepaliDate(SimpleDate(2081, 12, 30), 0, 15)], [], []],
+            NepaliDateConverter.find_nepali_dates_many(iter(["Chaitra 30 2081", "no date here", None]))
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
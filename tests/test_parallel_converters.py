@@ -0,0 +1,63 @@
+import unittest
+from datetime import date, timedelta
+from itertools import count, islice
+from nepali_calendar_utils.calendar_model.nepali_date_converter import NepaliDateConverter
+from nepali_calendar_utils.data.custom_calendar import SimpleDate
+
+
+class TestParallelConverters(unittest.TestCase):
+    def test_convert_many_matches_sequential_conversion_in_order(self):
+        english_dates = [date(2023, 1, 1) + timedelta(days=offset * 37 % 500) for offset in range(1_000)]
+        nepali_calendars = NepaliDateConverter.convert_english_to_nepali_many(english_dates)
+        nepali_dates = [nepali_calendar.to_simple_date() for nepali_calendar in nepali_calendars]
+
+        for workers in (1, 2):
+            with self.subTest(workers=workers):
+                self.assertEqual(
+                    nepali_calendars,
+                    list(NepaliDateConverter.convert_many(iter(english_dates), workers=workers, chunk_size=64))
+                )
+                self.assertEqual(
+                    NepaliDateConverter.convert_nepali_to_english_many(nepali_dates),
+                    list(NepaliDateConverter.convert_many(nepali_dates, to_nepali=False, workers=workers, chunk_size=99))
+                )
+                self.assertEqual(
+                    english_dates,
+                    list(NepaliDateConverter.convert_many(
+                        nepali_dates, to_nepali=False, workers=workers, chunk_size=99, as_date=True
+                    ))
+                )
+
+    def test_convert_many_streams_its_input(self):
+        english_dates = (date(2024, 4, 13) + timedelta(days=offset % 365) for offset in count())
+
+        nepali_calendars = NepaliDateConverter.convert_many(english_dates, workers=2, chunk_size=100)
+
+        self.assertEqual(
+            [SimpleDate(2081, 1, 1), SimpleDate(2081, 1, 2)],
+            [nepali_calendar.to_simple_date() for nepali_calendar in islice(nepali_calendars, 2)]
+        )
+        nepali_calendars.close()
+
+    def test_convert_many_errors(self):
+        with self.assertRaises(ValueError):
+            list(NepaliDateConverter.convert_many([(2081, 1, 1), (2081, 13, 1)], to_nepali=False, workers=2))
+
+        for workers in (None, 1, 2):
+            for as_date in (False, True):
+                with self.subTest(workers=workers, as_date=as_date):
+                    with self.assertRaises(ValueError):
+                        list(NepaliDateConverter.convert_many(
+                            [(2100, 12, 31), (2100, 12, 32)], to_nepali=False, workers=workers, as_date=as_date
+                        ))
+
+        for workers, chunk_size in ((0, 10), (2, 0)):
+            with self.subTest(workers=workers, chunk_size=chunk_size):
+                with self.assertRaises(ValueError):
+                    NepaliDateConverter.convert_many([], workers=workers, chunk_size=chunk_size)
+
+        self.assertEqual([], list(NepaliDateConverter.convert_many([], workers=2)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+import unittest
+from datetime import date, timedelta
+from nepali_calendar_utils.calendar_model.date_converters import DateConverters
+from nepali_calendar_utils.calendar_model.nepali_calendar_defaults import NepaliCalendarDefaults
+
+try:
+    import numpy as np
+    from nepali_calendar_utils.vectorized import ad_to_bs, bs_to_ad, bs_to_datetime64
+except ImportError:
+    np = None
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestVectorized(unittest.TestCase):
+    def test_ad_to_bs_matches_date_converters_for_every_supported_day(self):
+        first_day = date(1913, 4, 13)
+        last_day = date(NepaliCalendarDefaults.EnglishYearRange[-1], 12, 31)
+        english_days = [first_day + timedelta(days=offset) for offset in range((last_day - first_day).days + 1)]
+
+        nepali_columns = ad_to_bs(np.array(english_days, dtype="datetime64[D]"))
+
+        for index, english_day in enumerate(english_days):
+            nepali_calendar = DateConverters.convert_to_nepali_calendar(english_day.year, english_day.month, english_day.day)
+            self.assertEqual(
+                (
+                    nepali_calendar.year,
+                    nepali_calendar.month,
+                    nepali_calendar.day_of_month,
+                    nepali_calendar.day_of_week,
+                    nepali_calendar.day_of_year,
+                ),
+                (
+                    nepali_columns.year[index],
+                    nepali_columns.month[index],
+                    nepali_columns.day[index],
+                    nepali_columns.weekday[index],
+                    nepali_columns.day_of_year[index],
+                )
+            )
+
+    def test_bs_to_ad_matches_date_converters_for_every_supported_day(self):
+        nepali_days = [
+            (year, month, day)
+            for year in NepaliCalendarDefaults.NepaliYearRange
+            for month in range(1, 13)
+            for day in range(1, DateConverters.get_total_days_in_nepali_month(year, month) + 1)
+        ]
+        years, months, days = (np.array(column) for column in zip(*nepali_days))
+
+        english_columns = bs_to_ad(years, months, days)
+        english_dates = bs_to_datetime64(years, months, days)
+
+        for index, (year, month, day) in enumerate(nepali_days):
+            english_calendar = DateConverters.convert_to_english_calendar(year, month, day)
+            self.assertEqual(
+                (
+                    english_calendar.year,
+                    english_calendar.month,
+                    english_calendar.day_of_month,
+                    english_calendar.day_of_week,
+                    english_calendar.day_of_year,
+                ),
+                (
+                    english_columns.year[index],
+                    english_columns.month[index],
+                    english_columns.day[index],
+                    english_columns.weekday[index],
+                    english_columns.day_of_year[index],
+                )
+            )
+            self.assertEqual(
+                date(english_calendar.year, english_calendar.month, english_calendar.day_of_month),
+                english_dates[index].astype(date)
+            )
+
+    def test_ad_to_bs_accepts_days_since_epoch_as_integers(self):
+        english_dates = np.array(["2000-06-24", "2024-02-29"], dtype="datetime64[D]")
+
+        from_datetime64 = ad_to_bs(english_dates)
+        from_integers = ad_to_bs(english_dates.astype(np.int32))
+
+        np.testing.assert_array_equal(from_datetime64.year, from_integers.year)
+        np.testing.assert_array_equal(from_datetime64.month, from_integers.month)
+        np.testing.assert_array_equal(from_datetime64.day, from_integers.day)
+
+    def test_out_of_range_dates_raise_value_error(self):
+        with self.assertRaises(ValueError):
+            ad_to_bs(np.array(["1913-04-12"], dtype="datetime64[D]"))
+
+        with self.assertRaises(ValueError):
+            ad_to_bs(np.array(["2044-01-01"], dtype="datetime64[D]"))
+
+        with self.assertRaises(ValueError):
+            bs_to_ad([2101], [1], [1])
+
+        with self.assertRaises(ValueError):
+            bs_to_ad([2081], [13], [1])
+
+    def test_days_past_the_end_of_the_month_raise_like_the_scalar_converter(self):
+        for year, month, day in ((2100, 12, 32), (2081, 1, 32), (2080, 12, 31), (2081, 1, 0)):
+            with self.subTest(year=year, month=month, day=day):
+                with self.assertRaises(ValueError):
+                    DateConverters.get_checked_nepali_ordinal(year, month, day)
+                with self.assertRaises(ValueError):
+                    bs_to_ad([2081, year], [1, month], [1, day])
+                with self.assertRaises(ValueError):
+                    bs_to_datetime64(year, month, day)
+
+        self.assertEqual(np.datetime64("2044-04-13"), bs_to_datetime64(2100, 12, 31))
+
+
+if __name__ == "__main__":
+    unittest.main()